@@ -0,0 +1,208 @@
+"""Synthetic inputs for the tooling benchmarks.
+
+Every generator takes a size `n` and returns input shaped like the real thing:
+a router.go with `n` route blocks, a SEP document with `n` sections, a Dart
+file with `n` model classes, an SDK tree with `n` request builders, a seed list
+like seeds.py. Output is deterministic, so a timing difference between two runs
+is a difference in the code, not in the input.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def router_go(n: int) -> str:
+    """router.go whose addRoutes() holds `n` resource blocks, each with a nested r.Route."""
+    lines = [
+        "package httpx",
+        "",
+        "func (r *Router) addRoutes(config *RouterConfig, rateLimiter *throttled.HTTPRateLimiter) {",
+        "\tr.Method(http.MethodGet, \"/health\", config.HealthCheck)",
+        "",
+    ]
+    for i in range(n):
+        lines += [
+            f"\t// resource {i}",
+            f"\tr.Route(\"/resources{i}\", func(r chi.Router) {{",
+            f"\t\tr.With(stateMiddleware.Wrap).Method(http.MethodGet, \"/\", streamableHandler{i})",
+            f"\t\tr.Route(\"/{{resource{i}_id}}\", func(r chi.Router) {{",
+            f"\t\t\tr.Method(http.MethodGet, \"/\", objectHandler{i})",
+            f"\t\t\tr.Get(\"/effects\", effectsHandler{i})",
+            "\t\t\tr.Group(func(r chi.Router) {",
+            f"\t\t\t\tr.Post(\"/submit\", submitHandler{i})",
+            "\t\t\t})",
+            "\t\t})",
+            "\t})",
+            "",
+        ]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def sep_markdown(n: int) -> str:
+    """A SEP document with `n` sections, each holding a field table and a TOML example."""
+    out = [
+        "## Preamble",
+        "",
+        "```",
+        "SEP: 9999",
+        "Title: Synthetic Benchmark Protocol",
+        "Status: Active",
+        "```",
+        "",
+        "## Simple Summary",
+        "",
+        "A generated specification used to time the parser.",
+        "",
+    ]
+    for i in range(n):
+        out += [
+            f"## Section {i}",
+            "",
+            f"### Request {i}",
+            "",
+            "| Name | Type | Description |",
+            "| --- | --- | --- |",
+        ]
+        for j in range(6):
+            requirement = "required" if j % 2 == 0 else "optional"
+            out.append(f"| field_{i}_{j} | string | ({requirement}) Value {j} of section {i}. |")
+        out += ["", "```toml"]
+        for j in range(4):
+            out += [f"# Setting {j} of section {i}", f"SETTING_{i}_{j}=\"value-{i}-{j}\""]
+        out += ["```", "", f"- `FLAG_{i}`: optional flag for section {i}.", ""]
+    return "\n".join(out)
+
+
+def dart_models(n: int) -> str:
+    """A Dart file declaring `n` model classes with docs, fields, a constructor and methods."""
+    out = [
+        "// Copyright 2024 The Stellar Flutter SDK Authors. All rights reserved.",
+        "",
+        "import 'dart:convert';",
+        "",
+    ]
+    for i in range(n):
+        out += [
+            f"/// Model number {i}.",
+            "///",
+            "/// Carries a few fields and the usual JSON helpers.",
+            f"class Model{i} extends Response {{",
+            "  /// Identifier of the record.",
+            "  String id;",
+            "  /// Amount, as a decimal string.",
+            "  String? amount;",
+            "  // A trailing comment that mentions class Decoy and { braces }.",
+            "  int count = 0;",
+            "",
+            f"  Model{i}(this.id, {{this.amount, this.count = 0}});",
+            "",
+            "  /// Parses the record from Horizon's JSON.",
+            f"  factory Model{i}.fromJson(Map<String, dynamic> json) =>",
+            f"      Model{i}(json['id'], amount: json['amount']);",
+            "",
+            "  /// Serializes the record.",
+            "  Map<String, dynamic> toJson() => {'id': id, 'amount': amount};",
+            "",
+            "  String get label => \"model-$id /* not a comment */\";",
+            "",
+            "  @override",
+            f"  int compareTo(Model{i} other) => id.compareTo(other.id);",
+            "",
+            "  static List<String> keys() {",
+            "    return ['id', 'amount'];",
+            "  }",
+            "}",
+            "",
+        ]
+    return "\n".join(out)
+
+
+def _builder(i: int) -> str:
+    name = f"Resources{i}RequestBuilder"
+    return "\n".join([
+        "import 'dart:async';",
+        "",
+        "import 'package:http/http.dart' as http;",
+        "",
+        "import 'request_builder.dart';",
+        "",
+        f"/// Builds requests for resource set {i}.",
+        f"class {name} extends RequestBuilder {{",
+        f"  {name}(http.Client httpClient, Uri serverURI)",
+        f"      : super(httpClient, serverURI, [\"resources{i}\"]);",
+        "",
+        f"  Future<Response> resource(String resourceId) {{",
+        f"    this.setSegments([\"resources{i}\", resourceId]);",
+        "    return this.execute(this.buildUri());",
+        "  }",
+        "",
+        f"  {name} forAccount(String accountId) {{",
+        f"    this.setSegments([\"accounts\", accountId, \"resources{i}\"]);",
+        "    return this;",
+        "  }",
+        "",
+        f"  {name} forAsset(Asset asset) {{",
+        "    queryParameters.addAll({\"asset\": encodeAsset(asset)});",
+        "    return this;",
+        "  }",
+        "",
+        "  Stream<Response> stream() {",
+        "    StreamController<Response> listener = StreamController.broadcast();",
+        "    return listener.stream;",
+        "  }",
+        "",
+        f"  {name} cursor(String token) {{",
+        "    super.cursor(token);",
+        "    return this;",
+        "  }",
+        "}",
+        "",
+    ])
+
+
+def write_sdk_tree(root: Path, n: int) -> Path:
+    """
+    Write a minimal SDK checkout with `n` request builders under `root`.
+
+    It has what FlutterSDKAnalyzer reads: lib/src/requests/*_request_builder.dart,
+    a StellarSDK class exposing every builder, and a public barrel exporting them.
+    """
+    requests = root / "lib" / "src" / "requests"
+    requests.mkdir(parents=True, exist_ok=True)
+    exports = []
+    getters = []
+    for i in range(n):
+        file_name = f"resources{i}_request_builder.dart"
+        (requests / file_name).write_text(_builder(i), encoding="utf-8")
+        exports.append(f"export 'src/requests/{file_name}';")
+        getters.append(f"  Resources{i}RequestBuilder get resources{i} =>"
+                       f" Resources{i}RequestBuilder(httpClient, _serverURI);")
+    sdk = ["class StellarSDK {", "  late Uri _serverURI;", "", *getters, "}", ""]
+    (root / "lib" / "src" / "stellar_sdk.dart").write_text("\n".join(sdk), encoding="utf-8")
+    exports.append("export 'src/stellar_sdk.dart';")
+    (root / "lib" / "stellar_flutter_sdk.dart").write_text("\n".join(exports) + "\n",
+                                                           encoding="utf-8")
+    return root
+
+
+def corpus_seeds(n: int) -> list[dict]:
+    """`n` seeds in seeds.py's shape, a third of them incomparable under each spec form."""
+    seeds = []
+    for i in range(n):
+        value = {
+            "ledger": i,
+            "hash": [(i + k) % 256 for k in range(32)],
+            "entries": [{"key": f"k{i}-{k}", "amount": i * 1000 + k} for k in range(4)],
+        }
+        seed = {"type": "SyntheticEntry", "dart_type": "XdrSyntheticEntry",
+                "json": value, "note": f"Synthetic seed {i}."}
+        if i % 3 == 1:
+            seed.update(oracle="incomparable", spec_form="opaque_hex",
+                        spec_form_paths=["hash"])
+        elif i % 3 == 2:
+            seed.update(json=i * 7919, oracle="incomparable", spec_form="integer_string",
+                        spec_form_paths=[""])
+        seeds.append(seed)
+    return seeds
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Time the SDK tooling's parsers and transforms on synthetic inputs of growing size.
+
+Each benchmark runs at several sizes (route blocks, SEP sections, Dart classes,
+request builders, seeds). For every size the best of a few timeit repeats is
+kept, and a least-squares fit of log(time) against log(size) gives the scaling
+exponent: about 1 for linear work, 2 for quadratic. A run is compared with the
+committed baseline and fails when a case got slower than the threshold allows
+or a benchmark's exponent grew, which is how accidental quadratic behaviour
+shows up even on a faster machine. The baseline's absolute times only apply
+on the host that recorded it; elsewhere only the exponents are judged.
+
+Nothing here touches the network; every input comes from generators.py.
+
+Usage:
+    python3 tools/benchmarks/run_benchmarks.py [--only NAME ...] [--quick]
+        [--threshold RATIO] [--absolute] [--update-baseline]
+
+Exit codes:
+    0  no regression against the baseline (or the baseline was written)
+    1  a case or a scaling exponent regressed
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import generators
+
+BENCH_DIR = Path(__file__).resolve().parent
+TOOLS_DIR = BENCH_DIR.parent
+REPO_ROOT = TOOLS_DIR.parent
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+# Generated inputs live here (git-ignored). The synthetic SDK trees must sit
+# inside the repository because the export-graph resolver works on repo paths.
+WORK_DIR = BENCH_DIR / ".tmp"
+
+for _path in (TOOLS_DIR / "matrix-generator", TOOLS_DIR / "matrix-generator" / "horizon",
+              TOOLS_DIR / "matrix-generator" / "sep", TOOLS_DIR / "skill-generator",
+              TOOLS_DIR / "sep-51-corpus"):
+    sys.path.insert(0, str(_path))
+
+# A case may take this many times its baseline before it counts as a regression;
+# shared CI machines vary by well over 1.5x between runs of the same code.
+DEFAULT_THRESHOLD = 2.0
+# A scaling exponent may grow this much over the baseline's before it fails; timing
+# noise moves it by a few tenths, a linear step turning quadratic by a whole 1.
+EXPONENT_SLACK = 0.5
+REPEATS = 5
+BASELINE_NOTE = ("Times are specific to the host that recorded them. On any other host "
+                 "only the scaling exponents are compared, unless --absolute is given.")
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """One timed operation; `prepare(n)` builds the input and returns the call to time."""
+
+    name: str
+    description: str
+    sizes: tuple[int, ...]
+    prepare: Callable[[int], Callable[[], object]]
+
+
+def _quiet(fn: Callable[[], object]) -> Callable[[], object]:
+    """The parsers report progress on stdout; keep it out of the benchmark output."""
+    def call() -> object:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return call
+
+
+def _work_file(name: str, text: str) -> Path:
+    path = WORK_DIR / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def prepare_horizon_router(n: int) -> Callable[[], object]:
+    from horizon_parser import HorizonRouterParser
+    content = generators.router_go(n)
+    return _quiet(lambda: HorizonRouterParser().parse_from_content(content))
+
+
+def prepare_sep_fields(n: int) -> Callable[[], object]:
+    from sep_parser import SEPParser
+    content = generators.sep_markdown(n)
+    parser = SEPParser("9999")
+    return lambda: parser.extract_field_definitions(content)
+
+
+def prepare_sep_class_info(n: int) -> Callable[[], object]:
+    from common import SDK_ROOT
+    from sep_analyzer import SEPAnalyzer
+    path = _work_file(f"models-{n}.dart", generators.dart_models(n))
+    analyzer = SEPAnalyzer(str(SDK_ROOT), "0010")
+    return lambda: analyzer.extract_class_info(path)
+
+
+def prepare_flutter_sdk(n: int) -> Callable[[], object]:
+    from sdk_analyzer import FlutterSDKAnalyzer
+    root = generators.write_sdk_tree(WORK_DIR / f"sdk-{n}", n)
+    return _quiet(lambda: FlutterSDKAnalyzer(str(root)).analyze())
+
+
+def prepare_strip_comments(n: int) -> Callable[[], object]:
+    from dart_source import strip_all_comments
+    content = generators.dart_models(n)
+    return lambda: strip_all_comments(content)
+
+
+def prepare_parse_dart_file(n: int) -> Callable[[], object]:
+    from dart_source import lex_file
+    from generate_api_reference import parse_dart_file
+    path = _work_file(f"models-{n}.dart", generators.dart_models(n))
+
+    def call() -> object:
+        lex_file.cache_clear()  # time the lexing, not the per-run cache
+        return parse_dart_file(path)
+    return call
+
+
+def prepare_corpus_entries(n: int) -> Callable[[], object]:
+    import generate_corpus
+    seeds = generators.corpus_seeds(n)
+
+    # The real build_entry, with the reference CLI round trip replaced by one
+    # that hands the seed's JSON back as the reference's answer.
+    def encode(cli: object, type_name: str, document: object) -> str:
+        return json.dumps(document, **generate_corpus.DUMP)
+
+    def decode(cli: object, type_name: str, text: str) -> str:
+        return text
+
+    def call() -> object:
+        saved = generate_corpus.encode, generate_corpus.decode
+        generate_corpus.encode, generate_corpus.decode = encode, decode
+        try:
+            entries = [generate_corpus.build_entry(None, seed) for seed in seeds]
+        finally:
+            generate_corpus.encode, generate_corpus.decode = saved
+        return json.dumps({"entries": entries}, **generate_corpus.DUMP)
+    return call
+
+
+BENCHMARKS = [
+    Benchmark("horizon_router", "HorizonRouterParser on N nested route blocks",
+              (25, 50, 100, 200), prepare_horizon_router),
+    Benchmark("sep_field_definitions", "SEPParser.extract_field_definitions on N sections",
+              (10, 20, 40, 80), prepare_sep_fields),
+    Benchmark("sep_class_info", "SEPAnalyzer.extract_class_info on N model classes",
+              (10, 20, 40, 80), prepare_sep_class_info),
+    Benchmark("flutter_sdk_analyzer", "FlutterSDKAnalyzer.analyze on N request builders",
+              (10, 20, 40, 80), prepare_flutter_sdk),
+    Benchmark("strip_all_comments", "strip_all_comments on N model classes",
+              (25, 50, 100, 200), prepare_strip_comments),
+    Benchmark("parse_dart_file", "parse_dart_file on N model classes",
+              (25, 50, 100, 200), prepare_parse_dart_file),
+    Benchmark("corpus_entries", "generate_corpus.build_entry on N seeds (reference CLI stubbed)",
+              (250, 500, 1000, 2000), prepare_corpus_entries),
+]
+
+
+def measure(fn: Callable[[], object]) -> float:
+    """Best per-call time in seconds over REPEATS timeit runs of at least 0.2s each."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEATS, number=number)) / number
+
+
+def scaling_exponent(times: dict[int, float]) -> float:
+    """Least-squares slope of log(time) over log(size)."""
+    points = [(math.log(n), math.log(t)) for n, t in times.items() if t > 0]
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var if var else 0.0
+
+
+def run(benchmarks: list[Benchmark], quick: bool) -> dict:
+    results = {}
+    for bench in benchmarks:
+        sizes = bench.sizes[:2] if quick else bench.sizes
+        times = {}
+        for n in sizes:
+            times[n] = measure(bench.prepare(n))
+            print(f"  {bench.name:<24} n={n:<6} {times[n] * 1000:10.3f} ms", file=sys.stderr)
+        results[bench.name] = {
+            "description": bench.description,
+            "seconds": {str(n): round(t, 9) for n, t in times.items()},
+            "exponent": round(scaling_exponent(times), 3),
+        }
+    return results
+
+
+def same_host(baseline: dict) -> bool:
+    """True when this machine recorded `baseline`, so its absolute times apply here."""
+    return baseline.get("host") == platform.node() and baseline.get("machine") == platform.machine()
+
+
+def compare(results: dict, baseline: dict, threshold: float, absolute: bool = True) -> list[str]:
+    """
+    Regressions of `results` against `baseline`, as report lines. With
+    absolute=False only the scaling exponents are judged.
+    """
+    problems = []
+    for name, current in results.items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if base is None:
+            continue
+        for size, seconds in current["seconds"].items() if absolute else ():
+            before = base["seconds"].get(size)
+            if before and seconds > before * threshold:
+                problems.append(f"{name} n={size}: {seconds * 1000:.3f} ms, "
+                                f"{seconds / before:.2f}x the baseline {before * 1000:.3f} ms")
+        # An exponent from only two quick sizes is too noisy to judge.
+        if len(current["seconds"]) == len(base["seconds"]) and \
+                current["exponent"] > base["exponent"] + EXPONENT_SLACK:
+            problems.append(f"{name}: scaling exponent {current['exponent']:.2f}, "
+                            f"baseline {base['exponent']:.2f}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        choices=[b.name for b in BENCHMARKS], help="run only these benchmarks")
+    parser.add_argument("--quick", action="store_true",
+                        help="run the two smallest sizes only (no exponent check)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="RATIO",
+                        help="slowdown against the baseline that counts as a regression "
+                             f"(default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH,
+                        help=f"baseline file (default: {BASELINE_PATH.relative_to(REPO_ROOT)})")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write this run's results as the new baseline")
+    parser.add_argument("--absolute", action="store_true",
+                        help="compare absolute times even when the baseline was recorded "
+                             "on another machine (default: only the scaling exponents then)")
+    args = parser.parse_args()
+
+    selected = [b for b in BENCHMARKS if not args.only or b.name in args.only]
+    results = run(selected, args.quick)
+    print(json.dumps(results, indent=2))
+
+    if args.update_baseline:
+        if args.quick:
+            parser.error("--update-baseline needs the full size range; drop --quick")
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        baseline["note"] = BASELINE_NOTE
+        baseline["python"] = platform.python_version()
+        baseline["machine"] = platform.machine()
+        baseline["host"] = platform.node()
+        baseline.setdefault("benchmarks", {}).update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n",
+                                 encoding="utf-8")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create it.",
+              file=sys.stderr)
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    absolute = args.absolute or same_host(baseline)
+    if not absolute:
+        print(f"Baseline recorded on {baseline.get('host')} ({baseline.get('machine')}); "
+              "comparing scaling exponents only (--absolute compares times too).",
+              file=sys.stderr)
+    problems = compare(results, baseline, args.threshold, absolute)
+    for line in problems:
+        print(f"REGRESSION: {line}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,17 +3,51 @@
 Shared utilities for the compatibility matrix generator.
 """
 
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
 import re
+import subprocess
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
 
 # Root directories resolved from this file's location
 TOOLS_DIR = Path(__file__).parent
 SDK_ROOT = TOOLS_DIR.parent.parent
 DATA_DIR = TOOLS_DIR / 'data'
 COMPATIBILITY_DIR = SDK_ROOT / 'compatibility'
+TRACES_DIR = DATA_DIR / 'traces'
+# Home of the shared Dart tooling modules (dart_source, dart_exports)
+SKILL_GENERATOR_DIR = SDK_ROOT / 'tools' / 'skill-generator'
+
+# How the intermediate JSON under data/ is written: 'pretty' (indented, the
+# default), 'compact' (minified) or 'gzip' (minified and gzip-compressed,
+# stored as <name>.json.gz). Readers accept all three.
+DATA_FORMATS = ('pretty', 'compact', 'gzip')
+GZIP_MAGIC = b'\x1f\x8b'
+_data_format = 'pretty'
+
+# In deterministic mode report and metadata timestamps come from the sources
+# (see source_timestamp()) instead of the clock, so an unchanged input gives
+# byte-identical output. SOURCE_DATE_EPOCH, the reproducible-builds
+# convention, turns it on as well.
+_deterministic = 'SOURCE_DATE_EPOCH' in os.environ
 
 
 class Colors:
@@ -52,26 +86,591 @@ def get_sdk_version() -> str:
     return 'Unknown'
 
 
+@lru_cache(maxsize=None)
+def export_graph(sdk_root: Path = SDK_ROOT):
+    """
+    The SDK's public-API resolver, shared with the API reference generator.
+
+    Answers "is this class public?" from the barrel's transitive export graph
+    (see tools/skill-generator/dart_exports.py). The resolved graph is cached on
+    disk and only re-walked when a file in it changes.
+
+    Args:
+        sdk_root: Flutter SDK root directory whose barrel to resolve.
+
+    Returns:
+        A dart_exports.ExportGraph for that SDK.
+    """
+    if str(SKILL_GENERATOR_DIR) not in sys.path:
+        sys.path.insert(0, str(SKILL_GENERATOR_DIR))
+    from dart_exports import BARREL_PATH, DEFAULT_CACHE_PATH, ExportGraph
+    barrel = (Path(sdk_root) / 'lib' / 'stellar_flutter_sdk.dart').resolve()
+    # Only this checkout's graph is persisted; resolving another tree (such as
+    # the benchmarks' synthetic SDKs) must not evict it from the cache.
+    cache_path = DEFAULT_CACHE_PATH if barrel == BARREL_PATH.resolve() else None
+    graph = ExportGraph(cache_path, barrel=barrel)
+    with trace_span('export_graph') as span:
+        span.add('files', len(graph.allowlist()))
+        span.add('cache_hits' if graph.reused else 'cache_misses')
+    return graph
+
+
+def add_data_format_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --data-format=pretty|compact|gzip option to an argument parser."""
+    parser.add_argument(
+        '--data-format',
+        choices=DATA_FORMATS,
+        default='pretty',
+        help='How to write the intermediate JSON under data/: pretty (indented), '
+             'compact (minified) or gzip (minified, *.json.gz). Default: pretty'
+    )
+
+
+def split_data_format_flag(argv: List[str]) -> Tuple[Optional[str], List[str]]:
+    """
+    Remove --data-format=FORMAT from an argument list.
+
+    For scripts that read sys.argv by position instead of using argparse.
+
+    Returns:
+        Tuple of (format or None, remaining arguments)
+    """
+    fmt = None
+    rest = []
+    for arg in argv:
+        if arg.startswith('--data-format='):
+            fmt = arg.split('=', 1)[1]
+            if fmt not in DATA_FORMATS:
+                raise SystemExit(f"--data-format: expected one of {', '.join(DATA_FORMATS)}, got {fmt!r}")
+        else:
+            rest.append(arg)
+    return fmt, rest
+
+
+def set_data_format(fmt: Optional[str]) -> None:
+    """Make `fmt` the format write_data() uses by default in this process."""
+    global _data_format
+    if fmt is not None:
+        _data_format = fmt
+
+
+def add_deterministic_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --deterministic option to an argument parser."""
+    parser.add_argument(
+        '--deterministic',
+        action='store_true',
+        help='Stamp reports and data with the date of the last SDK commit (or '
+             'SOURCE_DATE_EPOCH) instead of the current time, so unchanged inputs '
+             'leave every output file untouched'
+    )
+
+
+def split_deterministic_flag(argv: List[str]) -> Tuple[bool, List[str]]:
+    """
+    Remove --deterministic from an argument list.
+
+    For scripts that read sys.argv by position instead of using argparse.
+
+    Returns:
+        Tuple of (whether the flag was given, remaining arguments)
+    """
+    rest = [arg for arg in argv if arg != '--deterministic']
+    return len(rest) != len(argv), rest
+
+
+def set_deterministic(enabled: bool) -> None:
+    """Turn deterministic mode on for this process if `enabled`."""
+    global _deterministic
+    _deterministic = _deterministic or enabled
+
+
+def is_deterministic() -> bool:
+    """Whether this process runs in deterministic mode."""
+    return _deterministic
+
+
+@lru_cache(maxsize=None)
+def source_timestamp() -> Optional[datetime]:
+    """
+    The time the analyzed sources last changed, as naive UTC.
+
+    SOURCE_DATE_EPOCH if it is set, else the commit date of the last commit
+    touching the SDK's lib/ or pubspec.yaml.
+
+    Returns:
+        The timestamp, or None outside a git checkout
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if not epoch:
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(SDK_ROOT), 'log', '-1', '--format=%ct', '--', 'lib', 'pubspec.yaml'],
+                capture_output=True, text=True, timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        epoch = result.stdout.strip() if result.returncode == 0 else ''
+    if not epoch.isdigit():
+        return None
+    return datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None)
+
+
+def report_timestamp() -> datetime:
+    """
+    The time to stamp into reports and data files.
+
+    The current time, or in deterministic mode the sources' timestamp (the
+    current time only if there is none).
+    """
+    if _deterministic:
+        return source_timestamp() or datetime.now()
+    return datetime.now()
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Mode for files written through a temporary file: what open() would have given
+# them. mkstemp() creates files 0600; read once here, because os.umask() can
+# only be read by setting it, which is not safe once writer threads run.
+_FILE_MODE = 0o666 & ~_umask()
+
+
+def write_if_changed(path: Union[str, Path], content: Union[str, bytes]) -> bool:
+    """
+    Write `content` to `path` atomically, unless the file already holds it.
+
+    The comparison is by SHA-256, so an unchanged file keeps its mtime and
+    downstream steps (git diff, doc builds, caches) can skip it.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = Path(path)
+    payload = content.encode('utf-8') if isinstance(content, str) else content
+    if path.exists():
+        current = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                current.update(chunk)
+        if current.digest() == hashlib.sha256(payload).digest():
+            return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp, _FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+@contextmanager
+def report_file(path: Union[str, Path]) -> Iterator[IO[str]]:
+    """
+    A text stream for rendering a report; the report is written to `path`
+    with write_if_changed() when the block ends without an error.
+    """
+    buffer = io.StringIO()
+    yield buffer
+    write_if_changed(path, buffer.getvalue())
+
+
+def add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --data-format and --deterministic, which control how outputs are written."""
+    add_data_format_argument(parser)
+    add_deterministic_argument(parser)
+
+
+def apply_output_arguments(args: argparse.Namespace) -> None:
+    """Apply the options added by add_output_arguments() to this process."""
+    set_data_format(args.data_format)
+    set_deterministic(args.deterministic)
+
+
+def split_output_flags(argv: List[str]) -> List[str]:
+    """
+    Remove --data-format and --deterministic from an argument list and apply them.
+
+    For scripts that read sys.argv by position instead of using argparse.
+
+    Returns:
+        The remaining arguments
+    """
+    fmt, argv = split_data_format_flag(argv)
+    deterministic, argv = split_deterministic_flag(argv)
+    set_data_format(fmt)
+    set_deterministic(deterministic)
+    return argv
+
+
+def _gzip_path(path: Path) -> Path:
+    return path.with_name(path.name + '.gz')
+
+
+def find_data(path: Union[str, Path]) -> Optional[Path]:
+    """
+    The file on disk holding the data file `path` names, in whatever format.
+
+    A gzip-format file lives next to the plain name as <name>.gz. If both
+    exist, the newer one wins.
+
+    Returns:
+        The existing file, or None if there is none
+    """
+    path = Path(path)
+    candidates = [p for p in (path, _gzip_path(path)) if p.exists()]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime_ns)
+
+
+def open_data(path: Union[str, Path]) -> IO[str]:
+    """
+    Open a data file for reading as text, decompressing it if it is gzipped.
+
+    The format is detected from the file's first bytes, not its name.
+
+    Raises:
+        FileNotFoundError: If no variant of the file exists
+    """
+    found = find_data(path)
+    if found is None:
+        raise FileNotFoundError(f'Data file not found: {path}')
+    with open(found, 'rb') as f:
+        magic = f.read(len(GZIP_MAGIC))
+    if magic == GZIP_MAGIC:
+        return gzip.open(found, 'rt', encoding='utf-8')
+    return open(found, 'r', encoding='utf-8')
+
+
+def read_data(path: Union[str, Path]) -> Any:
+    """
+    Load a data file written by write_data(), in any of its formats.
+
+    The JSON is decoded straight from the (decompressing) file stream, so a
+    gzipped file is never held in memory in both forms.
+    """
+    with open_data(path) as f:
+        return json.load(f)
+
+
+def write_data(path: Union[str, Path], data: Any, fmt: Optional[str] = None) -> Path:
+    """
+    Write `data` as JSON to the data file `path`, atomically, so a reader
+    never sees a half-written file, and only if its content changed.
+
+    In gzip format the file is <path>.gz. The variant in the other format,
+    if any, is removed so readers never pick up stale data.
+
+    Args:
+        path: The data file's plain (.json) name
+        data: JSON-serializable data
+        fmt: One of DATA_FORMATS. None = the process default (set_data_format())
+
+    Returns:
+        The data file's path on disk
+    """
+    fmt = fmt or _data_format
+    path = Path(path)
+    target, stale = (_gzip_path(path), path) if fmt == 'gzip' else (path, _gzip_path(path))
+    if fmt == 'pretty':
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    payload = text.encode('utf-8')
+    if fmt == 'gzip':
+        # mtime=0 keeps the compressed bytes a function of the content alone
+        payload = gzip.compress(payload, mtime=0)
+    write_if_changed(target, payload)
+    if stale.exists():
+        stale.unlink()
+    return target
+
+
+def load_stage_data(source: Union[str, Path, Dict[str, Any], Any]) -> Dict[str, Any]:
+    """
+    The output of a pipeline stage, however it was handed over.
+
+    Args:
+        source: The stage's result dict, the parser or analyzer object itself
+            (anything with to_json()), or the path of the data file it wrote
+            (in any format, see read_data()).
+
+    Returns:
+        The stage's data as a dict.
+    """
+    if isinstance(source, dict):
+        return source
+    if hasattr(source, 'to_json'):
+        return source.to_json()
+    return read_data(source)
+
+
+class JSONWriter:
+    """
+    The single writer of a pipeline run's intermediate JSON files.
+
+    Stages pass their results to each other in memory; the files under data/
+    are written once, here, for debugging and for the stand-alone scripts.
+    With background=True the writes run on one worker thread, in order, while
+    the next stage computes. Data handed to write() must not be modified
+    afterwards.
+    """
+
+    def __init__(self, background: bool = False, fmt: Optional[str] = None):
+        """
+        Args:
+            background: Write on a worker thread instead of in write()
+            fmt: One of DATA_FORMATS. None = the process default
+        """
+        self.fmt = fmt
+        self._executor = (ThreadPoolExecutor(max_workers=1, thread_name_prefix='json-writer')
+                          if background else None)
+        self._pending: List[Future] = []
+
+    def write(self, path: Union[str, Path], data: Any) -> None:
+        """Write `data` as JSON to `path`, now or on the worker thread."""
+        if self._executor is None:
+            write_data(path, data, self.fmt)
+        else:
+            self._pending.append(self._executor.submit(write_data, path, data, self.fmt))
+
+    def close(self, raise_errors: bool = True) -> None:
+        """Wait for outstanding writes; re-raise the first failure unless told not to."""
+        pending, self._pending = self._pending, []
+        errors = [f.exception() for f in pending if f.exception() is not None]
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if errors and raise_errors:
+            raise errors[0]
+
+
+def _process_peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of the whole process so far in KiB, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class Span:
+    """
+    One timed region of a run. Counters added while it is open (bytes read,
+    cache hits, ...) are reported as the span's arguments in the trace, next
+    to process_peak_rss_kb: the process's peak RSS so far when the span closed,
+    which is a high-water mark for the whole process, not the span's own use.
+    """
+
+    def __init__(self, name: str, args: Dict[str, Any]):
+        self.name = name
+        self.args = dict(args)
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    def add(self, counter: str, amount: int = 1) -> None:
+        """Add `amount` to a counter, e.g. span.add('bytes_read', len(data))."""
+        self.args[counter] = self.args.get(counter, 0) + amount
+
+    def set(self, key: str, value: Any) -> None:
+        """Record a plain value on the span."""
+        self.args[key] = value
+
+
+class _NullSpan(Span):
+    """Returned by trace_span() when no tracker is active; records nothing."""
+
+    def __init__(self):
+        super().__init__('', {})
+
+    def add(self, counter: str, amount: int = 1) -> None:
+        pass
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+# The tracker whose spans trace_span() records into, if any
+_ACTIVE_TRACKER: Optional['ProgressTracker'] = None
+
+
+@contextmanager
+def trace_span(name: str, **args: Any) -> Iterator[Span]:
+    """
+    Open a span on the active ProgressTracker, or do nothing if there is none.
+
+    Lets library code (parsers, analyzers) mark its phases without being handed
+    a tracker: `with trace_span('parse_sep_06.tables') as span: ...`.
+    """
+    if _ACTIVE_TRACKER is None:
+        yield _NullSpan()
+        return
+    with _ACTIVE_TRACKER.span(name, **args) as span:
+        yield span
+
+
+def split_trace_flag(argv: List[str]) -> Tuple[Optional[str], List[str]]:
+    """
+    Remove --trace=PATH from an argument list.
+
+    For scripts that read sys.argv by position instead of using argparse.
+
+    Returns:
+        Tuple of (trace path or None, remaining arguments)
+    """
+    path = None
+    rest = []
+    for arg in argv:
+        if arg.startswith('--trace='):
+            path = arg.split('=', 1)[1]
+        else:
+            rest.append(arg)
+    return path, rest
+
+
+@contextmanager
+def traced(label: str, path: Optional[Union[str, Path]] = None) -> Iterator['ProgressTracker']:
+    """
+    Trace a script run that has no ProgressTracker of its own.
+
+    Everything inside records into a fresh tracker under one span named
+    `label`, so the script's trace_span() calls are kept; the trace is written
+    when the block exits, also on failure.
+
+    Args:
+        label: Name of the run's top-level span and of the default trace file
+        path: Trace file. None = data/traces/<label>-<timestamp>.json
+    """
+    with ProgressTracker(total_steps=0) as tracker:
+        try:
+            with tracker.span(label):
+                yield tracker
+        finally:
+            tracker.write_trace(Path(path) if path else None, label=label)
+
+
 class ProgressTracker:
-    """Track and display progress of pipeline steps."""
+    """
+    Track and display progress of pipeline steps.
+
+    Besides the printed step progress, the tracker records nestable spans
+    (`with tracker.span('name'):`) with their start and end time, any counters
+    added to them and the process's peak RSS when they close. Every step is a
+    span too. write_trace() saves the spans as Chrome trace-event JSON, which
+    chrome://tracing and ui.perfetto.dev open directly.
+
+    A new tracker becomes the one trace_span() records into until close() is
+    called, which `with ProgressTracker() as tracker:` does on exit.
+    """
 
     def __init__(self, total_steps: int = 4, verbose: bool = False):
+        global _ACTIVE_TRACKER
         self.verbose = verbose
         self.step = 0
         self.total_steps = total_steps
         self.start_time = time.time()
         self.step_times: Dict[int, float] = {}
+        self.origin = time.perf_counter()
+        self.events: List[Dict[str, Any]] = []
+        self._stack: List[Span] = []
+        self._step_span: Optional[Span] = None
+        _ACTIVE_TRACKER = self
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Span]:
+        """Time a region of the run; spans opened inside it nest under it."""
+        span = self._open(name, args)
+        try:
+            yield span
+        finally:
+            self._close(span)
+
+    def _open(self, name: str, args: Dict[str, Any]) -> Span:
+        span = Span(name, args)
+        self._stack.append(span)
+        return span
+
+    def _close(self, span: Span) -> None:
+        span.end = time.perf_counter()
+        if span in self._stack:
+            self._stack.remove(span)
+        peak = _process_peak_rss_kb()
+        if peak is not None:
+            span.args['process_peak_rss_kb'] = peak
+        self.events.append({
+            'name': span.name,
+            'cat': span.name.split('.', 1)[0],
+            'ph': 'X',
+            'ts': round((span.start - self.origin) * 1e6, 1),
+            'dur': round((span.end - span.start) * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': span.args,
+        })
+
+    def close(self) -> None:
+        """Close an open step and stop trace_span() from recording into this tracker."""
+        global _ACTIVE_TRACKER
+        if self._step_span is not None:
+            self._close(self._step_span)
+            self._step_span = None
+        if _ACTIVE_TRACKER is self:
+            _ACTIVE_TRACKER = None
+
+    def __enter__(self) -> 'ProgressTracker':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def write_trace(self, path: Optional[Path] = None, label: str = 'run') -> Path:
+        """
+        Write the recorded spans as Chrome trace-event JSON.
+
+        Args:
+            path: Output file. Default: data/traces/<label>-<timestamp>.json
+            label: Run name used in the default file name.
+
+        Returns:
+            The path written.
+        """
+        if path is None:
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            path = TRACES_DIR / f'{label}-{stamp}.json'
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        events = sorted(self.events, key=lambda e: (e['ts'], -e['dur']))
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, indent=1)
+        return path
 
     def start_step(self, description: str) -> None:
         """Start a new step and print progress."""
+        if self._step_span is not None:
+            self._close(self._step_span)
         self.step += 1
         self.step_times[self.step] = time.time()
+        self._step_span = self._open(f"step{self.step}.{description}", {})
         print()
         print(f"Step {self.step}/{self.total_steps}: {description}")
         print("-" * 60)
 
     def finish_step(self, message: str = "") -> None:
         """Finish current step and print timing."""
+        if self._step_span is not None:
+            if message:
+                self._step_span.set('result', message)
+            self._close(self._step_span)
+            self._step_span = None
         if self.step in self.step_times:
             elapsed = time.time() - self.step_times[self.step]
             if message:
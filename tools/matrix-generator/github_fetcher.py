@@ -34,8 +34,14 @@ Example usage:
     print(f"Latest RPC version: {rpc_release.version}")
     jsonrpc_source = fetch_rpc_jsonrpc_source("v21.5.0")
     rpc_release, jsonrpc_source = fetch_latest_rpc_source()
+
+    # Any file pinned to a commit
+    commit = resolve_ref('stellar/stellar-protocol', 'master')
+    blobs = list_directory('stellar/stellar-protocol', commit, 'ecosystem')
+    spec = fetch_file('stellar/stellar-protocol', commit, 'ecosystem/sep-0010.md')
 """
 
+import hashlib
 import json
 import os
 import re
@@ -567,6 +573,85 @@ def _camel_to_snake(name: str) -> str:
     return ''.join(result)
 
 
+def resolve_ref(repo: str, ref: str) -> str:
+    """
+    Resolve a branch, tag or commit of a repository to its commit SHA.
+
+    Args:
+        repo: Repository as 'owner/name' (e.g. 'stellar/stellar-protocol')
+        ref: Branch, tag or commit (e.g. 'master')
+
+    Returns:
+        The full 40-character commit SHA
+
+    Raises:
+        GitHubFetchError: If the request fails or does not return a SHA
+    """
+    api_url = f'https://api.github.com/repos/{repo}/commits/{ref}'
+    # This media type makes the API answer with the bare SHA
+    sha = _make_request(api_url, {'Accept': 'application/vnd.github.sha'}).decode('utf-8').strip()
+    if not re.fullmatch(r'[0-9a-f]{40}', sha):
+        raise GitHubFetchError(f"Unexpected response resolving {repo}@{ref}: {sha[:80]!r}")
+    return sha
+
+
+def list_directory(repo: str, commit: str, path: str) -> Dict[str, str]:
+    """
+    List the files in a repository directory at a commit.
+
+    Args:
+        repo: Repository as 'owner/name'
+        commit: Commit SHA (or any ref)
+        path: Directory path within the repository (e.g. 'ecosystem')
+
+    Returns:
+        Dictionary mapping file name -> git blob SHA of its content
+
+    Raises:
+        GitHubFetchError: If the request fails or `path` is not a directory
+    """
+    api_url = f'https://api.github.com/repos/{repo}/contents/{path}?ref={commit}'
+    try:
+        entries = json.loads(_make_request(api_url).decode('utf-8'))
+    except json.JSONDecodeError as e:
+        raise GitHubFetchError(
+            f"Invalid JSON response from GitHub API: {e}"
+        ) from e
+
+    if not isinstance(entries, list):
+        raise GitHubFetchError(f"{repo}/{path}@{commit} is not a directory")
+    return {entry['name']: entry['sha'] for entry in entries if entry.get('type') == 'file'}
+
+
+def fetch_file(repo: str, commit: str, path: str) -> bytes:
+    """
+    Fetch the raw content of a repository file at a commit.
+
+    Args:
+        repo: Repository as 'owner/name'
+        commit: Commit SHA (or any ref)
+        path: File path within the repository
+
+    Returns:
+        The file's bytes
+
+    Raises:
+        SourceFileNotFoundError: If the file cannot be fetched
+    """
+    source_url = f"https://raw.githubusercontent.com/{repo}/{commit}/{path}"
+    try:
+        return _make_request(source_url)
+    except GitHubFetchError as e:
+        raise SourceFileNotFoundError(
+            f"Failed to fetch {path} from {repo}@{commit}: {e}"
+        ) from e
+
+
+def git_blob_sha(content: bytes) -> str:
+    """The SHA git (and the GitHub contents API) gives a file with this content."""
+    return hashlib.sha1(b'blob %d\0' % len(content) + content).hexdigest()
+
+
 def main() -> None:
     """
     Main function for standalone testing.
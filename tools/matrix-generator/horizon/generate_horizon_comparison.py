@@ -9,15 +9,20 @@ Author: Stellar Flutter SDK Team
 License: Apache-2.0
 """
 
-import json
 import sys
 import traceback
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Set, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
+# Add parent dir to path for shared modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common import (
+    JSONWriter, find_data, load_stage_data, report_file, report_timestamp, split_output_flags
+)
+
 
 class CompatibilityStatus(Enum):
     """Compatibility status indicators"""
@@ -50,32 +55,37 @@ class EndpointComparison:
 class HorizonSDKComparator:
     """Main class for comparing Horizon API with Flutter SDK implementation"""
 
-    def __init__(self, horizon_data_path: str, sdk_data_path: str):
+    def __init__(self, horizon_data: Union[str, Path, Dict[str, Any], Any],
+                 sdk_data: Union[str, Path, Dict[str, Any], Any]):
         """
-        Initialize the comparator with data file paths.
+        Initialize the comparator with the two stages' results.
+
+        Each argument is a path to the stage's JSON file, its data as a dict,
+        or the stage object itself (HorizonRouterParser, FlutterSDKAnalyzer),
+        so a pipeline can hand results over without a round trip through disk.
 
         Args:
-            horizon_data_path: Path to horizon_endpoints.json
-            sdk_data_path: Path to flutter_sdk_implementation.json
+            horizon_data: horizon_endpoints.json, or its data or parser
+            sdk_data: flutter_sdk_implementation.json, or its data or analyzer
         """
-        self.horizon_data_path = Path(horizon_data_path)
-        self.sdk_data_path = Path(sdk_data_path)
+        self.horizon_source = horizon_data
+        self.sdk_source = sdk_data
         self.horizon_data: Dict[str, Any] = {}
         self.sdk_data: Dict[str, Any] = {}
         self.comparisons: List[EndpointComparison] = []
         self.horizon_version: str = "Unknown"
         self.horizon_release_date: str = "Unknown"
         self.horizon_release_url: str = ""
+        # Request builders the package barrel does not export
+        self.unexported_builders: Set[str] = set()
 
     def load_data(self) -> None:
-        """Load JSON data from both files and extract version information"""
+        """Load both stages' data (from memory or file) and extract version information"""
         print("Loading Horizon API endpoints data...")
-        with open(self.horizon_data_path, 'r', encoding='utf-8') as f:
-            self.horizon_data = json.load(f)
+        self.horizon_data = load_stage_data(self.horizon_source)
 
         print("Loading Flutter SDK implementation data...")
-        with open(self.sdk_data_path, 'r', encoding='utf-8') as f:
-            self.sdk_data = json.load(f)
+        self.sdk_data = load_stage_data(self.sdk_source)
 
         # Extract Horizon version information from metadata
         metadata = self.horizon_data.get('metadata', {})
@@ -87,6 +97,13 @@ class HorizonSDKComparator:
         print(f"Horizon version: {self.horizon_version}")
         print(f"Loaded {self.sdk_data['metadata']['total_request_builders']} SDK request builders")
 
+        self.unexported_builders = {
+            builder['class_name'] for builder in self.sdk_data.get('request_builders', [])
+            if not builder.get('exported', True)
+        }
+        if self.unexported_builders:
+            print(f"Not exported by the package barrel: {', '.join(sorted(self.unexported_builders))}")
+
     def normalize_endpoint_path(self, path: str) -> str:
         """
         Normalize endpoint path for comparison.
@@ -172,6 +189,11 @@ class HorizonSDKComparator:
                         result['sdk_method'] = alt_sdk_method  # Use the explicit SDK method override
                         result['streaming'] = alt_impl.get('streaming', result['streaming'])
 
+            # A builder users cannot import does not make the endpoint available
+            if result['class'] in self.unexported_builders:
+                result['implemented'] = False
+                result['notes'] = f"{result['class']} is not exported by the package barrel"
+
             return True, result
 
         return False, {}
@@ -569,7 +591,7 @@ class HorizonSDKComparator:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with report_file(output_file) as f:
             # Header
             f.write("# Horizon API vs Flutter SDK Compatibility Matrix\n\n")
 
@@ -582,7 +604,7 @@ class HorizonSDKComparator:
             if self.horizon_release_url:
                 f.write(f"**Horizon Source:** [{self.horizon_version}]({self.horizon_release_url})  \n")
             f.write(f"**SDK Version:** {self.sdk_data['metadata']['sdk_version']}  \n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"**Generated:** {report_timestamp().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
             # Get overall stats first
             overall = stats['overall']
@@ -691,8 +713,17 @@ class HorizonSDKComparator:
 
         print(f"✓ Markdown report written to {output_path}")
 
-    def generate_comparison_report(self, output_path: str) -> None:
-        """Generate detailed comparison JSON report"""
+    def generate_comparison_report(self, output_path: str, writer: Optional[JSONWriter] = None) -> Dict[str, Any]:
+        """
+        Generate detailed comparison JSON report
+
+        Args:
+            output_path: Where the report is written
+            writer: Writer to hand the file to. None = write it now
+
+        Returns:
+            The report data
+        """
         print(f"\nGenerating comparison report: {output_path}")
 
         stats = self.calculate_statistics()
@@ -705,7 +736,7 @@ class HorizonSDKComparator:
                 'horizon_release_url': self.horizon_release_url,
                 'horizon_endpoints': self.horizon_data['metadata']['total_endpoints'],
                 'sdk_request_builders': self.sdk_data['metadata']['total_request_builders'],
-                'comparison_date': datetime.now().isoformat(),
+                'comparison_date': report_timestamp().isoformat(),
                 'horizon_source': self.horizon_data['metadata']['source'],
                 'sdk_version': self.sdk_data['metadata']['sdk_version'],
                 'coverage_percentage': stats['overall']['coverage_percentage']
@@ -725,13 +756,10 @@ class HorizonSDKComparator:
             'gaps': gaps
         }
 
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        (writer or JSONWriter()).write(output_path, report)
 
         print(f"✓ Comparison report written to {output_path}")
+        return report
 
     def generate_gaps_analysis(self) -> Dict[str, Any]:
         """Generate detailed gap analysis"""
@@ -769,14 +797,23 @@ class HorizonSDKComparator:
             'missing_features': missing_features
         }
 
-    def generate_statistics_report(self, output_path: str) -> None:
-        """Generate statistics JSON report"""
+    def generate_statistics_report(self, output_path: str, writer: Optional[JSONWriter] = None) -> Dict[str, Any]:
+        """
+        Generate statistics JSON report
+
+        Args:
+            output_path: Where the report is written
+            writer: Writer to hand the file to. None = write it now
+
+        Returns:
+            The report data
+        """
         print(f"\nGenerating statistics report: {output_path}")
 
         stats = self.calculate_statistics()
 
         report = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': report_timestamp().isoformat(),
             'horizon_version': self.horizon_version,
             'horizon_release_date': self.horizon_release_date,
             'horizon_release_url': self.horizon_release_url,
@@ -788,13 +825,10 @@ class HorizonSDKComparator:
             'gaps_summary': stats['gaps_summary']
         }
 
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        (writer or JSONWriter()).write(output_path, report)
 
         print(f"✓ Statistics report written to {output_path}")
+        return report
 
     def print_summary(self) -> None:
         """Print a summary of the comparison results to console"""
@@ -857,12 +891,12 @@ def main():
     markdown_output_path = compatibility_dir / 'horizon' / 'HORIZON_COMPATIBILITY_MATRIX.md'
 
     # Verify input files exist
-    if not horizon_data_path.exists():
+    if not find_data(horizon_data_path):
         print(f"ERROR: Horizon endpoints file not found: {horizon_data_path}")
         print("Please run horizon_parser.py first.")
         return 1
 
-    if not sdk_data_path.exists():
+    if not find_data(sdk_data_path):
         print(f"ERROR: SDK implementation file not found: {sdk_data_path}")
         print("Please run sdk_analyzer.py first.")
         return 1
@@ -903,4 +937,5 @@ def main():
 
 
 if __name__ == '__main__':
+    sys.argv[1:] = split_output_flags(sys.argv[1:])
     sys.exit(main())
@@ -13,17 +13,17 @@ License: Apache-2.0
 """
 
 import argparse
-import json
 import re
 import sys
 import traceback
-from datetime import datetime
 from pathlib import Path
 
 # Add parent dir to path for shared modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from typing import Dict, List, Set, Tuple, Optional
 
+from common import add_output_arguments, apply_output_arguments, report_timestamp, write_data
+
 
 class HorizonEndpoint:
     """Represents a single Horizon API endpoint"""
@@ -595,7 +595,7 @@ class HorizonRouterParser:
         """Convert parsed data to JSON structure"""
         metadata = {
             "source": str(self.router_path) if self.router_path else "GitHub",
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": report_timestamp().isoformat(),
             "total_endpoints": len(self.endpoints),
             "total_categories": len(self.categories)
         }
@@ -622,16 +622,10 @@ class HorizonRouterParser:
         }
 
     def save_json(self, output_path: str) -> None:
-        """Save parsed data to JSON file"""
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        data = self.to_json()
+        """Save parsed data to JSON file, in the run's data format"""
+        output_file = write_data(output_path, self.to_json())
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        print(f"Saved endpoint data to: {output_path}")
+        print(f"Saved endpoint data to: {output_file}")
 
 
 def parse_from_local(router_path: Path, output_path: Path) -> int:
@@ -712,7 +706,10 @@ Examples:
         help='Path to output JSON file'
     )
 
+    add_output_arguments(parser)
+
     args = parser.parse_args()
+    apply_output_arguments(args)
 
     print("=" * 70)
     print("Horizon API Endpoint Parser")
@@ -24,12 +24,17 @@ Usage:
 
     # Verbose output
     python run_horizon_analysis.py --verbose
+
+    # Write the data/ JSON files on a background thread
+    python run_horizon_analysis.py --background-writes
+
+    # Write the data/ JSON files gzip-compressed
+    python run_horizon_analysis.py --data-format=gzip
 """
 
 import argparse
 import sys
 import traceback
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -37,7 +42,11 @@ from typing import Dict, Any, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from common import ProgressTracker
+    from common import (
+        JSONWriter, ProgressTracker, add_output_arguments, apply_output_arguments, find_data,
+        report_timestamp
+    )
+    from profiling import add_profile_argument, profiled
     from github_fetcher import (
         get_latest_release,
         fetch_router_source,
@@ -62,7 +71,9 @@ class HorizonAnalysisPipeline:
         self,
         horizon_version: Optional[str] = None,
         local_router_path: Optional[str] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        trace_path: Optional[str] = None,
+        background_writes: bool = False
     ):
         """
         Initialize the pipeline.
@@ -71,11 +82,16 @@ class HorizonAnalysisPipeline:
             horizon_version: Specific Horizon version tag (e.g., 'v2.30.0'). None = latest
             local_router_path: Path to local router.go file. None = fetch from GitHub
             verbose: Enable verbose output
+            trace_path: Where to write the run's trace. None = data/traces/horizon-<timestamp>.json
+            background_writes: Write the data/ JSON files on a worker thread
+                while the next step runs
         """
         self.horizon_version = horizon_version
         self.local_router_path = local_router_path
         self.verbose = verbose
         self.progress = ProgressTracker(verbose=verbose)
+        self.trace_path = Path(trace_path) if trace_path else None
+        self.writer = JSONWriter(background=background_writes)
 
         # Define paths
         self.project_root = Path(__file__).parent.parent.parent.parent
@@ -96,6 +112,12 @@ class HorizonAnalysisPipeline:
         self.release_info: Optional[Dict[str, Any]] = None
         self.router_source: Optional[str] = None
 
+        # Step results, handed to the next step in memory. The JSON files
+        # above are written from these and never read back.
+        self.horizon_data: Optional[Dict[str, Any]] = None
+        self.sdk_data: Optional[Dict[str, Any]] = None
+        self.statistics: Optional[Dict[str, Any]] = None
+
     def run(self) -> int:
         """
         Execute the complete analysis pipeline.
@@ -119,6 +141,10 @@ class HorizonAnalysisPipeline:
             # Step 4: Generate comparison reports
             self.generate_comparison_reports()
 
+            # Wait for the JSON files still being written
+            with self.progress.span('write.flush'):
+                self.writer.close()
+
             # Print summary
             stats = self.collect_statistics()
             self.progress.print_summary(stats)
@@ -134,6 +160,12 @@ class HorizonAnalysisPipeline:
                 traceback.print_exc()
             return 1
 
+        finally:
+            self.writer.close(raise_errors=False)
+            self.progress.close()
+            trace_file = self.progress.write_trace(self.trace_path, label='horizon')
+            self.progress.log(f"Trace written to {trace_file}")
+
     def fetch_horizon_release(self) -> None:
         """Step 1: Fetch Horizon release information and source code"""
         self.progress.start_step("Fetching Horizon Release")
@@ -145,12 +177,14 @@ class HorizonAnalysisPipeline:
                 raise FileNotFoundError(f"Local router.go not found: {local_path}")
 
             self.progress.log(f"Using local file: {local_path}", force=True)
-            self.router_source = local_path.read_text(encoding='utf-8')
+            with self.progress.span('fetch.router_go', source='local') as span:
+                self.router_source = local_path.read_text(encoding='utf-8')
+                span.add('bytes_read', len(self.router_source))
 
             # Create minimal release info for local mode
             self.release_info = {
                 'version': 'local',
-                'published_at': datetime.now().strftime('%Y-%m-%d'),
+                'published_at': report_timestamp().strftime('%Y-%m-%d'),
                 'html_url': str(local_path),
                 'source': 'local'
             }
@@ -170,7 +204,9 @@ class HorizonAnalysisPipeline:
                 if self.horizon_version:
                     # Use specific version
                     self.progress.log(f"Fetching Horizon version: {self.horizon_version}", force=True)
-                    self.router_source = fetch_router_source(self.horizon_version)
+                    with self.progress.span('fetch.router_go', source='GitHub') as span:
+                        self.router_source = fetch_router_source(self.horizon_version)
+                        span.add('bytes_read', len(self.router_source))
                     self.release_info = {
                         'version': self.horizon_version,
                         'published_at': 'unknown',
@@ -180,8 +216,11 @@ class HorizonAnalysisPipeline:
                 else:
                     # Fetch latest release
                     self.progress.log("Fetching latest Horizon release...", force=True)
-                    release = get_latest_release()
-                    self.router_source = fetch_router_source(release.version)
+                    with self.progress.span('fetch.release_info'):
+                        release = get_latest_release()
+                    with self.progress.span('fetch.router_go', source='GitHub') as span:
+                        self.router_source = fetch_router_source(release.version)
+                        span.add('bytes_read', len(self.router_source))
                     self.release_info = {
                         'version': release.version,
                         'published_at': release.published_at.strftime('%Y-%m-%d'),
@@ -213,10 +252,14 @@ class HorizonAnalysisPipeline:
 
         # Parse router source
         parser = HorizonRouterParser(version_info=version_info)
-        parser.parse_from_content(self.router_source)
+        with self.progress.span('parse.router_go') as span:
+            parser.parse_from_content(self.router_source)
+            span.set('endpoints', len(parser.endpoints))
 
-        # Save results
-        parser.save_json(str(self.horizon_endpoints_file))
+        # Keep the results for step 4 and save them
+        self.horizon_data = parser.to_json()
+        with self.progress.span('write.horizon_endpoints'):
+            self.writer.write(self.horizon_endpoints_file, self.horizon_data)
 
         endpoints_count = len(parser.endpoints)
         categories_count = len(parser.categories)
@@ -230,10 +273,14 @@ class HorizonAnalysisPipeline:
 
         # Analyze SDK
         analyzer = FlutterSDKAnalyzer(str(self.project_root))
-        analyzer.analyze()
+        with self.progress.span('analyze.flutter_sdk') as span:
+            analyzer.analyze()
+            span.set('builders', len(analyzer.builders))
 
-        # Save results
-        analyzer.save_json(str(self.sdk_implementation_file))
+        # Keep the results for step 4 and save them
+        self.sdk_data = analyzer.to_json()
+        with self.progress.span('write.sdk_implementation'):
+            self.writer.write(self.sdk_implementation_file, self.sdk_data)
 
         from common import get_sdk_version
         sdk_version = get_sdk_version()
@@ -248,11 +295,8 @@ class HorizonAnalysisPipeline:
         """Step 4: Generate compatibility comparison reports"""
         self.progress.start_step("Generating Compatibility Reports")
 
-        # Create comparator
-        comparator = HorizonSDKComparator(
-            str(self.horizon_endpoints_file),
-            str(self.sdk_implementation_file)
-        )
+        # Create comparator on the results of steps 2 and 3
+        comparator = HorizonSDKComparator(self.horizon_data, self.sdk_data)
 
         # Load data
         comparator.load_data()
@@ -262,10 +306,12 @@ class HorizonAnalysisPipeline:
 
         # Generate all reports
         self.progress.log("Generating comparison JSON...", force=False)
-        comparator.generate_comparison_report(str(self.comparison_file))
+        with self.progress.span('write.comparison'):
+            comparator.generate_comparison_report(str(self.comparison_file), self.writer)
 
         self.progress.log("Generating statistics JSON...", force=False)
-        comparator.generate_statistics_report(str(self.statistics_file))
+        with self.progress.span('write.statistics'):
+            self.statistics = comparator.generate_statistics_report(str(self.statistics_file), self.writer)
 
         self.progress.log("Generating markdown matrix...", force=False)
         comparator.generate_markdown_report(str(self.markdown_file))
@@ -281,20 +327,16 @@ class HorizonAnalysisPipeline:
 
     def collect_statistics(self) -> Dict[str, Any]:
         """Collect final statistics for summary"""
-        import json
+        stats = self.statistics
 
-        # Load statistics file
-        with open(self.statistics_file, 'r', encoding='utf-8') as f:
-            stats = json.load(f)
-
-        # Collect file paths relative to project root
+        # Collect file paths relative to project root (a data file's name
+        # depends on the data format it was written in)
+        data_files = [self.horizon_endpoints_file, self.sdk_implementation_file,
+                      self.comparison_file, self.statistics_file]
         generated_files = [
-            str(self.horizon_endpoints_file.relative_to(self.project_root)),
-            str(self.sdk_implementation_file.relative_to(self.project_root)),
-            str(self.comparison_file.relative_to(self.project_root)),
-            str(self.statistics_file.relative_to(self.project_root)),
-            str(self.markdown_file.relative_to(self.project_root))
-        ]
+            str((find_data(path) or path).relative_to(self.project_root))
+            for path in data_files
+        ] + [str(self.markdown_file.relative_to(self.project_root))]
 
         return {
             'horizon_version': self.release_info['version'],
@@ -350,16 +392,37 @@ Examples:
         help='Enable verbose output with detailed progress'
     )
 
+    parser.add_argument(
+        '--trace',
+        type=str,
+        metavar='PATH',
+        help='Chrome trace-event JSON for this run (open in ui.perfetto.dev). '
+             'Default: data/traces/horizon-<timestamp>.json'
+    )
+
+    parser.add_argument(
+        '--background-writes',
+        action='store_true',
+        help='Write the data/ JSON files on a background thread while the next step runs'
+    )
+
+    add_output_arguments(parser)
+    add_profile_argument(parser)
+
     args = parser.parse_args()
+    apply_output_arguments(args)
 
     # Create and run pipeline
     pipeline = HorizonAnalysisPipeline(
         horizon_version=args.horizon_version,
         local_router_path=args.local,
-        verbose=args.verbose
+        verbose=args.verbose,
+        trace_path=args.trace,
+        background_writes=args.background_writes
     )
 
-    return pipeline.run()
+    with profiled(args.profile, 'run_horizon_analysis'):
+        return pipeline.run()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Shared --profile support for the analysis and generator scripts.
+
+`--profile` (or `--profile=cpu`) runs a script under cProfile and writes a
+.pstats file; `--profile=mem` runs it under tracemalloc and writes a top-N
+allocation report. Everything lands in data/profiles/, or in the directory a
+script passes as `directory` (the skill and corpus generators use their own
+.tmp/profiles/).
+
+The orchestrator (run_analysis.py) profiles the scripts it runs as child
+processes through this module's command line, which runs a script in-process
+under the profiler:
+
+    python3 profiling.py --profile=cpu --output data/profiles/x.pstats sep/sep_parser.py 0006
+
+aggregate() then merges the per-step results into one profile for the run.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import linecache
+import pstats
+import runpy
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PROFILES_DIR = Path(__file__).parent / 'data' / 'profiles'
+PROFILE_MODES = ('cpu', 'mem')
+
+# Entries shown in the text reports
+TOP_N = 30
+
+# Frames kept per allocation; the report groups by the innermost one
+TRACEMALLOC_FRAMES = 1
+
+
+def add_profile_argument(parser: argparse.ArgumentParser, directory: Path = PROFILES_DIR) -> None:
+    """Add the shared --profile[=cpu|mem] option to an argument parser."""
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='cpu',
+        choices=PROFILE_MODES,
+        metavar='cpu|mem',
+        help='Profile this run (cpu: cProfile .pstats, mem: tracemalloc top-N report) '
+             f'and write the result to {directory}. Default mode: cpu'
+    )
+
+
+def split_profile_flag(argv: List[str]) -> Tuple[Optional[str], List[str]]:
+    """
+    Remove --profile[=cpu|mem] from an argument list.
+
+    For scripts that read sys.argv by position instead of using argparse.
+
+    Returns:
+        Tuple of (mode or None, remaining arguments)
+    """
+    mode = None
+    rest = []
+    for arg in argv:
+        if arg == '--profile':
+            mode = 'cpu'
+        elif arg.startswith('--profile='):
+            mode = arg.split('=', 1)[1]
+            if mode not in PROFILE_MODES:
+                raise SystemExit(f"--profile: expected one of {', '.join(PROFILE_MODES)}, got {mode!r}")
+        else:
+            rest.append(arg)
+    return mode, rest
+
+
+def default_output(name: str, mode: str, directory: Path = PROFILES_DIR) -> Path:
+    """<directory>/<name>-<timestamp>.pstats (cpu) or .mem.txt (mem)."""
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    suffix = '.pstats' if mode == 'cpu' else '.mem.txt'
+    return Path(directory) / f'{name}-{stamp}{suffix}'
+
+
+def _mem_data_path(report_path: Path) -> Path:
+    """Raw per-line allocation totals written next to a mem report, for aggregate()."""
+    return report_path.with_name(report_path.name.replace('.mem.txt', '') + '.mem.json')
+
+
+def _format_mem_report(title: str, lines: Dict[Tuple[str, int], List[int]], peak: Optional[int]) -> str:
+    total = sum(size for size, _ in lines.values())
+    out = [title, '=' * len(title)]
+    if peak is not None:
+        out.append(f'Peak traced memory: {peak / 1024:.1f} KiB')
+    out.append(f'Live at exit: {total / 1024:.1f} KiB in {sum(c for _, c in lines.values())} blocks')
+    out.append('')
+    out.append(f'Top {TOP_N} allocation sites:')
+    ranked = sorted(lines.items(), key=lambda item: item[1][0], reverse=True)[:TOP_N]
+    for rank, ((filename, lineno), (size, count)) in enumerate(ranked, 1):
+        out.append(f'#{rank:<3} {size / 1024:10.1f} KiB {count:8} blocks  {filename}:{lineno}')
+        source = linecache.getline(filename, lineno).strip()
+        if source:
+            out.append(f'      {source}')
+    return '\n'.join(out) + '\n'
+
+
+@contextmanager
+def profiled(mode: Optional[str], name: str, output: Optional[Path] = None,
+             directory: Path = PROFILES_DIR) -> Iterator[None]:
+    """
+    Run the enclosed block under the profiler for `mode`; do nothing if mode is None.
+
+    Args:
+        mode: 'cpu', 'mem' or None
+        name: Run name used in the default output file name
+        output: Output file. Default: <directory>/<name>-<timestamp>.<ext>
+        directory: Where the default output file goes
+    """
+    if mode is None:
+        yield
+        return
+
+    path = Path(output) if output else default_output(name, mode, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if mode == 'cpu':
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(str(path))
+            summary = io.StringIO()
+            pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(TOP_N)
+            print(summary.getvalue(), file=sys.stderr)
+            print(f'CPU profile written to {path}', file=sys.stderr)
+        return
+
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ])
+        lines = {}
+        for stat in snapshot.statistics('lineno'):
+            frame = stat.traceback[0]
+            lines[(frame.filename, frame.lineno)] = [stat.size, stat.count]
+        path.write_text(_format_mem_report(f'Memory profile: {name}', lines, peak), encoding='utf-8')
+        with open(_mem_data_path(path), 'w', encoding='utf-8') as f:
+            json.dump({'name': name, 'peak': peak,
+                       'lines': [[fn, ln, size, count] for (fn, ln), (size, count) in lines.items()]}, f)
+        print(f'Memory profile written to {path}', file=sys.stderr)
+
+
+def aggregate(mode: str, outputs: List[Path], output: Path) -> Optional[Path]:
+    """
+    Merge per-step profiles into one.
+
+    CPU profiles are combined with pstats; memory reports are summed per
+    allocation site, with the largest step peak as the run's peak.
+
+    Returns:
+        The aggregate file, or None if there was nothing to merge
+    """
+    outputs = [p for p in outputs if p.exists()]
+    if not outputs:
+        return None
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    if mode == 'cpu':
+        stats = pstats.Stats(str(outputs[0]), stream=io.StringIO())
+        for path in outputs[1:]:
+            stats.add(str(path))
+        stats.dump_stats(str(output))
+        report = io.StringIO()
+        stats.stream = report
+        stats.sort_stats('cumulative').print_stats(TOP_N)
+        output.with_suffix('.txt').write_text(report.getvalue(), encoding='utf-8')
+        return output
+
+    lines: Dict[Tuple[str, int], List[int]] = {}
+    peak = 0
+    for path in outputs:
+        data_path = _mem_data_path(path)
+        if not data_path.exists():
+            continue
+        with open(data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        peak = max(peak, data['peak'])
+        for filename, lineno, size, count in data['lines']:
+            totals = lines.setdefault((filename, lineno), [0, 0])
+            totals[0] += size
+            totals[1] += count
+    title = f'Memory profile: {len(outputs)} step(s) combined (peak is the largest single step)'
+    output.write_text(_format_mem_report(title, lines, peak), encoding='utf-8')
+    return output
+
+
+def main() -> int:
+    """Run a script in-process under the profiler (used by run_analysis.py)."""
+    parser = argparse.ArgumentParser(
+        description='Run a Python script under cProfile or tracemalloc'
+    )
+    add_profile_argument(parser)
+    parser.add_argument('--output', type=Path, help='Profile output file')
+    parser.add_argument('script', help='Script to run')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments for the script')
+    args = parser.parse_args()
+
+    script = Path(args.script).resolve()
+    sys.argv = [str(script)] + args.args
+    sys.path.insert(0, str(script.parent))
+
+    status = 0
+    with profiled(args.profile or 'cpu', script.stem, args.output):
+        try:
+            runpy.run_path(str(script), run_name='__main__')
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,16 +14,18 @@ import json
 import re
 import sys
 import traceback
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
 # Add parent dir to path for shared modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from common import get_sdk_version
+from common import (
+    JSONWriter, find_data, get_sdk_version, load_stage_data, read_data, report_file, report_timestamp,
+    split_output_flags
+)
 
 
 class SupportStatus(Enum):
@@ -119,34 +121,41 @@ class RPCMethodExtractor:
     from rpc_parser import RPCMethodParser as _RPCMethodParser
     RPC_METHODS = _RPCMethodParser.METHOD_METADATA
 
-    def __init__(self, rpc_protocol_path: str, rpc_methods_file: Optional[Path] = None):
+    def __init__(self, rpc_protocol_path: str, rpc_methods_file: Optional[Path] = None,
+                 rpc_methods: Optional[Union[Dict[str, Any], Any]] = None):
         """
         Initialize with path to stellar-rpc protocol directory
 
         Args:
             rpc_protocol_path: Path to stellar-rpc protocol directory
             rpc_methods_file: Optional path to existing rpc_methods.json file
+            rpc_methods: Optional parse result already in memory, as a dict or
+                the RPCMethodParser itself. Takes precedence over rpc_methods_file
         """
         self.protocol_path = Path(rpc_protocol_path)
         self.rpc_methods_file = rpc_methods_file
+        self.rpc_methods = rpc_methods
 
     def load_methods_from_json(self) -> Optional[Dict[str, Any]]:
         """
-        Load RPC methods from existing JSON file
+        Load RPC methods from the in-memory parse result or the existing JSON file
 
         Returns:
-            Dictionary containing methods and metadata, or None if file not found
+            Dictionary containing methods and metadata, or None if neither is available
         """
-        if not self.rpc_methods_file or not self.rpc_methods_file.exists():
+        if self.rpc_methods is not None:
+            data = load_stage_data(self.rpc_methods)
+            return data if "methods" in data else None
+
+        if not self.rpc_methods_file or not find_data(self.rpc_methods_file):
             return None
 
         try:
-            with open(self.rpc_methods_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Validate structure
-                if "methods" in data:
-                    return data
-        except (json.JSONDecodeError, IOError):
+            data = read_data(self.rpc_methods_file)
+            # Validate structure
+            if "methods" in data:
+                return data
+        except (json.JSONDecodeError, IOError, EOFError):
             pass
 
         return None
@@ -168,7 +177,7 @@ class RPCMethodExtractor:
         return {
             "metadata": {
                 "source": str(self.protocol_path),
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": report_timestamp().isoformat(),
                 "total_methods": len(self.RPC_METHODS)
             },
             "methods": self.RPC_METHODS
@@ -222,7 +231,7 @@ class SorobanSDKAnalyzer:
         return {
             "metadata": {
                 "source": str(self.server_path),
-                "analyzed_at": datetime.now().isoformat(),
+                "analyzed_at": report_timestamp().isoformat(),
                 "total_methods": len(self.methods)
             },
             "implemented_methods": self.methods,
@@ -357,7 +366,7 @@ class SorobanSDKAnalyzer:
 
         # Extract parameter names from map['paramName'] = value patterns
         param_names = re.findall(r"map\[['\"](\w+)['\"]\]", method_body)
-        for param_name in set(param_names):  # Use set to avoid duplicates
+        for param_name in dict.fromkeys(param_names):  # Skip duplicates, keep source order
             params.append({
                 "name": param_name,
                 "type": "request_object",
@@ -760,7 +769,7 @@ class RPCComparisonAnalyzer:
             "metadata": {
                 "rpc_methods": len(self.rpc_data.get("methods", {})),
                 "sdk_methods": len(self.flutter_data.get("implemented_methods", {})),
-                "comparison_date": datetime.now().isoformat(),
+                "comparison_date": report_timestamp().isoformat(),
                 "coverage_percentage": self._calculate_overall_coverage(),
                 "rpc_version": self.rpc_version,
                 "rpc_release_date": self.rpc_release_date,
@@ -876,7 +885,7 @@ class RPCComparisonAnalyzer:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with report_file(output_file) as f:
             f.write("# Soroban RPC vs Flutter SDK Compatibility Matrix\n\n")
 
             # Version information section
@@ -889,7 +898,7 @@ class RPCComparisonAnalyzer:
                 f.write(f"**RPC Source:** [{self.rpc_release_url}]({self.rpc_release_url})  \n")
 
             f.write(f"**SDK Version:** {self.sdk_version}  \n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"**Generated:** {report_timestamp().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
             # Overall Statistics
             f.write("## Overall Coverage\n\n")
@@ -984,9 +993,8 @@ def main():
         rpc_data = rpc_extractor.extract_methods()
 
         # Save RPC methods
-        data_dir.mkdir(parents=True, exist_ok=True)
-        with open(rpc_methods_file, 'w', encoding='utf-8') as f:
-            json.dump(rpc_data, f, indent=2, ensure_ascii=False)
+        writer = JSONWriter()
+        writer.write(rpc_methods_file, rpc_data)
         print(f"✓ Saved RPC methods to: {rpc_methods_file}")
 
         # Analyze Flutter Soroban implementation
@@ -995,8 +1003,7 @@ def main():
         flutter_data = soroban_analyzer.analyze()
 
         # Save Flutter implementation
-        with open(flutter_implementation_file, 'w', encoding='utf-8') as f:
-            json.dump(flutter_data, f, indent=2, ensure_ascii=False)
+        writer.write(flutter_implementation_file, flutter_data)
         print(f"✓ Saved Flutter implementation to: {flutter_implementation_file}")
 
         # Perform comparison
@@ -1006,14 +1013,12 @@ def main():
 
         # Generate comparison data
         comparison_data = analyzer.generate_comparison_data()
-        with open(comparison_output_file, 'w', encoding='utf-8') as f:
-            json.dump(comparison_data, f, indent=2, ensure_ascii=False)
+        writer.write(comparison_output_file, comparison_data)
         print(f"✓ Saved comparison to: {comparison_output_file}")
 
         # Generate coverage statistics
         coverage_stats = analyzer.generate_coverage_stats()
-        with open(stats_output_file, 'w', encoding='utf-8') as f:
-            json.dump(coverage_stats, f, indent=2, ensure_ascii=False)
+        writer.write(stats_output_file, coverage_stats)
         print(f"✓ Saved statistics to: {stats_output_file}")
 
         # Generate markdown report
@@ -1066,4 +1071,5 @@ def main():
 
 
 if __name__ == "__main__":
+    sys.argv[1:] = split_output_flags(sys.argv[1:])
     sys.exit(main())
@@ -13,13 +13,16 @@ This module provides tools to:
 """
 
 import argparse
-import json
 import re
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Add parent dir to path for shared modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common import add_output_arguments, apply_output_arguments, report_timestamp, write_data
+
 
 class RPCMethodParser:
     """
@@ -297,7 +300,7 @@ class RPCMethodParser:
         return {
             "metadata": {
                 "source": self._source_type,
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": report_timestamp().isoformat(),
                 "rpc_version": self.version_info.get("version", "unknown"),
                 "rpc_release_date": self.version_info.get("release_date", "unknown"),
                 "rpc_release_url": self.version_info.get("release_url", ""),
@@ -308,7 +311,7 @@ class RPCMethodParser:
 
     def save_json(self, output_path: str) -> None:
         """
-        Save parsed methods to a JSON file.
+        Save parsed methods to a JSON file, in the run's data format.
 
         Args:
             output_path: Path where the JSON file should be written
@@ -316,12 +319,7 @@ class RPCMethodParser:
         Raises:
             IOError: If the file cannot be written
         """
-        path = Path(output_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = self.to_json()
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        write_data(output_path, self.to_json())
 
         print(f"Successfully saved {len(self.methods)} methods to: {output_path}")
 
@@ -390,7 +388,10 @@ Examples:
         help="GitHub release URL"
     )
 
+    add_output_arguments(parser)
+
     args = parser.parse_args()
+    apply_output_arguments(args)
 
     # Prepare version info
     version_info = {}
@@ -24,13 +24,17 @@ Usage:
 
     # Verbose output
     python run_rpc_analysis.py --verbose
+
+    # Write the data/ JSON files on a background thread
+    python run_rpc_analysis.py --background-writes
+
+    # Write the data/ JSON files gzip-compressed
+    python run_rpc_analysis.py --data-format=gzip
 """
 
 import argparse
-import json
 import sys
 import traceback
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -38,7 +42,11 @@ from typing import Dict, Any, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from common import ProgressTracker
+    from common import (
+        JSONWriter, ProgressTracker, add_output_arguments, apply_output_arguments, find_data,
+        report_timestamp
+    )
+    from profiling import add_profile_argument, profiled
     from github_fetcher import (
         get_latest_rpc_release,
         fetch_rpc_jsonrpc_source,
@@ -66,7 +74,9 @@ class RPCAnalysisPipeline:
         self,
         rpc_version: Optional[str] = None,
         local_jsonrpc_path: Optional[str] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        trace_path: Optional[str] = None,
+        background_writes: bool = False
     ):
         """
         Initialize the pipeline.
@@ -75,11 +85,16 @@ class RPCAnalysisPipeline:
             rpc_version: Specific RPC version tag (e.g., 'v22.0.0'). None = latest
             local_jsonrpc_path: Path to local jsonrpc.go file. None = fetch from GitHub
             verbose: Enable verbose output
+            trace_path: Where to write the run's trace. None = data/traces/rpc-<timestamp>.json
+            background_writes: Write the data/ JSON files on a worker thread
+                while the next step runs
         """
         self.rpc_version = rpc_version
         self.local_jsonrpc_path = local_jsonrpc_path
         self.verbose = verbose
         self.progress = ProgressTracker(verbose=verbose)
+        self.trace_path = Path(trace_path) if trace_path else None
+        self.writer = JSONWriter(background=background_writes)
 
         # Define paths
         self.project_root = Path(__file__).parent.parent.parent.parent
@@ -100,6 +115,13 @@ class RPCAnalysisPipeline:
         self.release_info: Optional[Dict[str, Any]] = None
         self.jsonrpc_source: Optional[str] = None
 
+        # Step results, handed to the next step in memory. The JSON files
+        # above are written from these and never read back.
+        self.rpc_data: Optional[Dict[str, Any]] = None
+        self.flutter_data: Optional[Dict[str, Any]] = None
+        self.comparison_data: Optional[Dict[str, Any]] = None
+        self.statistics: Optional[Dict[str, Any]] = None
+
     def run(self) -> int:
         """
         Execute the complete analysis pipeline.
@@ -123,6 +145,10 @@ class RPCAnalysisPipeline:
             # Step 4: Generate comparison reports
             self.generate_comparison_reports()
 
+            # Wait for the JSON files still being written
+            with self.progress.span('write.flush'):
+                self.writer.close()
+
             # Print summary
             stats = self.collect_statistics()
             self.progress.print_summary(stats)
@@ -138,6 +164,12 @@ class RPCAnalysisPipeline:
                 traceback.print_exc()
             return 1
 
+        finally:
+            self.writer.close(raise_errors=False)
+            self.progress.close()
+            trace_file = self.progress.write_trace(self.trace_path, label='rpc')
+            self.progress.log(f"Trace written to {trace_file}")
+
     def fetch_rpc_release(self) -> None:
         """Step 1: Fetch RPC release information and source code"""
         self.progress.start_step("Fetching RPC Release")
@@ -149,12 +181,14 @@ class RPCAnalysisPipeline:
                 raise FileNotFoundError(f"Local jsonrpc.go not found: {local_path}")
 
             self.progress.log(f"Using local file: {local_path}", force=True)
-            self.jsonrpc_source = local_path.read_text(encoding='utf-8')
+            with self.progress.span('fetch.jsonrpc_go', source='local') as span:
+                self.jsonrpc_source = local_path.read_text(encoding='utf-8')
+                span.add('bytes_read', len(self.jsonrpc_source))
 
             # Create minimal release info for local mode
             self.release_info = {
                 'version': 'local',
-                'published_at': datetime.now().strftime('%Y-%m-%d'),
+                'published_at': report_timestamp().strftime('%Y-%m-%d'),
                 'html_url': str(local_path),
                 'source': 'local'
             }
@@ -174,7 +208,9 @@ class RPCAnalysisPipeline:
                 if self.rpc_version:
                     # Use specific version
                     self.progress.log(f"Fetching RPC version: {self.rpc_version}", force=True)
-                    self.jsonrpc_source = fetch_rpc_jsonrpc_source(self.rpc_version)
+                    with self.progress.span('fetch.jsonrpc_go', source='GitHub') as span:
+                        self.jsonrpc_source = fetch_rpc_jsonrpc_source(self.rpc_version)
+                        span.add('bytes_read', len(self.jsonrpc_source))
                     self.release_info = {
                         'version': self.rpc_version,
                         'published_at': 'unknown',
@@ -184,8 +220,11 @@ class RPCAnalysisPipeline:
                 else:
                     # Fetch latest release
                     self.progress.log("Fetching latest RPC release...", force=True)
-                    release = get_latest_rpc_release()
-                    self.jsonrpc_source = fetch_rpc_jsonrpc_source(release.version)
+                    with self.progress.span('fetch.release_info'):
+                        release = get_latest_rpc_release()
+                    with self.progress.span('fetch.jsonrpc_go', source='GitHub') as span:
+                        self.jsonrpc_source = fetch_rpc_jsonrpc_source(release.version)
+                        span.add('bytes_read', len(self.jsonrpc_source))
                     self.release_info = {
                         'version': release.version,
                         'published_at': release.published_at.strftime('%Y-%m-%d'),
@@ -217,7 +256,8 @@ class RPCAnalysisPipeline:
 
         # Parse jsonrpc source
         parser = RPCMethodParser(version_info=version_info)
-        parser.parse(self.jsonrpc_source)
+        with self.progress.span('parse.jsonrpc_go'):
+            parser.parse(self.jsonrpc_source)
 
         methods_count = parser.get_method_count()
         self.progress.log(f"Found {methods_count} RPC methods", force=True)
@@ -227,10 +267,13 @@ class RPCAnalysisPipeline:
             self.progress.log("Fetching response struct definitions...", force=True)
             try:
                 method_names = parser.get_method_names()
-                response_files = fetch_all_rpc_response_files(
-                    self.release_info['version'],
-                    method_names
-                )
+                with self.progress.span('fetch.response_structs') as span:
+                    response_files = fetch_all_rpc_response_files(
+                        self.release_info['version'],
+                        method_names
+                    )
+                    span.add('bytes_read', sum(len(c) for c in response_files.values()))
+                    span.set('files', len(response_files))
 
                 self.progress.log(f"Found {len(response_files)} response struct files", force=True)
 
@@ -253,8 +296,10 @@ class RPCAnalysisPipeline:
                 self.progress.log(f"Error: Could not fetch response files: {e}", force=True)
                 raise
 
-        # Save results
-        parser.save_json(str(self.rpc_methods_file))
+        # Keep the results for step 4 and save them
+        self.rpc_data = parser.to_json()
+        with self.progress.span('write.rpc_methods'):
+            self.writer.write(self.rpc_methods_file, self.rpc_data)
 
         self.progress.finish_step(f"Parsed {methods_count} methods with response fields")
 
@@ -270,49 +315,42 @@ class RPCAnalysisPipeline:
 
         # Analyze SDK
         analyzer = SorobanSDKAnalyzer(str(soroban_server_path))
-        flutter_data = analyzer.analyze()
+        with self.progress.span('analyze.soroban_server'):
+            self.flutter_data = analyzer.analyze()
 
         # Save results
-        with open(self.sdk_implementation_file, 'w', encoding='utf-8') as f:
-            json.dump(flutter_data, f, indent=2, ensure_ascii=False)
+        with self.progress.span('write.sdk_implementation'):
+            self.writer.write(self.sdk_implementation_file, self.flutter_data)
 
-        methods_count = flutter_data['metadata']['total_methods']
+        methods_count = self.flutter_data['metadata']['total_methods']
         self.progress.finish_step(f"Found {methods_count} Soroban methods in soroban_server.dart")
 
     def generate_comparison_reports(self) -> None:
         """Step 4: Generate compatibility comparison reports"""
         self.progress.start_step("Generating Compatibility Reports")
 
-        # Load RPC methods data
-        with open(self.rpc_methods_file, 'r', encoding='utf-8') as f:
-            rpc_data = json.load(f)
-
-        # Load Flutter implementation data
-        with open(self.sdk_implementation_file, 'r', encoding='utf-8') as f:
-            flutter_data = json.load(f)
-
-        # Create analyzer
-        analyzer = RPCComparisonAnalyzer(rpc_data, flutter_data)
+        # Create analyzer on the results of steps 2 and 3
+        analyzer = RPCComparisonAnalyzer(self.rpc_data, self.flutter_data)
 
         # Perform analysis
         analyzer.analyze()
 
         # Generate all reports
         self.progress.log("Generating comparison JSON...", force=False)
-        comparison_data = analyzer.generate_comparison_data()
-        with open(self.comparison_file, 'w', encoding='utf-8') as f:
-            json.dump(comparison_data, f, indent=2, ensure_ascii=False)
+        self.comparison_data = analyzer.generate_comparison_data()
+        with self.progress.span('write.comparison'):
+            self.writer.write(self.comparison_file, self.comparison_data)
 
         self.progress.log("Generating statistics JSON...", force=False)
-        coverage_stats = analyzer.generate_coverage_stats()
-        with open(self.statistics_file, 'w', encoding='utf-8') as f:
-            json.dump(coverage_stats, f, indent=2, ensure_ascii=False)
+        self.statistics = analyzer.generate_coverage_stats()
+        with self.progress.span('write.statistics'):
+            self.writer.write(self.statistics_file, self.statistics)
 
         self.progress.log("Generating markdown matrix...", force=False)
         analyzer.generate_markdown_report(str(self.markdown_file))
 
         # Calculate summary stats
-        overall = coverage_stats['overall']
+        overall = self.statistics['overall']
 
         self.progress.finish_step(
             f"Coverage: {overall['coverage_percentage']}% "
@@ -321,26 +359,21 @@ class RPCAnalysisPipeline:
 
     def collect_statistics(self) -> Dict[str, Any]:
         """Collect final statistics for summary"""
-        # Load statistics file
-        with open(self.statistics_file, 'r', encoding='utf-8') as f:
-            stats = json.load(f)
+        stats = self.statistics
 
-        # Collect file paths relative to project root
+        # Collect file paths relative to project root (a data file's name
+        # depends on the data format it was written in)
+        data_files = [self.rpc_methods_file, self.sdk_implementation_file,
+                      self.comparison_file, self.statistics_file]
         generated_files = [
-            str(self.rpc_methods_file.relative_to(self.project_root)),
-            str(self.sdk_implementation_file.relative_to(self.project_root)),
-            str(self.comparison_file.relative_to(self.project_root)),
-            str(self.statistics_file.relative_to(self.project_root)),
-            str(self.markdown_file.relative_to(self.project_root))
-        ]
-
-        # Get SDK version from comparison data (it's embedded in the analyzer)
-        with open(self.comparison_file, 'r', encoding='utf-8') as f:
-            comparison_data = json.load(f)
+            str((find_data(path) or path).relative_to(self.project_root))
+            for path in data_files
+        ] + [str(self.markdown_file.relative_to(self.project_root))]
 
         return {
             'rpc_version': self.release_info['version'],
-            'sdk_version': comparison_data['metadata']['sdk_version'],
+            # The SDK version is embedded in the comparison data by the analyzer
+            'sdk_version': self.comparison_data['metadata']['sdk_version'],
             'coverage_percentage': stats['overall']['coverage_percentage'],
             'fully_supported': stats['overall']['fully_supported'],
             'total_methods': stats['overall']['total_methods'],
@@ -392,16 +425,37 @@ Examples:
         help='Enable verbose output with detailed progress'
     )
 
+    parser.add_argument(
+        '--trace',
+        type=str,
+        metavar='PATH',
+        help='Chrome trace-event JSON for this run (open in ui.perfetto.dev). '
+             'Default: data/traces/rpc-<timestamp>.json'
+    )
+
+    parser.add_argument(
+        '--background-writes',
+        action='store_true',
+        help='Write the data/ JSON files on a background thread while the next step runs'
+    )
+
+    add_output_arguments(parser)
+    add_profile_argument(parser)
+
     args = parser.parse_args()
+    apply_output_arguments(args)
 
     # Create and run pipeline
     pipeline = RPCAnalysisPipeline(
         rpc_version=args.rpc_version,
         local_jsonrpc_path=args.local,
-        verbose=args.verbose
+        verbose=args.verbose,
+        trace_path=args.trace,
+        background_writes=args.background_writes
     )
 
-    return pipeline.run()
+    with profiled(args.profile, 'run_rpc_analysis'):
+        return pipeline.run()
 
 
 if __name__ == '__main__':
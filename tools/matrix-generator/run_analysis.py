@@ -9,20 +9,34 @@ Author: Stellar Flutter SDK Team
 License: Apache-2.0
 """
 
+import argparse
 import sys
 import subprocess
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from common import Colors, SDK_ROOT
+from common import Colors, SDK_ROOT, TRACES_DIR, add_output_arguments, find_data
+from github_fetcher import GitHubFetchError
+from profiling import PROFILES_DIR, add_profile_argument, aggregate
+from sep.sep_spec_store import SPEC_REPO, SEPSpecStore
 
 
 class AnalysisOrchestrator:
     """Orchestrates the execution of all analysis scripts"""
 
-    def __init__(self):
-        """Initialize orchestrator"""
+    def __init__(self, profile: Optional[str] = None, data_format: str = 'pretty',
+                 deterministic: bool = False, offline: bool = False):
+        """
+        Initialize orchestrator
+
+        Args:
+            profile: 'cpu' or 'mem' to profile every script, None to run them plainly
+            data_format: Format of the intermediate JSON under data/ (see common.DATA_FORMATS)
+            deterministic: Have every script stamp its outputs with the sources'
+                timestamp instead of the current time
+            offline: Parse the SEPs from the local spec cache only
+        """
         self.tools_dir = Path(__file__).parent
         self.base_dir = self.tools_dir.parent.parent  # Go up two levels to SDK root
         self.scripts: List[Tuple[str, str, str]] = [
@@ -87,6 +101,22 @@ class AnalysisOrchestrator:
             ("sep/generate_sep_comparison.py 0053", "Generating SEP-53 compatibility report", "sep"),
         ]
         self.results: List[Tuple[str, bool, str]] = []
+        self.data_format = data_format
+        self.deterministic = deterministic
+
+        # stellar-protocol commit every SEP parser step reads, set by pin_spec_commit()
+        self.offline = offline
+        self.spec_commit: Optional[str] = None
+
+        # Per-step profiles, merged by aggregate_profiles() at the end of the run
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        self.profile = profile
+        self.profile_dir = PROFILES_DIR / f"run_analysis-{stamp}"
+        self.profile_outputs: List[Path] = []
+
+        # One trace per step, all in one directory per run
+        self.trace_dir = TRACES_DIR / f"run_analysis-{stamp}"
+        self.trace_count = 0
 
     def print_header(self):
         """Print analysis header"""
@@ -116,16 +146,40 @@ class AnalysisOrchestrator:
         parts = script_name.split()
         script_file = parts[0]
         script_args = parts[1:] if len(parts) > 1 else []
+        script_args.append(f'--data-format={self.data_format}')
+        if self.deterministic:
+            script_args.append('--deterministic')
+        if script_file == 'sep/sep_parser.py':
+            if self.offline:
+                script_args.append('--offline')
+            if self.spec_commit:
+                script_args.append(f'--spec-commit={self.spec_commit}')
 
         script_path = self.tools_dir / script_file
 
         if not script_path.exists():
             return False, f"Script not found: {script_path}"
 
+        self.trace_count += 1
+        name = '-'.join([f"{self.trace_count:02d}", script_path.stem] + parts[1:])
+        script_args.append(f'--trace={self.trace_dir / f"{name}.json"}')
+
+        command = [sys.executable, str(script_path)] + script_args
+        if self.profile:
+            # Run the script in-process under profiling.py so its profile can be aggregated
+            suffix = '.pstats' if self.profile == 'cpu' else '.mem.txt'
+            output = self.profile_dir / f"{name}{suffix}"
+            self.profile_outputs.append(output)
+            command = [
+                sys.executable, str(self.tools_dir / 'profiling.py'),
+                f'--profile={self.profile}', '--output', str(output),
+                str(script_path)
+            ] + script_args
+
         try:
             # Run script with arguments
             result = subprocess.run(
-                [sys.executable, str(script_path)] + script_args,
+                command,
                 capture_output=True,
                 text=True,
                 timeout=300  # 5 minute timeout
@@ -143,6 +197,16 @@ class AnalysisOrchestrator:
         except Exception as e:
             return False, f"Error running script: {str(e)}"
 
+    def pin_spec_commit(self) -> None:
+        """Resolve the stellar-protocol commit all SEP parser steps read, once per run"""
+        try:
+            self.spec_commit = SEPSpecStore(offline=self.offline).resolve_commit()
+        except GitHubFetchError as e:
+            # Each parser step then resolves (and reports) on its own
+            print(f"{Colors.YELLOW}⚠ Could not pin the SEP specs to a commit: {e}{Colors.END}")
+            return
+        print(f"SEP specs: {SPEC_REPO}@{self.spec_commit}\n")
+
     def run_all(self) -> bool:
         """
         Run all analysis scripts in sequence
@@ -151,6 +215,7 @@ class AnalysisOrchestrator:
             True if all scripts succeeded, False otherwise
         """
         self.print_header()
+        self.pin_spec_commit()
 
         total_steps = len(self.scripts)
         all_success = True
@@ -183,6 +248,16 @@ class AnalysisOrchestrator:
 
         return all_success
 
+    def aggregate_profiles(self) -> None:
+        """Merge the per-step profiles of this run into one"""
+        if not self.profile:
+            return
+        suffix = '.pstats' if self.profile == 'cpu' else '.mem.txt'
+        output = aggregate(self.profile, self.profile_outputs, self.profile_dir / f"aggregate{suffix}")
+        if output:
+            print(f"\n{Colors.BOLD}Profile:{Colors.END} {len(self.profile_outputs)} steps, combined in")
+            print(f"  {Colors.CYAN}{output}{Colors.END}")
+
     def print_summary(self):
         """Print final summary"""
         print(f"\n{Colors.BOLD}{Colors.HEADER}{'=' * 70}{Colors.END}")
@@ -228,13 +303,17 @@ class AnalysisOrchestrator:
             ])
 
         for report_name, report_path in reports:
-            full_path = self.base_dir / report_path
-            if full_path.exists():
+            full_path = find_data(self.base_dir / report_path)
+            if full_path:
                 print(f"  {Colors.GREEN}✓{Colors.END} {report_name}")
                 print(f"    {Colors.CYAN}{full_path}{Colors.END}")
             else:
                 print(f"  {Colors.YELLOW}⚠{Colors.END} {report_name} (not generated)")
 
+        if self.trace_dir.exists():
+            print(f"\n{Colors.BOLD}Traces:{Colors.END} one per step, in")
+            print(f"  {Colors.CYAN}{self.trace_dir}{Colors.END}")
+
         print()
 
         # Overall result
@@ -292,11 +371,27 @@ class AnalysisOrchestrator:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Run all compatibility analysis scripts")
+    add_output_arguments(parser)
+    add_profile_argument(parser)
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Parse the SEPs from the local spec cache (data/sep/specs/) without '
+             'any network request, at the stellar-protocol commit last resolved'
+    )
+    args = parser.parse_args()
+
     # Check if we're in a TTY (for colors)
     if not sys.stdout.isatty():
         Colors.disable()
 
-    orchestrator = AnalysisOrchestrator()
+    orchestrator = AnalysisOrchestrator(
+        profile=args.profile,
+        data_format=args.data_format,
+        deterministic=args.deterministic,
+        offline=args.offline
+    )
 
     # Verify prerequisites
     prereq_ok, errors = orchestrator.verify_prerequisites()
@@ -312,6 +407,7 @@ def main():
 
     # Print summary
     orchestrator.print_summary()
+    orchestrator.aggregate_profiles()
 
     return 0 if success else 1
 
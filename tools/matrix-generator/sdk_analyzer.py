@@ -12,17 +12,15 @@ Author: Stellar Flutter SDK Team
 License: Apache-2.0
 """
 
-import json
 import re
 import sys
 import traceback
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
-from common import get_sdk_version
+from common import export_graph, get_sdk_version, report_timestamp, split_output_flags, write_data
 
 
 class DetectionSource(Enum):
@@ -45,6 +43,7 @@ class RequestBuilderInfo:
     sdk_property: str = ""
     endpoint_detection_source: str = DetectionSource.DYNAMIC.value
     filter_detection_confidence: float = 1.0
+    exported: bool = True  # reachable through the public barrel
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -58,7 +57,8 @@ class RequestBuilderInfo:
             "exposed_in_sdk": self.exposed_in_sdk,
             "sdk_property": self.sdk_property,
             "endpoint_detection_source": self.endpoint_detection_source,
-            "filter_detection_confidence": self.filter_detection_confidence
+            "filter_detection_confidence": self.filter_detection_confidence,
+            "exported": self.exported
         }
 
 
@@ -430,7 +430,9 @@ class FlutterSDKAnalyzer:
                 exposed_in_sdk=exposed_in_sdk,
                 sdk_property=sdk_property,
                 endpoint_detection_source=detection_source.value,
-                filter_detection_confidence=confidence
+                filter_detection_confidence=confidence,
+                exported=export_graph(self.sdk_root).is_public_class(
+                    class_name, file_path.resolve())
             )
 
             self.builders.append(builder)
@@ -850,7 +852,7 @@ class FlutterSDKAnalyzer:
                     "class": builder.class_name,
                     "streaming": builder.streaming_support,
                     "deprecated": False,
-                    "filters": list(set(filters)),
+                    "filters": list(dict.fromkeys(filters)),
                     "notes": f"Implemented via {builder.class_name}" if implemented else ""
                 }
 
@@ -965,7 +967,7 @@ class FlutterSDKAnalyzer:
         return {
             "metadata": {
                 "sdk_version": sdk_version,
-                "analyzed_at": datetime.now().isoformat(),
+                "analyzed_at": report_timestamp().isoformat(),
                 "total_request_builders": len(self.builders),
                 "exposed_builders": len(self.exposed_builders),
                 "sdk_root": str(self.sdk_root),
@@ -981,16 +983,10 @@ class FlutterSDKAnalyzer:
         return get_sdk_version()
 
     def save_json(self, output_path: str) -> None:
-        """Save analyzed data to JSON file"""
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        """Save analyzed data to JSON file, in the run's data format"""
+        output_file = write_data(output_path, self.to_json())
 
-        data = self.to_json()
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        print(f"Saved SDK analysis to: {output_path}")
+        print(f"Saved SDK analysis to: {output_file}")
 
 
 def main():
@@ -1046,4 +1042,5 @@ def main():
 
 
 if __name__ == '__main__':
+    sys.argv[1:] = split_output_flags(sys.argv[1:])
     sys.exit(main())
@@ -9,50 +9,21 @@ Author: Stellar Flutter SDK Team
 License: Apache-2.0
 """
 
-import json
 import sys
 import traceback
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
-
-
-class CompatibilityStatus(Enum):
-    """Compatibility status indicators"""
-    FULLY_SUPPORTED = "✅"
-    PARTIALLY_SUPPORTED = "⚠️"
-    NOT_SUPPORTED = "❌"
-    UNKNOWN = "❔"
-
-
-class FieldPriority(Enum):
-    """Priority levels for missing fields"""
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
+from typing import Dict, List, Any
 
 
 # Add parent dir to path for shared modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from common import Colors, get_sdk_version
-
-
-@dataclass
-class FieldComparison:
-    """Represents a comparison between a SEP field and SDK implementation"""
-    section: str
-    field_name: str
-    required: bool
-    implemented: Optional[bool]  # None for N/A (e.g., server-side-only)
-    sdk_property: Optional[str]
-    description: str
-    priority: Optional[str] = None
-    server_side_only: bool = False
-    client_note: Optional[str] = None
+from common import (
+    Colors, find_data, get_sdk_version, read_data, report_file, report_timestamp, split_output_flags,
+    split_trace_flag, trace_span, traced, write_data
+)
+from sep_model import FieldComparison, FieldPriority
+from sep_plugins import load_plugin
 
 
 class SEPComparator:
@@ -83,12 +54,10 @@ class SEPComparator:
     def load_data(self) -> None:
         """Load JSON data from both files"""
         print(f"{Colors.CYAN}Loading SEP-{self.sep_number} definition...{Colors.END}")
-        with open(self.sep_def_path, 'r', encoding='utf-8') as f:
-            self.sep_data = json.load(f)
+        self.sep_data = read_data(self.sep_def_path)
 
         print(f"{Colors.CYAN}Loading Flutter SDK implementation...{Colors.END}")
-        with open(self.sdk_impl_path, 'r', encoding='utf-8') as f:
-            self.sdk_data = json.load(f)
+        self.sdk_data = read_data(self.sdk_impl_path)
 
         sections = len(self.sep_data.get('sections', []))
         classes = self.sdk_data.get('total_classes', 0)
@@ -131,1329 +100,13 @@ class SEPComparator:
             print(f"{Colors.YELLOW}⚠ SEP not implemented in SDK{Colors.END}")
             return
 
-        # Check if this is SEP-01 style (implemented_fields), SEP-02 style (implemented_features), or SEP-05 style
-        if 'implemented_fields' in self.sdk_data:
-            # Check if it's SEP-01 or SEP-09 style
-            fields = self.sdk_data['implemented_fields']
-            if 'natural_person_fields' in fields or 'organization_fields' in fields:
-                # SEP-09 style: KYC field definitions
-                self._compare_sep_09_fields()
-            else:
-                # SEP-01 style: field-based comparison
-                self._compare_sep_01_fields()
-        elif 'implemented_features' in self.sdk_data:
-            # Check if it's SEP-02, SEP-05, SEP-06, SEP-10, SEP-12, or SEP-38
-            features = self.sdk_data['implemented_features']
-            if 'bip39_features' in features:
-                # SEP-05 style: cryptographic feature comparison
-                self._compare_sep_05_features()
-            elif 'authentication_endpoints' in features and 'challenge_features' in features:
-                # SEP-45 style: contract account authentication feature comparison
-                self._compare_sep_45_features()
-            elif 'authentication_endpoints' in features:
-                # SEP-10 style: authentication feature comparison
-                self._compare_sep_10_features()
-            elif 'endpoints' in features:
-                # SEP-12 style: KYC API feature comparison
-                self._compare_sep_12_features()
-            elif 'deposit_endpoints' in features:
-                # SEP-06 style: Deposit/Withdrawal API feature comparison
-                self._compare_sep_06_features()
-            elif 'interactive_deposit_endpoint' in features:
-                # SEP-24 style: Hosted Deposit/Withdrawal API feature comparison
-                self._compare_sep_24_features()
-            elif 'api_endpoints' in features and 'recovery_features' in features:
-                # SEP-30 style: Account Recovery API feature comparison
-                self._compare_sep_30_features()
-            elif 'info_endpoint' in features and 'post_quote_endpoint' in features:
-                # SEP-38 style: Anchor RFQ API feature comparison
-                self._compare_sep_38_features()
-            elif 'operations' in features and 'validation_features' in features and 'signature_features' in features:
-                # SEP-07 style: URI Scheme feature comparison
-                self._compare_sep_07_features()
-            elif 'approval_endpoint' in features and 'response_statuses' in features:
-                # SEP-08 style: Regulated Assets API feature comparison
-                self._compare_sep_08_features()
-            elif 'encoding_features' in features and 'decoding_features' in features:
-                # SEP-11 style: Txrep feature comparison
-                self._compare_sep_11_features()
-            elif 'metadata_storage' in features and 'encoding_format' in features:
-                # SEP-46 style: Contract Meta feature comparison
-                self._compare_sep_46_features()
-            elif 'sep_declaration' in features and 'meta_entry_format' in features:
-                # SEP-47 style: Contract Interface Discovery feature comparison
-                self._compare_sep_47_features()
-            elif 'wasm_section' in features and 'entry_types' in features and 'type_system_primitive' in features:
-                # SEP-48 style: Smart Contract Specifications feature comparison
-                self._compare_sep_48_features()
-            elif 'xdr_data_types' in features and 'stellar_specific_types' in features:
-                # SEP-51 style: XDR-JSON mapping rule comparison
-                self._compare_sep_51_features()
-            elif 'message_signing' in features:
-                # SEP-53 style: message signing capability comparison
-                self._compare_sep_53_features()
-            else:
-                # SEP-02 style: API feature comparison
-                self._compare_sep_02_features()
-        else:
+        # Each SEP's comparison lives in its plugin, imported on first use
+        compare = getattr(load_plugin(self.sep_number), 'compare', None)
+        if compare is None:
             print(f"{Colors.YELLOW}⚠ Unknown SEP structure{Colors.END}")
+            return
 
-    def _compare_sep_01_fields(self) -> None:
-        """Compare SEP-01 style fields"""
-        implemented_fields = self.sdk_data.get('implemented_fields', {})
-
-        # Compare each section
-        for section_key, section_data in implemented_fields.items():
-            section_title = section_data.get('title', section_key)
-
-            for field_name, field_info in section_data.get('fields', {}).items():
-                comparison = FieldComparison(
-                    section=section_title,
-                    field_name=field_name,
-                    required=field_info.get('required', False),
-                    implemented=field_info.get('implemented', False),
-                    sdk_property=field_info.get('sdk_property'),
-                    description=field_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        field_name,
-                        field_info.get('required', False),
-                        section_key
-                    ) if not field_info.get('implemented') else None
-                )
-
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} fields{Colors.END}")
-
-    def _compare_sep_09_fields(self) -> None:
-        """Compare SEP-09 style KYC field definitions"""
-        implemented_fields = self.sdk_data.get('implemented_fields', {})
-
-        # Define section titles for display
-        section_titles = {
-            'natural_person_fields': 'Natural Person Fields',
-            'organization_fields': 'Organization Fields',
-            'financial_account_fields': 'Financial Account Fields',
-            'card_fields': 'Card Fields'
-        }
-
-        # Compare each field category
-        for category_key, category_title in section_titles.items():
-            category_fields = implemented_fields.get(category_key, {})
-
-            for field_name, field_info in category_fields.items():
-                # Skip the coverage key
-                if field_name == 'coverage':
-                    continue
-
-                comparison = FieldComparison(
-                    section=category_title,
-                    field_name=field_name,
-                    required=field_info.get('required', False),
-                    implemented=field_info.get('implemented', False),
-                    sdk_property=field_info.get('sdk_property'),
-                    description=field_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        field_name,
-                        field_info.get('required', False),
-                        category_key
-                    ) if not field_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} KYC fields{Colors.END}")
-
-    def _compare_sep_02_features(self) -> None:
-        """Compare SEP-02 style API features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare request types
-        for type_name, type_info in implemented_features.get('request_types', {}).items():
-            comparison = FieldComparison(
-                section='Request Types',
-                field_name=type_name,
-                required=type_info.get('required', False),
-                implemented=type_info.get('implemented', False),
-                sdk_property=type_info.get('sdk_method'),
-                description=type_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    type_name,
-                    type_info.get('required', False),
-                    'request_types'
-                ) if not type_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare request parameters
-        for param_name, param_info in implemented_features.get('request_parameters', {}).items():
-            comparison = FieldComparison(
-                section='Request Parameters',
-                field_name=param_name,
-                required=param_info.get('required', False),
-                implemented=param_info.get('implemented', False),
-                sdk_property=param_name,  # Parameters don't have direct mappings
-                description=param_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    param_name,
-                    param_info.get('required', False),
-                    'request_parameters'
-                ) if not param_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare response fields
-        for field_name, field_info in implemented_features.get('response_fields', {}).items():
-            comparison = FieldComparison(
-                section='Response Fields',
-                field_name=field_name,
-                required=field_info.get('required', False),
-                implemented=field_info.get('implemented', False),
-                sdk_property=field_info.get('sdk_property'),
-                description=field_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    field_name,
-                    field_info.get('required', False),
-                    'response_fields'
-                ) if not field_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} features{Colors.END}")
-
-    def _compare_sep_05_features(self) -> None:
-        """Compare SEP-05 style cryptographic features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare BIP-39 features
-        for feature_name, feature_info in implemented_features.get('bip39_features', {}).items():
-            comparison = FieldComparison(
-                section='BIP-39 Mnemonic Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'bip39'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare BIP-32 features
-        for feature_name, feature_info in implemented_features.get('bip32_features', {}).items():
-            comparison = FieldComparison(
-                section='BIP-32 Key Derivation',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'bip32'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare BIP-44 features
-        for feature_name, feature_info in implemented_features.get('bip44_features', {}).items():
-            comparison = FieldComparison(
-                section='BIP-44 Multi-Account Support',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'bip44'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare key derivation methods
-        for feature_name, feature_info in implemented_features.get('key_derivation_methods', {}).items():
-            comparison = FieldComparison(
-                section='Key Derivation Methods',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'key_derivation'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare language support
-        for feature_name, feature_info in implemented_features.get('language_support', {}).items():
-            comparison = FieldComparison(
-                section='Language Support',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'languages'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} cryptographic features{Colors.END}")
-
-    def _compare_sep_06_features(self) -> None:
-        """Compare SEP-06 style features (Deposit/Withdrawal API)"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare info endpoint
-        for feature_name, feature_info in implemented_features.get('info_endpoint', {}).items():
-            comparison = FieldComparison(
-                section='Info Endpoint',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'info'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare deposit endpoints
-        for feature_name, feature_info in implemented_features.get('deposit_endpoints', {}).items():
-            comparison = FieldComparison(
-                section='Deposit Endpoints',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'deposit'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare withdraw endpoints
-        for feature_name, feature_info in implemented_features.get('withdraw_endpoints', {}).items():
-            comparison = FieldComparison(
-                section='Withdraw Endpoints',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'withdraw'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare fee endpoint
-        for feature_name, feature_info in implemented_features.get('fee_endpoint', {}).items():
-            comparison = FieldComparison(
-                section='Fee Endpoint',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'fee'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare transaction endpoints
-        for feature_name, feature_info in implemented_features.get('transaction_endpoints', {}).items():
-            comparison = FieldComparison(
-                section='Transaction Endpoints',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'transaction'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare deposit request parameters
-        for feature_name, feature_info in implemented_features.get('deposit_request_parameters', {}).items():
-            comparison = FieldComparison(
-                section='Deposit Request Parameters',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_property'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'deposit_params'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare withdraw request parameters
-        for feature_name, feature_info in implemented_features.get('withdraw_request_parameters', {}).items():
-            comparison = FieldComparison(
-                section='Withdraw Request Parameters',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_property'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'withdraw_params'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare deposit response fields
-        for feature_name, feature_info in implemented_features.get('deposit_response_fields', {}).items():
-            comparison = FieldComparison(
-                section='Deposit Response Fields',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_property'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'deposit_response'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare withdraw response fields
-        for feature_name, feature_info in implemented_features.get('withdraw_response_fields', {}).items():
-            comparison = FieldComparison(
-                section='Withdraw Response Fields',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_property'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'withdraw_response'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare transaction fields
-        for feature_name, feature_info in implemented_features.get('transaction_fields', {}).items():
-            comparison = FieldComparison(
-                section='Transaction Fields',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_property'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'transaction_fields'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare transaction status values
-        for feature_name, feature_info in implemented_features.get('transaction_status_values', {}).items():
-            comparison = FieldComparison(
-                section='Transaction Status Values',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_status'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'transaction_status'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare info response fields
-        for feature_name, feature_info in implemented_features.get('info_response_fields', {}).items():
-            comparison = FieldComparison(
-                section='Info Response Fields',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_property'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'info_response'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} SEP-06 features{Colors.END}")
-
-    def _compare_sep_07_features(self) -> None:
-        """Compare SEP-07 style URI scheme features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Define section titles for display
-        section_titles = {
-            'operations': 'URI Operations',
-            'tx_parameters': 'TX Operation Parameters',
-            'pay_parameters': 'PAY Operation Parameters',
-            'common_parameters': 'Common Parameters',
-            'validation_features': 'Validation Features',
-            'signature_features': 'Signature Features'
-        }
-
-        # Compare each feature category
-        for category_key, category_title in section_titles.items():
-            category_features = implemented_features.get(category_key, {})
-
-            for feature_name, feature_info in category_features.items():
-                # Skip the coverage key
-                if feature_name == 'coverage':
-                    continue
-
-                # Determine SDK implementation property (method, constant, or property)
-                sdk_property = (
-                    feature_info.get('sdk_method') or
-                    feature_info.get('sdk_constant') or
-                    feature_info.get('sdk_property')
-                )
-
-                comparison = FieldComparison(
-                    section=category_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=sdk_property,
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_key
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} SEP-07 features{Colors.END}")
-
-    def _compare_sep_10_features(self) -> None:
-        """Compare SEP-10 style authentication features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare authentication endpoints
-        for endpoint_name, endpoint_info in implemented_features.get('authentication_endpoints', {}).items():
-            comparison = FieldComparison(
-                section='Authentication Endpoints',
-                field_name=endpoint_name,
-                required=endpoint_info.get('required', False),
-                implemented=endpoint_info.get('implemented', False),
-                sdk_property=endpoint_info.get('sdk_method'),
-                description=endpoint_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    endpoint_name,
-                    endpoint_info.get('required', False),
-                    'auth_endpoints'
-                ) if not endpoint_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare challenge transaction features
-        for feature_name, feature_info in implemented_features.get('challenge_transaction_features', {}).items():
-            comparison = FieldComparison(
-                section='Challenge Transaction Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'challenge_transaction'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare JWT token features
-        for feature_name, feature_info in implemented_features.get('jwt_token_features', {}).items():
-            is_server_side_only = feature_info.get('server_side_only', False)
-            implemented_status = feature_info.get('implemented')
-
-            # For server-side-only features, don't set priority (they're N/A for client)
-            priority = None
-            if not is_server_side_only and not implemented_status:
-                priority = self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'jwt_token'
-                )
-
-            comparison = FieldComparison(
-                section='JWT Token Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=implemented_status,
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=priority,
-                server_side_only=is_server_side_only,
-                client_note=feature_info.get('client_note')
-            )
-            self.comparisons.append(comparison)
-
-        # Compare client domain features
-        for feature_name, feature_info in implemented_features.get('client_domain_features', {}).items():
-            is_server_side_only = feature_info.get('server_side_only', False)
-            implemented_status = feature_info.get('implemented')
-
-            # For server-side-only features, don't set priority (they're N/A for client)
-            priority = None
-            if not is_server_side_only and not implemented_status:
-                priority = self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'client_domain'
-                )
-
-            comparison = FieldComparison(
-                section='Client Domain Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=implemented_status,
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=priority,
-                server_side_only=is_server_side_only,
-                client_note=feature_info.get('client_note')
-            )
-            self.comparisons.append(comparison)
-
-        # Compare verification features
-        for feature_name, feature_info in implemented_features.get('verification_features', {}).items():
-            comparison = FieldComparison(
-                section='Verification Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'verification'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} authentication features{Colors.END}")
-
-    def _compare_sep_45_features(self) -> None:
-        """Compare SEP-45 style contract account authentication features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare authentication endpoints
-        for endpoint_name, endpoint_info in implemented_features.get('authentication_endpoints', {}).items():
-            comparison = FieldComparison(
-                section='Authentication Endpoints',
-                field_name=endpoint_name,
-                required=endpoint_info.get('required', False),
-                implemented=endpoint_info.get('implemented', False),
-                sdk_property=endpoint_info.get('sdk_method'),
-                description=endpoint_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    endpoint_name,
-                    endpoint_info.get('required', False),
-                    'auth_endpoints'
-                ) if not endpoint_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare challenge features
-        for feature_name, feature_info in implemented_features.get('challenge_features', {}).items():
-            comparison = FieldComparison(
-                section='Challenge Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'challenge_features'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare JWT token features
-        for feature_name, feature_info in implemented_features.get('jwt_token_features', {}).items():
-            is_server_side_only = feature_info.get('server_side_only', False)
-            implemented_status = feature_info.get('implemented')
-
-            # For server-side-only features, don't set priority (they're N/A for client)
-            priority = None
-            if not is_server_side_only and not implemented_status:
-                priority = self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'jwt_token'
-                )
-
-            comparison = FieldComparison(
-                section='JWT Token Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=implemented_status,
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=priority,
-                server_side_only=is_server_side_only,
-                client_note=feature_info.get('client_note')
-            )
-            self.comparisons.append(comparison)
-
-        # Compare client domain features
-        for feature_name, feature_info in implemented_features.get('client_domain_features', {}).items():
-            comparison = FieldComparison(
-                section='Client Domain Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'client_domain'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare validation features
-        for feature_name, feature_info in implemented_features.get('validation_features', {}).items():
-            comparison = FieldComparison(
-                section='Validation Features',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'validation'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare exception types
-        for feature_name, feature_info in implemented_features.get('exception_types', {}).items():
-            comparison = FieldComparison(
-                section='Exception Types',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'exception_types'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} contract authentication features{Colors.END}")
-
-    def _compare_sep_12_features(self) -> None:
-        """Compare SEP-12 style KYC API features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare API endpoints
-        for endpoint_key, endpoint_info in implemented_features.get('endpoints', {}).items():
-            comparison = FieldComparison(
-                section='API Endpoints',
-                field_name=endpoint_key,
-                required=endpoint_info.get('required', True),  # KYC endpoints are essential
-                implemented=endpoint_info.get('implemented', False),
-                sdk_property=endpoint_info.get('sdk_method'),
-                description=f"{endpoint_info.get('method', '')} {endpoint_info.get('path', '')} - {endpoint_info.get('description', '')}",
-                priority=self.determine_field_priority(
-                    endpoint_key,
-                    endpoint_info.get('required', True),
-                    'api_endpoints'
-                ) if not endpoint_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare request parameters
-        for param_name, param_info in implemented_features.get('request_parameters', {}).items():
-            comparison = FieldComparison(
-                section='Request Parameters',
-                field_name=param_name,
-                required=param_info.get('required', False),
-                implemented=param_info.get('implemented', False),
-                sdk_property=param_info.get('sdk_property'),
-                description=param_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    param_name,
-                    param_info.get('required', False),
-                    'request_parameters'
-                ) if not param_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare response fields
-        for field_name, field_info in implemented_features.get('response_fields', {}).items():
-            comparison = FieldComparison(
-                section='Response Fields',
-                field_name=field_name,
-                required=field_info.get('required', False),
-                implemented=field_info.get('implemented', False),
-                sdk_property=field_info.get('sdk_property'),
-                description=field_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    field_name,
-                    field_info.get('required', False),
-                    'response_fields'
-                ) if not field_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare field type specifications
-        for field_name, field_info in implemented_features.get('field_types', {}).items():
-            comparison = FieldComparison(
-                section='Field Type Specifications',
-                field_name=field_name,
-                required=field_info.get('required', True),
-                implemented=field_info.get('implemented', False),
-                sdk_property=field_info.get('sdk_property'),
-                description=field_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    field_name,
-                    field_info.get('required', True),
-                    'field_types'
-                ) if not field_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Add authentication support
-        auth = implemented_features.get('authentication', {})
-        comparison = FieldComparison(
-            section='Authentication',
-            field_name='jwt_authentication',
-            required=True,
-            implemented=auth.get('implemented', False),
-            sdk_property='JWT Token',
-            description=f"{auth.get('method', 'JWT Token')} via {auth.get('type', 'SEP-10')} - {auth.get('description', '')}",
-            priority=FieldPriority.CRITICAL.value if not auth.get('implemented') else None
-        )
-        self.comparisons.append(comparison)
-
-        # Add file upload support
-        file_upload = implemented_features.get('file_upload', {})
-        comparison = FieldComparison(
-            section='File Upload',
-            field_name='multipart_file_upload',
-            required=True,
-            implemented=file_upload.get('implemented', False),
-            sdk_property='multipart/form-data',
-            description=file_upload.get('description', ''),
-            priority=FieldPriority.HIGH.value if not file_upload.get('implemented') else None
-        )
-        self.comparisons.append(comparison)
-
-        # Add SEP-9 integration
-        sep9 = implemented_features.get('sep9_integration', {})
-        comparison = FieldComparison(
-            section='SEP-9 Integration',
-            field_name='standard_kyc_fields',
-            required=True,
-            implemented=sep9.get('implemented', False),
-            sdk_property='StandardKYCFields',
-            description=sep9.get('description', ''),
-            priority=FieldPriority.HIGH.value if not sep9.get('implemented') else None
-        )
-        self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} KYC API features{Colors.END}")
-
-    def _compare_sep_38_features(self) -> None:
-        """Compare SEP-38 style Anchor RFQ API features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Section title mappings
-        section_mapping = {
-            'info_endpoint': 'Info Endpoint',
-            'prices_endpoint': 'Prices Endpoint',
-            'price_endpoint': 'Price Endpoint',
-            'post_quote_endpoint': 'Post Quote Endpoint',
-            'get_quote_endpoint': 'Get Quote Endpoint',
-            'info_response_fields': 'Info Response Fields',
-            'asset_fields': 'Asset Fields',
-            'delivery_method_fields': 'Delivery Method Fields',
-            'prices_request_parameters': 'Prices Request Parameters',
-            'prices_response_fields': 'Prices Response Fields',
-            'buy_asset_fields': 'Buy Asset Fields',
-            'price_request_parameters': 'Price Request Parameters',
-            'price_response_fields': 'Price Response Fields',
-            'post_quote_request_fields': 'Post Quote Request Fields',
-            'quote_response_fields': 'Quote Response Fields',
-            'fee_fields': 'Fee Fields',
-            'fee_details_fields': 'Fee Details Fields'
-        }
-
-        # Compare each feature category
-        for category_key, category_title in section_mapping.items():
-            category_features = implemented_features.get(category_key, {})
-
-            for feature_name, feature_info in category_features.items():
-                # Determine description based on category
-                description = feature_info.get('description', '')
-                if category_key in ['info_endpoint', 'prices_endpoint', 'price_endpoint', 'post_quote_endpoint', 'get_quote_endpoint']:
-                    method = feature_info.get('method', '')
-                    path = feature_info.get('path', '')
-                    if method and path:
-                        description = f"{method} {path} - {description}"
-
-                comparison = FieldComparison(
-                    section=category_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=feature_info.get('sdk_method') or feature_info.get('sdk_property'),
-                    description=description,
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_key
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Anchor RFQ API features{Colors.END}")
-
-    def _compare_sep_24_features(self) -> None:
-        """Compare SEP-24 style Hosted Deposit/Withdrawal API features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Section title mapping for display
-        section_titles = {
-            'info_endpoint': 'Info Endpoint',
-            'interactive_deposit_endpoint': 'Interactive Deposit Endpoint',
-            'interactive_withdraw_endpoint': 'Interactive Withdraw Endpoint',
-            'transaction_endpoints': 'Transaction Endpoints',
-            'fee_endpoint': 'Fee Endpoint',
-            'deposit_request_parameters': 'Deposit Request Parameters',
-            'withdraw_request_parameters': 'Withdraw Request Parameters',
-            'interactive_response_fields': 'Interactive Response Fields',
-            'transaction_status_values': 'Transaction Status Values',
-            'transaction_fields': 'Transaction Fields',
-            'info_response_fields': 'Info Response Fields',
-            'deposit_asset_fields': 'Deposit Asset Fields',
-            'withdraw_asset_fields': 'Withdraw Asset Fields',
-            'feature_flags_fields': 'Feature Flags Fields',
-            'fee_endpoint_fields': 'Fee Endpoint Info Fields'
-        }
-
-        # Compare each category
-        for category_name, category_features in implemented_features.items():
-            if category_name == 'coverage':
-                continue
-
-            section_title = section_titles.get(category_name, category_name.replace('_', ' ').title())
-
-            for feature_name, feature_info in category_features.items():
-                comparison = FieldComparison(
-                    section=section_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=feature_info.get('sdk_method') or feature_info.get('sdk_property'),
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_name
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Hosted Deposit/Withdrawal API features{Colors.END}")
-
-    def _compare_sep_30_features(self) -> None:
-        """Compare SEP-30 style Account Recovery API features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Section title mapping for display
-        section_titles = {
-            'api_endpoints': 'API Endpoints',
-            'request_fields': 'Request Fields',
-            'response_fields': 'Response Fields',
-            'error_codes': 'Error Codes',
-            'recovery_features': 'Recovery Features',
-            'authentication': 'Authentication'
-        }
-
-        # Compare each category
-        for category_name, category_features in implemented_features.items():
-            if category_name == 'coverage':
-                continue
-
-            section_title = section_titles.get(category_name, category_name.replace('_', ' ').title())
-
-            for feature_name, feature_info in category_features.items():
-                comparison = FieldComparison(
-                    section=section_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=feature_info.get('sdk_method') or feature_info.get('sdk_property') or feature_info.get('sdk_exception'),
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_name
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Account Recovery API features{Colors.END}")
-
-    def _compare_sep_08_features(self) -> None:
-        """Compare SEP-08 style Regulated Assets API features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Section title mapping for display
-        section_titles = {
-            'approval_endpoint': 'Approval Endpoint',
-            'request_parameters': 'Request Parameters',
-            'response_statuses': 'Response Statuses',
-            'success_response_fields': 'Success Response Fields',
-            'revised_response_fields': 'Revised Response Fields',
-            'pending_response_fields': 'Pending Response Fields',
-            'action_required_response_fields': 'Action Required Response Fields',
-            'rejected_response_fields': 'Rejected Response Fields',
-            'action_url_handling': 'Action URL Handling',
-            'stellar_toml_fields': 'Stellar TOML Fields',
-            'authorization_flags': 'Authorization Flags'
-        }
-
-        # Compare each category
-        for category_name, category_features in implemented_features.items():
-            if category_name == 'coverage':
-                continue
-
-            section_title = section_titles.get(category_name, category_name.replace('_', ' ').title())
-
-            for feature_name, feature_info in category_features.items():
-                # Get appropriate SDK reference (method, property, class, or combination)
-                sdk_reference = (
-                    feature_info.get('sdk_method') or
-                    feature_info.get('sdk_property') or
-                    feature_info.get('sdk_class') or
-                    feature_info.get('sdk_method_or_class')
-                )
-
-                comparison = FieldComparison(
-                    section=section_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=sdk_reference,
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_name
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Regulated Assets API features{Colors.END}")
-
-    def _compare_sep_11_features(self) -> None:
-        """Compare SEP-11 style Txrep features"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Section title mapping for display
-        section_titles = {
-            'encoding_features': 'Encoding Features',
-            'decoding_features': 'Decoding Features',
-            'asset_encoding': 'Asset Encoding',
-            'operation_types': 'Operation Types',
-            'format_features': 'Format Features'
-        }
-
-        # Compare each category
-        for category_name, category_features in implemented_features.items():
-            if category_name == 'coverage':
-                continue
-
-            section_title = section_titles.get(category_name, category_name.replace('_', ' ').title())
-
-            for feature_name, feature_info in category_features.items():
-                sdk_reference = feature_info.get('sdk_method')
-
-                comparison = FieldComparison(
-                    section=section_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=sdk_reference,
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_name
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Txrep features{Colors.END}")
-
-    def _compare_sep_46_features(self) -> None:
-        """Compare SEP-46 style features (Contract Meta)"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare metadata storage features
-        for feature_name, feature_info in implemented_features.get('metadata_storage', {}).items():
-            comparison = FieldComparison(
-                section='Metadata Storage',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'metadata_storage'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare encoding format features
-        for feature_name, feature_info in implemented_features.get('encoding_format', {}).items():
-            comparison = FieldComparison(
-                section='Encoding Format',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'encoding_format'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare implementation support features
-        for feature_name, feature_info in implemented_features.get('implementation_support', {}).items():
-            comparison = FieldComparison(
-                section='Implementation Support',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'implementation_support'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Contract Meta features{Colors.END}")
-
-    def _compare_sep_47_features(self) -> None:
-        """Compare SEP-47 style features (Contract Interface Discovery)"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Compare SEP declaration features
-        for feature_name, feature_info in implemented_features.get('sep_declaration', {}).items():
-            comparison = FieldComparison(
-                section='SEP Declaration',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'sep_declaration'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare meta entry format features
-        for feature_name, feature_info in implemented_features.get('meta_entry_format', {}).items():
-            comparison = FieldComparison(
-                section='Meta Entry Format',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'meta_entry_format'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        # Compare implementation support features
-        for feature_name, feature_info in implemented_features.get('implementation_support', {}).items():
-            comparison = FieldComparison(
-                section='Implementation Support',
-                field_name=feature_name,
-                required=feature_info.get('required', False),
-                implemented=feature_info.get('implemented', False),
-                sdk_property=feature_info.get('sdk_method'),
-                description=feature_info.get('description', ''),
-                priority=self.determine_field_priority(
-                    feature_name,
-                    feature_info.get('required', False),
-                    'implementation_support'
-                ) if not feature_info.get('implemented') else None
-            )
-            self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Contract Interface Discovery features{Colors.END}")
-
-    def _compare_sep_48_features(self) -> None:
-        """Compare SEP-48 style features (Smart Contract Specifications)"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Define section titles for display
-        section_titles = {
-            'wasm_section': 'Wasm Custom Section',
-            'entry_types': 'Entry Types',
-            'type_system_primitive': 'Type System - Primitive Types',
-            'type_system_compound': 'Type System - Compound Types',
-            'parsing_support': 'Parsing Support',
-            'xdr_support': 'XDR Support'
-        }
-
-        # Compare each feature category
-        for category_key, category_title in section_titles.items():
-            category_features = implemented_features.get(category_key, {})
-
-            for feature_name, feature_info in category_features.items():
-                comparison = FieldComparison(
-                    section=category_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=feature_info.get('sdk_method'),
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_key
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} Smart Contract Specification features{Colors.END}")
-
-    def _compare_sep_51_features(self) -> None:
-        """Compare SEP-51 style features (XDR-JSON)"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        section_titles = {
-            'xdr_data_types': 'XDR Data Types',
-            'stellar_specific_types': 'Stellar-Specific Types',
-            'json_schema': 'JSON Schema',
-        }
-
-        for category_key, category_title in section_titles.items():
-            category_features = implemented_features.get(category_key, {})
-
-            for feature_name, feature_info in category_features.items():
-                comparison = FieldComparison(
-                    section=category_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=feature_info.get('sdk_method'),
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_key
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} XDR-JSON features{Colors.END}")
-
-    def _compare_sep_53_features(self) -> None:
-        """Compare SEP-53 style features (Sign and Verify Messages)"""
-        implemented_features = self.sdk_data.get('implemented_features', {})
-
-        # Single capability section for message signing and verification.
-        section_titles = {
-            'message_signing': 'Message Signing',
-        }
-
-        for category_key, category_title in section_titles.items():
-            category_features = implemented_features.get(category_key, {})
-
-            for feature_name, feature_info in category_features.items():
-                comparison = FieldComparison(
-                    section=category_title,
-                    field_name=feature_name,
-                    required=feature_info.get('required', False),
-                    implemented=feature_info.get('implemented', False),
-                    sdk_property=feature_info.get('sdk_method'),
-                    description=feature_info.get('description', ''),
-                    priority=self.determine_field_priority(
-                        feature_name,
-                        feature_info.get('required', False),
-                        category_key
-                    ) if not feature_info.get('implemented') else None
-                )
-                self.comparisons.append(comparison)
-
-        print(f"{Colors.GREEN}✓ Compared {len(self.comparisons)} message signing features{Colors.END}")
+        compare(self)
 
     def calculate_statistics(self) -> Dict[str, Any]:
         """Calculate coverage statistics from comparisons (excluding server-side-only features)"""
@@ -1550,10 +203,10 @@ class SEPComparator:
         sep_version = preamble.get('version', 'N/A')
         sep_status = preamble.get('status', 'Unknown')
 
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with report_file(output_file) as f:
             # Header
             f.write(f"# SEP-{self.sep_number} ({sep_title}) Compatibility Matrix\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n")
+            f.write(f"**Generated:** {report_timestamp().strftime('%Y-%m-%d %H:%M:%S')}  \n")
             f.write(f"**SDK Version:** {self.sdk_version}  \n")
             f.write(f"**SEP Version:** {sep_version}  \n")
             f.write(f"**SEP Status:** {sep_status}  \n")
@@ -1872,8 +525,8 @@ class SEPComparator:
                 }
 
                 classes = self.sdk_data.get('classes', [])
-                # Filter out private classes (those starting with _)
-                public_classes = [cls for cls in classes if not cls['name'].startswith('_')]
+                # Only classes the package barrel exports (see SEPAnalyzer's 'public')
+                public_classes = [cls for cls in classes if cls.get('public', not cls['name'].startswith('_'))]
                 if public_classes:
                     f.write("### Key Classes\n\n")
                     for cls in public_classes:
@@ -1896,8 +549,10 @@ class SEPComparator:
                         f.write("\n")
                     f.write("\n")
 
-            # Add SEP-48 enhanced sections (Implementation Details, Integration, Testing, Code Examples)
-            self._generate_sep_48_enhanced_sections(f)
+            # SEP-specific sections (SEP-48: Implementation Details, Integration with Other SEPs)
+            write_sections = getattr(load_plugin(self.sep_number), 'write_markdown_sections', None)
+            if write_sections is not None:
+                write_sections(self, f)
 
             # Section Coverage
             f.write("## Coverage by Section\n\n")
@@ -2022,7 +677,7 @@ class SEPComparator:
         preamble = self.sep_data.get('preamble', {})
 
         report = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': report_timestamp().isoformat(),
             'sep_number': self.sep_number,
             'sep_title': preamble.get('title', f'SEP-{self.sep_number}'),
             'sep_version': preamble.get('version', 'N/A'),
@@ -2032,13 +687,9 @@ class SEPComparator:
             'gaps_by_priority': stats['gaps_by_priority']
         }
 
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        output_file = write_data(output_path, report)
 
-        print(f"{Colors.GREEN}✓ Statistics report written to {output_path}{Colors.END}")
+        print(f"{Colors.GREEN}✓ Statistics report written to {output_file}{Colors.END}")
 
     def print_summary(self) -> None:
         """Print a summary of the comparison results to console"""
@@ -2081,128 +732,6 @@ class SEPComparator:
         print(f"\n{Colors.BOLD}{Colors.HEADER}{'=' * 70}{Colors.END}\n")
 
 
-    def _generate_sep_48_enhanced_sections(self, f) -> None:
-        """
-        Generate enhanced sections for SEP-48 compatibility matrix.
-        These sections provide detailed implementation information and integration details.
-
-        Args:
-            f: File handle for writing markdown content
-        """
-        if self.sep_number != '0048':
-            return  # Only generate for SEP-48
-
-        # Implementation Details section
-        self._generate_sep_48_implementation_details(f)
-
-        # Integration with Other SEPs section
-        self._generate_sep_48_integration_with_seps(f)
-
-    def _generate_sep_48_implementation_details(self, f) -> None:
-        """Generate Implementation Details section for SEP-48"""
-        f.write("## Implementation Details\n\n")
-
-        f.write("### Parsing Contract Bytecode\n\n")
-        f.write("The Flutter SDK provides comprehensive bytecode parsing through the `SorobanContractParser` class:\n\n")
-        f.write("```dart\n")
-        f.write("import 'package:stellar_flutter_sdk/stellar_flutter_sdk.dart';\n\n")
-        f.write("// Parse contract bytecode\n")
-        f.write("final contractBytes = await Util.readFile('path/to/contract.wasm');\n")
-        f.write("final contractInfo = SorobanContractParser.parseContractByteCode(contractBytes);\n\n")
-        f.write("// Access parsed data\n")
-        f.write("final envVersion = contractInfo.envInterfaceVersion;\n")
-        f.write("final specEntries = contractInfo.specEntries;  // List of XdrSCSpecEntry\n")
-        f.write("final metaEntries = contractInfo.metaEntries;  // Map<String, String>\n")
-        f.write("final supportedSeps = contractInfo.supportedSeps;  // SEP-47 integration\n\n")
-        f.write("// Convenient categorized access (automatically populated)\n")
-        f.write("final functions = contractInfo.funcs;  // List of XdrSCSpecFunctionV0\n")
-        f.write("final structs = contractInfo.udtStructs;  // List of XdrSCSpecUDTStructV0\n")
-        f.write("final unions = contractInfo.udtUnions;  // List of XdrSCSpecUDTUnionV0\n")
-        f.write("final enums = contractInfo.udtEnums;  // List of XdrSCSpecUDTEnumV0\n")
-        f.write("final errorEnums = contractInfo.udtErrorEnums;  // List of XdrSCSpecUDTErrorEnumV0\n")
-        f.write("final events = contractInfo.events;  // List of XdrSCSpecEventV0\n")
-        f.write("```\n\n")
-
-        f.write("### Working with Contract Specifications\n\n")
-        f.write("The `ContractSpec` class provides utilities for working with parsed specifications:\n\n")
-        f.write("```dart\n")
-        f.write("import 'package:stellar_flutter_sdk/stellar_flutter_sdk.dart';\n\n")
-        f.write("// Create ContractSpec from parsed entries\n")
-        f.write("final spec = ContractSpec(contractInfo.specEntries);\n\n")
-        f.write("// Get all functions\n")
-        f.write("final functions = spec.funcs();\n\n")
-        f.write("// Get all UDT structs\n")
-        f.write("final structs = spec.udtStructs();\n\n")
-        f.write("// Get all UDT unions\n")
-        f.write("final unions = spec.udtUnions();\n\n")
-        f.write("// Get all UDT enums\n")
-        f.write("final enums = spec.udtEnums();\n\n")
-        f.write("// Get all UDT error enums\n")
-        f.write("final errorEnums = spec.udtErrorEnums();\n\n")
-        f.write("// Get all events\n")
-        f.write("final events = spec.events();\n\n")
-        f.write("// Get specific function\n")
-        f.write("final func = spec.getFunc('transfer');\n\n")
-        f.write("// Find any entry by name (function, struct, union, enum, error enum, or event)\n")
-        f.write("final entry = spec.findEntry('DataKey');\n\n")
-        f.write("// Convert native Dart arguments to XDR SCVal\n")
-        f.write("final args = {\n")
-        f.write("  'from': 'GABC...',\n")
-        f.write("  'to': 'GDEF...',\n")
-        f.write("  'amount': 1000\n")
-        f.write("};\n")
-        f.write("final xdrArgs = spec.funcArgsToXdrSCValues('transfer', args);\n")
-        f.write("```\n\n")
-
-        f.write("### Type System Support\n\n")
-        f.write("The SDK provides complete XDR type system support with 70+ XDR classes covering:\n\n")
-        f.write("- **Primitive types**: bool, u32, i32, u64, i64, u128, i128, u256, i256, address, bytes, string, symbol, void, timepoint, duration\n")
-        f.write("- **Compound types**: vec, map, tuple, option, result, bytesN\n")
-        f.write("- **User-defined types**: struct, union, enum, error enum\n")
-        f.write("- **Special types**: function inputs, event parameters\n\n")
-
-        f.write("### Native to XDR Conversion\n\n")
-        f.write("The `ContractSpec` class includes production-ready type conversion:\n\n")
-        f.write("```dart\n")
-        f.write("// Supports all primitive types\n")
-        f.write("spec.nativeToXdrSCVal(true, boolType);\n")
-        f.write("spec.nativeToXdrSCVal(42, u32Type);\n")
-        f.write("spec.nativeToXdrSCVal('Hello', stringType);\n\n")
-        f.write("// Supports compound types\n")
-        f.write("spec.nativeToXdrSCVal([1, 2, 3], vecType);\n")
-        f.write("spec.nativeToXdrSCVal({'key': 'value'}, mapType);\n\n")
-        f.write("// Supports BigInt values for u128, i128, u256, i256\n")
-        f.write("spec.nativeToXdrSCVal(BigInt.parse('123456789'), u128Type);\n")
-        f.write("spec.nativeToXdrSCVal('999999999999999999', u256Type);\n\n")
-        f.write("// Supports user-defined types\n")
-        f.write("spec.nativeToXdrSCVal({'name': 'Alice'}, structType);\n")
-        f.write("```\n\n")
-
-    def _generate_sep_48_integration_with_seps(self, f) -> None:
-        """Generate Integration with Other SEPs section for SEP-48"""
-        f.write("## Integration with Other SEPs\n\n")
-
-        f.write("### SEP-46 (Contract Meta)\n\n")
-        f.write("SEP-48 builds on SEP-46 by parsing metadata from the `contractmetav0` custom section:\n\n")
-        f.write("```dart\n")
-        f.write("// Meta entries are automatically parsed\n")
-        f.write("final metaEntries = contractInfo.metaEntries;\n\n")
-        f.write("// Example: Get contract version\n")
-        f.write("final version = metaEntries['version'];\n")
-        f.write("```\n\n")
-
-        f.write("### SEP-47 (Contract Interface Discovery)\n\n")
-        f.write("SEP-48 implementation includes full SEP-47 support for discovering which SEPs a contract implements:\n\n")
-        f.write("```dart\n")
-        f.write("// Supported SEPs are automatically extracted from meta entries\n")
-        f.write("final supportedSeps = contractInfo.supportedSeps;\n\n")
-        f.write("// Example: Check if contract supports SEP-41\n")
-        f.write("if (supportedSeps.contains('41')) {\n")
-        f.write("  // Contract implements SEP-41 (Token Interface)\n")
-        f.write("}\n")
-        f.write("```\n\n")
-
-
 def main():
     """Main entry point for the script"""
     if len(sys.argv) < 2:
@@ -2224,12 +753,12 @@ def main():
     markdown_output_path = compatibility_dir / 'sep' / f'SEP-{sep_number}_COMPATIBILITY_MATRIX.md'
 
     # Verify input files exist
-    if not sep_def_path.exists():
+    if not find_data(sep_def_path):
         print(f"{Colors.RED}ERROR: SEP definition file not found: {sep_def_path}{Colors.END}")
         print(f"Please run: {Colors.CYAN}sep_parser.py {sep_number}{Colors.END}")
         return 1
 
-    if not sdk_impl_path.exists():
+    if not find_data(sdk_impl_path):
         print(f"{Colors.RED}ERROR: SDK implementation file not found: {sdk_impl_path}{Colors.END}")
         print(f"Please run: {Colors.CYAN}sep_analyzer.py {sep_number}{Colors.END}")
         return 1
@@ -2243,14 +772,18 @@ def main():
 
     try:
         # Load data
-        comparator.load_data()
+        with trace_span('load.inputs'):
+            comparator.load_data()
 
         # Compare fields
-        comparator.compare_fields()
+        with trace_span(f'compare_sep_{sep_number[-2:]}') as span:
+            comparator.compare_fields()
+            span.add('comparisons', len(comparator.comparisons))
 
         # Generate reports
-        comparator.generate_statistics_report(str(statistics_output_path))
-        comparator.generate_markdown_report(str(markdown_output_path))
+        with trace_span('write.reports'):
+            comparator.generate_statistics_report(str(statistics_output_path))
+            comparator.generate_markdown_report(str(markdown_output_path))
 
         # Print summary
         comparator.print_summary()
@@ -2273,4 +806,8 @@ if __name__ == '__main__':
     if not sys.stdout.isatty():
         Colors.disable()
 
-    sys.exit(main())
+    sys.argv[1:] = split_output_flags(sys.argv[1:])
+    trace_path, sys.argv[1:] = split_trace_flag(sys.argv[1:])
+    with traced(f"generate_sep_comparison-{sys.argv[1] if len(sys.argv) > 1 else '0001'}", trace_path):
+        status = main()
+    sys.exit(status)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Comparison types shared by the SEP comparator and the per-SEP plugins.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+
+class CompatibilityStatus(Enum):
+    """Compatibility status indicators"""
+    FULLY_SUPPORTED = "✅"
+    PARTIALLY_SUPPORTED = "⚠️"
+    NOT_SUPPORTED = "❌"
+    UNKNOWN = "❔"
+
+
+class FieldPriority(Enum):
+    """Priority levels for missing fields"""
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
+@dataclass
+class FieldComparison:
+    """Represents a comparison between a SEP field and SDK implementation"""
+    section: str
+    field_name: str
+    required: bool
+    implemented: Optional[bool]  # None for N/A (e.g., server-side-only)
+    sdk_property: Optional[str]
+    description: str
+    priority: Optional[str] = None
+    server_side_only: bool = False
+    client_note: Optional[str] = None
@@ -0,0 +1,66 @@
+"""
+Per-SEP plugins for the SEP parser, analyzer and comparator.
+
+Each SEP with its own parsing, SDK mapping or comparison logic has a module
+here, sep_NNNN.py, that defines any of:
+
+    parse(parser)                            SEPParser: the SEP definition dict
+    analyze(analyzer)                        SEPAnalyzer: the analysis dict
+    compare(comparator)                      SEPComparator: appends FieldComparisons
+    write_markdown_sections(comparator, f)   extra compatibility-matrix sections
+
+A stage with no hook for a SEP falls back to its generic code path. Modules are
+imported the first time their SEP is processed, so a run over one SEP loads
+that SEP's code and no other's. The static feature catalogues the parsers
+enumerate live in catalogues/sep_NNNN.json and are read only by the parse()
+that uses them.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+import importlib
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+CATALOGUE_DIR = Path(__file__).parent / 'catalogues'
+
+# SEPs with a plugin module
+PLUGINS = frozenset({
+    '0001', '0002', '0005', '0006', '0007', '0008', '0009', '0010', '0011', '0012',
+    '0024', '0030', '0038', '0045', '0046', '0047', '0048', '0051', '0053',
+})
+
+
+def load_plugin(sep_number: str) -> Optional[ModuleType]:
+    """
+    Import the plugin for a SEP on first use.
+
+    Args:
+        sep_number: SEP number (e.g., '0005' or '5')
+
+    Returns:
+        The plugin module, or None if the SEP has no plugin
+    """
+    sep_number = sep_number.zfill(4)
+    if sep_number not in PLUGINS:
+        return None
+    return importlib.import_module(f'{__name__}.sep_{sep_number}')
+
+
+def load_catalogue(name: str) -> Dict[str, Any]:
+    """
+    Read a static feature catalogue from catalogues/<name>.json.
+
+    Each call returns a fresh copy, so callers may extend what they get.
+
+    Args:
+        name: Catalogue name (e.g., 'sep_0005')
+
+    Returns:
+        Dictionary of catalogue entries by name
+    """
+    with open(CATALOGUE_DIR / f'{name}.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
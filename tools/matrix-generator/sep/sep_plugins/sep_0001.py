@@ -0,0 +1,258 @@
+"""
+SEP-01 (stellar.toml) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+import re
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-01 (stellar.toml) specific structure.
+
+    Returns:
+        Structured SEP-01 data
+    """
+    catalogue = load_catalogue('sep_0001')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define expected sections for SEP-01 with their search patterns
+    section_definitions = catalogue['section_definitions']
+
+    content = parser.raw_content
+
+    # Extract each section
+    for section_def in section_definitions:
+        section_content = None
+
+        # Try each pattern until we find the section
+        for pattern in section_def['patterns']:
+            match = re.search(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+            if match:
+                section_content = match.group(1)
+                break
+
+        if section_content:
+            # Extract field definitions from the section content
+            fields = parser.extract_field_definitions(section_content)
+
+            # Store section data
+            data['sections'].append({
+                'title': section_def['title'],
+                'key': section_def['key'],
+                'content': section_content.strip()[:500],  # First 500 chars for reference
+                'field_count': len(fields),
+                'fields': fields
+            })
+
+            print(f"{Colors.GREEN}  ✓ Found '{section_def['title']}': {len(fields)} fields{Colors.END}")
+        else:
+            print(f"{Colors.YELLOW}  ⚠ Section '{section_def['title']}' not found{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-01 (stellar.toml) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-01 implementation files found'
+        }
+
+    # Load SEP-01 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented features
+    implemented_fields = map_fields(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_fields': implemented_fields,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_fields(classes: List[Dict[str, Any]],
+               sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-01 field requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping sections to implemented fields
+    """
+    implemented = {}
+
+    # Get all properties from all classes
+    all_properties = set()
+    for cls in classes:
+        for prop in cls.get('properties', []):
+            all_properties.add(prop['name'])
+
+    # Map to SEP sections
+    sections = sep_definition.get('sections', [])
+
+    for section in sections:
+        section_key = section.get('key', '')
+        section_title = section.get('title', '')
+        sep_fields = section.get('fields', [])
+
+        section_impl = {
+            'title': section_title,
+            'fields': {},
+            'coverage': 0
+        }
+
+        for field in sep_fields:
+            field_name = field.get('name', '')
+
+            # Convert SEP field name to SDK property name
+            # e.g., VERSION -> version, NETWORK_PASSPHRASE -> networkPassphrase
+            sdk_field_name = field_to_sdk_property(field_name)
+
+            implemented_in_sdk = sdk_field_name in all_properties
+
+            section_impl['fields'][field_name] = {
+                'required': field.get('required', False),
+                'implemented': implemented_in_sdk,
+                'sdk_property': sdk_field_name if implemented_in_sdk else None,
+                'description': field.get('description', '')
+            }
+
+        # Calculate coverage
+        total = len(sep_fields)
+        supported = sum(1 for f in section_impl['fields'].values() if f['implemented'])
+        section_impl['coverage'] = round((supported / total * 100) if total > 0 else 0, 2)
+
+        implemented[section_key] = section_impl
+
+    return implemented
+
+
+def field_to_sdk_property(sep_field: str) -> str:
+    """
+    Convert SEP field name to SDK property name.
+
+    Args:
+        sep_field: SEP field name (e.g., 'NETWORK_PASSPHRASE')
+
+    Returns:
+        SDK property name (e.g., 'networkPassphrase')
+    """
+    # Known mappings
+    mappings = {
+        'VERSION': 'version',
+        'NETWORK_PASSPHRASE': 'networkPassphrase',
+        'FEDERATION_SERVER': 'federationServer',
+        'AUTH_SERVER': 'authServer',
+        'TRANSFER_SERVER': 'transferServer',
+        'TRANSFER_SERVER_SEP0024': 'transferServerSep24',
+        'KYC_SERVER': 'kYCServer',
+        'WEB_AUTH_ENDPOINT': 'webAuthEndpoint',
+        'SIGNING_KEY': 'signingKey',
+        'HORIZON_URL': 'horizonUrl',
+        'ACCOUNTS': 'accounts',
+        'URI_REQUEST_SIGNING_KEY': 'uriRequestSigningKey',
+        'DIRECT_PAYMENT_SERVER': 'directPaymentServer',
+        'ANCHOR_QUOTE_SERVER': 'anchorQuoteServer',
+        'ORG_NAME': 'orgName',
+        'ORG_DBA': 'orgDBA',
+        'ORG_URL': 'orgUrl',
+        'ORG_LOGO': 'orgLogo',
+        'ORG_DESCRIPTION': 'orgDescription',
+        'ORG_PHYSICAL_ADDRESS': 'orgPhysicalAddress',
+        'ORG_PHYSICAL_ADDRESS_ATTESTATION': 'orgPhysicalAddressAttestation',
+        'ORG_PHONE_NUMBER': 'orgPhoneNumber',
+        'ORG_PHONE_NUMBER_ATTESTATION': 'orgPhoneNumberAttestation',
+        'ORG_KEYBASE': 'orgKeybase',
+        'ORG_TWITTER': 'orgTwitter',
+        'ORG_GITHUB': 'orgGithub',
+        'ORG_OFFICIAL_EMAIL': 'orgOfficialEmail',
+        'ORG_SUPPORT_EMAIL': 'orgSupportEmail',
+        'ORG_LICENSING_AUTHORITY': 'orgLicensingAuthority',
+        'ORG_LICENSE_TYPE': 'orgLicenseType',
+        'ORG_LICENSE_NUMBER': 'orgLicenseNumber',
+        'ALIAS': 'alias',
+        'DISPLAY_NAME': 'displayName',
+        'PUBLIC_KEY': 'publicKey',
+        'HOST': 'host',
+        'HISTORY': 'history',
+    }
+
+    if sep_field in mappings:
+        return mappings[sep_field]
+
+    # Default: convert to camelCase
+    parts = sep_field.lower().split('_')
+    return parts[0] + ''.join(p.capitalize() for p in parts[1:])
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-01 style fields"""
+    implemented_fields = comparator.sdk_data.get('implemented_fields', {})
+
+    # Compare each section
+    for section_key, section_data in implemented_fields.items():
+        section_title = section_data.get('title', section_key)
+
+        for field_name, field_info in section_data.get('fields', {}).items():
+            comparison = FieldComparison(
+                section=section_title,
+                field_name=field_name,
+                required=field_info.get('required', False),
+                implemented=field_info.get('implemented', False),
+                sdk_property=field_info.get('sdk_property'),
+                description=field_info.get('description', ''),
+                priority=comparator.determine_field_priority(
+                    field_name,
+                    field_info.get('required', False),
+                    section_key
+                ) if not field_info.get('implemented') else None
+            )
+
+            comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} fields{Colors.END}")
@@ -0,0 +1,314 @@
+"""
+SEP-02 (Federation Protocol) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+import re
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+_REQUEST_TYPES_RE = re.compile(r'Supported types:\s*\n\n(.*?)(?=\n##|\Z)', re.MULTILINE | re.DOTALL)
+_REQUEST_TYPE_RE = re.compile(r'-\s+`(\w+)`:\s+(.*?)(?=\n-\s+`\w+`:|Example|$)', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-02 (Federation Protocol) specific structure.
+
+    Returns:
+        Structured SEP-02 data with API endpoints and fields
+    """
+    catalogue = load_catalogue('sep_0002')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define API structure for SEP-02
+    api_structure = {
+        'endpoint': {
+            'path': '/federation',
+            'method': 'GET',
+            'description': 'Federation lookup endpoint'
+        },
+        'request_parameters': [],
+        'request_types': [],
+        'response_fields': []
+    }
+
+    # Extract request types
+    match = _REQUEST_TYPES_RE.search(parser.raw_content)
+    if match:
+        types_text = match.group(1)
+        # Extract each type definition
+        for type_match in _REQUEST_TYPE_RE.finditer(types_text):
+            type_name = type_match.group(1)
+            description = type_match.group(2).strip()
+            # Clean up description
+            description = _WHITESPACE_RE.sub(' ', description)
+            api_structure['request_types'].append({
+                'name': type_name,
+                'description': description,
+                'required': type_name in ['name', 'id']  # name and id are core functionality
+            })
+
+    # Extract query parameters
+    query_params = catalogue['query_params']
+    api_structure['request_parameters'] = query_params
+
+    # Extract response fields
+    # For SEP-02, we know the response fields from the spec, so hardcode them
+    # The parsing regex has issues with multiline descriptions
+    api_structure['response_fields'] = catalogue['response_fields']
+
+    # Store API structure as a section
+    data['sections'].append({
+        'title': 'API Structure',
+        'key': 'api',
+        'content': 'Federation API endpoints and parameters',
+        'api_structure': api_structure,
+        'field_count': len(api_structure['response_fields']) + len(api_structure['request_parameters'])
+    })
+
+    # Extract other sections for context
+    general_sections = parser.extract_sections()
+    for section in general_sections:
+        if section['title'] not in ['Preamble', 'Summary', 'Simple Summary']:
+            data['sections'].append(section)
+
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['request_types'])} request types{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['request_parameters'])} request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['response_fields'])} response fields{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-02 (Federation Protocol) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-02 implementation files found'
+        }
+
+    # Load SEP-02 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented API features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-02 API requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping API features to implementation status
+    """
+    implemented = {
+        'request_types': {},
+        'request_parameters': {},
+        'response_fields': {},
+        'coverage': {}
+    }
+
+    # Get API structure from definition
+    api_structure = None
+    for section in sep_definition.get('sections', []):
+        if section.get('key') == 'api':
+            api_structure = section.get('api_structure', {})
+            break
+
+    if not api_structure:
+        return implemented
+
+    # Get all methods from all classes
+    all_methods = {}
+    for cls in classes:
+        for method in cls.get('methods', []):
+            all_methods[method['name']] = method
+
+    # Get all properties from FederationResponse class
+    all_properties = set()
+    for cls in classes:
+        if cls['name'] == 'FederationResponse':
+            for prop in cls.get('properties', []):
+                all_properties.add(prop['name'])
+
+    # Map request types to methods
+    request_types_map = {
+        'name': 'resolveStellarAddress',
+        'id': 'resolveStellarAccountId',
+        'txid': 'resolveStellarTransactionId',
+        'forward': 'resolveForward'
+    }
+
+    for req_type in api_structure.get('request_types', []):
+        type_name = req_type['name']
+        sdk_method = request_types_map.get(type_name)
+        implemented_in_sdk = sdk_method in all_methods
+
+        implemented['request_types'][type_name] = {
+            'required': req_type.get('required', False),
+            'implemented': implemented_in_sdk,
+            'sdk_method': sdk_method if implemented_in_sdk else None,
+            'description': req_type.get('description', '')
+        }
+
+    # Map request parameters
+    # Both q and type are handled internally by the RequestBuilder
+    for param in api_structure.get('request_parameters', []):
+        param_name = param['name']
+        # These are handled by forStringToLookUp (q) and forType (type) methods
+        implemented_in_sdk = True  # Always true since it's part of the request builder
+
+        implemented['request_parameters'][param_name] = {
+            'required': param.get('required', False),
+            'implemented': implemented_in_sdk,
+            'description': param.get('description', '')
+        }
+
+    # Map response fields to properties
+    property_name_map = {
+        'stellar_address': 'stellarAddress',
+        'account_id': 'accountId',
+        'memo_type': 'memoType',
+        'memo': 'memo'
+    }
+
+    for field in api_structure.get('response_fields', []):
+        field_name = field['name']
+        sdk_property = property_name_map.get(field_name, field_name)
+        implemented_in_sdk = sdk_property in all_properties
+
+        implemented['response_fields'][field_name] = {
+            'required': field.get('required', False),
+            'implemented': implemented_in_sdk,
+            'sdk_property': sdk_property if implemented_in_sdk else None,
+            'description': field.get('description', '')
+        }
+
+    # Calculate coverage
+    total_features = (
+        len(api_structure.get('request_types', [])) +
+        len(api_structure.get('request_parameters', [])) +
+        len(api_structure.get('response_fields', []))
+    )
+
+    implemented_count = (
+        sum(1 for v in implemented['request_types'].values() if v['implemented']) +
+        sum(1 for v in implemented['request_parameters'].values() if v['implemented']) +
+        sum(1 for v in implemented['response_fields'].values() if v['implemented'])
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-02 style API features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare request types
+    for type_name, type_info in implemented_features.get('request_types', {}).items():
+        comparison = FieldComparison(
+            section='Request Types',
+            field_name=type_name,
+            required=type_info.get('required', False),
+            implemented=type_info.get('implemented', False),
+            sdk_property=type_info.get('sdk_method'),
+            description=type_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                type_name,
+                type_info.get('required', False),
+                'request_types'
+            ) if not type_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare request parameters
+    for param_name, param_info in implemented_features.get('request_parameters', {}).items():
+        comparison = FieldComparison(
+            section='Request Parameters',
+            field_name=param_name,
+            required=param_info.get('required', False),
+            implemented=param_info.get('implemented', False),
+            sdk_property=param_name,  # Parameters don't have direct mappings
+            description=param_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                param_name,
+                param_info.get('required', False),
+                'request_parameters'
+            ) if not param_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare response fields
+    for field_name, field_info in implemented_features.get('response_fields', {}).items():
+        comparison = FieldComparison(
+            section='Response Fields',
+            field_name=field_name,
+            required=field_info.get('required', False),
+            implemented=field_info.get('implemented', False),
+            sdk_property=field_info.get('sdk_property'),
+            description=field_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                field_name,
+                field_info.get('required', False),
+                'response_fields'
+            ) if not field_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} features{Colors.END}")
@@ -0,0 +1,444 @@
+"""
+SEP-05 (Key Derivation Methods for Stellar Keys) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+import re
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+_PRIVATE_METHOD_RE = re.compile(r'(?:Uint8List|Future<\w+>|void)\s+(_\w+)\s*\(')
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-05 (Key Derivation Methods for Stellar Keys) specific structure.
+
+    Returns:
+        Structured SEP-05 data with cryptographic standards and key derivation methods
+    """
+    catalogue = load_catalogue('sep_0005')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define cryptographic features structure for SEP-05
+    crypto_features = {
+        'bip39_features': [],
+        'bip32_features': [],
+        'bip44_features': [],
+        'key_derivation_methods': [],
+        'language_support': []
+    }
+
+    # BIP-39 Mnemonic features (core requirement)
+    crypto_features['bip39_features'] = catalogue['bip39_features']
+
+    # BIP-32 Hierarchical Deterministic Key Derivation
+    crypto_features['bip32_features'] = catalogue['bip32_features']
+
+    # BIP-44 Multi-Account Hierarchy
+    crypto_features['bip44_features'] = catalogue['bip44_features']
+
+    # Key Derivation Methods
+    crypto_features['key_derivation_methods'] = catalogue['key_derivation_methods']
+
+    # Language Support
+    crypto_features['language_support'] = catalogue['language_support']
+
+    # Store crypto features as sections
+    data['sections'].append({
+        'title': 'BIP-39 Mnemonic Features',
+        'key': 'bip39',
+        'content': 'BIP-39 mnemonic generation, validation, and seed derivation',
+        'crypto_features': crypto_features['bip39_features'],
+        'feature_count': len(crypto_features['bip39_features'])
+    })
+
+    data['sections'].append({
+        'title': 'BIP-32 Key Derivation',
+        'key': 'bip32',
+        'content': 'BIP-32 hierarchical deterministic key derivation',
+        'crypto_features': crypto_features['bip32_features'],
+        'feature_count': len(crypto_features['bip32_features'])
+    })
+
+    data['sections'].append({
+        'title': 'BIP-44 Multi-Account Support',
+        'key': 'bip44',
+        'content': "BIP-44 multi-account hierarchy for Stellar (m/44'/148'/account')",
+        'crypto_features': crypto_features['bip44_features'],
+        'feature_count': len(crypto_features['bip44_features'])
+    })
+
+    data['sections'].append({
+        'title': 'Key Derivation Methods',
+        'key': 'key_derivation',
+        'content': 'Methods for deriving Stellar keys from mnemonics',
+        'crypto_features': crypto_features['key_derivation_methods'],
+        'feature_count': len(crypto_features['key_derivation_methods'])
+    })
+
+    data['sections'].append({
+        'title': 'Language Support',
+        'key': 'languages',
+        'content': 'BIP-39 word list language support',
+        'crypto_features': crypto_features['language_support'],
+        'feature_count': len(crypto_features['language_support'])
+    })
+
+    # Calculate totals
+    total_features = (
+        len(crypto_features['bip39_features']) +
+        len(crypto_features['bip32_features']) +
+        len(crypto_features['bip44_features']) +
+        len(crypto_features['key_derivation_methods']) +
+        len(crypto_features['language_support'])
+    )
+
+    print(f"{Colors.GREEN}  ✓ Found {len(crypto_features['bip39_features'])} BIP-39 features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(crypto_features['bip32_features'])} BIP-32 features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(crypto_features['bip44_features'])} BIP-44 features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(crypto_features['key_derivation_methods'])} key derivation methods{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(crypto_features['language_support'])} languages{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} cryptographic features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-05 (Key Derivation Methods) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-05 implementation files found'
+        }
+
+    # Load SEP-05 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented cryptographic features
+    implemented_features = map_features(analyzer, all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(analyzer: 'SEPAnalyzer', classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-05 cryptographic feature requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping crypto features to implementation status
+    """
+    implemented = {
+        'bip39_features': {},
+        'bip32_features': {},
+        'bip44_features': {},
+        'key_derivation_methods': {},
+        'language_support': {},
+        'coverage': {}
+    }
+
+    # Get all methods from all classes (including private methods)
+    all_methods = {}
+    for cls in classes:
+        for method in cls.get('methods', []):
+            all_methods[method['name']] = method
+
+    # Also search for private methods in the source code
+    # For SEP-05, we need to check for _derivePath, _derive, _hMacSHA512
+    for cls in classes:
+        if 'file' in cls:
+            # Read the source file to find private methods
+            file_path = analyzer.sdk_path / cls['file']
+            if file_path.exists():
+                content = file_path.read_text(encoding='utf-8', errors='ignore')
+                # Find private method definitions
+                matches = _PRIVATE_METHOD_RE.finditer(content)
+                for match in matches:
+                    method_name = match.group(1)
+                    if method_name not in all_methods:
+                        all_methods[method_name] = {'name': method_name, 'private': True}
+
+    # Map BIP-39 features to SDK methods
+    bip39_feature_map = {
+        'mnemonic_generation_12_words': 'generate12WordsMnemonic',
+        'mnemonic_generation_24_words': 'generate24WordsMnemonic',
+        'mnemonic_validation': 'validate',
+        'mnemonic_to_seed': 'mnemonicToSeed',
+        'passphrase_support': 'mnemonicToSeed'  # Passphrase is a parameter
+    }
+
+    # Map BIP-32 features to SDK methods
+    bip32_feature_map = {
+        'hd_key_derivation': '_derivePath',
+        'ed25519_curve': '_hMacSHA512',  # Ed25519 support through HMAC-SHA512
+        'master_key_generation': '_derivePath',
+        'child_key_derivation': '_derive'
+    }
+
+    # Map BIP-44 features to SDK methods
+    bip44_feature_map = {
+        'stellar_derivation_path': 'getKeyPair',  # Uses m/44'/148'/account'
+        'multiple_accounts': 'getKeyPair',  # Supports index parameter
+        'account_index_support': 'getKeyPair'
+    }
+
+    # Map key derivation methods
+    key_derivation_map = {
+        'keypair_from_mnemonic': 'getKeyPair',
+        'account_id_from_mnemonic': 'getAccountId',
+        'seed_from_mnemonic': 'mnemonicToSeed'
+    }
+
+    # Map language support (check for word list methods)
+    language_map = {
+        'english': 'englishWords',
+        'chinese_simplified': 'chineseSimplifiedWords',
+        'chinese_traditional': 'chineseTraditionalWords',
+        'french': 'frenchWords',
+        'italian': 'italianWords',
+        'japanese': 'japaneseWords',
+        'korean': 'koreanWords',
+        'spanish': 'spanishWords'
+    }
+
+    # Check if WordList class has these methods
+    wordlist_methods = set()
+    for cls in classes:
+        if cls['name'] == 'WordList':
+            for method in cls.get('methods', []):
+                wordlist_methods.add(method['name'])
+
+    # Process each section from SEP definition
+    sections = sep_definition.get('sections', [])
+
+    for section in sections:
+        section_key = section.get('key', '')
+        crypto_features = section.get('crypto_features', [])
+
+        if section_key == 'bip39':
+            for feature in crypto_features:
+                feature_name = feature['name']
+                sdk_method = bip39_feature_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['bip39_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'bip32':
+            for feature in crypto_features:
+                feature_name = feature['name']
+                sdk_method = bip32_feature_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['bip32_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'bip44':
+            for feature in crypto_features:
+                feature_name = feature['name']
+                sdk_method = bip44_feature_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['bip44_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'key_derivation':
+            for feature in crypto_features:
+                feature_name = feature['name']
+                sdk_method = key_derivation_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['key_derivation_methods'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'languages':
+            for feature in crypto_features:
+                feature_name = feature['name']
+                wordlist_method = language_map.get(feature_name)
+                implemented_in_sdk = wordlist_method in wordlist_methods if wordlist_method else False
+
+                implemented['language_support'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': wordlist_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage
+    total_features = (
+        len(implemented['bip39_features']) +
+        len(implemented['bip32_features']) +
+        len(implemented['bip44_features']) +
+        len(implemented['key_derivation_methods']) +
+        len(implemented['language_support'])
+    )
+
+    implemented_count = (
+        sum(1 for v in implemented['bip39_features'].values() if v['implemented']) +
+        sum(1 for v in implemented['bip32_features'].values() if v['implemented']) +
+        sum(1 for v in implemented['bip44_features'].values() if v['implemented']) +
+        sum(1 for v in implemented['key_derivation_methods'].values() if v['implemented']) +
+        sum(1 for v in implemented['language_support'].values() if v['implemented'])
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-05 style cryptographic features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare BIP-39 features
+    for feature_name, feature_info in implemented_features.get('bip39_features', {}).items():
+        comparison = FieldComparison(
+            section='BIP-39 Mnemonic Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'bip39'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare BIP-32 features
+    for feature_name, feature_info in implemented_features.get('bip32_features', {}).items():
+        comparison = FieldComparison(
+            section='BIP-32 Key Derivation',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'bip32'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare BIP-44 features
+    for feature_name, feature_info in implemented_features.get('bip44_features', {}).items():
+        comparison = FieldComparison(
+            section='BIP-44 Multi-Account Support',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'bip44'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare key derivation methods
+    for feature_name, feature_info in implemented_features.get('key_derivation_methods', {}).items():
+        comparison = FieldComparison(
+            section='Key Derivation Methods',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'key_derivation'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare language support
+    for feature_name, feature_info in implemented_features.get('language_support', {}).items():
+        comparison = FieldComparison(
+            section='Language Support',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'languages'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} cryptographic features{Colors.END}")
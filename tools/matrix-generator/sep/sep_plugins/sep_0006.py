@@ -0,0 +1,808 @@
+"""
+SEP-06 (Anchor/Client Interoperability) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-06 (Deposit and Withdrawal API) specific structure.
+
+    Returns:
+        Structured SEP-06 data with API endpoints and transaction flow features
+    """
+    catalogue = load_catalogue('sep_0006')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define comprehensive API structure for SEP-06
+    api_structure = catalogue['api_structure']
+
+    # Store API structure components as sections
+    data['sections'].append({
+        'title': 'Info Endpoint',
+        'key': 'info_endpoint',
+        'content': 'Endpoint for querying anchor capabilities',
+        'api_features': [api_structure['info_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Deposit Endpoints',
+        'key': 'deposit_endpoints',
+        'content': 'Endpoints for initiating deposit transactions',
+        'api_features': api_structure['deposit_endpoints'],
+        'feature_count': len(api_structure['deposit_endpoints'])
+    })
+
+    data['sections'].append({
+        'title': 'Withdraw Endpoints',
+        'key': 'withdraw_endpoints',
+        'content': 'Endpoints for initiating withdrawal transactions',
+        'api_features': api_structure['withdraw_endpoints'],
+        'feature_count': len(api_structure['withdraw_endpoints'])
+    })
+
+    data['sections'].append({
+        'title': 'Transaction Endpoints',
+        'key': 'transaction_endpoints',
+        'content': 'Endpoints for tracking and managing transactions',
+        'api_features': api_structure['transaction_endpoints'],
+        'feature_count': len(api_structure['transaction_endpoints'])
+    })
+
+    data['sections'].append({
+        'title': 'Fee Endpoint',
+        'key': 'fee_endpoint',
+        'content': 'Endpoint for calculating transaction fees',
+        'api_features': [api_structure['fee_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Deposit Request Parameters',
+        'key': 'deposit_request_parameters',
+        'content': 'Parameters for deposit endpoint requests',
+        'api_features': api_structure['deposit_request_parameters'],
+        'feature_count': len(api_structure['deposit_request_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Withdraw Request Parameters',
+        'key': 'withdraw_request_parameters',
+        'content': 'Parameters for withdraw endpoint requests',
+        'api_features': api_structure['withdraw_request_parameters'],
+        'feature_count': len(api_structure['withdraw_request_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Deposit Response Fields',
+        'key': 'deposit_response_fields',
+        'content': 'Fields returned in deposit endpoint responses',
+        'api_features': api_structure['deposit_response_fields'],
+        'feature_count': len(api_structure['deposit_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Withdraw Response Fields',
+        'key': 'withdraw_response_fields',
+        'content': 'Fields returned in withdraw endpoint responses',
+        'api_features': api_structure['withdraw_response_fields'],
+        'feature_count': len(api_structure['withdraw_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Transaction Status Values',
+        'key': 'transaction_status_values',
+        'content': 'Possible transaction status values',
+        'api_features': api_structure['transaction_status_values'],
+        'feature_count': len(api_structure['transaction_status_values'])
+    })
+
+    data['sections'].append({
+        'title': 'Transaction Fields',
+        'key': 'transaction_fields',
+        'content': 'Fields returned in transaction objects',
+        'api_features': api_structure['transaction_fields'],
+        'feature_count': len(api_structure['transaction_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Info Response Fields',
+        'key': 'info_response_fields',
+        'content': 'Fields returned in info endpoint response',
+        'api_features': api_structure['info_response_fields'],
+        'feature_count': len(api_structure['info_response_fields'])
+    })
+
+    # Calculate totals
+    total_features = (
+        1 +  # info_endpoint
+        len(api_structure['deposit_endpoints']) +
+        len(api_structure['withdraw_endpoints']) +
+        len(api_structure['transaction_endpoints']) +
+        1 +  # fee_endpoint
+        len(api_structure['deposit_request_parameters']) +
+        len(api_structure['withdraw_request_parameters']) +
+        len(api_structure['deposit_response_fields']) +
+        len(api_structure['withdraw_response_fields']) +
+        len(api_structure['transaction_status_values']) +
+        len(api_structure['transaction_fields']) +
+        len(api_structure['info_response_fields'])
+    )
+
+    print(f"{Colors.GREEN}  ✓ Found 1 info endpoint{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['deposit_endpoints'])} deposit endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['withdraw_endpoints'])} withdraw endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['transaction_endpoints'])} transaction endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['deposit_request_parameters'])} deposit request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['withdraw_request_parameters'])} withdraw request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['transaction_status_values'])} transaction status values{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} SEP-06 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-06 (Deposit and Withdrawal API) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-06 implementation files found'
+        }
+
+    # Load SEP-06 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented API features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-06 Deposit/Withdrawal API requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping API features to implementation status
+    """
+    implemented = {
+        'info_endpoint': {},
+        'deposit_endpoints': {},
+        'withdraw_endpoints': {},
+        'transaction_endpoints': {},
+        'fee_endpoint': {},
+        'deposit_request_parameters': {},
+        'withdraw_request_parameters': {},
+        'deposit_response_fields': {},
+        'withdraw_response_fields': {},
+        'transaction_status_values': {},
+        'transaction_fields': {},
+        'info_response_fields': {},
+        'coverage': {}
+    }
+
+    # Get all methods from TransferServerService class
+    transfer_service_methods = set()
+    for cls in classes:
+        if cls['name'] == 'TransferServerService':
+            for method in cls.get('methods', []):
+                transfer_service_methods.add(method['name'])
+
+    # Map endpoints to TransferServerService methods
+    endpoint_map = {
+        'info_endpoint': 'info',
+        'deposit': 'deposit',
+        'deposit_exchange': 'depositExchange',
+        'withdraw': 'withdraw',
+        'withdraw_exchange': 'withdrawExchange',
+        'transactions': 'transactions',
+        'transaction': 'transaction',
+        'patch_transaction': 'patchTransaction',
+        'fee_endpoint': 'fee'
+    }
+
+    # Process each section from SEP definition
+    for section in sep_definition.get('sections', []):
+        section_key = section.get('key', '')
+        api_features = section.get('api_features', [])
+
+        if section_key == 'info_endpoint':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['info_endpoint'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'deposit_endpoints':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['deposit_endpoints'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'withdraw_endpoints':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['withdraw_endpoints'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'transaction_endpoints':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['transaction_endpoints'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'fee_endpoint':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['fee_endpoint'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'deposit_request_parameters':
+            # Check DepositRequest class properties
+            deposit_request_properties = set()
+            for cls in classes:
+                if cls['name'] == 'DepositRequest':
+                    for prop in cls.get('properties', []):
+                        deposit_request_properties.add(prop['name'])
+
+            # Map parameter names to SDK properties
+            param_map = {
+                'asset_code': 'assetCode',
+                'account': 'account',
+                'memo_type': 'memoType',
+                'memo': 'memo',
+                'email_address': 'emailAddress',
+                'type': 'type',
+                'wallet_name': 'walletName',
+                'wallet_url': 'walletUrl',
+                'lang': 'lang',
+                'on_change_callback': 'onChangeCallback',
+                'amount': 'amount',
+                'country_code': 'countryCode',
+                'claimable_balance_supported': 'claimableBalanceSupported',
+                'customer_id': 'customerId',
+                'location_id': 'locationId'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = param_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in deposit_request_properties
+
+                implemented['deposit_request_parameters'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'withdraw_request_parameters':
+            # Check WithdrawRequest class properties
+            withdraw_request_properties = set()
+            for cls in classes:
+                if cls['name'] == 'WithdrawRequest':
+                    for prop in cls.get('properties', []):
+                        withdraw_request_properties.add(prop['name'])
+
+            # Map parameter names to SDK properties
+            param_map = {
+                'asset_code': 'assetCode',
+                'type': 'type',
+                'dest': 'dest',
+                'dest_extra': 'destExtra',
+                'account': 'account',
+                'memo': 'memo',
+                'memo_type': 'memoType',
+                'wallet_name': 'walletName',
+                'wallet_url': 'walletUrl',
+                'lang': 'lang',
+                'on_change_callback': 'onChangeCallback',
+                'amount': 'amount',
+                'country_code': 'countryCode',
+                'refund_memo': 'refundMemo',
+                'refund_memo_type': 'refundMemoType',
+                'customer_id': 'customerId',
+                'location_id': 'locationId'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = param_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in withdraw_request_properties
+
+                implemented['withdraw_request_parameters'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'deposit_response_fields':
+            # Check DepositResponse class properties
+            deposit_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'DepositResponse':
+                    for prop in cls.get('properties', []):
+                        deposit_response_properties.add(prop['name'])
+
+            # Map response field names to SDK properties
+            field_map = {
+                'how': 'how',
+                'id': 'id',
+                'eta': 'eta',
+                'min_amount': 'minAmount',
+                'max_amount': 'maxAmount',
+                'fee_fixed': 'feeFixed',
+                'fee_percent': 'feePercent',
+                'extra_info': 'extraInfo'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in deposit_response_properties
+
+                implemented['deposit_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'withdraw_response_fields':
+            # Check WithdrawResponse class properties
+            withdraw_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'WithdrawResponse':
+                    for prop in cls.get('properties', []):
+                        withdraw_response_properties.add(prop['name'])
+
+            # Map response field names to SDK properties
+            field_map = {
+                'account_id': 'accountId',
+                'memo_type': 'memoType',
+                'memo': 'memo',
+                'id': 'id',
+                'eta': 'eta',
+                'min_amount': 'minAmount',
+                'max_amount': 'maxAmount',
+                'fee_fixed': 'feeFixed',
+                'fee_percent': 'feePercent',
+                'extra_info': 'extraInfo'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in withdraw_response_properties
+
+                implemented['withdraw_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'transaction_status_values':
+            # Check AnchorTransaction class for status constants or fields
+            # SEP-06 transaction statuses are typically handled as string values
+            # We check if AnchorTransaction class has a status field
+            has_status_field = False
+            for cls in classes:
+                if cls['name'] == 'AnchorTransaction':
+                    for prop in cls.get('properties', []):
+                        if prop['name'] == 'status':
+                            has_status_field = True
+                            break
+
+            # All status values are supported if the status field exists
+            for feature in api_features:
+                feature_name = feature['name']
+
+                implemented['transaction_status_values'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': has_status_field,
+                    'sdk_property': 'status' if has_status_field else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'transaction_fields':
+            # Check AnchorTransaction class properties
+            transaction_properties = set()
+            for cls in classes:
+                if cls['name'] == 'AnchorTransaction':
+                    for prop in cls.get('properties', []):
+                        transaction_properties.add(prop['name'])
+
+            # Map transaction field names to SDK properties
+            field_map = {
+                'id': 'id',
+                'kind': 'kind',
+                'status': 'status',
+                'status_eta': 'statusEta',
+                'amount_in': 'amountIn',
+                'amount_out': 'amountOut',
+                'amount_fee': 'amountFee',
+                'started_at': 'startedAt',
+                'completed_at': 'completedAt',
+                'stellar_transaction_id': 'stellarTransactionId',
+                'external_transaction_id': 'externalTransactionId',
+                'from': 'from',
+                'to': 'to',
+                'refunded': 'refunded',
+                'refunds': 'refunds',
+                'message': 'message'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in transaction_properties
+
+                implemented['transaction_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'info_response_fields':
+            # Check InfoResponse class properties
+            info_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'InfoResponse':
+                    for prop in cls.get('properties', []):
+                        info_response_properties.add(prop['name'])
+
+            # FIXED: Map info response field names to correct SDK properties
+            # The SDK uses different property names than the SEP field names:
+            # - SEP fields are snake_case or kebab-case (e.g., 'deposit', 'deposit-exchange')
+            # - SDK properties are camelCase with descriptive suffixes (e.g., 'depositAssets', 'feeInfo')
+            #
+            # Correct mappings verified from lib/src/sep/0006/transfer_server_service.dart:
+            # - Line 1678: Map<String, DepositAsset>? depositAssets
+            # - Line 1679: Map<String, DepositExchangeAsset>? depositExchangeAssets
+            # - Line 1680: Map<String, WithdrawAsset>? withdrawAssets
+            # - Line 1681: Map<String, WithdrawExchangeAsset>? withdrawExchangeAssets
+            # - Line 1682: AnchorFeeInfo? feeInfo
+            # - Line 1683: AnchorTransactionsInfo? transactionsInfo
+            # - Line 1684: AnchorTransactionInfo? transactionInfo
+            # - Line 1685: AnchorFeatureFlags? featureFlags
+            field_map = {
+                'deposit': 'depositAssets',
+                'deposit-exchange': 'depositExchangeAssets',
+                'withdraw': 'withdrawAssets',
+                'withdraw-exchange': 'withdrawExchangeAssets',
+                'fee': 'feeInfo',
+                'transactions': 'transactionsInfo',
+                'transaction': 'transactionInfo',
+                'features': 'featureFlags'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in info_response_properties
+
+                implemented['info_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage
+    total_features = sum(
+        len(category) for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+    )
+
+    implemented_count = sum(
+        1 for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+        for feature in category.values()
+        if feature.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-06 style features (Deposit/Withdrawal API)"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare info endpoint
+    for feature_name, feature_info in implemented_features.get('info_endpoint', {}).items():
+        comparison = FieldComparison(
+            section='Info Endpoint',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'info'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare deposit endpoints
+    for feature_name, feature_info in implemented_features.get('deposit_endpoints', {}).items():
+        comparison = FieldComparison(
+            section='Deposit Endpoints',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'deposit'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare withdraw endpoints
+    for feature_name, feature_info in implemented_features.get('withdraw_endpoints', {}).items():
+        comparison = FieldComparison(
+            section='Withdraw Endpoints',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'withdraw'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare fee endpoint
+    for feature_name, feature_info in implemented_features.get('fee_endpoint', {}).items():
+        comparison = FieldComparison(
+            section='Fee Endpoint',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'fee'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare transaction endpoints
+    for feature_name, feature_info in implemented_features.get('transaction_endpoints', {}).items():
+        comparison = FieldComparison(
+            section='Transaction Endpoints',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'transaction'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare deposit request parameters
+    for feature_name, feature_info in implemented_features.get('deposit_request_parameters', {}).items():
+        comparison = FieldComparison(
+            section='Deposit Request Parameters',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_property'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'deposit_params'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare withdraw request parameters
+    for feature_name, feature_info in implemented_features.get('withdraw_request_parameters', {}).items():
+        comparison = FieldComparison(
+            section='Withdraw Request Parameters',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_property'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'withdraw_params'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare deposit response fields
+    for feature_name, feature_info in implemented_features.get('deposit_response_fields', {}).items():
+        comparison = FieldComparison(
+            section='Deposit Response Fields',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_property'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'deposit_response'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare withdraw response fields
+    for feature_name, feature_info in implemented_features.get('withdraw_response_fields', {}).items():
+        comparison = FieldComparison(
+            section='Withdraw Response Fields',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_property'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'withdraw_response'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare transaction fields
+    for feature_name, feature_info in implemented_features.get('transaction_fields', {}).items():
+        comparison = FieldComparison(
+            section='Transaction Fields',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_property'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'transaction_fields'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare transaction status values
+    for feature_name, feature_info in implemented_features.get('transaction_status_values', {}).items():
+        comparison = FieldComparison(
+            section='Transaction Status Values',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_status'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'transaction_status'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare info response fields
+    for feature_name, feature_info in implemented_features.get('info_response_fields', {}).items():
+        comparison = FieldComparison(
+            section='Info Response Fields',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_property'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'info_response'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} SEP-06 features{Colors.END}")
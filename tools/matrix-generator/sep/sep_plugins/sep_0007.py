@@ -0,0 +1,414 @@
+"""
+SEP-07 (URI Scheme to facilitate delegated signing) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-07 (URI Scheme to facilitate delegated signing) specific structure.
+
+    Returns:
+        Structured SEP-07 data with URI operations and parameters
+    """
+    catalogue = load_catalogue('sep_0007')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define URI scheme structure for SEP-07
+    uri_structure = {
+        'operations': [],
+        'tx_operation_parameters': [],
+        'pay_operation_parameters': [],
+        'common_parameters': [],
+        'validation_features': [],
+        'signature_features': []
+    }
+
+    # Operation types
+    uri_structure['operations'] = catalogue['operations']
+
+    # TX operation parameters
+    uri_structure['tx_operation_parameters'] = catalogue['tx_operation_parameters']
+
+    # PAY operation parameters
+    uri_structure['pay_operation_parameters'] = catalogue['pay_operation_parameters']
+
+    # Common parameters (used by both operations)
+    uri_structure['common_parameters'] = catalogue['common_parameters']
+
+    # Validation features
+    uri_structure['validation_features'] = catalogue['validation_features']
+
+    # Signature features
+    uri_structure['signature_features'] = catalogue['signature_features']
+
+    # Store URI structure as sections
+    data['sections'].append({
+        'title': 'URI Operations',
+        'key': 'operations',
+        'content': 'URI scheme operations (tx and pay)',
+        'uri_features': uri_structure['operations'],
+        'feature_count': len(uri_structure['operations'])
+    })
+
+    data['sections'].append({
+        'title': 'TX Operation Parameters',
+        'key': 'tx_parameters',
+        'content': 'Parameters for tx operation',
+        'uri_features': uri_structure['tx_operation_parameters'],
+        'feature_count': len(uri_structure['tx_operation_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'PAY Operation Parameters',
+        'key': 'pay_parameters',
+        'content': 'Parameters for pay operation',
+        'uri_features': uri_structure['pay_operation_parameters'],
+        'feature_count': len(uri_structure['pay_operation_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Common Parameters',
+        'key': 'common_parameters',
+        'content': 'Parameters common to both operations',
+        'uri_features': uri_structure['common_parameters'],
+        'feature_count': len(uri_structure['common_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Validation Features',
+        'key': 'validation_features',
+        'content': 'URI validation capabilities',
+        'uri_features': uri_structure['validation_features'],
+        'feature_count': len(uri_structure['validation_features'])
+    })
+
+    data['sections'].append({
+        'title': 'Signature Features',
+        'key': 'signature_features',
+        'content': 'URI signing and verification capabilities',
+        'uri_features': uri_structure['signature_features'],
+        'feature_count': len(uri_structure['signature_features'])
+    })
+
+    # Calculate totals
+    total_features = (
+        len(uri_structure['operations']) +
+        len(uri_structure['tx_operation_parameters']) +
+        len(uri_structure['pay_operation_parameters']) +
+        len(uri_structure['common_parameters']) +
+        len(uri_structure['validation_features']) +
+        len(uri_structure['signature_features'])
+    )
+
+    print(f"{Colors.GREEN}  ✓ Found {len(uri_structure['operations'])} URI operations{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(uri_structure['tx_operation_parameters'])} TX operation parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(uri_structure['pay_operation_parameters'])} PAY operation parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(uri_structure['common_parameters'])} common parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(uri_structure['validation_features'])} validation features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(uri_structure['signature_features'])} signature features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} SEP-07 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-07 (URI Scheme to facilitate delegated signing) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-07 implementation files found'
+        }
+
+    # Load SEP-07 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented URI features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-07 URI scheme requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping URI features to implementation status
+    """
+    implemented = {
+        'operations': {},
+        'tx_parameters': {},
+        'pay_parameters': {},
+        'common_parameters': {},
+        'validation_features': {},
+        'signature_features': {},
+        'coverage': {}
+    }
+
+    # Get all methods from all classes
+    all_methods = {}
+    all_constants = set()
+    for cls in classes:
+        for method in cls.get('methods', []):
+            all_methods[method['name']] = method
+        # Also collect constants (static fields) which define parameter names
+        for prop in cls.get('properties', []):
+            all_constants.add(prop['name'])
+
+    # Map operations - SEP-07 supports tx and pay operations
+    operation_map = {
+        'tx': 'generateSignTransactionURI',
+        'pay': 'generatePayOperationURI'
+    }
+
+    sections_by_key = {}
+    for section in sep_definition.get('sections', []):
+        sections_by_key[section['key']] = section
+
+    # Map operations
+    if 'operations' in sections_by_key:
+        for operation in sections_by_key['operations'].get('uri_features', []):
+            op_name = operation['name']
+            sdk_method = operation_map.get(op_name)
+            implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+            implemented['operations'][op_name] = {
+                'required': operation.get('required', False),
+                'implemented': implemented_in_sdk,
+                'sdk_method': sdk_method if implemented_in_sdk else None,
+                'description': operation.get('description', '')
+            }
+
+    # Map TX operation parameters
+    tx_param_constant_map = {
+        'xdr': 'xdrParameterName',
+        'replace': 'replaceParameterName',
+        'callback': 'callbackParameterName',
+        'pubkey': 'publicKeyParameterName',
+        'chain': 'chainParameterName'
+    }
+
+    if 'tx_parameters' in sections_by_key:
+        for param in sections_by_key['tx_parameters'].get('uri_features', []):
+            param_name = param['name']
+            sdk_constant = tx_param_constant_map.get(param_name)
+            implemented_in_sdk = sdk_constant in all_constants if sdk_constant else False
+
+            implemented['tx_parameters'][param_name] = {
+                'required': param.get('required', False),
+                'implemented': implemented_in_sdk,
+                'sdk_constant': sdk_constant if implemented_in_sdk else None,
+                'description': param.get('description', '')
+            }
+
+    # Map PAY operation parameters
+    pay_param_constant_map = {
+        'destination': 'destinationParameterName',
+        'amount': 'amountParameterName',
+        'asset_code': 'assetCodeParameterName',
+        'asset_issuer': 'assetIssuerParameterName',
+        'memo': 'memoParameterName',
+        'memo_type': 'memoTypeParameterName'
+    }
+
+    if 'pay_parameters' in sections_by_key:
+        for param in sections_by_key['pay_parameters'].get('uri_features', []):
+            param_name = param['name']
+            sdk_constant = pay_param_constant_map.get(param_name)
+            implemented_in_sdk = sdk_constant in all_constants if sdk_constant else False
+
+            implemented['pay_parameters'][param_name] = {
+                'required': param.get('required', False),
+                'implemented': implemented_in_sdk,
+                'sdk_constant': sdk_constant if implemented_in_sdk else None,
+                'description': param.get('description', '')
+            }
+
+    # Map common parameters
+    common_param_constant_map = {
+        'msg': 'messageParameterName',
+        'network_passphrase': 'networkPassphraseParameterName',
+        'origin_domain': 'originDomainParameterName',
+        'signature': 'signatureParameterName'
+    }
+
+    if 'common_parameters' in sections_by_key:
+        for param in sections_by_key['common_parameters'].get('uri_features', []):
+            param_name = param['name']
+            sdk_constant = common_param_constant_map.get(param_name)
+            implemented_in_sdk = sdk_constant in all_constants if sdk_constant else False
+
+            implemented['common_parameters'][param_name] = {
+                'required': param.get('required', False),
+                'implemented': implemented_in_sdk,
+                'sdk_constant': sdk_constant if implemented_in_sdk else None,
+                'description': param.get('description', '')
+            }
+
+    # Map validation features
+    validation_method_map = {
+        'validate_uri_scheme': 'isValidSep7Url',
+        'validate_operation_type': 'isValidSep7Url',
+        'validate_xdr_parameter': 'isValidSep7Url',
+        'validate_destination_parameter': 'isValidSep7Url',
+        'validate_stellar_address': 'isValidSep7Url',
+        'validate_asset_code': 'isValidSep7Url',
+        'validate_memo_type': 'isValidSep7Url',
+        'validate_memo_value': 'isValidSep7Url',
+        'validate_message_length': 'isValidSep7Url',
+        'validate_origin_domain': 'isValidSep7Url',
+        'validate_chain_nesting': 'isValidSep7Url'
+    }
+
+    if 'validation_features' in sections_by_key:
+        for feature in sections_by_key['validation_features'].get('uri_features', []):
+            feature_name = feature['name']
+            sdk_method = validation_method_map.get(feature_name)
+            # All validations are done within isValidSep7Url method
+            implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+            implemented['validation_features'][feature_name] = {
+                'required': feature.get('required', False),
+                'implemented': implemented_in_sdk,
+                'sdk_method': sdk_method if implemented_in_sdk else None,
+                'description': feature.get('description', '')
+            }
+
+    # Map signature features
+    signature_method_map = {
+        'sign_uri': 'addSignature',
+        'verify_signature': 'verifySignature',
+        'verify_signed_uri': 'isValidSep7SignedUrl'
+    }
+
+    if 'signature_features' in sections_by_key:
+        for feature in sections_by_key['signature_features'].get('uri_features', []):
+            feature_name = feature['name']
+            sdk_method = signature_method_map.get(feature_name)
+            implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+            implemented['signature_features'][feature_name] = {
+                'required': feature.get('required', False),
+                'implemented': implemented_in_sdk,
+                'sdk_method': sdk_method if implemented_in_sdk else None,
+                'description': feature.get('description', '')
+            }
+
+    # Calculate coverage
+    total_features = sum(
+        len(category) for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+    )
+
+    implemented_count = sum(
+        1 for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+        for feature in category.values()
+        if feature.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-07 style URI scheme features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Define section titles for display
+    section_titles = {
+        'operations': 'URI Operations',
+        'tx_parameters': 'TX Operation Parameters',
+        'pay_parameters': 'PAY Operation Parameters',
+        'common_parameters': 'Common Parameters',
+        'validation_features': 'Validation Features',
+        'signature_features': 'Signature Features'
+    }
+
+    # Compare each feature category
+    for category_key, category_title in section_titles.items():
+        category_features = implemented_features.get(category_key, {})
+
+        for feature_name, feature_info in category_features.items():
+            # Skip the coverage key
+            if feature_name == 'coverage':
+                continue
+
+            # Determine SDK implementation property (method, constant, or property)
+            sdk_property = (
+                feature_info.get('sdk_method') or
+                feature_info.get('sdk_constant') or
+                feature_info.get('sdk_property')
+            )
+
+            comparison = FieldComparison(
+                section=category_title,
+                field_name=feature_name,
+                required=feature_info.get('required', False),
+                implemented=feature_info.get('implemented', False),
+                sdk_property=sdk_property,
+                description=feature_info.get('description', ''),
+                priority=comparator.determine_field_priority(
+                    feature_name,
+                    feature_info.get('required', False),
+                    category_key
+                ) if not feature_info.get('implemented') else None
+            )
+            comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} SEP-07 features{Colors.END}")
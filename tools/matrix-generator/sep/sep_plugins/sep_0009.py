@@ -0,0 +1,397 @@
+"""
+SEP-09 (Standard KYC / AML fields) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+import re
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+# Class bodies and static const key declarations in standard_kyc_fields.dart
+_NATURAL_PERSON_FIELDS_RE = re.compile(r'class NaturalPersonKYCFields.*?\{(.*?)(?=\n  /// |\nclass )', re.DOTALL)
+_ORGANIZATION_FIELDS_RE = re.compile(r'class OrganizationKYCFields.*?\{(.*?)(?=\n  /// |\nclass )', re.DOTALL)
+_FINANCIAL_ACCOUNT_FIELDS_RE = re.compile(r'class FinancialAccountKYCFields.*?\{(.*?)(?=\n  /// |\nclass )', re.DOTALL)
+_CARD_FIELDS_RE = re.compile(r'class CardKYCFields.*?\{(.*?)$', re.DOTALL)
+_FIELD_OR_FILE_KEY_RE = re.compile(r'static const String (\w+_field_key|\w+_file_key)')
+_FIELD_KEY_RE = re.compile(r'static const String (\w+_field_key)')
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-09 (Standard KYC / AML fields) specific structure.
+
+    Returns:
+        Structured SEP-09 data with field definitions
+    """
+    catalogue = load_catalogue('sep_0009')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define field categories for SEP-09
+    # SEP-09 is a field definition standard similar to SEP-01
+    field_categories = {
+        'natural_person_fields': [],
+        'organization_fields': [],
+        'financial_account_fields': [],
+        'card_fields': []
+    }
+
+    # Natural Person Fields
+    field_categories['natural_person_fields'] = catalogue['natural_person_fields']
+
+    # Organization Fields (prefixed with "organization.")
+    field_categories['organization_fields'] = catalogue['organization_fields']
+
+    # Financial Account Fields
+    field_categories['financial_account_fields'] = catalogue['financial_account_fields']
+
+    # Card Fields (prefixed with "card.")
+    field_categories['card_fields'] = catalogue['card_fields']
+
+    # Store field categories as sections
+    data['sections'].append({
+        'title': 'Natural Person Fields',
+        'key': 'natural_person_fields',
+        'content': 'Standard KYC fields for natural persons',
+        'fields': field_categories['natural_person_fields'],
+        'field_count': len(field_categories['natural_person_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Organization Fields',
+        'key': 'organization_fields',
+        'content': 'Standard KYC fields for organizations',
+        'fields': field_categories['organization_fields'],
+        'field_count': len(field_categories['organization_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Financial Account Fields',
+        'key': 'financial_account_fields',
+        'content': 'Standard fields for financial account information',
+        'fields': field_categories['financial_account_fields'],
+        'field_count': len(field_categories['financial_account_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Card Fields',
+        'key': 'card_fields',
+        'content': 'Standard fields for card payment information',
+        'fields': field_categories['card_fields'],
+        'field_count': len(field_categories['card_fields'])
+    })
+
+    # Calculate totals
+    total_fields = (
+        len(field_categories['natural_person_fields']) +
+        len(field_categories['organization_fields']) +
+        len(field_categories['financial_account_fields']) +
+        len(field_categories['card_fields'])
+    )
+
+    print(f"{Colors.GREEN}  ✓ Found {len(field_categories['natural_person_fields'])} natural person fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(field_categories['organization_fields'])} organization fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(field_categories['financial_account_fields'])} financial account fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(field_categories['card_fields'])} card fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_fields} KYC/AML fields{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-09 (Standard KYC/AML Fields) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-09 implementation files found'
+        }
+
+    # Load SEP-09 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented field definitions
+    implemented_fields = map_fields(analyzer, all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_fields': implemented_fields,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_fields(analyzer: 'SEPAnalyzer', classes: List[Dict[str, Any]],
+               sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-09 field requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping fields to implementation status
+    """
+    implemented = {
+        'natural_person_fields': {},
+        'organization_fields': {},
+        'financial_account_fields': {},
+        'card_fields': {},
+        'coverage': {}
+    }
+
+    # Extract all field keys and properties from classes
+    natural_person_keys = set()
+    natural_person_properties = set()
+    organization_keys = set()
+    organization_properties = set()
+    financial_keys = set()
+    financial_properties = set()
+    card_keys = set()
+    card_properties = set()
+
+    # Read the source file to extract static const field keys
+    sep_file = analyzer.sdk_path / 'lib' / 'src' / 'sep' / '0009' / 'standard_kyc_fields.dart'
+    if sep_file.exists():
+        content = sep_file.read_text(encoding='utf-8')
+
+        # Extract NaturalPersonKYCFields constants
+        natural_match = _NATURAL_PERSON_FIELDS_RE.search(content)
+        if natural_match:
+            class_body = natural_match.group(1)
+            # Find all static const field_key declarations
+            for match in _FIELD_OR_FILE_KEY_RE.finditer(class_body):
+                const_name = match.group(1)
+                field_name = const_name.replace('_field_key', '').replace('_file_key', '')
+                natural_person_keys.add(field_name)
+
+        # Extract OrganizationKYCFields constants
+        org_match = _ORGANIZATION_FIELDS_RE.search(content)
+        if org_match:
+            class_body = org_match.group(1)
+            for match in _FIELD_OR_FILE_KEY_RE.finditer(class_body):
+                const_name = match.group(1)
+                field_name = const_name.replace('_field_key', '').replace('_file_key', '')
+                organization_keys.add(field_name)
+
+        # Extract FinancialAccountKYCFields constants
+        financial_match = _FINANCIAL_ACCOUNT_FIELDS_RE.search(content)
+        if financial_match:
+            class_body = financial_match.group(1)
+            for match in _FIELD_KEY_RE.finditer(class_body):
+                const_name = match.group(1)
+                field_name = const_name.replace('_field_key', '')
+                financial_keys.add(field_name)
+
+        # Extract CardKYCFields constants
+        card_match = _CARD_FIELDS_RE.search(content)
+        if card_match:
+            class_body = card_match.group(1)
+            for match in _FIELD_KEY_RE.finditer(class_body):
+                const_name = match.group(1)
+                field_name = const_name.replace('_field_key', '')
+                card_keys.add(field_name)
+
+    # Get properties from class info
+    for cls in classes:
+        class_name = cls.get('name', '')
+
+        # Get properties
+        for prop in cls.get('properties', []):
+            prop_name = prop['name']
+
+            if class_name == 'NaturalPersonKYCFields':
+                natural_person_properties.add(prop_name)
+            elif class_name == 'OrganizationKYCFields':
+                organization_properties.add(prop_name)
+            elif class_name == 'FinancialAccountKYCFields':
+                financial_properties.add(prop_name)
+            elif class_name == 'CardKYCFields':
+                card_properties.add(prop_name)
+
+    # Helper function to convert snake_case to camelCase
+    def snake_to_camel(snake_str: str) -> str:
+        components = snake_str.split('_')
+        return components[0] + ''.join(x.title() for x in components[1:])
+
+    # Helper function to check if field is implemented
+    def is_field_implemented(field_name: str, keys: set, properties: set,
+                            prefix: str = '') -> tuple:
+        # Remove prefix if present for checking
+        check_name = field_name
+        if prefix and field_name.startswith(prefix):
+            check_name = field_name[len(prefix):]
+
+        # Check if field key exists
+        has_key = check_name in keys
+
+        # Check if property exists (convert to camelCase)
+        camel_name = snake_to_camel(check_name)
+        has_property = camel_name in properties
+
+        # For VATNumber, check both VATNumber and vatNumber
+        if check_name == 'VAT_number':
+            has_property = 'VATNumber' in properties or 'vatNumber' in properties
+            camel_name = 'VATNumber' if 'VATNumber' in properties else ('vatNumber' if 'vatNumber' in properties else camel_name)
+
+        return (has_key and has_property, camel_name if has_property else None)
+
+    # Process each section from SEP definition
+    sections = sep_definition.get('sections', [])
+    for section in sections:
+        section_key = section.get('key', '')
+        fields = section.get('fields', [])
+
+        if section_key == 'natural_person_fields':
+            for field in fields:
+                field_name = field['name']
+                is_implemented, sdk_property = is_field_implemented(
+                    field_name, natural_person_keys, natural_person_properties
+                )
+
+                implemented['natural_person_fields'][field_name] = {
+                    'required': field.get('required', False),
+                    'implemented': is_implemented,
+                    'sdk_property': sdk_property,
+                    'description': field.get('description', ''),
+                    'type': field.get('type', 'string')
+                }
+
+        elif section_key == 'organization_fields':
+            for field in fields:
+                field_name = field['name']
+                # Organization fields have 'organization.' prefix
+                is_implemented, sdk_property = is_field_implemented(
+                    field_name, organization_keys, organization_properties,
+                    'organization.'
+                )
+
+                implemented['organization_fields'][field_name] = {
+                    'required': field.get('required', False),
+                    'implemented': is_implemented,
+                    'sdk_property': sdk_property,
+                    'description': field.get('description', ''),
+                    'type': field.get('type', 'string')
+                }
+
+        elif section_key == 'financial_account_fields':
+            for field in fields:
+                field_name = field['name']
+                is_implemented, sdk_property = is_field_implemented(
+                    field_name, financial_keys, financial_properties
+                )
+
+                implemented['financial_account_fields'][field_name] = {
+                    'required': field.get('required', False),
+                    'implemented': is_implemented,
+                    'sdk_property': sdk_property,
+                    'description': field.get('description', ''),
+                    'type': field.get('type', 'string')
+                }
+
+        elif section_key == 'card_fields':
+            for field in fields:
+                field_name = field['name']
+                # Card fields have 'card.' prefix
+                is_implemented, sdk_property = is_field_implemented(
+                    field_name, card_keys, card_properties,
+                    'card.'
+                )
+
+                implemented['card_fields'][field_name] = {
+                    'required': field.get('required', False),
+                    'implemented': is_implemented,
+                    'sdk_property': sdk_property,
+                    'description': field.get('description', ''),
+                    'type': field.get('type', 'string')
+                }
+
+    # Calculate coverage statistics
+    total_fields = sum(len(cat) for cat in implemented.values() if isinstance(cat, dict) and cat != implemented['coverage'])
+    implemented_count = sum(
+        1 for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+        for field in category.values()
+        if field.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_fields,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_fields * 100) if total_fields > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-09 style KYC field definitions"""
+    implemented_fields = comparator.sdk_data.get('implemented_fields', {})
+
+    # Define section titles for display
+    section_titles = {
+        'natural_person_fields': 'Natural Person Fields',
+        'organization_fields': 'Organization Fields',
+        'financial_account_fields': 'Financial Account Fields',
+        'card_fields': 'Card Fields'
+    }
+
+    # Compare each field category
+    for category_key, category_title in section_titles.items():
+        category_fields = implemented_fields.get(category_key, {})
+
+        for field_name, field_info in category_fields.items():
+            # Skip the coverage key
+            if field_name == 'coverage':
+                continue
+
+            comparison = FieldComparison(
+                section=category_title,
+                field_name=field_name,
+                required=field_info.get('required', False),
+                implemented=field_info.get('implemented', False),
+                sdk_property=field_info.get('sdk_property'),
+                description=field_info.get('description', ''),
+                priority=comparator.determine_field_priority(
+                    field_name,
+                    field_info.get('required', False),
+                    category_key
+                ) if not field_info.get('implemented') else None
+            )
+            comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} KYC fields{Colors.END}")
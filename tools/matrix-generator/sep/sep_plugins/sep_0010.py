@@ -0,0 +1,481 @@
+"""
+SEP-10 (Stellar Web Authentication) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-10 (Stellar Web Authentication) specific structure.
+
+    Returns:
+        Structured SEP-10 data with authentication protocol endpoints and features
+    """
+    catalogue = load_catalogue('sep_0010')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define authentication features structure for SEP-10
+    auth_features = {
+        'authentication_endpoints': [],
+        'challenge_transaction_features': [],
+        'jwt_token_features': [],
+        'client_domain_features': [],
+        'verification_features': []
+    }
+
+    # Authentication Endpoints (GET and POST /auth)
+    auth_features['authentication_endpoints'] = catalogue['authentication_endpoints']
+
+    # Challenge Transaction Features
+    auth_features['challenge_transaction_features'] = catalogue['challenge_transaction_features']
+
+    # JWT Token Features
+    auth_features['jwt_token_features'] = catalogue['jwt_token_features']
+
+    # Client Domain Features
+    auth_features['client_domain_features'] = catalogue['client_domain_features']
+
+    # Verification Features
+    auth_features['verification_features'] = catalogue['verification_features']
+
+    # Store auth features as sections
+    data['sections'].append({
+        'title': 'Authentication Endpoints',
+        'key': 'auth_endpoints',
+        'content': 'GET and POST /auth endpoints for challenge-response authentication',
+        'auth_features': auth_features['authentication_endpoints'],
+        'feature_count': len(auth_features['authentication_endpoints'])
+    })
+
+    data['sections'].append({
+        'title': 'Challenge Transaction Features',
+        'key': 'challenge_transaction',
+        'content': 'Challenge transaction structure, operations, and requirements',
+        'auth_features': auth_features['challenge_transaction_features'],
+        'feature_count': len(auth_features['challenge_transaction_features'])
+    })
+
+    data['sections'].append({
+        'title': 'JWT Token Features',
+        'key': 'jwt_token',
+        'content': 'JWT token generation, validation, and structure',
+        'auth_features': auth_features['jwt_token_features'],
+        'feature_count': len(auth_features['jwt_token_features'])
+    })
+
+    data['sections'].append({
+        'title': 'Client Domain Features',
+        'key': 'client_domain',
+        'content': 'Optional client domain verification and signing',
+        'auth_features': auth_features['client_domain_features'],
+        'feature_count': len(auth_features['client_domain_features'])
+    })
+
+    data['sections'].append({
+        'title': 'Verification Features',
+        'key': 'verification',
+        'content': 'Challenge validation, signature verification, and security checks',
+        'auth_features': auth_features['verification_features'],
+        'feature_count': len(auth_features['verification_features'])
+    })
+
+    # Calculate totals
+    total_features = (
+        len(auth_features['authentication_endpoints']) +
+        len(auth_features['challenge_transaction_features']) +
+        len(auth_features['jwt_token_features']) +
+        len(auth_features['client_domain_features']) +
+        len(auth_features['verification_features'])
+    )
+
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['authentication_endpoints'])} authentication endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['challenge_transaction_features'])} challenge transaction features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['jwt_token_features'])} JWT token features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['client_domain_features'])} client domain features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['verification_features'])} verification features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} authentication features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-10 (Stellar Web Authentication) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-10 implementation files found'
+        }
+
+    # Load SEP-10 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented authentication features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-10 authentication feature requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping auth features to implementation status
+    """
+    implemented = {
+        'authentication_endpoints': {},
+        'challenge_transaction_features': {},
+        'jwt_token_features': {},
+        'client_domain_features': {},
+        'verification_features': {},
+        'coverage': {}
+    }
+
+    # Get all methods from all classes
+    all_methods = {}
+    for cls in classes:
+        for method in cls.get('methods', []):
+            all_methods[method['name']] = method
+
+    # Map authentication endpoints to methods
+    auth_endpoints_map = {
+        'get_auth_challenge': 'getChallenge',
+        'post_auth_token': 'sendSignedChallengeTransaction'
+    }
+
+    # Map challenge transaction features to methods/validation
+    challenge_features_map = {
+        'challenge_transaction_generation': 'getChallenge',
+        'transaction_envelope_format': 'validateChallenge',
+        'sequence_number_zero': 'validateChallenge',
+        'manage_data_operations': 'validateChallenge',
+        'home_domain_operation': 'validateChallenge',
+        'web_auth_domain_operation': 'validateChallenge',
+        'timebounds_enforcement': 'validateChallenge',
+        'server_signature': 'validateChallenge',
+        'nonce_generation': 'getChallenge'
+    }
+
+    # Map JWT token features to methods
+    jwt_features_map = {
+        'jwt_token_generation': 'sendSignedChallengeTransaction',
+        'jwt_token_response': 'sendSignedChallengeTransaction',
+        'jwt_token_validation': 'jwtToken',
+        'jwt_expiration': 'sendSignedChallengeTransaction',
+        'jwt_claims': 'sendSignedChallengeTransaction'
+    }
+
+    # Map client domain features to methods
+    client_domain_features_map = {
+        'client_domain_parameter': 'getChallenge',
+        'client_domain_operation': 'validateChallenge',
+        'client_domain_verification': 'jwtToken',
+        'client_domain_signature': 'signTransaction'
+    }
+
+    # Map verification features to methods
+    verification_features_map = {
+        'challenge_validation': 'validateChallenge',
+        'signature_verification': 'validateChallenge',
+        'multi_signature_support': 'signTransaction',
+        'timebounds_validation': 'validateChallenge',
+        'home_domain_validation': 'validateChallenge',
+        'memo_support': 'getChallenge'
+    }
+
+    # Process each section from SEP definition
+    sections = sep_definition.get('sections', [])
+
+    for section in sections:
+        section_key = section.get('key', '')
+        auth_features = section.get('auth_features', [])
+
+        if section_key == 'auth_endpoints':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = auth_endpoints_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['authentication_endpoints'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'challenge_transaction':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = challenge_features_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['challenge_transaction_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'jwt_token':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = jwt_features_map.get(feature_name)
+
+                # Check if this is a server-side-only feature
+                is_server_side_only = feature.get('server_side_only', False)
+
+                # For server-side-only features, mark as N/A for client SDKs
+                if is_server_side_only:
+                    implemented_in_sdk = None  # N/A
+                else:
+                    implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['jwt_token_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', ''),
+                    'server_side_only': is_server_side_only,
+                    'client_note': feature.get('client_note', '') if is_server_side_only else None
+                }
+
+        elif section_key == 'client_domain':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = client_domain_features_map.get(feature_name)
+
+                # Check if this is a server-side-only feature
+                is_server_side_only = feature.get('server_side_only', False)
+
+                # For server-side-only features, mark as N/A for client SDKs
+                if is_server_side_only:
+                    implemented_in_sdk = None  # N/A
+                else:
+                    implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['client_domain_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', ''),
+                    'server_side_only': is_server_side_only,
+                    'client_note': feature.get('client_note', '') if is_server_side_only else None
+                }
+
+        elif section_key == 'verification':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = verification_features_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['verification_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage (excluding server-side-only features)
+    # Count total client-applicable features (excluding server_side_only)
+    def count_client_features(feature_dict):
+        return sum(1 for v in feature_dict.values() if not v.get('server_side_only', False))
+
+    def count_implemented_features(feature_dict):
+        return sum(1 for v in feature_dict.values()
+                  if not v.get('server_side_only', False) and v.get('implemented', False))
+
+    total_features = (
+        count_client_features(implemented['authentication_endpoints']) +
+        count_client_features(implemented['challenge_transaction_features']) +
+        count_client_features(implemented['jwt_token_features']) +
+        count_client_features(implemented['client_domain_features']) +
+        count_client_features(implemented['verification_features'])
+    )
+
+    implemented_count = (
+        count_implemented_features(implemented['authentication_endpoints']) +
+        count_implemented_features(implemented['challenge_transaction_features']) +
+        count_implemented_features(implemented['jwt_token_features']) +
+        count_implemented_features(implemented['client_domain_features']) +
+        count_implemented_features(implemented['verification_features'])
+    )
+
+    # Also count server-side-only features separately for reporting
+    server_side_count = (
+        sum(1 for v in implemented['authentication_endpoints'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['challenge_transaction_features'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['jwt_token_features'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['client_domain_features'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['verification_features'].values() if v.get('server_side_only', False))
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2),
+        'server_side_only_count': server_side_count,
+        'note': f'Excludes {server_side_count} server-side-only feature(s) not applicable to client SDKs' if server_side_count > 0 else None
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-10 style authentication features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare authentication endpoints
+    for endpoint_name, endpoint_info in implemented_features.get('authentication_endpoints', {}).items():
+        comparison = FieldComparison(
+            section='Authentication Endpoints',
+            field_name=endpoint_name,
+            required=endpoint_info.get('required', False),
+            implemented=endpoint_info.get('implemented', False),
+            sdk_property=endpoint_info.get('sdk_method'),
+            description=endpoint_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                endpoint_name,
+                endpoint_info.get('required', False),
+                'auth_endpoints'
+            ) if not endpoint_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare challenge transaction features
+    for feature_name, feature_info in implemented_features.get('challenge_transaction_features', {}).items():
+        comparison = FieldComparison(
+            section='Challenge Transaction Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'challenge_transaction'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare JWT token features
+    for feature_name, feature_info in implemented_features.get('jwt_token_features', {}).items():
+        is_server_side_only = feature_info.get('server_side_only', False)
+        implemented_status = feature_info.get('implemented')
+
+        # For server-side-only features, don't set priority (they're N/A for client)
+        priority = None
+        if not is_server_side_only and not implemented_status:
+            priority = comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'jwt_token'
+            )
+
+        comparison = FieldComparison(
+            section='JWT Token Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=implemented_status,
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=priority,
+            server_side_only=is_server_side_only,
+            client_note=feature_info.get('client_note')
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare client domain features
+    for feature_name, feature_info in implemented_features.get('client_domain_features', {}).items():
+        is_server_side_only = feature_info.get('server_side_only', False)
+        implemented_status = feature_info.get('implemented')
+
+        # For server-side-only features, don't set priority (they're N/A for client)
+        priority = None
+        if not is_server_side_only and not implemented_status:
+            priority = comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'client_domain'
+            )
+
+        comparison = FieldComparison(
+            section='Client Domain Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=implemented_status,
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=priority,
+            server_side_only=is_server_side_only,
+            client_note=feature_info.get('client_note')
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare verification features
+    for feature_name, feature_info in implemented_features.get('verification_features', {}).items():
+        comparison = FieldComparison(
+            section='Verification Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'verification'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} authentication features{Colors.END}")
@@ -0,0 +1,313 @@
+"""
+SEP-11 (Txrep: Human-Readable Low-Level Representation of Stellar Transactions) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-11 (Txrep) specific structure.
+
+    Txrep is a human-readable low-level representation of Stellar transactions.
+    It provides encoding/decoding capabilities between XDR binary and text format.
+
+    Returns:
+        Structured SEP-11 data with txrep conversion features
+    """
+    catalogue = load_catalogue('sep_0011')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define Txrep conversion features for SEP-11
+    # SEP-11 is about format conversion, not HTTP API
+    txrep_features = catalogue['txrep_features']
+
+    # Add encoding features section
+    data['sections'].append({
+        'title': 'Encoding Features',
+        'key': 'encoding_features',
+        'content': 'Features for converting transaction envelope XDR to txrep format',
+        'txrep_features': txrep_features['encoding_features'],
+        'feature_count': len(txrep_features['encoding_features'])
+    })
+
+    # Add decoding features section
+    data['sections'].append({
+        'title': 'Decoding Features',
+        'key': 'decoding_features',
+        'content': 'Features for parsing txrep format to transaction envelope XDR',
+        'txrep_features': txrep_features['decoding_features'],
+        'feature_count': len(txrep_features['decoding_features'])
+    })
+
+    # Add asset encoding section
+    data['sections'].append({
+        'title': 'Asset Encoding',
+        'key': 'asset_encoding',
+        'content': 'Asset type encoding in txrep format',
+        'txrep_features': txrep_features['asset_encoding'],
+        'feature_count': len(txrep_features['asset_encoding'])
+    })
+
+    # Add operation types section
+    data['sections'].append({
+        'title': 'Operation Types',
+        'key': 'operation_types',
+        'content': 'All supported Stellar operation types',
+        'txrep_features': txrep_features['operation_types'],
+        'feature_count': len(txrep_features['operation_types'])
+    })
+
+    # Add format features section
+    data['sections'].append({
+        'title': 'Format Features',
+        'key': 'format_features',
+        'content': 'Txrep format specification features',
+        'txrep_features': txrep_features['format_features'],
+        'feature_count': len(txrep_features['format_features'])
+    })
+
+    # Calculate totals
+    total_features = sum(len(features) for features in txrep_features.values())
+
+    print(f"{Colors.GREEN}  ✓ Found {len(txrep_features['encoding_features'])} encoding features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(txrep_features['decoding_features'])} decoding features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(txrep_features['asset_encoding'])} asset encoding features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(txrep_features['operation_types'])} operation types{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(txrep_features['format_features'])} format features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} txrep features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-11 (Txrep) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-11 implementation files found'
+        }
+
+    # Load SEP-11 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented txrep features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-11 Txrep requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping txrep features to implementation status
+    """
+    implemented = {
+        'encoding_features': {},
+        'decoding_features': {},
+        'asset_encoding': {},
+        'operation_types': {},
+        'format_features': {},
+        'coverage': {}
+    }
+
+    # Get all methods from TxRep class
+    txrep_methods = set()
+    for cls in classes:
+        if cls['name'] == 'TxRep':
+            for method in cls.get('methods', []):
+                txrep_methods.add(method['name'])
+
+    # The TxRep class has two main public methods:
+    # - fromTransactionEnvelopeXdrBase64 (encoding: XDR -> txrep)
+    # - transactionEnvelopeXdrBase64FromTxRep (decoding: txrep -> XDR)
+    # All specific encoding/decoding features are implemented through these methods
+
+    has_encoding = 'fromTransactionEnvelopeXdrBase64' in txrep_methods
+    has_decoding = 'transactionEnvelopeXdrBase64FromTxRep' in txrep_methods
+
+    # Process each section from SEP definition
+    for section in sep_definition.get('sections', []):
+        section_key = section.get('key', '')
+        txrep_features = section.get('txrep_features', [])
+
+        if section_key == 'encoding_features':
+            # All encoding features are implemented through fromTransactionEnvelopeXdrBase64
+            for feature in txrep_features:
+                feature_name = feature['name']
+                implemented[section_key][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': has_encoding,
+                    'sdk_method': 'fromTransactionEnvelopeXdrBase64' if has_encoding else None,
+                    'description': feature.get('description', ''),
+                    'category': feature.get('category', '')
+                }
+
+        elif section_key == 'decoding_features':
+            # All decoding features are implemented through transactionEnvelopeXdrBase64FromTxRep
+            for feature in txrep_features:
+                feature_name = feature['name']
+                implemented[section_key][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': has_decoding,
+                    'sdk_method': 'transactionEnvelopeXdrBase64FromTxRep' if has_decoding else None,
+                    'description': feature.get('description', ''),
+                    'category': feature.get('category', '')
+                }
+
+        elif section_key == 'asset_encoding':
+            # Asset encoding is part of the general encoding implementation
+            for feature in txrep_features:
+                feature_name = feature['name']
+                implemented[section_key][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': has_encoding,  # Part of encoding
+                    'sdk_method': '_encodeAsset' if has_encoding else None,
+                    'description': feature.get('description', ''),
+                    'category': feature.get('category', '')
+                }
+
+        elif section_key == 'operation_types':
+            # All operation types are supported through the general encode/decode methods
+            for feature in txrep_features:
+                feature_name = feature['name']
+                # Both encoding and decoding must work for operation types
+                implemented[section_key][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': has_encoding and has_decoding,
+                    'sdk_method': '_addOperation (encode), operation parsing (decode)' if has_encoding and has_decoding else None,
+                    'description': feature.get('description', ''),
+                    'category': feature.get('category', '')
+                }
+
+        elif section_key == 'format_features':
+            # Format features are inherent in the implementation
+            format_feature_impl = {
+                'comment_support': has_decoding,  # Comments handled in _removeComment
+                'dot_notation': has_encoding and has_decoding,  # Used throughout
+                'array_indexing': has_encoding and has_decoding,  # Used for operations, signatures, etc.
+                'hex_encoding': has_encoding and has_decoding,  # Used for binary data
+                'string_escaping': has_encoding and has_decoding  # Used for text memos
+            }
+
+            for feature in txrep_features:
+                feature_name = feature['name']
+                is_implemented = format_feature_impl.get(feature_name, False)
+                implemented[section_key][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': is_implemented,
+                    'sdk_method': 'TxRep format implementation' if is_implemented else None,
+                    'description': feature.get('description', ''),
+                    'category': feature.get('category', '')
+                }
+
+    # Calculate coverage
+    total_features = 0
+    implemented_count = 0
+
+    for category_name, category_features in implemented.items():
+        if category_name == 'coverage':
+            continue
+        for feature_info in category_features.values():
+            total_features += 1
+            if feature_info.get('implemented'):
+                implemented_count += 1
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-11 style Txrep features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Section title mapping for display
+    section_titles = {
+        'encoding_features': 'Encoding Features',
+        'decoding_features': 'Decoding Features',
+        'asset_encoding': 'Asset Encoding',
+        'operation_types': 'Operation Types',
+        'format_features': 'Format Features'
+    }
+
+    # Compare each category
+    for category_name, category_features in implemented_features.items():
+        if category_name == 'coverage':
+            continue
+
+        section_title = section_titles.get(category_name, category_name.replace('_', ' ').title())
+
+        for feature_name, feature_info in category_features.items():
+            sdk_reference = feature_info.get('sdk_method')
+
+            comparison = FieldComparison(
+                section=section_title,
+                field_name=feature_name,
+                required=feature_info.get('required', False),
+                implemented=feature_info.get('implemented', False),
+                sdk_property=sdk_reference,
+                description=feature_info.get('description', ''),
+                priority=comparator.determine_field_priority(
+                    feature_name,
+                    feature_info.get('required', False),
+                    category_name
+                ) if not feature_info.get('implemented') else None
+            )
+            comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} Txrep features{Colors.END}")
@@ -0,0 +1,485 @@
+"""
+SEP-12 (Anchor/Client customer info transfer) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison, FieldPriority
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-12 (KYC API) specific structure.
+
+    Returns:
+        Structured SEP-12 data with API endpoints and fields
+    """
+    catalogue = load_catalogue('sep_0012')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define API structure for SEP-12 (KYC API)
+    # SEP-12 has multiple endpoints for customer information management
+    api_structure = catalogue['api_structure']
+
+    # Store API structure as a section
+    data['sections'].append({
+        'title': 'KYC API Endpoints',
+        'key': 'endpoints',
+        'content': 'Customer information management endpoints',
+        'api_structure': api_structure,
+        'field_count': (len(api_structure['endpoints']) +
+                       len(api_structure['request_parameters']) +
+                       len(api_structure['response_fields']) +
+                       len(api_structure['field_types']))
+    })
+
+    # Extract other sections for context
+    general_sections = parser.extract_sections()
+    for section in general_sections:
+        if section['title'].lower() not in ['preamble', 'summary']:
+            data['sections'].append(section)
+
+    # Print summary
+    total_features = (len(api_structure['endpoints']) +
+                     len(api_structure['request_parameters']) +
+                     len(api_structure['response_fields']) +
+                     len(api_structure['field_types']))
+
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['endpoints'])} API endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['request_parameters'])} request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['response_fields'])} response fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['field_types'])} field type specifications{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} KYC API features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-12 (KYC API) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-12 implementation files found'
+        }
+
+    # Load SEP-12 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented API features
+    implemented_features = map_features(analyzer, all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(analyzer: 'SEPAnalyzer', classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-12 KYC API requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping API features to implementation status
+    """
+    implemented = {
+        'endpoints': {},
+        'request_parameters': {},
+        'response_fields': {},
+        'field_types': {},
+        'authentication': {},
+        'file_upload': {},
+        'sep9_integration': {},
+        'coverage': {}
+    }
+
+    # Get API structure from definition
+    api_structure = None
+    for section in sep_definition.get('sections', []):
+        if section.get('key') == 'endpoints':
+            api_structure = section.get('api_structure', {})
+            break
+
+    if not api_structure:
+        return implemented
+
+    # Get all methods from KYCService class
+    kyc_service_methods = set()
+    for cls in classes:
+        if cls['name'] == 'KYCService':
+            for method in cls.get('methods', []):
+                kyc_service_methods.add(method['name'])
+
+    # Map endpoints to KYCService methods
+    endpoint_map = {
+        'get_customer': 'getCustomerInfo',
+        'put_customer': 'putCustomerInfo',
+        'put_customer_verification': 'putCustomerVerification',
+        'delete_customer': 'deleteCustomer',
+        'put_customer_callback': 'putCustomerCallback',
+        'post_customer_files': 'postCustomerFile',
+        'get_customer_files': 'getCustomerFiles'
+    }
+
+    for endpoint in api_structure.get('endpoints', []):
+        endpoint_key = endpoint['key']
+        sdk_method = endpoint_map.get(endpoint_key)
+        implemented_in_sdk = sdk_method in kyc_service_methods
+
+        implemented['endpoints'][endpoint_key] = {
+            'required': True,  # All KYC endpoints are essential
+            'implemented': implemented_in_sdk,
+            'sdk_method': sdk_method if implemented_in_sdk else None,
+            'description': endpoint.get('description', ''),
+            'path': endpoint.get('path', ''),
+            'method': endpoint.get('method', '')
+        }
+
+    # Map request parameters to GetCustomerInfoRequest properties
+    request_properties = set()
+    for cls in classes:
+        if cls['name'] == 'GetCustomerInfoRequest':
+            for prop in cls.get('properties', []):
+                request_properties.add(prop['name'])
+
+    for param in api_structure.get('request_parameters', []):
+        param_name = param['name']
+        # Map snake_case to camelCase for comparison
+        sdk_property_map = {
+            'id': 'id',
+            'account': 'account',
+            'memo': 'memo',
+            'memo_type': 'memoType',
+            'type': 'type',
+            'transaction_id': 'transactionId',
+            'lang': 'lang'
+        }
+        sdk_property = sdk_property_map.get(param_name, param_name)
+        implemented_in_sdk = sdk_property in request_properties
+
+        implemented['request_parameters'][param_name] = {
+            'required': param.get('required', False),
+            'implemented': implemented_in_sdk,
+            'sdk_property': sdk_property if implemented_in_sdk else None,
+            'description': param.get('description', '')
+        }
+
+    # Map response fields to GetCustomerInfoResponse properties
+    response_properties = set()
+    for cls in classes:
+        if cls['name'] == 'GetCustomerInfoResponse':
+            for prop in cls.get('properties', []):
+                response_properties.add(prop['name'])
+
+    for field in api_structure.get('response_fields', []):
+        field_name = field['name']
+        # Map snake_case to camelCase
+        sdk_property_map = {
+            'id': 'id',
+            'status': 'status',
+            'fields': 'fields',
+            'provided_fields': 'providedFields',
+            'message': 'message'
+        }
+        sdk_property = sdk_property_map.get(field_name, field_name)
+        implemented_in_sdk = sdk_property in response_properties
+
+        implemented['response_fields'][field_name] = {
+            'required': field.get('required', False),
+            'implemented': implemented_in_sdk,
+            'sdk_property': sdk_property if implemented_in_sdk else None,
+            'description': field.get('description', '')
+        }
+
+    # Map field type specifications to GetCustomerInfoField and GetCustomerInfoProvidedField properties
+    field_properties = set()
+    provided_field_properties = set()
+    for cls in classes:
+        if cls['name'] == 'GetCustomerInfoField':
+            for prop in cls.get('properties', []):
+                field_properties.add(prop['name'])
+        elif cls['name'] == 'GetCustomerInfoProvidedField':
+            for prop in cls.get('properties', []):
+                provided_field_properties.add(prop['name'])
+
+    for field_type in api_structure.get('field_types', []):
+        field_name = field_type['name']
+        # Check both GetCustomerInfoField and GetCustomerInfoProvidedField
+        implemented_in_sdk = field_name in field_properties or field_name in provided_field_properties
+
+        implemented['field_types'][field_name] = {
+            'required': field_type.get('required', True),  # Core field specs
+            'implemented': implemented_in_sdk,
+            'sdk_property': field_name if implemented_in_sdk else None,
+            'description': field_type.get('description', '')
+        }
+
+    # Check authentication implementation
+    auth = api_structure.get('authentication', {})
+    # Check if request classes have jwt parameter or if Authorization header is used
+    jwt_supported = False
+
+    # Check request classes for jwt property
+    request_classes = ['GetCustomerInfoRequest', 'PutCustomerInfoRequest',
+                      'PutCustomerVerificationRequest', 'PutCustomerCallbackRequest']
+    for cls in classes:
+        if cls['name'] in request_classes:
+            for prop in cls.get('properties', []):
+                if prop['name'] == 'jwt':
+                    jwt_supported = True
+                    break
+            if jwt_supported:
+                break
+
+    # Also check if any method accepts jwt parameter directly
+    if not jwt_supported:
+        for cls in classes:
+            if cls['name'] == 'KYCService':
+                for method in cls.get('methods', []):
+                    # Check parameters for jwt
+                    for param in method.get('parameters', []):
+                        if 'jwt' in param.lower():
+                            jwt_supported = True
+                            break
+                    if jwt_supported:
+                        break
+
+    implemented['authentication'] = {
+        'type': auth.get('type', 'SEP-10'),
+        'method': auth.get('method', 'JWT Token'),
+        'implemented': jwt_supported,
+        'description': auth.get('description', '')
+    }
+
+    # Check file upload support
+    file_upload = api_structure.get('file_upload', {})
+    file_upload_supported = 'postCustomerFile' in kyc_service_methods
+
+    implemented['file_upload'] = {
+        'supported': file_upload.get('supported', True),
+        'implemented': file_upload_supported,
+        'content_type': file_upload.get('content_type', 'multipart/form-data'),
+        'description': file_upload.get('description', '')
+    }
+
+    # Check SEP-9 integration
+    sep9_classes = set()
+    for cls in classes:
+        if 'KYC' in cls['name'] or 'kyc' in cls['name'].lower():
+            sep9_classes.add(cls['name'])
+
+    sep9_integration = api_structure.get('sep9_integration', {})
+
+    # Check if SEP-9 module exists and is imported
+    sep9_module_exists = False
+    sep9_file_path = analyzer.sdk_path / 'lib' / 'src' / 'sep' / '0009' / 'standard_kyc_fields.dart'
+    if sep9_file_path.exists():
+        sep9_module_exists = True
+
+    # Check if StandardKYCFields, NaturalPersonKYCFields, OrganizationKYCFields exist
+    sep9_classes_exist = (
+        'NaturalPersonKYCFields' in sep9_classes or
+        'OrganizationKYCFields' in sep9_classes or
+        'StandardKYCFields' in sep9_classes
+    )
+
+    # Check if PutCustomerInfoRequest has kycFields property
+    sep9_integrated = False
+    for cls in classes:
+        if cls['name'] == 'PutCustomerInfoRequest':
+            for prop in cls.get('properties', []):
+                if prop['name'] == 'kycFields':
+                    sep9_integrated = True
+                    break
+
+    # SEP-9 is implemented if module exists OR classes exist OR integration exists
+    sep9_implemented = sep9_module_exists or sep9_classes_exist or sep9_integrated
+
+    implemented['sep9_integration'] = {
+        'supported': sep9_integration.get('supported', True),
+        'implemented': sep9_implemented,
+        'description': sep9_integration.get('description', '')
+    }
+
+    # Calculate coverage
+    total_features = (
+        len(api_structure.get('endpoints', [])) +
+        len(api_structure.get('request_parameters', [])) +
+        len(api_structure.get('response_fields', [])) +
+        len(api_structure.get('field_types', [])) +
+        3  # authentication, file_upload, sep9_integration
+    )
+
+    implemented_count = (
+        sum(1 for v in implemented['endpoints'].values() if v['implemented']) +
+        sum(1 for v in implemented['request_parameters'].values() if v['implemented']) +
+        sum(1 for v in implemented['response_fields'].values() if v['implemented']) +
+        sum(1 for v in implemented['field_types'].values() if v['implemented']) +
+        (1 if implemented['authentication']['implemented'] else 0) +
+        (1 if implemented['file_upload']['implemented'] else 0) +
+        (1 if implemented['sep9_integration']['implemented'] else 0)
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100), 2) if total_features > 0 else 0
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-12 style KYC API features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare API endpoints
+    for endpoint_key, endpoint_info in implemented_features.get('endpoints', {}).items():
+        comparison = FieldComparison(
+            section='API Endpoints',
+            field_name=endpoint_key,
+            required=endpoint_info.get('required', True),  # KYC endpoints are essential
+            implemented=endpoint_info.get('implemented', False),
+            sdk_property=endpoint_info.get('sdk_method'),
+            description=f"{endpoint_info.get('method', '')} {endpoint_info.get('path', '')} - {endpoint_info.get('description', '')}",
+            priority=comparator.determine_field_priority(
+                endpoint_key,
+                endpoint_info.get('required', True),
+                'api_endpoints'
+            ) if not endpoint_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare request parameters
+    for param_name, param_info in implemented_features.get('request_parameters', {}).items():
+        comparison = FieldComparison(
+            section='Request Parameters',
+            field_name=param_name,
+            required=param_info.get('required', False),
+            implemented=param_info.get('implemented', False),
+            sdk_property=param_info.get('sdk_property'),
+            description=param_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                param_name,
+                param_info.get('required', False),
+                'request_parameters'
+            ) if not param_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare response fields
+    for field_name, field_info in implemented_features.get('response_fields', {}).items():
+        comparison = FieldComparison(
+            section='Response Fields',
+            field_name=field_name,
+            required=field_info.get('required', False),
+            implemented=field_info.get('implemented', False),
+            sdk_property=field_info.get('sdk_property'),
+            description=field_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                field_name,
+                field_info.get('required', False),
+                'response_fields'
+            ) if not field_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare field type specifications
+    for field_name, field_info in implemented_features.get('field_types', {}).items():
+        comparison = FieldComparison(
+            section='Field Type Specifications',
+            field_name=field_name,
+            required=field_info.get('required', True),
+            implemented=field_info.get('implemented', False),
+            sdk_property=field_info.get('sdk_property'),
+            description=field_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                field_name,
+                field_info.get('required', True),
+                'field_types'
+            ) if not field_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Add authentication support
+    auth = implemented_features.get('authentication', {})
+    comparison = FieldComparison(
+        section='Authentication',
+        field_name='jwt_authentication',
+        required=True,
+        implemented=auth.get('implemented', False),
+        sdk_property='JWT Token',
+        description=f"{auth.get('method', 'JWT Token')} via {auth.get('type', 'SEP-10')} - {auth.get('description', '')}",
+        priority=FieldPriority.CRITICAL.value if not auth.get('implemented') else None
+    )
+    comparator.comparisons.append(comparison)
+
+    # Add file upload support
+    file_upload = implemented_features.get('file_upload', {})
+    comparison = FieldComparison(
+        section='File Upload',
+        field_name='multipart_file_upload',
+        required=True,
+        implemented=file_upload.get('implemented', False),
+        sdk_property='multipart/form-data',
+        description=file_upload.get('description', ''),
+        priority=FieldPriority.HIGH.value if not file_upload.get('implemented') else None
+    )
+    comparator.comparisons.append(comparison)
+
+    # Add SEP-9 integration
+    sep9 = implemented_features.get('sep9_integration', {})
+    comparison = FieldComparison(
+        section='SEP-9 Integration',
+        field_name='standard_kyc_fields',
+        required=True,
+        implemented=sep9.get('implemented', False),
+        sdk_property='StandardKYCFields',
+        description=sep9.get('description', ''),
+        priority=FieldPriority.HIGH.value if not sep9.get('implemented') else None
+    )
+    comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} KYC API features{Colors.END}")
@@ -0,0 +1,710 @@
+"""
+SEP-24 (Hosted Deposit and Withdrawal) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-24 (Hosted Deposit and Withdrawal) specific structure.
+
+    Returns:
+        Structured SEP-24 data with API endpoints and interactive flow features
+    """
+    catalogue = load_catalogue('sep_0024')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define comprehensive API structure for SEP-24
+    # SEP-24 is similar to SEP-06 but uses POST for interactive flows
+    api_structure = catalogue['api_structure']
+
+    # Store API structure components as sections
+    data['sections'].append({
+        'title': 'Info Endpoint',
+        'key': 'info_endpoint',
+        'content': 'Endpoint for querying anchor interactive deposit/withdrawal capabilities',
+        'api_features': [api_structure['info_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Interactive Deposit Endpoint',
+        'key': 'interactive_deposit_endpoint',
+        'content': 'Endpoint for initiating interactive deposit flow',
+        'api_features': [api_structure['interactive_deposit_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Interactive Withdraw Endpoint',
+        'key': 'interactive_withdraw_endpoint',
+        'content': 'Endpoint for initiating interactive withdrawal flow',
+        'api_features': [api_structure['interactive_withdraw_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Transaction Endpoints',
+        'key': 'transaction_endpoints',
+        'content': 'Endpoints for tracking and querying transactions',
+        'api_features': api_structure['transaction_endpoints'],
+        'feature_count': len(api_structure['transaction_endpoints'])
+    })
+
+    data['sections'].append({
+        'title': 'Fee Endpoint',
+        'key': 'fee_endpoint',
+        'content': 'Optional endpoint for calculating transaction fees',
+        'api_features': [api_structure['fee_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Deposit Request Parameters',
+        'key': 'deposit_request_parameters',
+        'content': 'Parameters for interactive deposit endpoint',
+        'api_features': api_structure['deposit_request_parameters'],
+        'feature_count': len(api_structure['deposit_request_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Withdraw Request Parameters',
+        'key': 'withdraw_request_parameters',
+        'content': 'Parameters for interactive withdraw endpoint',
+        'api_features': api_structure['withdraw_request_parameters'],
+        'feature_count': len(api_structure['withdraw_request_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Interactive Response Fields',
+        'key': 'interactive_response_fields',
+        'content': 'Fields returned in interactive deposit/withdraw responses',
+        'api_features': api_structure['interactive_response_fields'],
+        'feature_count': len(api_structure['interactive_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Transaction Status Values',
+        'key': 'transaction_status_values',
+        'content': 'Possible transaction status values in SEP-24',
+        'api_features': api_structure['transaction_status_values'],
+        'feature_count': len(api_structure['transaction_status_values'])
+    })
+
+    data['sections'].append({
+        'title': 'Transaction Fields',
+        'key': 'transaction_fields',
+        'content': 'Fields returned in transaction objects',
+        'api_features': api_structure['transaction_fields'],
+        'feature_count': len(api_structure['transaction_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Info Response Fields',
+        'key': 'info_response_fields',
+        'content': 'Fields returned in info endpoint response',
+        'api_features': api_structure['info_response_fields'],
+        'feature_count': len(api_structure['info_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Deposit Asset Fields',
+        'key': 'deposit_asset_fields',
+        'content': 'Fields in deposit asset objects',
+        'api_features': api_structure['deposit_asset_fields'],
+        'feature_count': len(api_structure['deposit_asset_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Withdraw Asset Fields',
+        'key': 'withdraw_asset_fields',
+        'content': 'Fields in withdraw asset objects',
+        'api_features': api_structure['withdraw_asset_fields'],
+        'feature_count': len(api_structure['withdraw_asset_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Feature Flags Fields',
+        'key': 'feature_flags_fields',
+        'content': 'Fields in feature flags object',
+        'api_features': api_structure['feature_flags_fields'],
+        'feature_count': len(api_structure['feature_flags_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Fee Endpoint Info Fields',
+        'key': 'fee_endpoint_fields',
+        'content': 'Fields in fee endpoint info object',
+        'api_features': api_structure['fee_endpoint_fields'],
+        'feature_count': len(api_structure['fee_endpoint_fields'])
+    })
+
+    # Calculate totals
+    total_features = sum(section['feature_count'] for section in data['sections'])
+
+    print(f"{Colors.GREEN}  ✓ Found 1 info endpoint{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found 1 interactive deposit endpoint{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found 1 interactive withdraw endpoint{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['transaction_endpoints'])} transaction endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['deposit_request_parameters'])} deposit request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['withdraw_request_parameters'])} withdraw request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['transaction_status_values'])} transaction status values{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['transaction_fields'])} transaction fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} SEP-24 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-24 (Hosted Deposit and Withdrawal) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-24 implementation files found'
+        }
+
+    # Load SEP-24 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented API features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-24 Hosted Deposit/Withdrawal API requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping API features to implementation status
+    """
+    implemented = {
+        'info_endpoint': {},
+        'interactive_deposit_endpoint': {},
+        'interactive_withdraw_endpoint': {},
+        'transaction_endpoints': {},
+        'fee_endpoint': {},
+        'deposit_request_parameters': {},
+        'withdraw_request_parameters': {},
+        'interactive_response_fields': {},
+        'transaction_status_values': {},
+        'transaction_fields': {},
+        'info_response_fields': {},
+        'deposit_asset_fields': {},
+        'withdraw_asset_fields': {},
+        'feature_flags_fields': {},
+        'fee_endpoint_fields': {},
+        'coverage': {}
+    }
+
+    # Get all methods from TransferServerSEP24Service class
+    transfer_service_methods = set()
+    for cls in classes:
+        if cls['name'] == 'TransferServerSEP24Service':
+            for method in cls.get('methods', []):
+                transfer_service_methods.add(method['name'])
+
+    # Map endpoints to TransferServerSEP24Service methods
+    endpoint_map = {
+        'info_endpoint': 'info',
+        'interactive_deposit': 'deposit',
+        'interactive_withdraw': 'withdraw',
+        'transactions': 'transactions',
+        'transaction': 'transaction',
+        'fee_endpoint': 'fee'
+    }
+
+    # Process each section from SEP definition
+    for section in sep_definition.get('sections', []):
+        section_key = section.get('key', '')
+        api_features = section.get('api_features', [])
+
+        if section_key == 'info_endpoint':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['info_endpoint'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'interactive_deposit_endpoint':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['interactive_deposit_endpoint'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'interactive_withdraw_endpoint':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['interactive_withdraw_endpoint'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'transaction_endpoints':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['transaction_endpoints'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'fee_endpoint':
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in transfer_service_methods if sdk_method else False
+
+                implemented['fee_endpoint'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'deposit_request_parameters':
+            # Check SEP24DepositRequest class properties
+            deposit_request_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP24DepositRequest':
+                    for prop in cls.get('properties', []):
+                        deposit_request_properties.add(prop['name'])
+
+            # Map parameter names to SDK properties
+            param_map = {
+                'asset_code': 'assetCode',
+                'asset_issuer': 'assetIssuer',
+                'source_asset': 'sourceAsset',
+                'amount': 'amount',
+                'quote_id': 'quoteId',
+                'account': 'account',
+                'memo': 'memo',
+                'memo_type': 'memoType',
+                'wallet_name': 'walletName',
+                'wallet_url': 'walletUrl',
+                'lang': 'lang',
+                'claimable_balance_supported': 'claimableBalanceSupported'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = param_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in deposit_request_properties
+
+                implemented['deposit_request_parameters'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'withdraw_request_parameters':
+            # Check SEP24WithdrawRequest class properties
+            withdraw_request_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP24WithdrawRequest':
+                    for prop in cls.get('properties', []):
+                        withdraw_request_properties.add(prop['name'])
+
+            # Map parameter names to SDK properties
+            param_map = {
+                'asset_code': 'assetCode',
+                'asset_issuer': 'assetIssuer',
+                'destination_asset': 'destinationAsset',
+                'amount': 'amount',
+                'quote_id': 'quoteId',
+                'account': 'account',
+                'memo': 'memo',
+                'memo_type': 'memoType',
+                'wallet_name': 'walletName',
+                'wallet_url': 'walletUrl',
+                'lang': 'lang'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = param_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in withdraw_request_properties
+
+                implemented['withdraw_request_parameters'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'interactive_response_fields':
+            # Check SEP24InteractiveResponse class properties
+            interactive_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP24InteractiveResponse':
+                    for prop in cls.get('properties', []):
+                        interactive_response_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'type': 'type',
+                'url': 'url',
+                'id': 'id'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in interactive_response_properties
+
+                implemented['interactive_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'transaction_status_values':
+            # Transaction status values are handled by the SEP24Transaction class
+            # All statuses are supported as string values
+            for feature in api_features:
+                feature_name = feature['name']
+                # All transaction statuses are supported
+                implemented['transaction_status_values'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': True,
+                    'sdk_property': 'status',
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'transaction_fields':
+            # Check SEP24Transaction class properties
+            transaction_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP24Transaction':
+                    for prop in cls.get('properties', []):
+                        transaction_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'id': 'id',
+                'kind': 'kind',
+                'status': 'status',
+                'status_eta': 'statusEta',
+                'kyc_verified': 'kycVerified',
+                'more_info_url': 'moreInfoUrl',
+                'amount_in': 'amountIn',
+                'amount_in_asset': 'amountInAsset',
+                'amount_out': 'amountOut',
+                'amount_out_asset': 'amountOutAsset',
+                'amount_fee': 'amountFee',
+                'amount_fee_asset': 'amountFeeAsset',
+                'quote_id': 'quoteId',
+                'started_at': 'startedAt',
+                'completed_at': 'completedAt',
+                'updated_at': 'updatedAt',
+                'user_action_required_by': 'userActionRequiredBy',
+                'stellar_transaction_id': 'stellarTransactionId',
+                'external_transaction_id': 'externalTransactionId',
+                'message': 'message',
+                'refunded': 'refunded',
+                'refunds': 'refunds',
+                'from': 'from',
+                'to': 'to',
+                'deposit_memo': 'depositMemo',
+                'deposit_memo_type': 'depositMemoType',
+                'claimable_balance_id': 'claimableBalanceId',
+                'withdraw_anchor_account': 'withdrawAnchorAccount',
+                'withdraw_memo': 'withdrawMemo',
+                'withdraw_memo_type': 'withdrawMemoType'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in transaction_properties
+
+                implemented['transaction_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'info_response_fields':
+            # Check SEP24InfoResponse class properties
+            info_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP24InfoResponse':
+                    for prop in cls.get('properties', []):
+                        info_response_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'deposit': 'depositAssets',
+                'withdraw': 'withdrawAssets',
+                'fee': 'feeEndpointInfo',
+                'features': 'featureFlags'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in info_response_properties
+
+                implemented['info_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'deposit_asset_fields':
+            # Check SEP24DepositAsset class properties
+            deposit_asset_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP24DepositAsset':
+                    for prop in cls.get('properties', []):
+                        deposit_asset_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'enabled': 'enabled',
+                'min_amount': 'minAmount',
+                'max_amount': 'maxAmount',
+                'fee_fixed': 'feeFixed',
+                'fee_percent': 'feePercent',
+                'fee_minimum': 'feeMinimum'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in deposit_asset_properties
+
+                implemented['deposit_asset_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'withdraw_asset_fields':
+            # Check SEP24WithdrawAsset class properties
+            withdraw_asset_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP24WithdrawAsset':
+                    for prop in cls.get('properties', []):
+                        withdraw_asset_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'enabled': 'enabled',
+                'min_amount': 'minAmount',
+                'max_amount': 'maxAmount',
+                'fee_fixed': 'feeFixed',
+                'fee_percent': 'feePercent',
+                'fee_minimum': 'feeMinimum'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in withdraw_asset_properties
+
+                implemented['withdraw_asset_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'feature_flags_fields':
+            # Check FeatureFlags class properties
+            feature_flags_properties = set()
+            for cls in classes:
+                if cls['name'] == 'FeatureFlags':
+                    for prop in cls.get('properties', []):
+                        feature_flags_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'account_creation': 'accountCreation',
+                'claimable_balances': 'claimableBalances'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in feature_flags_properties
+
+                implemented['feature_flags_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'fee_endpoint_fields':
+            # Check FeeEndpointInfo class properties
+            fee_endpoint_properties = set()
+            for cls in classes:
+                if cls['name'] == 'FeeEndpointInfo':
+                    for prop in cls.get('properties', []):
+                        fee_endpoint_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'enabled': 'enabled',
+                'authentication_required': 'authenticationRequired'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in fee_endpoint_properties
+
+                implemented['fee_endpoint_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage
+    total_features = sum(
+        len(category) for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+    )
+
+    implemented_count = sum(
+        1 for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+        for feature in category.values()
+        if feature.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-24 style Hosted Deposit/Withdrawal API features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Section title mapping for display
+    section_titles = {
+        'info_endpoint': 'Info Endpoint',
+        'interactive_deposit_endpoint': 'Interactive Deposit Endpoint',
+        'interactive_withdraw_endpoint': 'Interactive Withdraw Endpoint',
+        'transaction_endpoints': 'Transaction Endpoints',
+        'fee_endpoint': 'Fee Endpoint',
+        'deposit_request_parameters': 'Deposit Request Parameters',
+        'withdraw_request_parameters': 'Withdraw Request Parameters',
+        'interactive_response_fields': 'Interactive Response Fields',
+        'transaction_status_values': 'Transaction Status Values',
+        'transaction_fields': 'Transaction Fields',
+        'info_response_fields': 'Info Response Fields',
+        'deposit_asset_fields': 'Deposit Asset Fields',
+        'withdraw_asset_fields': 'Withdraw Asset Fields',
+        'feature_flags_fields': 'Feature Flags Fields',
+        'fee_endpoint_fields': 'Fee Endpoint Info Fields'
+    }
+
+    # Compare each category
+    for category_name, category_features in implemented_features.items():
+        if category_name == 'coverage':
+            continue
+
+        section_title = section_titles.get(category_name, category_name.replace('_', ' ').title())
+
+        for feature_name, feature_info in category_features.items():
+            comparison = FieldComparison(
+                section=section_title,
+                field_name=feature_name,
+                required=feature_info.get('required', False),
+                implemented=feature_info.get('implemented', False),
+                sdk_property=feature_info.get('sdk_method') or feature_info.get('sdk_property'),
+                description=feature_info.get('description', ''),
+                priority=comparator.determine_field_priority(
+                    feature_name,
+                    feature_info.get('required', False),
+                    category_name
+                ) if not feature_info.get('implemented') else None
+            )
+            comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} Hosted Deposit/Withdrawal API features{Colors.END}")
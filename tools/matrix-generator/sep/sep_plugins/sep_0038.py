@@ -0,0 +1,667 @@
+"""
+SEP-38 (Anchor RFQ API) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-38 (Anchor RFQ API) specific structure.
+
+    Returns:
+        Structured SEP-38 data with API endpoints and quote features
+    """
+    catalogue = load_catalogue('sep_0038')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define comprehensive API structure for SEP-38
+    api_structure = catalogue['api_structure']
+
+    # Store API structure components as sections
+    data['sections'].append({
+        'title': 'Info Endpoint',
+        'key': 'info_endpoint',
+        'content': 'Endpoint for querying supported assets for trading',
+        'api_features': [api_structure['info_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Prices Endpoint',
+        'key': 'prices_endpoint',
+        'content': 'Endpoint for fetching indicative prices for multiple buy assets',
+        'api_features': [api_structure['prices_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Price Endpoint',
+        'key': 'price_endpoint',
+        'content': 'Endpoint for fetching indicative price for specific asset pair',
+        'api_features': [api_structure['price_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Post Quote Endpoint',
+        'key': 'post_quote_endpoint',
+        'content': 'Endpoint for requesting firm quote',
+        'api_features': [api_structure['post_quote_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Get Quote Endpoint',
+        'key': 'get_quote_endpoint',
+        'content': 'Endpoint for fetching previously provided firm quote',
+        'api_features': [api_structure['get_quote_endpoint']],
+        'feature_count': 1
+    })
+
+    data['sections'].append({
+        'title': 'Info Response Fields',
+        'key': 'info_response_fields',
+        'content': 'Fields returned in info endpoint response',
+        'api_features': api_structure['info_response_fields'],
+        'feature_count': len(api_structure['info_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Asset Fields',
+        'key': 'asset_fields',
+        'content': 'Fields in asset objects',
+        'api_features': api_structure['asset_fields'],
+        'feature_count': len(api_structure['asset_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Delivery Method Fields',
+        'key': 'delivery_method_fields',
+        'content': 'Fields in delivery method objects',
+        'api_features': api_structure['delivery_method_fields'],
+        'feature_count': len(api_structure['delivery_method_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Prices Request Parameters',
+        'key': 'prices_request_parameters',
+        'content': 'Parameters for prices endpoint requests',
+        'api_features': api_structure['prices_request_parameters'],
+        'feature_count': len(api_structure['prices_request_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Prices Response Fields',
+        'key': 'prices_response_fields',
+        'content': 'Fields returned in prices endpoint response',
+        'api_features': api_structure['prices_response_fields'],
+        'feature_count': len(api_structure['prices_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Buy Asset Fields',
+        'key': 'buy_asset_fields',
+        'content': 'Fields in buy asset objects from prices response',
+        'api_features': api_structure['buy_asset_fields'],
+        'feature_count': len(api_structure['buy_asset_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Price Request Parameters',
+        'key': 'price_request_parameters',
+        'content': 'Parameters for price endpoint requests',
+        'api_features': api_structure['price_request_parameters'],
+        'feature_count': len(api_structure['price_request_parameters'])
+    })
+
+    data['sections'].append({
+        'title': 'Price Response Fields',
+        'key': 'price_response_fields',
+        'content': 'Fields returned in price endpoint response',
+        'api_features': api_structure['price_response_fields'],
+        'feature_count': len(api_structure['price_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Post Quote Request Fields',
+        'key': 'post_quote_request_fields',
+        'content': 'Fields in POST /quote request body',
+        'api_features': api_structure['post_quote_request_fields'],
+        'feature_count': len(api_structure['post_quote_request_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Quote Response Fields',
+        'key': 'quote_response_fields',
+        'content': 'Fields returned in quote endpoint responses',
+        'api_features': api_structure['quote_response_fields'],
+        'feature_count': len(api_structure['quote_response_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Fee Fields',
+        'key': 'fee_fields',
+        'content': 'Fields in fee objects',
+        'api_features': api_structure['fee_fields'],
+        'feature_count': len(api_structure['fee_fields'])
+    })
+
+    data['sections'].append({
+        'title': 'Fee Details Fields',
+        'key': 'fee_details_fields',
+        'content': 'Fields in fee details objects',
+        'api_features': api_structure['fee_details_fields'],
+        'feature_count': len(api_structure['fee_details_fields'])
+    })
+
+    # Calculate totals
+    total_features = sum(section['feature_count'] for section in data['sections'])
+
+    print(f"{Colors.GREEN}  ✓ Found 5 endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['prices_request_parameters'])} prices request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['price_request_parameters'])} price request parameters{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['post_quote_request_fields'])} post quote request fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(api_structure['quote_response_fields'])} quote response fields{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} SEP-38 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-38 (Anchor RFQ API) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-38 implementation files found'
+        }
+
+    # Load SEP-38 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented API features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-38 Anchor RFQ API requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping API features to implementation status
+    """
+    implemented = {
+        'info_endpoint': {},
+        'prices_endpoint': {},
+        'price_endpoint': {},
+        'post_quote_endpoint': {},
+        'get_quote_endpoint': {},
+        'info_response_fields': {},
+        'asset_fields': {},
+        'delivery_method_fields': {},
+        'prices_request_parameters': {},
+        'prices_response_fields': {},
+        'buy_asset_fields': {},
+        'price_request_parameters': {},
+        'price_response_fields': {},
+        'post_quote_request_fields': {},
+        'quote_response_fields': {},
+        'fee_fields': {},
+        'fee_details_fields': {},
+        'coverage': {}
+    }
+
+    # Get all methods from SEP38QuoteService class
+    quote_service_methods = set()
+    for cls in classes:
+        if cls['name'] == 'SEP38QuoteService':
+            for method in cls.get('methods', []):
+                quote_service_methods.add(method['name'])
+
+    # Map endpoints to SEP38QuoteService methods
+    endpoint_map = {
+        'info_endpoint': 'info',
+        'prices_endpoint': 'prices',
+        'price_endpoint': 'price',
+        'post_quote_endpoint': 'postQuote',
+        'get_quote_endpoint': 'getQuote'
+    }
+
+    # Process each section from SEP definition
+    for section in sep_definition.get('sections', []):
+        section_key = section.get('key', '')
+        api_features = section.get('api_features', [])
+
+        if section_key in ['info_endpoint', 'prices_endpoint', 'price_endpoint', 'post_quote_endpoint', 'get_quote_endpoint']:
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_method = endpoint_map.get(feature_name)
+                implemented_in_sdk = sdk_method in quote_service_methods if sdk_method else False
+
+                implemented[section_key][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'info_response_fields':
+            # Check SEP38InfoResponse class properties
+            info_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38InfoResponse':
+                    for prop in cls.get('properties', []):
+                        info_response_properties.add(prop['name'])
+
+            for feature in api_features:
+                feature_name = feature['name']
+                implemented_in_sdk = feature_name in info_response_properties
+
+                implemented['info_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': feature_name if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'asset_fields':
+            # Check SEP38Asset class properties
+            asset_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38Asset':
+                    for prop in cls.get('properties', []):
+                        asset_properties.add(prop['name'])
+
+            # Map field names to SDK properties
+            field_map = {
+                'asset': 'asset',
+                'sell_delivery_methods': 'sellDeliveryMethods',
+                'buy_delivery_methods': 'buyDeliveryMethods',
+                'country_codes': 'countryCodes'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in asset_properties
+
+                implemented['asset_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'delivery_method_fields':
+            # Check Sep38SellDeliveryMethod and Sep38BuyDeliveryMethod classes
+            delivery_method_properties = set()
+            for cls in classes:
+                if cls['name'] in ['Sep38SellDeliveryMethod', 'Sep38BuyDeliveryMethod']:
+                    for prop in cls.get('properties', []):
+                        delivery_method_properties.add(prop['name'])
+
+            for feature in api_features:
+                feature_name = feature['name']
+                implemented_in_sdk = feature_name in delivery_method_properties
+
+                implemented['delivery_method_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': feature_name if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'prices_request_parameters':
+            # Check if prices method accepts these parameters
+            # Parameters are passed as method arguments, not as object properties
+            param_map = {
+                'sell_asset': 'sellAsset',
+                'sell_amount': 'sellAmount',
+                'sell_delivery_method': 'sellDeliveryMethod',
+                'buy_delivery_method': 'buyDeliveryMethod',
+                'country_code': 'countryCode'
+            }
+
+            # All parameters are supported if the prices method exists
+            has_prices_method = 'prices' in quote_service_methods
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_param = param_map.get(feature_name, feature_name)
+
+                implemented['prices_request_parameters'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': has_prices_method,
+                    'sdk_property': sdk_param if has_prices_method else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'prices_response_fields':
+            # Check SEP38PricesResponse class properties
+            prices_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38PricesResponse':
+                    for prop in cls.get('properties', []):
+                        prices_response_properties.add(prop['name'])
+
+            # Map field names
+            field_map = {
+                'buy_assets': 'buyAssets'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in prices_response_properties
+
+                implemented['prices_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'buy_asset_fields':
+            # Check SEP38BuyAsset class properties
+            buy_asset_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38BuyAsset':
+                    for prop in cls.get('properties', []):
+                        buy_asset_properties.add(prop['name'])
+
+            for feature in api_features:
+                feature_name = feature['name']
+                implemented_in_sdk = feature_name in buy_asset_properties
+
+                implemented['buy_asset_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': feature_name if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'price_request_parameters':
+            # Check if price method accepts these parameters
+            param_map = {
+                'context': 'context',
+                'sell_asset': 'sellAsset',
+                'buy_asset': 'buyAsset',
+                'sell_amount': 'sellAmount',
+                'buy_amount': 'buyAmount',
+                'sell_delivery_method': 'sellDeliveryMethod',
+                'buy_delivery_method': 'buyDeliveryMethod',
+                'country_code': 'countryCode'
+            }
+
+            has_price_method = 'price' in quote_service_methods
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_param = param_map.get(feature_name, feature_name)
+
+                implemented['price_request_parameters'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': has_price_method,
+                    'sdk_property': sdk_param if has_price_method else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'price_response_fields':
+            # Check SEP38PriceResponse class properties
+            price_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38PriceResponse':
+                    for prop in cls.get('properties', []):
+                        price_response_properties.add(prop['name'])
+
+            # Map field names
+            field_map = {
+                'total_price': 'totalPrice',
+                'price': 'price',
+                'sell_amount': 'sellAmount',
+                'buy_amount': 'buyAmount',
+                'fee': 'fee'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in price_response_properties
+
+                implemented['price_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'post_quote_request_fields':
+            # Check SEP38PostQuoteRequest class properties
+            post_quote_request_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38PostQuoteRequest':
+                    for prop in cls.get('properties', []):
+                        post_quote_request_properties.add(prop['name'])
+
+            # Map field names
+            field_map = {
+                'context': 'context',
+                'sell_asset': 'sellAsset',
+                'buy_asset': 'buyAsset',
+                'sell_amount': 'sellAmount',
+                'buy_amount': 'buyAmount',
+                'expire_after': 'expireAfter',
+                'sell_delivery_method': 'sellDeliveryMethod',
+                'buy_delivery_method': 'buyDeliveryMethod',
+                'country_code': 'countryCode'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in post_quote_request_properties
+
+                implemented['post_quote_request_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'quote_response_fields':
+            # Check SEP38QuoteResponse class properties
+            quote_response_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38QuoteResponse':
+                    for prop in cls.get('properties', []):
+                        quote_response_properties.add(prop['name'])
+
+            # Map field names
+            field_map = {
+                'id': 'id',
+                'expires_at': 'expiresAt',
+                'total_price': 'totalPrice',
+                'price': 'price',
+                'sell_asset': 'sellAsset',
+                'sell_amount': 'sellAmount',
+                'buy_asset': 'buyAsset',
+                'buy_amount': 'buyAmount',
+                'fee': 'fee'
+            }
+
+            for feature in api_features:
+                feature_name = feature['name']
+                sdk_property = field_map.get(feature_name, feature_name)
+                implemented_in_sdk = sdk_property in quote_response_properties
+
+                implemented['quote_response_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': sdk_property if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'fee_fields':
+            # Check SEP38Fee class properties
+            fee_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38Fee':
+                    for prop in cls.get('properties', []):
+                        fee_properties.add(prop['name'])
+
+            for feature in api_features:
+                feature_name = feature['name']
+                implemented_in_sdk = feature_name in fee_properties
+
+                implemented['fee_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': feature_name if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'fee_details_fields':
+            # Check SEP38FeeDetails class properties
+            fee_details_properties = set()
+            for cls in classes:
+                if cls['name'] == 'SEP38FeeDetails':
+                    for prop in cls.get('properties', []):
+                        fee_details_properties.add(prop['name'])
+
+            for feature in api_features:
+                feature_name = feature['name']
+                implemented_in_sdk = feature_name in fee_details_properties
+
+                implemented['fee_details_fields'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_property': feature_name if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage
+    total_features = sum(
+        len(category) for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+    )
+
+    implemented_count = sum(
+        1 for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+        for feature in category.values()
+        if feature.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-38 style Anchor RFQ API features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Section title mappings
+    section_mapping = {
+        'info_endpoint': 'Info Endpoint',
+        'prices_endpoint': 'Prices Endpoint',
+        'price_endpoint': 'Price Endpoint',
+        'post_quote_endpoint': 'Post Quote Endpoint',
+        'get_quote_endpoint': 'Get Quote Endpoint',
+        'info_response_fields': 'Info Response Fields',
+        'asset_fields': 'Asset Fields',
+        'delivery_method_fields': 'Delivery Method Fields',
+        'prices_request_parameters': 'Prices Request Parameters',
+        'prices_response_fields': 'Prices Response Fields',
+        'buy_asset_fields': 'Buy Asset Fields',
+        'price_request_parameters': 'Price Request Parameters',
+        'price_response_fields': 'Price Response Fields',
+        'post_quote_request_fields': 'Post Quote Request Fields',
+        'quote_response_fields': 'Quote Response Fields',
+        'fee_fields': 'Fee Fields',
+        'fee_details_fields': 'Fee Details Fields'
+    }
+
+    # Compare each feature category
+    for category_key, category_title in section_mapping.items():
+        category_features = implemented_features.get(category_key, {})
+
+        for feature_name, feature_info in category_features.items():
+            # Determine description based on category
+            description = feature_info.get('description', '')
+            if category_key in ['info_endpoint', 'prices_endpoint', 'price_endpoint', 'post_quote_endpoint', 'get_quote_endpoint']:
+                method = feature_info.get('method', '')
+                path = feature_info.get('path', '')
+                if method and path:
+                    description = f"{method} {path} - {description}"
+
+            comparison = FieldComparison(
+                section=category_title,
+                field_name=feature_name,
+                required=feature_info.get('required', False),
+                implemented=feature_info.get('implemented', False),
+                sdk_property=feature_info.get('sdk_method') or feature_info.get('sdk_property'),
+                description=description,
+                priority=comparator.determine_field_priority(
+                    feature_name,
+                    feature_info.get('required', False),
+                    category_key
+                ) if not feature_info.get('implemented') else None
+            )
+            comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} Anchor RFQ API features{Colors.END}")
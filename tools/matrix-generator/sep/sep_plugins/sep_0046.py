@@ -0,0 +1,309 @@
+"""
+SEP-46 (Contract Meta) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-46 (Contract Meta) specific structure.
+
+    Returns:
+        Structured SEP-46 data with contract metadata features
+    """
+    catalogue = load_catalogue('sep_0046')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define contract metadata features structure for SEP-46
+    contract_meta_features = {
+        'metadata_storage': [],
+        'encoding_format': [],
+        'implementation_support': []
+    }
+
+    # Metadata storage features
+    contract_meta_features['metadata_storage'] = catalogue['metadata_storage']
+
+    # Encoding format features
+    contract_meta_features['encoding_format'] = catalogue['encoding_format']
+
+    # Implementation support features
+    contract_meta_features['implementation_support'] = catalogue['implementation_support']
+
+    # Store features as sections
+    data['sections'].append({
+        'title': 'Contract Metadata Storage',
+        'key': 'metadata_storage',
+        'content': 'Features for storing metadata in Wasm custom sections',
+        'contract_meta_features': contract_meta_features['metadata_storage'],
+        'feature_count': len(contract_meta_features['metadata_storage'])
+    })
+
+    data['sections'].append({
+        'title': 'Encoding Format',
+        'key': 'encoding_format',
+        'content': 'XDR encoding format for metadata entries',
+        'contract_meta_features': contract_meta_features['encoding_format'],
+        'feature_count': len(contract_meta_features['encoding_format'])
+    })
+
+    data['sections'].append({
+        'title': 'Implementation Support',
+        'key': 'implementation_support',
+        'content': 'SDK support for parsing and extracting contract metadata',
+        'contract_meta_features': contract_meta_features['implementation_support'],
+        'feature_count': len(contract_meta_features['implementation_support'])
+    })
+
+    total_features = (
+        len(contract_meta_features['metadata_storage']) +
+        len(contract_meta_features['encoding_format']) +
+        len(contract_meta_features['implementation_support'])
+    )
+
+    print(f"{Colors.GREEN}  ✓ Found {len(contract_meta_features['metadata_storage'])} metadata storage features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(contract_meta_features['encoding_format'])} encoding format features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(contract_meta_features['implementation_support'])} implementation support features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} SEP-46 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-46 (Contract Meta) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    # SEP-46 is implemented in the soroban_contract_parser.dart file
+    files = []
+    soroban_parser_path = analyzer.sdk_path / 'lib' / 'src' / 'soroban' / 'soroban_contract_parser.dart'
+    if soroban_parser_path.exists():
+        files.append(soroban_parser_path)
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-46 implementation files found (soroban_contract_parser.dart)'
+        }
+
+    # Load SEP-46 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented contract meta features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-46 contract meta feature requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping contract meta features to implementation status
+    """
+    implemented = {
+        'metadata_storage': {},
+        'encoding_format': {},
+        'implementation_support': {},
+        'coverage': {}
+    }
+
+    # Get all methods from all classes
+    all_methods = {}
+    all_properties = {}
+    for cls in classes:
+        for method in cls.get('methods', []):
+            all_methods[method['name']] = method
+        for prop in cls.get('properties', []):
+            all_properties[prop['name']] = prop
+
+    # Map metadata storage features to SDK implementation
+    metadata_storage_map = {
+        'contractmetav0_section': '_parseMeta',  # Parses contractmetav0 section
+        'multiple_entries_single_section': '_parseMeta',  # Handles multiple entries
+        'multiple_sections': '_parseMeta'  # Sequential interpretation
+    }
+
+    # Map encoding format features
+    encoding_format_map = {
+        'scmetaentry_xdr': '_parseMeta',  # Uses XdrSCMetaEntry
+        'binary_stream_encoding': '_parseMeta',  # Decodes binary stream
+        'key_value_pairs': 'metaEntries'  # Returns Map<String, String>
+    }
+
+    # Map implementation support features
+    implementation_support_map = {
+        'parse_contract_meta': 'parseContractByteCode',  # Main parsing method
+        'extract_meta_entries': '_parseMeta',  # Extracts meta entries
+        'decode_scmetaentry': '_parseMeta'  # Decodes XdrSCMetaEntry
+    }
+
+    # Process each section from SEP definition
+    sections = sep_definition.get('sections', [])
+
+    for section in sections:
+        section_key = section.get('key', '')
+        contract_meta_features = section.get('contract_meta_features', [])
+
+        if section_key == 'metadata_storage':
+            for feature in contract_meta_features:
+                feature_name = feature['name']
+                sdk_method = metadata_storage_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['metadata_storage'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'encoding_format':
+            for feature in contract_meta_features:
+                feature_name = feature['name']
+                sdk_item = encoding_format_map.get(feature_name)
+                # Check if it's a method or property
+                implemented_in_sdk = (sdk_item in all_methods or sdk_item in all_properties) if sdk_item else False
+
+                implemented['encoding_format'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_item if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'implementation_support':
+            for feature in contract_meta_features:
+                feature_name = feature['name']
+                sdk_method = implementation_support_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['implementation_support'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage
+    total_features = sum(
+        len(category) for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+    )
+    implemented_count = sum(
+        1 for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+        for feature in category.values()
+        if feature.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-46 style features (Contract Meta)"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare metadata storage features
+    for feature_name, feature_info in implemented_features.get('metadata_storage', {}).items():
+        comparison = FieldComparison(
+            section='Metadata Storage',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'metadata_storage'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare encoding format features
+    for feature_name, feature_info in implemented_features.get('encoding_format', {}).items():
+        comparison = FieldComparison(
+            section='Encoding Format',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'encoding_format'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare implementation support features
+    for feature_name, feature_info in implemented_features.get('implementation_support', {}).items():
+        comparison = FieldComparison(
+            section='Implementation Support',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'implementation_support'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} Contract Meta features{Colors.END}")
@@ -0,0 +1,309 @@
+"""
+SEP-47 (Contract Interface Discovery) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Parse SEP-47 (Contract Interface Discovery) specific structure.
+
+    Returns:
+        Structured SEP-47 data with contract interface discovery features
+    """
+    catalogue = load_catalogue('sep_0047')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': parser.extract_preamble(),
+        'summary': parser.extract_summary(),
+        'sections': []
+    }
+
+    # Define contract interface discovery features structure for SEP-47
+    interface_discovery_features = {
+        'sep_declaration': [],
+        'meta_entry_format': [],
+        'implementation_support': []
+    }
+
+    # SEP declaration features
+    interface_discovery_features['sep_declaration'] = catalogue['sep_declaration']
+
+    # Meta entry format features
+    interface_discovery_features['meta_entry_format'] = catalogue['meta_entry_format']
+
+    # Implementation support features
+    interface_discovery_features['implementation_support'] = catalogue['implementation_support']
+
+    # Store features as sections
+    data['sections'].append({
+        'title': 'SEP Declaration',
+        'key': 'sep_declaration',
+        'content': 'Features for declaring implemented SEPs in contract metadata',
+        'contract_meta_features': interface_discovery_features['sep_declaration'],
+        'feature_count': len(interface_discovery_features['sep_declaration'])
+    })
+
+    data['sections'].append({
+        'title': 'Meta Entry Format',
+        'key': 'meta_entry_format',
+        'content': 'Parsing and format handling for SEP meta entries',
+        'contract_meta_features': interface_discovery_features['meta_entry_format'],
+        'feature_count': len(interface_discovery_features['meta_entry_format'])
+    })
+
+    data['sections'].append({
+        'title': 'Implementation Support',
+        'key': 'implementation_support',
+        'content': 'SDK support for parsing and exposing supported SEPs',
+        'contract_meta_features': interface_discovery_features['implementation_support'],
+        'feature_count': len(interface_discovery_features['implementation_support'])
+    })
+
+    total_features = (
+        len(interface_discovery_features['sep_declaration']) +
+        len(interface_discovery_features['meta_entry_format']) +
+        len(interface_discovery_features['implementation_support'])
+    )
+
+    print(f"{Colors.GREEN}  ✓ Found {len(interface_discovery_features['sep_declaration'])} SEP declaration features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(interface_discovery_features['meta_entry_format'])} meta entry format features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Found {len(interface_discovery_features['implementation_support'])} implementation support features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {total_features} SEP-47 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-47 (Contract Interface Discovery) implementation.
+
+    Returns:
+        Analysis results dictionary
+    """
+    # SEP-47 is implemented in the soroban_contract_parser.dart file
+    files = []
+    soroban_parser_path = analyzer.sdk_path / 'lib' / 'src' / 'soroban' / 'soroban_contract_parser.dart'
+    if soroban_parser_path.exists():
+        files.append(soroban_parser_path)
+
+    if not files:
+        return {
+            'implemented': False,
+            'reason': 'No SEP-47 implementation files found (soroban_contract_parser.dart)'
+        }
+
+    # Load SEP-47 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    # Analyze each file
+    all_classes = []
+    for file_path in files:
+        classes = analyzer.extract_class_info(file_path)
+        all_classes.extend(classes)
+
+    # Map implemented interface discovery features
+    implemented_features = map_features(all_classes, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(f.relative_to(analyzer.sdk_path)) for f in files],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(classes: List[Dict[str, Any]],
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map SDK implementation to SEP-47 interface discovery feature requirements.
+
+    Args:
+        classes: List of SDK classes
+        sep_definition: SEP specification definition
+
+    Returns:
+        Dictionary mapping interface discovery features to implementation status
+    """
+    implemented = {
+        'sep_declaration': {},
+        'meta_entry_format': {},
+        'implementation_support': {},
+        'coverage': {}
+    }
+
+    # Get all methods from all classes
+    all_methods = {}
+    all_properties = {}
+    for cls in classes:
+        for method in cls.get('methods', []):
+            all_methods[method['name']] = method
+        for prop in cls.get('properties', []):
+            all_properties[prop['name']] = prop
+
+    # Map SEP declaration features to SDK implementation
+    sep_declaration_map = {
+        'sep_meta_key': '_parseSupportedSeps',  # Looks for "sep" key in meta
+        'comma_separated_list': '_parseSupportedSeps',  # Splits by comma
+        'multiple_sep_entries': '_parseSupportedSeps'  # Could handle multiple entries
+    }
+
+    # Map meta entry format features
+    meta_entry_format_map = {
+        'sep_number_format': '_parseSupportedSeps',  # Parses SEP numbers
+        'whitespace_handling': '_parseSupportedSeps',  # Uses trim()
+        'empty_value_handling': '_parseSupportedSeps'  # Handles empty values
+    }
+
+    # Map implementation support features
+    implementation_support_map = {
+        'parse_supported_seps': '_parseSupportedSeps',  # Static parsing method
+        'expose_supported_seps': 'supportedSeps',  # Property on SorobanContractInfo
+        'validate_sep_format': '_parseSupportedSeps'  # Filters invalid entries
+    }
+
+    # Process each section from SEP definition
+    sections = sep_definition.get('sections', [])
+
+    for section in sections:
+        section_key = section.get('key', '')
+        contract_meta_features = section.get('contract_meta_features', [])
+
+        if section_key == 'sep_declaration':
+            for feature in contract_meta_features:
+                feature_name = feature['name']
+                sdk_method = sep_declaration_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['sep_declaration'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'meta_entry_format':
+            for feature in contract_meta_features:
+                feature_name = feature['name']
+                sdk_method = meta_entry_format_map.get(feature_name)
+                implemented_in_sdk = sdk_method in all_methods if sdk_method else False
+
+                implemented['meta_entry_format'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_method if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+        elif section_key == 'implementation_support':
+            for feature in contract_meta_features:
+                feature_name = feature['name']
+                sdk_item = implementation_support_map.get(feature_name)
+                # Check if it's a method or property
+                implemented_in_sdk = (sdk_item in all_methods or sdk_item in all_properties) if sdk_item else False
+
+                implemented['implementation_support'][feature_name] = {
+                    'required': feature.get('required', False),
+                    'implemented': implemented_in_sdk,
+                    'sdk_method': sdk_item if implemented_in_sdk else None,
+                    'description': feature.get('description', '')
+                }
+
+    # Calculate coverage
+    total_features = sum(
+        len(category) for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+    )
+    implemented_count = sum(
+        1 for category in implemented.values()
+        if isinstance(category, dict) and category != implemented['coverage']
+        for feature in category.values()
+        if feature.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-47 style features (Contract Interface Discovery)"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Compare SEP declaration features
+    for feature_name, feature_info in implemented_features.get('sep_declaration', {}).items():
+        comparison = FieldComparison(
+            section='SEP Declaration',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'sep_declaration'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare meta entry format features
+    for feature_name, feature_info in implemented_features.get('meta_entry_format', {}).items():
+        comparison = FieldComparison(
+            section='Meta Entry Format',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'meta_entry_format'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    # Compare implementation support features
+    for feature_name, feature_info in implemented_features.get('implementation_support', {}).items():
+        comparison = FieldComparison(
+            section='Implementation Support',
+            field_name=feature_name,
+            required=feature_info.get('required', False),
+            implemented=feature_info.get('implemented', False),
+            sdk_property=feature_info.get('sdk_method'),
+            description=feature_info.get('description', ''),
+            priority=comparator.determine_field_priority(
+                feature_name,
+                feature_info.get('required', False),
+                'implementation_support'
+            ) if not feature_info.get('implemented') else None
+        )
+        comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} Contract Interface Discovery features{Colors.END}")
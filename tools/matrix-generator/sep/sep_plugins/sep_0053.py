@@ -0,0 +1,224 @@
+"""
+SEP-53 (Sign and Verify Messages) plugin.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+from common import Colors, find_data, read_data
+from sep_model import FieldComparison
+from sep_plugins import load_catalogue
+
+if TYPE_CHECKING:
+    from sep_parser import SEPParser
+    from sep_analyzer import SEPAnalyzer
+    from generate_sep_comparison import SEPComparator
+
+
+def parse(parser: 'SEPParser') -> Dict[str, Any]:
+    """
+    Build the SEP-53 (Sign and Verify Messages) definition.
+
+    SEP-53 is a cryptographic specification with no HTTP endpoints, so the
+    capability set is enumerated in catalogues/sep_0053.json rather than
+    parsed from a fetched markdown document. Preamble, summary, and source URL
+    are set explicitly from the specification.
+
+    Returns:
+        Structured SEP-53 data with message signing capability fields
+    """
+    catalogue = load_catalogue('sep_0053')
+
+    data = {
+        'sep_number': parser.sep_number,
+        'preamble': {
+            'sep': '0053',
+            'title': 'Sign and Verify Messages',
+            'status': 'Final Comment Period (Final)',
+            'version': '0.0.1',
+        },
+        'summary': (
+            'A canonical method for signing and verifying arbitrary messages '
+            'using Stellar key pairs. Messages are prefixed with '
+            '"Stellar Signed Message:\\n", hashed with SHA-256, and signed '
+            'with the Ed25519 private key. Both binary and UTF-8 string '
+            'message variants are supported for signing and verification.'
+        ),
+        'sections': []
+    }
+
+    # Message signing and verification capability fields.
+    message_signing_fields = catalogue['message_signing_fields']
+
+    data['sections'].append({
+        'title': 'Message Signing',
+        'key': 'message_signing',
+        'content': 'Signing and verifying arbitrary messages with Stellar key pairs',
+        'message_signing_features': message_signing_fields,
+        'feature_count': len(message_signing_fields)
+    })
+
+    print(f"{Colors.GREEN}  ✓ Found {len(message_signing_fields)} message signing features{Colors.END}")
+    print(f"{Colors.GREEN}  ✓ Total: {len(message_signing_fields)} SEP-53 features{Colors.END}")
+
+    return data
+
+
+def analyze(analyzer: 'SEPAnalyzer') -> Dict[str, Any]:
+    """
+    Analyze SEP-53 (Sign and Verify Messages) implementation.
+
+    SEP-53 message signing is implemented on the KeyPair class in
+    lib/src/key_pair.dart. Detection is performed against the source of that
+    file rather than a SEP source directory.
+
+    Returns:
+        Analysis results dictionary
+    """
+    keypair_path = analyzer.sdk_path / 'lib' / 'src' / 'key_pair.dart'
+
+    if not keypair_path.exists():
+        return {
+            'implemented': False,
+            'reason': 'No SEP-53 implementation file found (lib/src/key_pair.dart)'
+        }
+
+    # Load SEP-53 definition
+    sep_def_path = analyzer.data_dir / f'sep_{analyzer.sep_number}_definition.json'
+
+    sep_definition = {}
+    if find_data(sep_def_path):
+        sep_definition = read_data(sep_def_path)
+
+    content = keypair_path.read_text(encoding='utf-8')
+
+    # Restrict reported classes to the SEP-53 entry point.
+    all_classes = [
+        cls for cls in analyzer.extract_class_info(keypair_path)
+        if cls['name'] == 'KeyPair'
+    ]
+    for cls in all_classes:
+        if cls['name'] == 'KeyPair':
+            cls['documentation'] = (
+                'Stellar key pair with SEP-53 message signing and verification '
+                'methods (signMessage, signMessageString, verifyMessage, '
+                'verifyMessageString)'
+            )
+
+    implemented_features = map_features(content, sep_definition)
+
+    return {
+        'implemented': True,
+        'files': [str(keypair_path.relative_to(analyzer.sdk_path))],
+        'classes': all_classes,
+        'implemented_features': implemented_features,
+        'total_classes': len(all_classes),
+        'total_methods': sum(len(c['methods']) for c in all_classes),
+        'total_properties': sum(len(c['properties']) for c in all_classes)
+    }
+
+
+def map_features(content: str,
+                 sep_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map the KeyPair source to SEP-53 message signing capability fields.
+
+    Args:
+        content: Source of lib/src/key_pair.dart
+        sep_definition: SEP-53 specification definition
+
+    Returns:
+        Dictionary mapping message signing features to implementation status
+    """
+    implemented = {
+        'message_signing': {},
+        'coverage': {}
+    }
+
+    def detect(name: str) -> Tuple[bool, str]:
+        if name == 'message_prefix':
+            if "Stellar Signed Message:\\n" in content and '_calculateMessageHash' in content:
+                return True, '_calculateMessageHash (prefix constant)'
+        elif name == 'sha256_hashing':
+            if 'Util.hash' in content and '_calculateMessageHash' in content:
+                return True, '_calculateMessageHash (SHA-256 hash)'
+        elif name == 'sign_message_binary':
+            if 'Uint8List signMessage(Uint8List message)' in content:
+                return True, 'signMessage(Uint8List)'
+        elif name == 'sign_message_string':
+            if 'Uint8List signMessageString(String message)' in content:
+                return True, 'signMessageString(String)'
+        elif name == 'verify_message_binary':
+            if 'bool verifyMessage(Uint8List message, Uint8List signature)' in content:
+                return True, 'verifyMessage(Uint8List, Uint8List)'
+        elif name == 'verify_message_string':
+            if 'bool verifyMessageString(String message' in content and 'signature' in content:
+                return True, 'verifyMessageString(String, Uint8List)'
+        elif name == 'ed25519_signature':
+            if 'Uint8List sign(Uint8List data)' in content and 'Ed25519' in content:
+                return True, 'sign (Ed25519 64-byte signature)'
+        elif name == 'utf8_encoding':
+            if 'utf8.encode' in content and 'signMessage' in content:
+                return True, 'signMessageString (UTF-8 encoding)'
+        return False, None
+
+    sections = sep_definition.get('sections', [])
+    for section in sections:
+        if section.get('key') != 'message_signing':
+            continue
+        for feature in section.get('message_signing_features', []):
+            feature_name = feature['name']
+            is_implemented, sdk_property = detect(feature_name)
+            implemented['message_signing'][feature_name] = {
+                'required': feature.get('required', False),
+                'implemented': is_implemented,
+                'sdk_method': sdk_property if is_implemented else None,
+                'description': feature.get('description', '')
+            }
+
+    total_features = len(implemented['message_signing'])
+    implemented_count = sum(
+        1 for feature in implemented['message_signing'].values()
+        if feature.get('implemented')
+    )
+
+    implemented['coverage'] = {
+        'total': total_features,
+        'implemented': implemented_count,
+        'percentage': round((implemented_count / total_features * 100) if total_features > 0 else 0, 2)
+    }
+
+    return implemented
+
+
+def compare(comparator: 'SEPComparator') -> None:
+    """Compare SEP-53 style features (Sign and Verify Messages)"""
+    implemented_features = comparator.sdk_data.get('implemented_features', {})
+
+    # Single capability section for message signing and verification.
+    section_titles = {
+        'message_signing': 'Message Signing',
+    }
+
+    for category_key, category_title in section_titles.items():
+        category_features = implemented_features.get(category_key, {})
+
+        for feature_name, feature_info in category_features.items():
+            comparison = FieldComparison(
+                section=category_title,
+                field_name=feature_name,
+                required=feature_info.get('required', False),
+                implemented=feature_info.get('implemented', False),
+                sdk_property=feature_info.get('sdk_method'),
+                description=feature_info.get('description', ''),
+                priority=comparator.determine_field_priority(
+                    feature_name,
+                    feature_info.get('required', False),
+                    category_key
+                ) if not feature_info.get('implemented') else None
+            )
+            comparator.comparisons.append(comparison)
+
+    print(f"{Colors.GREEN}✓ Compared {len(comparator.comparisons)} message signing features{Colors.END}")
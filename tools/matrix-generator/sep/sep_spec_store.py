@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Commit-pinned store for SEP specification markdown.
+
+A run reads every SEP from one stellar-protocol commit: master is resolved to
+a commit once, and each ecosystem/sep-XXXX.md is downloaded at that commit
+into a local cache under data/sep/specs/, addressed by its git blob SHA:
+
+    refs.json                  last commit master resolved to (for --offline)
+    trees/<commit>.json        sep-XXXX.md -> blob SHA at that commit
+    objects/<blob sha>.md      spec content
+
+A commit's file list never changes and a blob SHA names its content, so a
+later run downloads only the specs whose content changed since they were
+last cached. With --offline no request is made at all: the run uses the
+commit recorded in refs.json (or the one given with --spec-commit) and fails
+for a spec that is not cached.
+
+Author: Stellar Flutter SDK Team
+License: Apache-2.0
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from common import DATA_DIR, find_data, read_data, write_data, write_if_changed
+from github_fetcher import (
+    GitHubFetchError, SourceFileNotFoundError, fetch_file, git_blob_sha, list_directory, resolve_ref
+)
+
+SPEC_REPO = 'stellar/stellar-protocol'
+SPEC_REF = 'master'
+SPEC_DIR = 'ecosystem'
+SPEC_CACHE_DIR = DATA_DIR / 'sep' / 'specs'
+
+
+class SpecNotCachedError(GitHubFetchError):
+    """Raised in offline mode when what a run needs is not in the cache."""
+    pass
+
+
+class SEPSpecStore:
+    """SEP markdown at one stellar-protocol commit, through a local content cache"""
+
+    def __init__(self, cache_dir: Path = SPEC_CACHE_DIR, offline: bool = False,
+                 commit: Optional[str] = None):
+        """
+        Initialize the spec store.
+
+        Args:
+            cache_dir: Root of the content cache
+            offline: Never touch the network; read only what is cached
+            commit: stellar-protocol commit to read. None = resolve SPEC_REF
+                (or, offline, use the commit it last resolved to)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.offline = offline
+        self.commit = commit
+        # Network requests this store has made (0 for a fully cached run), and
+        # how many of them downloaded a spec
+        self.requests = 0
+        self.downloads = 0
+        self._blobs: Optional[Dict[str, str]] = None
+
+    def resolve_commit(self) -> str:
+        """
+        The commit this store reads, resolving SPEC_REF on first use.
+
+        Raises:
+            SpecNotCachedError: Offline, if SPEC_REF was never resolved
+            GitHubFetchError: If resolving fails
+        """
+        if self.commit is None:
+            refs_path = self.cache_dir / 'refs.json'
+            if self.offline:
+                refs = read_data(refs_path) if find_data(refs_path) else {}
+                if SPEC_REF not in refs:
+                    raise SpecNotCachedError(
+                        f"No {SPEC_REPO} commit cached yet; run once without --offline"
+                    )
+                self.commit = refs[SPEC_REF]
+            else:
+                self.requests += 1
+                self.commit = resolve_ref(SPEC_REPO, SPEC_REF)
+                write_data(refs_path, {SPEC_REF: self.commit}, fmt='pretty')
+        return self.commit
+
+    def _spec_blobs(self) -> Dict[str, str]:
+        """File name -> blob SHA for SPEC_DIR at the store's commit, cached per commit."""
+        if self._blobs is None:
+            commit = self.resolve_commit()
+            tree_path = self.cache_dir / 'trees' / f'{commit}.json'
+            if find_data(tree_path):
+                self._blobs = read_data(tree_path)
+            elif self.offline:
+                raise SpecNotCachedError(f"No cached file list for {SPEC_REPO}@{commit[:12]}")
+            else:
+                self.requests += 1
+                self._blobs = list_directory(SPEC_REPO, commit, SPEC_DIR)
+                write_data(tree_path, self._blobs, fmt='pretty')
+        return self._blobs
+
+    def spec_path(self, sep_number: str) -> str:
+        """Path of a SEP's markdown within the stellar-protocol repository."""
+        return f'{SPEC_DIR}/sep-{sep_number.zfill(4)}.md'
+
+    def source_url(self, sep_number: str) -> str:
+        """GitHub URL of a SEP's markdown at the store's commit."""
+        return f'https://github.com/{SPEC_REPO}/blob/{self.resolve_commit()}/{self.spec_path(sep_number)}'
+
+    def read(self, sep_number: str) -> str:
+        """
+        A SEP's markdown at the store's commit, from the cache when it holds it.
+
+        Args:
+            sep_number: SEP number (e.g., '0010')
+
+        Returns:
+            The markdown text
+
+        Raises:
+            SourceFileNotFoundError: If the SEP does not exist at the commit
+            SpecNotCachedError: Offline, if the spec is not cached
+            GitHubFetchError: If a request fails
+        """
+        path = self.spec_path(sep_number)
+        name = path.rsplit('/', 1)[1]
+        blob = self._spec_blobs().get(name)
+        if blob is None:
+            raise SourceFileNotFoundError(f"{path} not found in {SPEC_REPO}@{self.commit[:12]}")
+
+        object_path = self.cache_dir / 'objects' / f'{blob}.md'
+        if object_path.exists():
+            return object_path.read_bytes().decode('utf-8')
+        if self.offline:
+            raise SpecNotCachedError(f"{path} at {SPEC_REPO}@{self.commit[:12]} is not cached")
+
+        self.requests += 1
+        self.downloads += 1
+        content = fetch_file(SPEC_REPO, self.commit, path)
+        if git_blob_sha(content) != blob:
+            raise GitHubFetchError(f"Content of {path} does not match blob {blob[:12]}")
+        write_if_changed(object_path, content)
+        return content.decode('utf-8')
+
+
+def split_spec_flags(argv: List[str]) -> Tuple[bool, Optional[str], List[str]]:
+    """
+    Remove --offline and --spec-commit=SHA from an argument list.
+
+    For scripts that read sys.argv by position instead of using argparse.
+
+    Returns:
+        Tuple of (whether --offline was given, commit or None, remaining arguments)
+    """
+    offline = False
+    commit = None
+    rest = []
+    for arg in argv:
+        if arg == '--offline':
+            offline = True
+        elif arg.startswith('--spec-commit='):
+            commit = arg.split('=', 1)[1]
+        else:
+            rest.append(arg)
+    return offline, commit, rest
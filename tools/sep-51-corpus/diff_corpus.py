@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""Compares two SEP-0051 conformance corpus documents entry by entry.
+
+A textual diff of two corpus documents answers the question in bytes: one moved
+entry shifts every line after it, and a changed rendering shows up as a pair of
+long JSON strings with no indication of which field moved. This compares the
+documents as what they are instead. Entries are matched on (type, note), and the
+report names the entries added, removed and changed, the fields that changed on
+each, any metadata field that differs, and an order change where the same
+entries appear in a different sequence.
+
+Both documents are read incrementally, one entry at a time, but the comparison
+is not a stream: every left-hand entry is decoded into a dict keyed on
+(type, note) before the right-hand document is read, so memory grows with the
+left document. Right-hand entries are matched against that dict as they are
+decoded and not kept, and no normalised copy of either document is built.
+
+corpus.json is byte-deterministic, so two documents that agree structurally but
+not in bytes are still drift: the report says so rather than calling them equal.
+`--ignore-metadata` names metadata fields to leave out of the comparison, and
+`--structural` accepts a difference in bytes alone; the advisory refresh uses
+both to compare renderings rather than provenance.
+
+Usage:
+    python3 diff_corpus.py LEFT RIGHT [--ignore-metadata FIELD ...] [--structural]
+
+Exit codes:
+    0  the documents match
+    1  drift: the differences are printed
+    2  a document is missing or malformed
+"""
+
+import argparse
+import filecmp
+import json
+import sys
+
+# Large enough that an entry almost always decodes from a single read, small
+# enough that the reader never holds more than a fraction of a large document.
+CHUNK_SIZE = 64 * 1024
+
+# Entry fields in the order the generator writes them; a field outside this list
+# is still compared, after these.
+ENTRY_FIELDS = ("type", "dart_type", "xdr", "json", "oracle", "oracle_json", "reason",
+                "note")
+
+
+class PrerequisiteError(Exception):
+    """A document is absent or malformed."""
+
+
+class DocumentReader:
+    """Decodes a corpus document one top-level value at a time.
+
+    Understands only the shape the generator writes: an object whose members are
+    a `metadata` object and an `entries` array. Every other member is skipped
+    after decoding, so a future top-level section does not break the reader.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            self.handle = open(path, encoding="utf-8")
+        except FileNotFoundError:
+            raise PrerequisiteError("%s does not exist" % path)
+        self.buffer = ""
+        self.position = 0
+        self.exhausted = False
+
+    def close(self):
+        self.handle.close()
+
+    def _fill(self):
+        chunk = self.handle.read(CHUNK_SIZE)
+        if not chunk:
+            self.exhausted = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in " \t\r\n":
+                self.position += 1
+            if self.position < len(self.buffer) or not self._fill():
+                return
+
+    def _expect(self, character):
+        self._skip_whitespace()
+        if self.position >= len(self.buffer) or self.buffer[self.position] != character:
+            found = self.buffer[self.position:self.position + 20] or "end of file"
+            raise PrerequisiteError("%s is malformed: expected %r, found %r"
+                                    % (self.path, character, found))
+        self.position += 1
+
+    def _peek(self):
+        self._skip_whitespace()
+        if self.position >= len(self.buffer):
+            return ""
+        return self.buffer[self.position]
+
+    def _value(self):
+        """Decodes the next JSON value, reading further chunks until it is complete.
+
+        A decode that stops exactly at the end of the buffer is retried with more
+        input, because a number or literal cut by a chunk boundary decodes cleanly
+        to the wrong value.
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as error:
+                if self._fill():
+                    continue
+                raise PrerequisiteError("%s is not valid JSON: %s" % (self.path, error))
+            if end == len(self.buffer) and not self.exhausted and self._fill():
+                continue
+            self.position = end
+            return value
+
+    def sections(self):
+        """Yields ("metadata", dict) once, then ("entry", dict) for each entry in order."""
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise PrerequisiteError("%s is malformed: a member name is not a string"
+                                        % self.path)
+            self._expect(":")
+            if key == "entries":
+                self._expect("[")
+                if self._peek() == "]":
+                    self.position += 1
+                else:
+                    while True:
+                        yield "entry", self._value()
+                        if self._peek() == ",":
+                            self.position += 1
+                            continue
+                        self._expect("]")
+                        break
+            else:
+                value = self._value()
+                if key == "metadata":
+                    yield "metadata", value
+            if self._peek() == ",":
+                self.position += 1
+                continue
+            self._expect("}")
+            return
+
+
+def entry_key(entry, seen):
+    """The matching key of an entry: its type and note, with an ordinal for a repeat.
+
+    Two seeds may share a note when they pin the same rule on different values,
+    so the second occurrence of a (type, note) pair is told apart by its position
+    among its namesakes rather than colliding with the first.
+    """
+    if not isinstance(entry, dict) or "type" not in entry:
+        raise PrerequisiteError("an entry has no 'type': %r" % (entry,))
+    base = (entry["type"], entry.get("note") or "")
+    occurrence = seen.get(base, 0) + 1
+    seen[base] = occurrence
+    return base + (occurrence,)
+
+
+def describe(key):
+    type_name, note, occurrence = key
+    label = "%s: %s" % (type_name, note) if note else type_name
+    if occurrence > 1:
+        label += " (#%d)" % occurrence
+    return label
+
+
+def shown(value):
+    """A field value as the report prints it: text as-is, anything else as JSON.
+
+    Most entry fields hold JSON text already, and quoting it again would bury the
+    rendering under a second layer of escapes.
+    """
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def changed_fields(left, right):
+    fields = [field for field in ENTRY_FIELDS if field in left or field in right]
+    fields += sorted((set(left) | set(right)) - set(ENTRY_FIELDS))
+    return [(field, left.get(field), right.get(field)) for field in fields
+            if left.get(field) != right.get(field)]
+
+
+def compare(left_path, right_path, ignored_metadata=()):
+    """Returns the structural differences between two documents as report lines.
+
+    An empty list means the documents agree entry for entry and field for field.
+    """
+    left_reader = DocumentReader(left_path)
+    right_reader = DocumentReader(right_path)
+    try:
+        left_metadata = {}
+        left_entries = {}
+        left_order = []
+        seen = {}
+        for kind, value in left_reader.sections():
+            if kind == "metadata":
+                left_metadata = value
+                continue
+            key = entry_key(value, seen)
+            left_entries[key] = value
+            left_order.append(key)
+
+        right_metadata = {}
+        right_order = []
+        added = []
+        changed = []
+        seen = {}
+        for kind, value in right_reader.sections():
+            if kind == "metadata":
+                right_metadata = value
+                continue
+            key = entry_key(value, seen)
+            right_order.append(key)
+            previous = left_entries.pop(key, None)
+            if previous is None:
+                added.append(key)
+                continue
+            fields = changed_fields(previous, value)
+            if fields:
+                changed.append((key, fields))
+    finally:
+        left_reader.close()
+        right_reader.close()
+
+    lines = []
+    if not isinstance(left_metadata, dict) or not isinstance(right_metadata, dict):
+        raise PrerequisiteError("a document's metadata is not an object")
+    for field in sorted((set(left_metadata) | set(right_metadata)) - set(ignored_metadata)):
+        before, after = left_metadata.get(field), right_metadata.get(field)
+        if before != after:
+            lines.append("metadata %s: %s -> %s" % (
+                field, json.dumps(before, ensure_ascii=False),
+                json.dumps(after, ensure_ascii=False)))
+
+    removed = [key for key in left_order if key in left_entries]
+    for key in removed:
+        lines.append("- %s" % describe(key))
+    for key in added:
+        lines.append("+ %s" % describe(key))
+    for key, fields in changed:
+        lines.append("~ %s" % describe(key))
+        for field, before, after in fields:
+            lines.append("    %s:" % field)
+            lines.append("      - %s" % shown(before))
+            lines.append("      + %s" % shown(after))
+
+    # Order only means something among the entries both documents carry; an
+    # addition or removal is already reported above.
+    common = set(left_order) - set(removed)
+    if [key for key in left_order if key in common] != \
+            [key for key in right_order if key in common]:
+        lines.append("entry order differs")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("left", help="the committed corpus")
+    parser.add_argument("right", help="the freshly generated corpus")
+    parser.add_argument("--ignore-metadata", nargs="*", default=[], metavar="FIELD",
+                        help="metadata fields left out of the comparison")
+    parser.add_argument("--structural", action="store_true",
+                        help="treat documents that differ only in bytes as matching")
+    args = parser.parse_args()
+
+    try:
+        identical = filecmp.cmp(args.left, args.right, shallow=False)
+    except FileNotFoundError as error:
+        print("diff_corpus.py: %s does not exist" % error.filename, file=sys.stderr)
+        return 2
+    if identical:
+        return 0
+
+    try:
+        lines = compare(args.left, args.right, args.ignore_metadata)
+    except PrerequisiteError as error:
+        print("diff_corpus.py: %s" % error, file=sys.stderr)
+        return 2
+
+    if not lines and not args.structural:
+        lines.append("the documents agree entry for entry but differ in bytes; "
+                     "corpus.json is byte-deterministic, so this is still drift")
+    if not lines:
+        return 0
+    print("--- %s" % args.left)
+    print("+++ %s" % args.right)
+    for line in lines:
+        print(line)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
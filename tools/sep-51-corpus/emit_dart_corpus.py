@@ -9,8 +9,20 @@ This reads only committed artefacts. It never invokes the reference CLI, so it
 runs in a per-PR job that checks the committed corpus without building the
 reference.
 
+Two options keep a large corpus cheap to compile. `--max-entries-per-file`
+splits the entries across numbered part libraries next to the output, which then
+becomes an index that imports and concatenates them; no single const literal
+grows past the limit. `--compact` replaces the per-entry string literals with
+one packed string table and a list of offsets into it, interning every repeated
+string, and builds the entries from it once at load time. The default emission
+is neither, and is the one committed and checked in CI.
+
+`--corpus` also accepts the index of the extended corpus `expand_corpus.py`
+writes, whose entries are read from its shards in order.
+
 Usage:
     python3 emit_dart_corpus.py [--corpus PATH] [--output PATH]
+                                [--max-entries-per-file N] [--compact]
 
 Exit codes:
     0  the Dart source was written
@@ -18,6 +30,7 @@ Exit codes:
 """
 
 import argparse
+import glob
 import json
 import os
 import sys
@@ -112,6 +125,8 @@ def read_corpus(path):
             "python3 tools/sep-51-corpus/generate_corpus.py" % path)
     except json.JSONDecodeError as error:
         raise PrerequisiteError("%s is not valid JSON: %s" % (path, error))
+    if "shards" in document:
+        document = read_sharded(path, document)
     for key in ("metadata", "entries"):
         if key not in document:
             raise PrerequisiteError("%s has no '%s' section" % (path, key))
@@ -125,6 +140,24 @@ def read_corpus(path):
     return document
 
 
+def read_sharded(path, index):
+    """Joins an extended corpus index and its shards into one corpus document."""
+    directory = os.path.dirname(os.path.abspath(path))
+    entries = []
+    for shard in index["shards"]:
+        shard_path = os.path.join(directory, shard["file"])
+        try:
+            with open(shard_path) as handle:
+                entries.extend(json.load(handle)["entries"])
+        except FileNotFoundError:
+            raise PrerequisiteError("%s lists the shard %s, which does not exist"
+                                    % (path, shard_path))
+        except (json.JSONDecodeError, KeyError) as error:
+            raise PrerequisiteError("the shard %s is malformed: %s" % (shard_path, error))
+    metadata = {key: value for key, value in index.items() if key != "shards"}
+    return {"metadata": metadata, "entries": entries}
+
+
 LINE_LENGTH = 80
 
 
@@ -146,8 +179,7 @@ def named_argument(lines, indent, name, literal):
     lines.append("%s%s," % (" " * (indent + 4), literal))
 
 
-def render(document):
-    lines = HEADER.splitlines()
+def render_metadata(lines, document):
     lines.append("")
     lines.append("/// Provenance of the corpus: the reference build that produced it and")
     lines.append("/// the XDR revision this SDK generates from.")
@@ -156,11 +188,12 @@ def render(document):
         named_argument(lines, 2, dart_string(key),
                        dart_string(metadata_string(value)))
     lines.append("};")
-    lines.append("")
-    lines.append("/// The SEP-0051 conformance corpus, in the order the corpus document")
-    lines.append("/// records it.")
-    lines.append("const List<Sep51CorpusEntry> sep51Corpus = <Sep51CorpusEntry>[")
-    for entry in document["entries"]:
+
+
+def render_entries(lines, name, entries):
+    """Appends `const List<Sep51CorpusEntry> name = [...]`, one constructor per entry."""
+    lines.append("const List<Sep51CorpusEntry> %s = <Sep51CorpusEntry>[" % name)
+    for entry in entries:
         lines.append("  Sep51CorpusEntry(")
         for key, dart_name, optional in ENTRY_FIELDS:
             if optional and entry.get(key) is None:
@@ -168,16 +201,182 @@ def render(document):
             named_argument(lines, 4, dart_name, dart_string(entry[key]))
         lines.append("  ),")
     lines.append("];")
+
+
+def dart_length(value):
+    """The length of a string as Dart counts it, in UTF-16 code units."""
+    return len(value.encode("utf-16-le")) // 2
+
+
+# Each string literal line of the packed table holds at most this many source
+# characters, so the table is laid out the way `dart format` leaves it.
+TABLE_CHUNK = 64
+
+
+def render_compact(lines, name, entries):
+    """Appends `name` built from one packed string table instead of per-entry literals.
+
+    Every distinct string is stored once. Each entry is a row of offset/length
+    pairs into the table, one pair per constructor field, with -1 for an absent
+    optional field, and the list is materialised once when the library loads.
+    """
+    table, offsets, rows = [], {}, []
+    size = 0
+    for entry in entries:
+        row = []
+        for key, _, optional in ENTRY_FIELDS:
+            value = entry.get(key)
+            if optional and value is None:
+                row.extend((-1, 0))
+                continue
+            if value not in offsets:
+                offsets[value] = size
+                table.append(value)
+                size += dart_length(value)
+            row.extend((offsets[value], dart_length(value)))
+        rows.append(row)
+
+    packed = "".join(table)
+    private = "_" + name
+    lines.append("const String %sStrings =" % private)
+    chunks = [packed[start:start + TABLE_CHUNK]
+              for start in range(0, len(packed), TABLE_CHUNK)] or [""]
+    for position, chunk in enumerate(chunks):
+        ending = ";" if position == len(chunks) - 1 else ""
+        lines.append("    %s%s" % (dart_string(chunk), ending))
+    lines.append("")
+    lines.append("const List<int> %sOffsets = <int>[" % private)
+    for row in rows:
+        # Four pairs to a line keeps even six-digit offsets inside the page width.
+        for start in range(0, len(row), 8):
+            lines.append("  %s," % ", ".join(str(number) for number in row[start:start + 8]))
+    lines.append("];")
+    lines.append("")
+    lines.append("String? %sField(int row, int field) {" % private)
+    lines.append("  final int at = (row * %d + field) * 2;" % len(ENTRY_FIELDS))
+    lines.append("  final int start = %sOffsets[at];" % private)
+    lines.append("  if (start < 0) return null;")
+    lines.append("  final int end = start + %sOffsets[at + 1];" % private)
+    lines.append("  return %sStrings.substring(start, end);" % private)
+    lines.append("}")
+    lines.append("")
+    lines.append("final List<Sep51CorpusEntry> %s =" % name)
+    lines.append("    List<Sep51CorpusEntry>.unmodifiable(")
+    lines.append("      List<Sep51CorpusEntry>.generate(")
+    lines.append("        %d," % len(rows))
+    lines.append("        (int row) => Sep51CorpusEntry(")
+    for position, (_, dart_name, optional) in enumerate(ENTRY_FIELDS):
+        bang = "" if optional else "!"
+        lines.append("          %s: %sField(row, %d)%s,"
+                     % (dart_name, private, position, bang))
+    lines.append("        ),")
+    lines.append("      ),")
+    lines.append("    );")
+
+
+def render(document):
+    lines = HEADER.splitlines()
+    render_metadata(lines, document)
+    lines.append("")
+    lines.append("/// The SEP-0051 conformance corpus, in the order the corpus document")
+    lines.append("/// records it.")
+    render_entries(lines, "sep51Corpus", document["entries"])
     return "\n".join(lines) + "\n"
 
 
+def part_path(output, number):
+    """The part library `number` of a split emission, named after the index."""
+    stem, extension = os.path.splitext(output)
+    return "%s_part_%s%s" % (stem, number if isinstance(number, str) else
+                             "%03d" % number, extension)
+
+
+def existing_parts(output):
+    """Every part library of `output` on disk, whatever its number of digits."""
+    prefix, extension = os.path.splitext(part_path(output, ""))
+    parts = []
+    for path in glob.glob(glob.escape(prefix) + "[0-9]*" + glob.escape(extension)):
+        number = path[len(prefix):len(path) - len(extension)]
+        if number.isascii() and number.isdigit():
+            parts.append(path)
+    return parts
+
+
+def render_files(document, output, max_entries=None, compact=False):
+    """Returns (path, source) for every file of the emission, the index first.
+
+    Without a limit, or with a corpus that fits under it, this is the single file
+    `render` produces, or its compact form.
+    """
+    entries = document["entries"]
+    if max_entries is None or len(entries) <= max_entries:
+        if not compact:
+            return [(output, render(document))]
+        lines = HEADER.splitlines()
+        render_metadata(lines, document)
+        lines.append("")
+        lines.append("/// The SEP-0051 conformance corpus, in the order the corpus document")
+        lines.append("/// records it.")
+        render_compact(lines, "sep51Corpus", entries)
+        return [(output, "\n".join(lines) + "\n")]
+
+    parts = []
+    names = []
+    for number, start in enumerate(range(0, len(entries), max_entries)):
+        name = "sep51CorpusPart%03d" % number
+        path = part_path(output, number)
+        lines = [
+            "// AUTO-GENERATED - DO NOT EDIT",
+            "// Generated by tools/sep-51-corpus/emit_dart_corpus.py",
+            "",
+            "import '%s';" % os.path.basename(output),
+            "",
+            "/// Entries %d to %d of the SEP-0051 conformance corpus."
+            % (start, min(start + max_entries, len(entries)) - 1),
+        ]
+        chunk = entries[start:start + max_entries]
+        if compact:
+            render_compact(lines, name, chunk)
+        else:
+            render_entries(lines, name, chunk)
+        parts.append((path, "\n".join(lines) + "\n"))
+        names.append((os.path.basename(path), name))
+
+    lines = HEADER.splitlines()
+    header_end = 2
+    imports = [""] + ["import '%s';" % file_name for file_name, _ in names]
+    lines[header_end:header_end] = imports
+    render_metadata(lines, document)
+    lines.append("")
+    lines.append("/// The SEP-0051 conformance corpus, in the order the corpus document")
+    lines.append("/// records it, joined from %d part libraries." % len(names))
+    if compact:
+        lines.append("final List<Sep51CorpusEntry> sep51Corpus =")
+        lines.append("    List<Sep51CorpusEntry>.unmodifiable(<Sep51CorpusEntry>[")
+        indent = "      "
+    else:
+        lines.append("const List<Sep51CorpusEntry> sep51Corpus = <Sep51CorpusEntry>[")
+        indent = "  "
+    for _, name in names:
+        lines.append("%s...%s," % (indent, name))
+    lines.append("    ]);" if compact else "];")
+    return [(output, "\n".join(lines) + "\n")] + parts
+
+
 def main():
     parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     parser.add_argument("--corpus", default=DEFAULT_CORPUS,
                         help="the committed corpus (default: %(default)s)")
     parser.add_argument("--output", default=DEFAULT_OUTPUT,
                         help="where to write the Dart source (default: %(default)s)")
+    parser.add_argument("--max-entries-per-file", type=int, default=None, metavar="N",
+                        help="split the entries across part libraries of at most N "
+                             "entries, with the output as their index")
+    parser.add_argument("--compact", action="store_true",
+                        help="emit the entries as one packed string table with offsets")
     args = parser.parse_args()
+    if args.max_entries_per_file is not None and args.max_entries_per_file < 1:
+        parser.error("--max-entries-per-file must be at least 1")
 
     try:
         document = read_corpus(args.corpus)
@@ -185,14 +384,20 @@ def main():
         print("emit_dart_corpus.py: %s" % error, file=sys.stderr)
         return 2
 
-    source = render(document)
+    files = render_files(document, args.output, args.max_entries_per_file, args.compact)
     os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
-    with open(args.output, "w") as handle:
-        handle.write(source)
+    # A part a previous, finer split left behind would still compile and would
+    # still be imported by nothing, so it is removed rather than left to confuse.
+    for stale in existing_parts(args.output):
+        os.remove(stale)
+    for path, source in files:
+        with open(path, "w") as handle:
+            handle.write(source)
 
     print("Wrote %s" % args.output)
     print("  entries: %d" % len(document["entries"]))
-    print("  bytes:   %d" % len(source.encode("utf-8")))
+    print("  files:   %d" % len(files))
+    print("  bytes:   %d" % sum(len(source.encode("utf-8")) for _, source in files))
     return 0
 
 
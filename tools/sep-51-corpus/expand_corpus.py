@@ -0,0 +1,768 @@
+#!/usr/bin/env python3
+"""Expands the .x grammar into a large, sharded SEP-0051 corpus.
+
+`seeds.py` is written by hand and pins the renderings that need a human to
+choose them. This covers the rest mechanically, at a scale no one would write
+out: it parses the same `.x` sources `generate_corpus.py` reads its typedef list
+from and enumerates, for every type the SDK exposes, one value per choice the
+grammar offers it. That is every enum member, every union arm (the default arm
+included), both states of every optional field, and the bounds of every integer,
+array, opaque and string field.
+
+Values are built as XDR, not as JSON, because the binary form follows from the
+grammar alone while the JSON form depends on the naming rules the corpus exists
+to check. Each value is decoded by the pinned reference CLI and the decoded
+document is then run through `generate_corpus.build_entry`, which encodes it
+and decodes it again, so an entry only reaches the output once the reference
+has round-tripped it. A value the reference refuses is recorded as a finding
+and left out, which is the expected outcome for the inputs SEP-0051 and the
+reference disagree on, such as an empty signed payload.
+
+Two divergences are derived here exactly as the hand-authored corpus derives
+them. A standalone 64-bit integer the reference renders as a bare number is an
+`integer_string` entry. A value carrying fixed-length opaque data declared
+inline in a struct field or union arm is an `opaque_hex` entry, and the number
+of locations the transformation rewrites must equal the number of such fields
+the grammar walk emitted, so the value-addressed rewrite can never reach an
+integer array by accident. A value where the two counts differ is a finding.
+
+Output is byte-deterministic: types in name order, values in grammar order, a
+fixed shard size and the serialisation `generate_corpus.py` uses. It is written
+to `extended/` next to `corpus.json`, as an index and numbered shards. The
+reference is driven from a thread pool, and every answer goes through the same
+memo as `generate_corpus.py`, so a re-run after an XDR pin bump only invokes the
+CLI for values that changed.
+
+Usage:
+    python3 expand_corpus.py [--output-dir PATH] [--shard-size N] [--jobs N]
+
+Exit codes:
+    0  extended corpus written
+    1  the grammar could not be parsed or expanded
+    2  the reference CLI is missing or does not match the pin, or a committed
+       artefact this generator reads is absent or malformed
+"""
+
+import argparse
+import base64
+import concurrent.futures
+import glob
+import json
+import os
+import re
+import struct
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+import generate_corpus  # noqa: E402
+from generate_corpus import (  # noqa: E402
+    GenerationError, PrerequisiteError, XDR_DIR)
+
+DEFAULT_OUTPUT_DIR = os.path.join(SCRIPT_DIR, "extended")
+DEFAULT_SHARD_SIZE = 1000
+
+# Bounded fields are expanded to their maximum only up to these lengths. Beyond
+# them the maximum is a property of the length prefix alone, which the shorter
+# values already pin, and the entry would only add bulk.
+MAX_EXPANDED_ELEMENTS = 8
+MAX_EXPANDED_BYTES = 64
+
+INT_RANGES = {
+    "int": (">i", -2 ** 31, 2 ** 31 - 1),
+    "unsigned int": (">I", 0, 2 ** 32 - 1),
+    "hyper": (">q", -2 ** 63, 2 ** 63 - 1),
+    "unsigned hyper": (">Q", 0, 2 ** 64 - 1),
+}
+HYPER_TYPES = ("hyper", "unsigned hyper")
+
+
+# --- Grammar ------------------------------------------------------------------
+
+
+class Decl:
+    """One declaration: a field, a union arm, a typedef body or a discriminant.
+
+    ``kind`` is "void", "single", "optional", "fixed" or "var"; ``size`` is the
+    fixed length or the variable bound, None for an unbounded `<>`. ``type`` is a
+    primitive name, "opaque", "string" or the name of a definition.
+    """
+
+    def __init__(self, name, type_name, kind="single", size=None):
+        self.name = name
+        self.type = type_name
+        self.kind = kind
+        self.size = size
+
+
+class Enum:
+    def __init__(self, name, members):
+        self.name = name
+        self.members = members
+
+
+class Struct:
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+
+class Union:
+    def __init__(self, name, discriminant, arms, default):
+        self.name = name
+        self.discriminant = discriminant
+        self.arms = arms
+        self.default = default
+
+
+class Typedef:
+    def __init__(self, name, decl):
+        self.name = name
+        self.decl = decl
+
+
+TOKEN_RE = re.compile(
+    r"\s+|//[^\n]*|/\*.*?\*/|^%[^\n]*"
+    r"|(?P<number>-?0[xX][0-9a-fA-F]+|-?\d+)"
+    r"|(?P<word>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<punct>[{}()\[\]<>;:,=*])",
+    re.S | re.M,
+)
+
+
+def tokenize(text, path):
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = TOKEN_RE.match(text, position)
+        if match is None:
+            raise GenerationError("%s: unexpected character %r at offset %d"
+                                  % (path, text[position], position))
+        position = match.end()
+        if match.lastgroup == "number":
+            tokens.append(("number", int(match.group("number"), 0)))
+        elif match.lastgroup:
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+    return tokens
+
+
+class Grammar:
+    """Every definition and constant across the .x sources.
+
+    Inline struct and union bodies are lifted out as definitions of their own,
+    named the way the XDR generator names them: the enclosing type's name
+    followed by the field or arm name with its first letter capitalised, so
+    `AccountEntry.ext` becomes `AccountEntryExt`. An inline union lends its arms
+    its enclosing type's name rather than its own, so the `v1` arm of
+    `ContractCodeEntry.ext` is `ContractCodeEntryV1`, not `ContractCodeEntryExtV1`.
+    """
+
+    def __init__(self):
+        self.definitions = {}
+        self.constants = {}
+        self.tokens = []
+        self.index = 0
+        self.path = None
+
+    @classmethod
+    def load(cls, directory=XDR_DIR):
+        paths = sorted(glob.glob(os.path.join(directory, "*.x")))
+        if not paths:
+            raise PrerequisiteError(
+                "no .x sources under %s. Fetch them with: make xdr-generate" % directory)
+        grammar = cls()
+        for path in paths:
+            with open(path) as handle:
+                grammar.parse(handle.read(), path)
+        grammar._resolve()
+        return grammar
+
+    # Token cursor.
+
+    def _peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+
+    def _next(self):
+        token = self._peek()
+        if token[0] is None:
+            raise GenerationError("%s: unexpected end of input" % self.path)
+        self.index += 1
+        return token
+
+    def _expect(self, value):
+        kind, token = self._next()
+        if token != value:
+            raise GenerationError("%s: expected %r, found %r" % (self.path, value, token))
+
+    def _word(self):
+        kind, token = self._next()
+        if kind != "word":
+            raise GenerationError("%s: expected a name, found %r" % (self.path, token))
+        return token
+
+    def _value(self):
+        """A number, or the name of a constant left for `_resolve` to look up.
+
+        The sources are parsed in file-name order, which is not the order they
+        include each other in, so a constant can be used before it is declared.
+        """
+        kind, token = self._next()
+        if kind in ("number", "word"):
+            return token
+        raise GenerationError("%s: expected a value, found %r" % (self.path, token))
+
+    def _constant(self, value, seen=()):
+        if isinstance(value, int):
+            return value
+        if value in seen or value not in self.constants:
+            raise GenerationError("unknown constant %r" % value)
+        return self._constant(self.constants[value], seen + (value,))
+
+    def _resolve(self):
+        """Replaces every constant name left by `_value` with its number."""
+        for name in list(self.constants):
+            self.constants[name] = self._constant(name)
+        for definition in self.definitions.values():
+            decls = []
+            if isinstance(definition, Enum):
+                definition.members = [(member, self._constant(value))
+                                      for member, value in definition.members]
+            elif isinstance(definition, Typedef):
+                decls = [definition.decl]
+            elif isinstance(definition, Struct):
+                decls = definition.fields
+            else:
+                definition.arms = [([self._constant(case) for case in cases], arm)
+                                   for cases, arm in definition.arms]
+                decls = [arm for _, arm in definition.arms] + [definition.default]
+            for decl in decls:
+                if decl is not None and decl.size is not None:
+                    decl.size = self._constant(decl.size)
+
+    # Definitions.
+
+    def parse(self, text, path):
+        self.tokens = tokenize(text, path)
+        self.index = 0
+        self.path = path
+        while self._peek()[0] is not None:
+            self._definition()
+
+    def _definition(self):
+        keyword = self._word()
+        if keyword == "namespace":
+            self._word()
+            self._expect("{")
+            while self._peek()[1] != "}":
+                self._definition()
+            self._expect("}")
+            return
+        if keyword == "const":
+            name = self._word()
+            self._expect("=")
+            self.constants[name] = self._value()
+        elif keyword == "typedef":
+            decl = self._declaration(None)
+            self._define(Typedef(decl.name, decl))
+        elif keyword in ("enum", "struct", "union"):
+            name = self._word()
+            self._body(keyword, name)
+        else:
+            raise GenerationError("%s: unexpected %r at top level" % (self.path, keyword))
+        self._expect(";")
+
+    def _define(self, definition):
+        self.definitions[definition.name] = definition
+        return definition.name
+
+    def _body(self, keyword, name, prefix=None):
+        if keyword == "enum":
+            self._expect("{")
+            members = []
+            while True:
+                member = self._word()
+                self._expect("=")
+                value = self._value()
+                self.constants[member] = value
+                members.append((member, value))
+                if self._peek()[1] == ",":
+                    self._next()
+                    continue
+                break
+            self._expect("}")
+            return self._define(Enum(name, members))
+        if keyword == "struct":
+            self._expect("{")
+            fields = []
+            while self._peek()[1] != "}":
+                fields.append(self._declaration(name))
+                self._expect(";")
+            self._expect("}")
+            return self._define(Struct(name, fields))
+        prefix = prefix or name
+        self._expect("switch")
+        self._expect("(")
+        discriminant = self._declaration(prefix)
+        self._expect(")")
+        self._expect("{")
+        arms, default = [], None
+        while self._peek()[1] != "}":
+            if self._peek()[1] == "default":
+                self._next()
+                self._expect(":")
+                default = self._declaration(prefix)
+                self._expect(";")
+                continue
+            cases = []
+            while self._peek()[1] == "case":
+                self._next()
+                cases.append(self._value())
+                self._expect(":")
+            arms.append((cases, self._declaration(prefix)))
+            self._expect(";")
+        self._expect("}")
+        return self._define(Union(name, discriminant, arms, default))
+
+    def _type_spec(self):
+        """Returns the type name and, for an inline body, the keyword that opened it."""
+        word = self._word()
+        if word == "unsigned":
+            if self._peek()[1] in ("int", "hyper"):
+                return "unsigned " + self._next()[1], None
+            return "unsigned int", None
+        if word in ("enum", "struct", "union"):
+            return None, word
+        return word, None
+
+    def _declaration(self, parent):
+        if self._peek()[1] == "void":
+            self._next()
+            return Decl(None, None, "void")
+        type_name, inline = self._type_spec()
+        if inline is not None:
+            # The body precedes the field name, so it is parsed under a placeholder
+            # and renamed once the name is known.
+            start = self.index
+            depth = 0
+            while True:
+                token = self._next()[1]
+                if token == "{":
+                    depth += 1
+                elif token == "}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+            name = self._word()
+            lifted = parent + name[0].upper() + name[1:]
+            end = self.index
+            self.index = start
+            self._body(inline, lifted, parent)
+            self.index = end
+            type_name = lifted
+        pointer = False
+        if self._peek()[1] == "*":
+            self._next()
+            pointer = True
+        name = self._word() if inline is None else self.tokens[self.index - 1][1]
+        if pointer:
+            return Decl(name, type_name, "optional")
+        if self._peek()[1] == "[":
+            self._next()
+            size = self._value()
+            self._expect("]")
+            return Decl(name, type_name, "fixed", size)
+        if self._peek()[1] == "<":
+            self._next()
+            size = None if self._peek()[1] == ">" else self._value()
+            self._expect(">")
+            return Decl(name, type_name, "var", size)
+        return Decl(name, type_name)
+
+
+# --- Values -------------------------------------------------------------------
+
+
+class Value:
+    """An XDR encoding, and how many inline fixed-length opaque fields it carries.
+
+    The count is what the `opaque_hex` rewrite of the decoded document must match.
+    """
+
+    def __init__(self, data=b"", inline_opaque=0):
+        self.data = data
+        self.inline_opaque = inline_opaque
+
+    def __add__(self, other):
+        return Value(self.data + other.data, self.inline_opaque + other.inline_opaque)
+
+
+def pad(data):
+    return data + b"\0" * (-len(data) % 4)
+
+
+def uint32(value):
+    return Value(struct.pack(">I", value))
+
+
+def pattern(length, fill=None):
+    """Deterministic bytes: printable letters, so asset codes and strings stay legible."""
+    if fill is not None:
+        return bytes([fill]) * length
+    return bytes(ord("A") + index % 26 for index in range(length))
+
+
+class Expander:
+    """Enumerates the values the grammar offers each type.
+
+    A type's own choices are varied one at a time while every nested type takes
+    its base value, so the output grows with the size of the grammar rather than
+    with the product of its choices. Nested choices are covered by the nested
+    type's own entries.
+
+    A base value is the first enum member, the first union arm, an absent
+    optional, an empty array and one byte of opaque or string data. Those are
+    exactly the choices that cannot recurse, so the base of a recursive type such
+    as SCVal or ClaimPredicate is always finite.
+    """
+
+    def __init__(self, grammar, string_rendered):
+        self.grammar = grammar
+        self.string_rendered = string_rendered
+
+    def definition(self, name):
+        definition = self.grammar.definitions.get(name)
+        if definition is None:
+            raise GenerationError("the grammar does not define %s" % name)
+        return definition
+
+    def primitive(self, name):
+        """The primitive a type name bottoms out at, following typedefs, or None."""
+        while name not in INT_RANGES and name != "bool":
+            definition = self.grammar.definitions.get(name)
+            if not isinstance(definition, Typedef) or definition.decl.kind != "single":
+                return None
+            name = definition.decl.type
+        return name
+
+    # Base values.
+
+    def base(self, type_name, inside_string=False, depth=0):
+        if depth > 64:
+            raise GenerationError("the base value of %s does not terminate" % type_name)
+        if type_name in INT_RANGES:
+            return Value(struct.pack(INT_RANGES[type_name][0], 0))
+        if type_name == "bool":
+            return uint32(0)
+        definition = self.definition(type_name)
+        inside_string = inside_string or type_name in self.string_rendered
+        if isinstance(definition, Enum):
+            return Value(struct.pack(">i", definition.members[0][1]))
+        if isinstance(definition, Typedef):
+            return self.decl_base(definition.decl, inside_string, depth + 1, field=False)
+        if isinstance(definition, Struct):
+            value = Value()
+            for field in definition.fields:
+                value += self.decl_base(field, inside_string, depth + 1)
+            return value
+        if definition.arms:
+            cases, arm = definition.arms[0]
+            return (self.discriminant(definition, cases[0])
+                    + self.decl_base(arm, inside_string, depth + 1))
+        return (self.discriminant(definition, self.default_case(definition))
+                + self.decl_base(definition.default, inside_string, depth + 1))
+
+    def decl_base(self, decl, inside_string, depth, field=True):
+        if decl.kind == "void":
+            return Value()
+        if decl.kind == "optional":
+            return uint32(0)
+        if decl.type in ("opaque", "string"):
+            length = decl.size if decl.kind == "fixed" else 1
+            return self.bytes_value(decl, pattern(length), inside_string, field)
+        if decl.kind == "fixed":
+            value = Value()
+            for _ in range(decl.size):
+                value += self.base(decl.type, inside_string, depth)
+            return value
+        if decl.kind == "var":
+            return uint32(0)
+        return self.base(decl.type, inside_string, depth)
+
+    def bytes_value(self, decl, data, inside_string, field):
+        if decl.kind == "fixed":
+            # Only an inline declaration renders as a byte array in the reference;
+            # a named typedef, and anything inside a strkey-rendered type, does not.
+            inline = field and decl.type == "opaque" and not inside_string
+            return Value(pad(data), 1 if inline else 0)
+        return uint32(len(data)) + Value(pad(data))
+
+    def discriminant(self, union, case):
+        return Value(struct.pack(">i" if self.signed(union.discriminant.type) else ">I", case))
+
+    def signed(self, type_name):
+        primitive = self.primitive(type_name)
+        return primitive != "unsigned int"
+
+    def default_case(self, union):
+        """A discriminant no explicit arm claims, for the default arm."""
+        taken = {case for cases, _ in union.arms for case in cases}
+        definition = self.grammar.definitions.get(union.discriminant.type)
+        if isinstance(definition, Enum):
+            for _, value in definition.members:
+                if value not in taken:
+                    return value
+            return None
+        return max(taken, default=-1) + 1
+
+    # Variants.
+
+    def decl_variants(self, decl, inside_string, field=True):
+        """(label, value) for every bound of one declaration, its base first."""
+        base = self.decl_base(decl, inside_string, 0, field)
+        if decl.kind == "void":
+            return [("void", base)]
+        if decl.kind == "optional":
+            return [("absent", base),
+                    ("present", uint32(1) + self.base(decl.type, inside_string))]
+        if decl.type in ("opaque", "string"):
+            if decl.kind == "fixed":
+                return [("pattern", base),
+                        ("zero", self.bytes_value(decl, pattern(decl.size, 0), inside_string,
+                                                  field)),
+                        ("all ones", self.bytes_value(decl, pattern(decl.size, 0xFF),
+                                                      inside_string, field))]
+            variants = [("one byte", base),
+                        ("empty", self.bytes_value(decl, b"", inside_string, field))]
+            if decl.size is not None and 1 < decl.size <= MAX_EXPANDED_BYTES:
+                variants.append(("maximum length %d" % decl.size,
+                                 self.bytes_value(decl, pattern(decl.size), inside_string,
+                                                  field)))
+            return variants
+        if decl.kind == "fixed":
+            return [("base", base)]
+        if decl.kind == "var":
+            element = self.base(decl.type, inside_string)
+            variants = [("empty", base), ("one element", uint32(1) + element)]
+            if decl.size is not None and 1 < decl.size <= MAX_EXPANDED_ELEMENTS:
+                value = uint32(decl.size)
+                for _ in range(decl.size):
+                    value += element
+                variants.append(("maximum length %d" % decl.size, value))
+            return variants
+        primitive = self.primitive(decl.type)
+        if primitive == "bool":
+            return [("false", base), ("true", uint32(1))]
+        if primitive is not None:
+            layout, low, high = INT_RANGES[primitive]
+            variants = [("zero", base)]
+            if low:
+                variants.append(("minimum", Value(struct.pack(layout, low))))
+            variants.append(("maximum", Value(struct.pack(layout, high))))
+            return variants
+        return [("base", base)]
+
+    def variants(self, type_name):
+        """(note, value) for every choice the type itself offers, in grammar order."""
+        definition = self.definition(type_name)
+        inside_string = type_name in self.string_rendered
+        if isinstance(definition, Enum):
+            return [("member %s" % member, Value(struct.pack(">i", value)))
+                    for member, value in definition.members]
+        if isinstance(definition, Typedef):
+            return [("%s" % label, value) for label, value
+                    in self.decl_variants(definition.decl, inside_string, field=False)]
+        if isinstance(definition, Struct):
+            bases = [self.decl_base(field, inside_string, 0) for field in definition.fields]
+            out = [("base value", sum(bases, Value()))]
+            for position, field in enumerate(definition.fields):
+                for label, value in self.decl_variants(field, inside_string)[1:]:
+                    parts = bases[:position] + [value] + bases[position + 1:]
+                    out.append(("field %s: %s" % (field.name, label), sum(parts, Value())))
+            return out
+        out = []
+        members = {}
+        discriminant_type = self.grammar.definitions.get(definition.discriminant.type)
+        if isinstance(discriminant_type, Enum):
+            members = {value: member for member, value in reversed(discriminant_type.members)}
+        arms = [(cases, arm) for cases, arm in definition.arms]
+        if definition.default is not None:
+            default = self.default_case(definition)
+            if default is not None:
+                arms.append(([default], definition.default))
+        for cases, arm in arms:
+            for case in cases:
+                label = "arm %s" % members.get(case, case)
+                if arm is definition.default:
+                    label += " (default)"
+                for variant, value in self.decl_variants(arm, inside_string):
+                    note = label if variant in ("void", "base") else "%s, %s" % (label, variant)
+                    out.append((note, self.discriminant(definition, case) + value))
+        return out
+
+
+# --- Corpus -------------------------------------------------------------------
+
+
+def expand_seeds(grammar, expander, index, available, classes):
+    """One seed per (type, choice), for every type the SDK and the reference both expose.
+
+    A seed here carries base64 XDR rather than JSON; `entry_for` decodes it.
+    """
+    spellings = {name.lower(): name for name in available}
+    seeds = []
+    for xdr_name in sorted(grammar.definitions):
+        resolved = index.get(xdr_name.lower())
+        oracle = spellings.get(xdr_name.lower())
+        if resolved is None or oracle is None or resolved[1] not in classes:
+            continue
+        primitive = expander.primitive(xdr_name)
+        for note, value in expander.variants(xdr_name):
+            seeds.append({
+                "type": oracle,
+                "dart_type": resolved[1],
+                "xdr": base64.b64encode(value.data).decode("ascii"),
+                "inline_opaque": value.inline_opaque,
+                "hyper": primitive in HYPER_TYPES,
+                "note": "Grammar expansion: %s." % note,
+            })
+    return seeds
+
+
+def entry_for(cli, seed):
+    """Decodes one expanded seed and builds its entry, or returns (None, finding)."""
+    try:
+        oracle_text = generate_corpus.decode(cli, seed["type"], seed["xdr"])
+    except GenerationError as error:
+        return None, "%s (%s): %s" % (seed["type"], seed["note"], error)
+    document = json.loads(oracle_text)
+    authored = {"type": seed["type"], "dart_type": seed["dart_type"], "json": document,
+                "note": seed["note"]}
+
+    if seed["hyper"] and isinstance(document, int) and not isinstance(document, bool):
+        authored.update(oracle="incomparable", spec_form="integer_string",
+                        spec_form_paths=[""])
+    elif seed["inline_opaque"]:
+        _, rewritten = generate_corpus.opaque_hex(document)
+        if len(rewritten) != seed["inline_opaque"]:
+            return None, (
+                "%s (%s): the grammar emitted %d inline fixed-length opaque field(s) but "
+                "opaque_hex would rewrite %s" % (seed["type"], seed["note"],
+                                                 seed["inline_opaque"], sorted(rewritten)))
+        authored.update(oracle="incomparable", spec_form="opaque_hex",
+                        spec_form_paths=sorted(rewritten))
+
+    findings = []
+    try:
+        entry = generate_corpus.build_entry(cli, authored, findings)
+    except GenerationError as error:
+        return None, "%s (%s): %s" % (seed["type"], seed["note"], error)
+    if entry is None:
+        return None, findings[0]
+    if entry["xdr"] != seed["xdr"]:
+        return None, ("%s (%s): the reference decodes %s but re-encodes it as %s"
+                      % (seed["type"], seed["note"], seed["xdr"], entry["xdr"]))
+    if findings:
+        return None, findings[0]
+    return entry, None
+
+
+def write_shards(output_dir, metadata, entries, shard_size):
+    """Writes the index and shards, replacing any shard a previous run left behind."""
+    os.makedirs(output_dir, exist_ok=True)
+    for stale in glob.glob(os.path.join(output_dir, "shard-*.json")):
+        os.remove(stale)
+    shards = []
+    for number, start in enumerate(range(0, len(entries), shard_size)):
+        name = "shard-%04d.json" % number
+        chunk = entries[start:start + shard_size]
+        with open(os.path.join(output_dir, name), "w") as handle:
+            json.dump({"entries": chunk}, handle, ensure_ascii=False, indent=2,
+                      sort_keys=False)
+            handle.write("\n")
+        shards.append({"file": name, "entry_count": len(chunk)})
+    index = dict(metadata)
+    index["shards"] = shards
+    with open(os.path.join(output_dir, "index.json"), "w") as handle:
+        json.dump(index, handle, ensure_ascii=False, indent=2, sort_keys=False)
+        handle.write("\n")
+    return index
+
+
+def expand(output_dir, shard_size=DEFAULT_SHARD_SIZE, jobs=None,
+           cache_dir=generate_corpus.DEFAULT_CACHE_DIR):
+    (pin, cli, version, commit, sdk_xdr_commit,
+     name_map, index, classes) = generate_corpus.check_prerequisites()
+    generate_corpus.CACHE = (
+        generate_corpus.ReferenceCache(cache_dir, pin["tool"], version, commit)
+        if cache_dir is not None else None)
+    try:
+        verification = generate_corpus.read_verification(name_map)
+        string_rendered = set(verification.get("union_types_string_rendered", [])) | \
+            set(verification.get("struct_types_string_rendered", []))
+        grammar = Grammar.load()
+        expander = Expander(grammar, string_rendered)
+        seeds = expand_seeds(grammar, expander, index,
+                             generate_corpus.known_types(cli), classes)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            results = list(pool.map(lambda seed: entry_for(cli, seed), seeds))
+    finally:
+        if generate_corpus.CACHE is not None:
+            generate_corpus.CACHE.save()
+
+    entries = [entry for entry, _ in results if entry is not None]
+    findings = [finding for _, finding in results if finding is not None]
+    metadata = {
+        "description": (
+            "SEP-0051 (XDR-JSON) extended corpus, expanded from the .x grammar: one "
+            "value per enum member, union arm, optional state and bound of every type "
+            "the SDK exposes, each round-tripped through the reference."
+        ),
+        "reference_tool": pin["tool"],
+        "reference_version": version,
+        "reference_xdr_commit": commit,
+        "sdk_xdr_commit": sdk_xdr_commit,
+        "seed_count": len(seeds),
+        "entry_count": len(entries),
+        "omitted_count": len(findings),
+        "omitted": findings,
+    }
+    return write_shards(output_dir, metadata, entries, shard_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR,
+                        help="where to write the index and shards (default: %(default)s)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="entries per shard (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="reference CLI processes run at once (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="run the reference CLI for every value, reading and "
+                             "writing no memo.")
+    args = parser.parse_args()
+    if args.shard_size < 1:
+        parser.error("--shard-size must be at least 1")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    try:
+        index = expand(args.output_dir, shard_size=args.shard_size, jobs=args.jobs,
+                       cache_dir=None if args.no_cache else
+                       generate_corpus.DEFAULT_CACHE_DIR)
+    except PrerequisiteError as error:
+        print("expand_corpus.py: %s" % error, file=sys.stderr)
+        return 2
+    except GenerationError as error:
+        print("expand_corpus.py: %s" % error, file=sys.stderr)
+        return 1
+
+    print("Wrote %s" % args.output_dir)
+    print("  seeds:   %d" % index["seed_count"])
+    print("  entries: %d in %d shard(s)" % (index["entry_count"], len(index["shards"])))
+    print("  omitted: %d (listed in index.json)" % index["omitted_count"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
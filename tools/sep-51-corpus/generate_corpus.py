@@ -13,8 +13,13 @@ Output is byte-deterministic: fixed entry order, fixed key order and one
 serialisation configuration. It carries no timestamp, so a re-run on an
 unchanged input produces an unchanged file and any diff is real drift.
 
+Every reference invocation is memoised on disk under `.tmp/reference-cache/`,
+keyed on the version and xdr commit the build reports. A re-run only starts the
+CLI for seeds that are new or edited, and a different build never reads another
+build's answers.
+
 Usage:
-    python3 generate_corpus.py [--output PATH]
+    python3 generate_corpus.py [--output PATH] [--no-cache]
     python3 generate_corpus.py --check-prerequisites
     python3 generate_corpus.py --advisory --output PATH
 
@@ -26,12 +31,17 @@ Exit codes:
 """
 
 import argparse
+import concurrent.futures
+import hashlib
+import importlib.util
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
@@ -46,10 +56,22 @@ MAKEFILE = os.path.join(REPO_ROOT, "Makefile")
 XDR_DIR = os.path.join(REPO_ROOT, "xdr")
 LIB_XDR_DIR = os.path.join(REPO_ROOT, "lib", "src", "xdr")
 DEFAULT_OUTPUT = os.path.join(SCRIPT_DIR, "corpus.json")
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, ".tmp", "reference-cache")
+DEFAULT_ARTEFACT_INDEX = os.path.join(SCRIPT_DIR, ".tmp", "artefact-index.json")
+PROFILES_DIR = os.path.join(SCRIPT_DIR, ".tmp", "profiles")
 
 sys.path.insert(0, SCRIPT_DIR)
 from seeds import SEEDS  # noqa: E402
 
+# The shared --profile support lives with the matrix generator's scripts. It is
+# loaded from its file instead of through sys.path, so nothing in that
+# directory can shadow a module of this tool or of the standard library.
+_spec = importlib.util.spec_from_file_location(
+    "matrix_generator_profiling", os.path.join(REPO_ROOT, "tools", "matrix-generator", "profiling.py"))
+_profiling = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_profiling)
+add_profile_argument, profiled = _profiling.add_profile_argument, _profiling.profiled
+
 # One serialisation configuration for every string written into the corpus.
 DUMP = dict(ensure_ascii=False, separators=(",", ":"))
 
@@ -111,31 +133,115 @@ def verify_pin(cli, pin):
         )
 
 
+class ReferenceCache:
+    """An on-disk memo of reference CLI invocations.
+
+    `encode`, `decode` and `types list` are pure functions of the build that
+    answers them and of their input, so a result is stored under the hash of the
+    arguments and the input text, in a file named for the tool, version and xdr
+    commit the build reports. A different build reads a different file, so a pin
+    bump invalidates every stored answer without anything having to delete them.
+
+    Failures are stored as well as successes: the divergence probes expect the
+    reference to refuse, and its refusal is as much a function of the input as
+    an encoding is.
+
+    expand_corpus.py calls the reference from a pool of threads, so lookups,
+    stores and the save go through one lock.
+    """
+
+    def __init__(self, directory, tool, version, commit):
+        self.path = os.path.join(directory, "%s-%s-%s.json" % (tool, version, commit))
+        self.reference = {"tool": tool, "version": version, "xdr_commit": commit}
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        try:
+            with open(self.path) as handle:
+                stored = json.load(handle)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        # The file name already carries the build; the recorded block guards against a
+        # file copied or renamed by hand.
+        if stored.get("reference") == self.reference:
+            self.results = stored.get("results", {})
+
+    @staticmethod
+    def key(args, text):
+        material = json.dumps([args, text], **DUMP)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, args, text):
+        key = self.key(args, text)
+        with self.lock:
+            result = self.results.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return result
+
+    def put(self, args, text, returncode, stdout, stderr):
+        key = self.key(args, text)
+        with self.lock:
+            self.results[key] = [returncode, stdout, stderr]
+
+    def save(self):
+        """Writes the memo atomically, so an interrupted run never leaves a torn file."""
+        if self.misses == 0:
+            return
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, scratch = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with self.lock, os.fdopen(descriptor, "w") as handle:
+            json.dump({"reference": self.reference, "results": self.results}, handle,
+                      ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        os.replace(scratch, self.path)
+
+
+# The memo for the current run, or None when the CLI is to be run every time.
+# Installed by generate() once the build has been identified.
+CACHE = None
+
+
+def run_reference(cli, args, text=None):
+    """Runs the reference CLI, returning (returncode, stdout, stderr).
+
+    Consults CACHE first. Only the executable is left out of the key: which build
+    it is has already been folded into the file the memo is read from.
+    """
+    if CACHE is not None:
+        cached = CACHE.get(args, text)
+        if cached is not None:
+            return tuple(cached)
+    result = subprocess.run([cli] + args, input=text, capture_output=True, text=True)
+    if CACHE is not None:
+        CACHE.put(args, text, result.returncode, result.stdout, result.stderr)
+    return result.returncode, result.stdout, result.stderr
+
+
 def encode(cli, type_name, document):
-    result = subprocess.run(
-        [cli, "encode", "--type", type_name],
-        input=json.dumps(document, **DUMP), capture_output=True, text=True,
-    )
-    if result.returncode != 0:
+    returncode, stdout, stderr = run_reference(
+        cli, ["encode", "--type", type_name], json.dumps(document, **DUMP))
+    if returncode != 0:
         raise GenerationError(
             "the reference CLI rejected the authored JSON for %s: %s"
-            % (type_name, result.stderr.strip())
+            % (type_name, stderr.strip())
         )
-    return result.stdout.strip()
+    return stdout.strip()
 
 
 def decode(cli, type_name, base64_text):
-    result = subprocess.run(
-        [cli, "decode", "--type", type_name, "--input", "single-base64",
-         "--output", "json"],
-        input=base64_text, capture_output=True, text=True,
-    )
-    if result.returncode != 0:
+    returncode, stdout, stderr = run_reference(
+        cli, ["decode", "--type", type_name, "--input", "single-base64",
+              "--output", "json"], base64_text)
+    if returncode != 0:
         raise GenerationError(
             "the reference CLI could not decode its own encoding of %s: %s"
-            % (type_name, result.stderr.strip())
+            % (type_name, stderr.strip())
         )
-    return result.stdout.strip()
+    return stdout.strip()
 
 
 def try_encode(cli, type_name, text):
@@ -144,13 +250,10 @@ def try_encode(cli, type_name, text):
     Used for the probes that expect the reference to refuse, where a raised
     GenerationError would be the wrong shape.
     """
-    result = subprocess.run(
-        [cli, "encode", "--type", type_name],
-        input=text, capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        return False, result.stderr.strip()
-    return True, result.stdout.strip()
+    returncode, stdout, stderr = run_reference(cli, ["encode", "--type", type_name], text)
+    if returncode != 0:
+        return False, stderr.strip()
+    return True, stdout.strip()
 
 
 def without_position(text):
@@ -165,10 +268,10 @@ def without_position(text):
 
 
 def known_types(cli):
-    result = subprocess.run([cli, "types", "list"], capture_output=True, text=True)
-    if result.returncode != 0:
+    returncode, stdout, _ = run_reference(cli, ["types", "list"])
+    if returncode != 0:
         raise PrerequisiteError("'%s types list' failed" % cli)
-    return set(result.stdout.split())
+    return set(stdout.split())
 
 
 # --- Committed artefacts ------------------------------------------------------
@@ -236,24 +339,107 @@ def read_verification(name_map):
     return verification
 
 
+class ArtefactIndex:
+    """Per-file scan results over the committed artefacts, persisted between runs.
+
+    The typedef list, the Dart class set and the generator's override maps are
+    each a union of independent per-file results, so each file's result is kept
+    under the file's content hash. A file whose size and modification time are
+    unchanged is not read at all; one whose stamp moved is hashed, and only
+    rescanned when its content actually changed. Bumping VERSION discards every
+    stored result, for when a scanner itself changes.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.dirty = False
+        try:
+            with open(path) as handle:
+                stored = json.load(handle)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if stored.get("version") == self.VERSION:
+            self.files = stored.get("files", {})
+
+    def scan(self, path, scanner, *args):
+        """Returns ``scanner(text, *args)`` for the file at ``path``, reusing a stored result."""
+        key = "%s:%s:%s" % (scanner.__name__, ":".join(args),
+                            os.path.relpath(path, REPO_ROOT))
+        status = os.stat(path)
+        stamp = [status.st_size, status.st_mtime_ns]
+        stored = self.files.get(key)
+        if stored is not None and stored["stamp"] == stamp:
+            return stored["result"]
+        with open(path, "rb") as handle:
+            data = handle.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if stored is not None and stored["sha256"] == digest:
+            result = stored["result"]
+        else:
+            result = scanner(data.decode("utf-8"), *args)
+        self.files[key] = {"stamp": stamp, "sha256": digest, "result": result}
+        self.dirty = True
+        return result
+
+    def save(self):
+        if not self.dirty:
+            return
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, scratch = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(descriptor, "w") as handle:
+            json.dump({"version": self.VERSION, "files": self.files}, handle,
+                      sort_keys=True, separators=(",", ":"))
+        os.replace(scratch, self.path)
+        self.dirty = False
+
+
+# The artefact index for the current run, or None to scan every file afresh.
+# Installed by check_prerequisites().
+ARTEFACTS = None
+
+
+def scan_artefact(path, scanner, *args):
+    if ARTEFACTS is not None:
+        return ARTEFACTS.scan(path, scanner, *args)
+    with open(path) as handle:
+        return scanner(handle.read(), *args)
+
+
+def _constant_map_in(source, constant):
+    """The `NAME => "value"` pairs of one Ruby constant, or None when it is not defined."""
+    marker = constant + " = {"
+    if marker not in source:
+        return None
+    body = source.split(marker, 1)[1].split("}.freeze", 1)[0]
+    return dict(re.findall(r'"([^"]+)"\s*=>\s*"([^"]+)"', body))
+
+
 def ruby_constant_map(path, constant):
     """Reads a `NAME => "value"` Ruby hash literal out of a generator override file."""
     try:
-        source = open(path).read()
+        mapping = scan_artefact(path, _constant_map_in, constant)
     except FileNotFoundError:
         raise PrerequisiteError("the generator override file %s is missing" % path)
-    marker = constant + " = {"
-    if marker not in source:
+    if mapping is None:
         raise PrerequisiteError("%s does not define %s" % (path, constant))
-    body = source.split(marker, 1)[1].split("}.freeze", 1)[0]
-    mapping = {}
-    for match in re.finditer(r'"([^"]+)"\s*=>\s*"([^"]+)"', body):
-        mapping[match.group(1)] = match.group(2)
     if not mapping:
         raise PrerequisiteError("%s in %s parsed as empty" % (constant, path))
     return mapping
 
 
+TYPEDEF_RE = re.compile(
+    r"\s*typedef\s+.*?([A-Za-z_][A-Za-z0-9_]*)\s*(\[[^\]]*\]|<[^>]*>)?\s*;")
+
+
+def _typedefs_in(source):
+    return [match.group(1) for match in map(TYPEDEF_RE.match, source.splitlines())
+            if match]
+
+
 def xdr_typedef_identifiers():
     """Every typedef identifier declared across the .x sources."""
     try:
@@ -266,34 +452,32 @@ def xdr_typedef_identifiers():
         raise PrerequisiteError("no .x sources under %s" % XDR_DIR)
     identifiers = []
     for name in names:
-        with open(os.path.join(XDR_DIR, name)) as handle:
-            for line in handle:
-                match = re.match(
-                    r"\s*typedef\s+.*?([A-Za-z_][A-Za-z0-9_]*)\s*"
-                    r"(\[[^\]]*\]|<[^>]*>)?\s*;", line)
-                if match:
-                    identifiers.append(match.group(1))
+        identifiers.extend(scan_artefact(os.path.join(XDR_DIR, name), _typedefs_in))
     return identifiers
 
 
+def _json_classes_in(source):
+    if "fromXdrJsonValue" not in source:
+        return []
+    return re.findall(r"^class ([A-Za-z0-9_]+)", source, re.M)
+
+
 def dart_json_classes():
     """Every class under lib/src/xdr that carries the SEP-0051 value reader.
 
     A seed naming a Dart type absent from this set names something the corpus
-    cannot be driven through, whatever the name maps say.
+    cannot be driven through, whatever the name maps say. The files are read on
+    a thread pool; with a warm artefact index only the changed ones are read at
+    all.
     """
     try:
         files = sorted(f for f in os.listdir(LIB_XDR_DIR) if f.endswith(".dart"))
     except FileNotFoundError:
         raise PrerequisiteError("the generated XDR sources are not at %s" % LIB_XDR_DIR)
-    classes = set()
-    for name in files:
-        with open(os.path.join(LIB_XDR_DIR, name)) as handle:
-            text = handle.read()
-        if "fromXdrJsonValue" not in text:
-            continue
-        for match in re.finditer(r"^class ([A-Za-z0-9_]+)", text, re.M):
-            classes.add(match.group(1))
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        found = pool.map(lambda name: scan_artefact(os.path.join(LIB_XDR_DIR, name),
+                                                    _json_classes_in), files)
+        classes = {name for names in found for name in names}
     if not classes:
         raise PrerequisiteError(
             "no class under %s declares fromXdrJsonValue; generate the SDK first "
@@ -678,12 +862,26 @@ def assert_type_alias(cli, probe_type):
 # --- Corpus -------------------------------------------------------------------
 
 
-def check_prerequisites(advisory=False):
+def check_prerequisites(advisory=False, index_path=DEFAULT_ARTEFACT_INDEX,
+                        persist=True):
     """Verifies the reference build and every committed artefact this generator reads.
 
     Runs before anything is written, so a missing CLI can never be mistaken for a
-    clean diff and can never leave a half-written artefact.
+    clean diff and can never leave a half-written artefact. The only file it may
+    write is the artefact index at ``index_path``, a scratch cache of per-file
+    scan results; None scans every artefact afresh and writes nothing. With
+    ``persist`` false an existing index is still read but never written back.
     """
+    global ARTEFACTS
+    ARTEFACTS = ArtefactIndex(index_path) if index_path is not None else None
+    try:
+        return verify_artefacts(advisory)
+    finally:
+        if ARTEFACTS is not None and persist:
+            ARTEFACTS.save()
+
+
+def verify_artefacts(advisory):
     pin = read_pin()
     cli = resolve_cli(pin)
     if advisory:
@@ -710,23 +908,48 @@ def check_prerequisites(advisory=False):
     return pin, cli, version, commit, sdk_xdr_commit, name_map, index, classes
 
 
-def generate(output_path, advisory=False):
+def generate(output_path, advisory=False, cache_dir=DEFAULT_CACHE_DIR):
     """Builds the corpus.
 
     Normally the reference build must match the pin exactly. An advisory run instead
     accepts whatever build is on PATH and records its version in the metadata, so a newer
     release can be compared against the committed corpus without disturbing it. It never
     writes to the committed file; the caller supplies a scratch path.
+
+    With a ``cache_dir`` the reference's answers are memoised there for the build
+    identified above, and the memo is written back even when a seed fails, so the next
+    run only repeats the work the failure left undone. None runs the CLI every time.
     """
+    global CACHE
     if advisory and os.path.abspath(output_path) == os.path.abspath(DEFAULT_OUTPUT):
         raise PrerequisiteError(
             "an advisory run must not write the committed corpus; pass --output"
         )
 
     (pin, cli, version, commit, sdk_xdr_commit,
-     name_map, index, classes) = check_prerequisites(advisory=advisory)
+     name_map, index, classes) = check_prerequisites(
+         advisory=advisory,
+         index_path=DEFAULT_ARTEFACT_INDEX if cache_dir is not None else None)
     findings = [] if advisory else None
+    CACHE = (ReferenceCache(cache_dir, pin["tool"], version, commit)
+             if cache_dir is not None else None)
+    try:
+        corpus = build_corpus(pin, cli, version, commit, sdk_xdr_commit,
+                              name_map, index, classes, findings)
+    finally:
+        if CACHE is not None:
+            CACHE.save()
 
+    with open(output_path, "w") as handle:
+        json.dump(corpus, handle, ensure_ascii=False, indent=2, sort_keys=False)
+        handle.write("\n")
+
+    return corpus, findings or []
+
+
+def build_corpus(pin, cli, version, commit, sdk_xdr_commit, name_map, index, classes,
+                 findings):
+    """Runs every check and seed through the reference and assembles the document."""
     check_type_names(index, known_types(cli), classes)
     type_field_types = check_completeness(name_map, index)
     probe_type = oracle_name_for(index, "DontHave")
@@ -762,12 +985,7 @@ def generate(output_path, advisory=False):
         },
         "entries": entries,
     }
-
-    with open(output_path, "w") as handle:
-        json.dump(corpus, handle, ensure_ascii=False, indent=2, sort_keys=False)
-        handle.write("\n")
-
-    return corpus, findings or []
+    return corpus
 
 
 def main():
@@ -781,18 +999,31 @@ def main():
     parser.add_argument("--check-prerequisites", action="store_true",
                         help="verify the reference build and the committed artefacts, "
                              "write nothing, and exit 0 or 2.")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="where reference answers are memoised, one file per "
+                             "build (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="run the reference CLI for every seed and rescan every "
+                             "artefact, reading and writing no memo or index.")
+    add_profile_argument(parser, PROFILES_DIR)
     args = parser.parse_args()
 
     if args.check_prerequisites:
         try:
-            check_prerequisites(advisory=args.advisory)
+            check_prerequisites(
+                advisory=args.advisory,
+                index_path=None if args.no_cache else DEFAULT_ARTEFACT_INDEX,
+                persist=False)
         except PrerequisiteError as error:
             print("generate_corpus.py: %s" % error, file=sys.stderr)
             return 2
         return 0
 
     try:
-        corpus, findings = generate(args.output, advisory=args.advisory)
+        with profiled(args.profile, "generate_corpus", directory=PROFILES_DIR):
+            corpus, findings = generate(
+                args.output, advisory=args.advisory,
+                cache_dir=None if args.no_cache else args.cache_dir)
     except PrerequisiteError as error:
         print("generate_corpus.py: %s" % error, file=sys.stderr)
         return 2
@@ -813,6 +1044,8 @@ def main():
     print("  comparable:     %d" % (len(entries) - len(incomparable)))
     print("  incomparable:   %d (%s)" % (len(incomparable),
                                          ", ".join(incomparable_types)))
+    if CACHE is not None:
+        print("  reference:      %d cached, %d run" % (CACHE.hits, CACHE.misses))
 
     if findings:
         print("")
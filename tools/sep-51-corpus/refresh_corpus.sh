@@ -3,8 +3,11 @@
 # Regenerates the SEP-0051 conformance corpus into a scratch directory and diffs
 # it against the committed corpus.json.
 #
-# corpus.json carries no timestamp and a fixed entry and key order, so the whole
-# document is compared raw and any difference is real drift.
+# corpus.json carries no timestamp and a fixed entry and key order, so any
+# difference is real drift. diff_corpus.py reports it entry by entry.
+#
+# The generator memoises the reference's answers under .tmp/reference-cache/, one
+# file per build, so a check after editing a seed only runs the CLI for that seed.
 #
 # Usage:
 #   refresh_corpus.sh              Check the committed corpus against the pinned build.
@@ -14,7 +17,7 @@
 #
 # Exit codes:
 #   0  the committed corpus matches a fresh generation
-#   1  drift: the diff is printed
+#   1  drift: the changed entries and metadata fields are printed
 #   2  a prerequisite is missing (reference CLI absent, or not matching the pin outside
 #      advisory mode, or a committed artefact the generator reads is absent)
 
@@ -67,43 +70,26 @@ if [ "$status" -ne 0 ] && [ ! -f "$FRESH" ]; then
   exit 1
 fi
 
-LEFT="$COMMITTED"
-RIGHT="$FRESH"
-
+# Entries are matched on (type, note) and compared field by field, so the report names
+# what changed rather than which lines moved.
+DIFF_ARGS=()
 if [ -n "$ADVISORY" ]; then
   # Compare renderings, not provenance. An advisory document honestly records the build that
   # produced it, so reference_version and reference_xdr_commit differ on every real release
   # and would drown out the question being asked: does anything this SDK emits change?
   # entry_count stays in the comparison, because a dropped seed is a real difference.
-  NORM_LEFT="$TMP_DIR/committed-normalised.json"
-  NORM_RIGHT="$TMP_DIR/advisory-normalised.json"
-  if ! python3 - "$COMMITTED" "$NORM_LEFT" "$FRESH" "$NORM_RIGHT" <<'NORMALISE'
-import json
-import sys
-
-PROVENANCE = ("reference_version", "reference_xdr_commit")
-
-for source, target in ((sys.argv[1], sys.argv[2]), (sys.argv[3], sys.argv[4])):
-    with open(source) as handle:
-        document = json.load(handle)
-    for field in PROVENANCE:
-        if field in document.get("metadata", {}):
-            document["metadata"][field] = "<ignored in advisory comparison>"
-    with open(target, "w") as handle:
-        json.dump(document, handle, ensure_ascii=False, indent=2, sort_keys=False)
-        handle.write("\n")
-NORMALISE
-  then
-    echo "refresh_corpus.sh: could not normalise the documents for comparison" >&2
-    exit 2
-  fi
-  LEFT="$NORM_LEFT"
-  RIGHT="$NORM_RIGHT"
+  DIFF_ARGS=(--structural --ignore-metadata reference_version reference_xdr_commit)
 fi
 
 # In advisory mode the generation itself may already have reported findings; the diff
 # below is the enumeration of what the new build renders differently.
-if diff -u -L "$COMMITTED" -L "$FRESH" "$LEFT" "$RIGHT"; then
+python3 "$SCRIPT_DIR/diff_corpus.py" "$COMMITTED" "$FRESH" ${DIFF_ARGS[@]+"${DIFF_ARGS[@]}"}
+diff_status=$?
+if [ "$diff_status" -eq 2 ]; then
+  echo "refresh_corpus.sh: could not compare the documents" >&2
+  exit 2
+fi
+if [ "$diff_status" -eq 0 ]; then
   if [ -n "$ADVISORY" ] && [ "$status" -ne 0 ]; then
     echo "ADVISORY: renderings match, but the run reported findings above." >&2
     exit 1
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Public-API resolution for the stellar_flutter_sdk package.
+
+A declaration is public when its declaring file is reachable from the public
+barrel (lib/stellar_flutter_sdk.dart) through the transitive `export` graph and
+its name is not underscore-prefixed. This module resolves that graph once and
+answers "is this file / class public?" for any tool in the repository: the API
+reference generator and the compatibility matrix analyzers share it.
+
+The resolved allowlist is persisted (by default under
+tools/skill-generator/.tmp/) together with the content hash of every file the
+walk read; it is reused while all of those hashes match, since the walk is a
+function of those contents alone, and whenever this module or the lexer
+changes.
+
+Usage as a library:
+
+    from dart_exports import ExportGraph
+    graph = ExportGraph()
+    graph.is_public_class('KeyPair', Path('lib/src/key_pair.dart'))
+
+Usage from the command line (prints each path with public/internal):
+
+    python3 dart_exports.py lib/src/key_pair.dart ...
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+from dart_source import file_digest, lex_file
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+LIB_PATH = REPO_ROOT / "lib"
+BARREL_PATH = REPO_ROOT / "lib" / "stellar_flutter_sdk.dart"
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / ".tmp" / "export-graph.json"
+
+# Package import prefix used by `package:...` export URIs.
+PACKAGE_PREFIX = "package:stellar_flutter_sdk/"
+
+
+def _extract_export_targets(export_clean: str) -> list[str]:
+    """
+    Extract the resolvable target URI(s) from a single `export '...';` clause
+    (comments already stripped from the input).
+
+    Plain export:        export 'a/b.dart';            -> ['a/b.dart']
+    Conditional export:  export 'stub.dart'
+                             if (dart.library.js_interop) 'impl.dart';
+
+    For conditional exports we deliberately select ONLY the `if (...)` target
+    (the platform implementation, e.g. the Flutter-web variant) and drop the
+    default token (the stub). This guarantees a single allowlisted variant so
+    the public class is emitted exactly once with its real signature.
+    """
+    uris = re.findall(r"'([^']+)'", export_clean)
+    if not uris:
+        return []
+    start = 1 if ('if (' in export_clean and len(uris) >= 2) else 0
+    return [u for u in uris[start:] if u.endswith('.dart')]
+
+
+def _resolve_export_uri(uri: str, current_file: Path, lib_path: Path = LIB_PATH) -> Path | None:
+    """
+    Resolve an export URI to an absolute path under lib/.
+
+    Handles relative-to-file URIs and `package:stellar_flutter_sdk/...` URIs.
+    Returns None for non-package external URIs (e.g. dart:io).
+    """
+    if uri.startswith('dart:'):
+        return None
+    if uri.startswith(PACKAGE_PREFIX):
+        rel = uri.removeprefix(PACKAGE_PREFIX)
+        return (lib_path / rel).resolve()
+    if uri.startswith('package:'):
+        return None
+    # Relative to the directory of the exporting file
+    return (current_file.parent / uri).resolve()
+
+
+def _collect_exports(clean_text: str, source_file: Path, lib_path: Path = LIB_PATH) -> list[Path]:
+    """Resolve all export target paths declared in already-cleaned `clean_text`."""
+    resolved_paths: list[Path] = []
+    for stmt in re.finditer(r'export\b([^;]*);', clean_text):
+        for uri in _extract_export_targets(stmt.group(1)):
+            resolved = _resolve_export_uri(uri, source_file, lib_path)
+            if resolved:
+                resolved_paths.append(resolved)
+    return resolved_paths
+
+
+def build_export_allowlist(graph: dict[Path, str | None] | None = None,
+                           barrel: Path = BARREL_PATH) -> set[Path]:
+    """
+    Build the transitive set of source files reachable from the public barrel
+    (lib/stellar_flutter_sdk.dart) via `export` statements.
+
+    Only classes declared in files within this set are emitted, mirroring the
+    public API surface authority of the barrel. `package:` URIs resolve against
+    the barrel's own lib/ directory, so another checkout's barrel works too.
+
+    When `graph` is given it receives the content hash of every file the walk
+    read, which is what the allowlist depends on: None for a missing target and
+    an empty string, which never matches, for one that could not be read.
+    """
+    allow: set[Path] = set()
+    worklist: list[Path] = [barrel]
+
+    while worklist:
+        current = worklist.pop()
+        if not current.exists():
+            print(f"WARNING: export target does not exist, skipping: {current}",
+                  file=sys.stderr)
+            if graph is not None:
+                graph[current] = None
+            continue
+        try:
+            clean = lex_file(current).clean
+            if graph is not None:
+                graph[current] = file_digest(current)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"WARNING: could not read export target {current}: {e}",
+                  file=sys.stderr)
+            if graph is not None:
+                graph[current] = ""
+            continue
+        for resolved in _collect_exports(clean, current, barrel.parent):
+            if resolved not in allow:
+                allow.add(resolved)
+                worklist.append(resolved)
+
+    return allow
+
+
+def _resolver_digest() -> str:
+    """Hash of the code the allowlist depends on: this module and the lexer."""
+    here = Path(__file__).resolve().parent
+    return "".join(file_digest(here / name) for name in ("dart_exports.py", "dart_source.py"))
+
+
+class ExportGraph:
+    """
+    The barrel's export allowlist, resolved at most once per process and
+    persisted across runs.
+
+    `cache_path=None` disables persistence; the allowlist is then walked on
+    first use and kept in memory only.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: Path | None = DEFAULT_CACHE_PATH,
+                 barrel: Path = BARREL_PATH) -> None:
+        self.cache_path = cache_path
+        self.barrel = barrel.resolve()
+        self.reused = False
+        self._allow: set[Path] | None = None
+
+    def allowlist(self) -> set[Path]:
+        """Resolved paths of every file the barrel exports, directly or transitively."""
+        if self._allow is None:
+            self._allow = self._load()
+            self.reused = self._allow is not None
+            if self._allow is None:
+                graph: dict[Path, str | None] = {}
+                self._allow = build_export_allowlist(graph, self.barrel)
+                self._save(graph)
+        return self._allow
+
+    def is_public_file(self, path: Path | str) -> bool:
+        """True when `path` is reachable from the barrel (relative paths are repo-relative)."""
+        path = Path(path)
+        if not path.is_absolute():
+            path = REPO_ROOT / path
+        return path.resolve() in self.allowlist()
+
+    def is_public_class(self, name: str, path: Path | str) -> bool:
+        """True when a class called `name` declared in `path` is public API."""
+        return not name.startswith('_') and self.is_public_file(path)
+
+    def _load(self) -> set[Path] | None:
+        if self.cache_path is None:
+            return None
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if (data.get("version") != self.VERSION
+                or data.get("resolver") != _resolver_digest()
+                or data.get("barrel") != _repo_relative(self.barrel)):
+            return None
+        for rel, digest in data["graph"].items():
+            path = REPO_ROOT / rel
+            try:
+                current = file_digest(path) if path.exists() else None
+            except OSError:
+                return None
+            if current != digest:
+                return None
+        for rel, digest in data["graph"].items():
+            if digest is None:
+                print(f"WARNING: export target does not exist, skipping: {REPO_ROOT / rel}",
+                      file=sys.stderr)
+        return {(REPO_ROOT / rel).resolve() for rel in data["allowlist"]}
+
+    def _save(self, graph: dict[Path, str | None]) -> None:
+        """Write the cache atomically; a failed write only costs the next run time."""
+        if self.cache_path is None:
+            return
+        data = {
+            "version": self.VERSION,
+            "resolver": _resolver_digest(),
+            "barrel": _repo_relative(self.barrel),
+            "graph": {_repo_relative(p): d for p, d in sorted(graph.items())},
+            "allowlist": sorted(_repo_relative(p) for p in self._allow),
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+        except OSError as e:
+            print(f"WARNING: could not write cache {self.cache_path}: {e}", file=sys.stderr)
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            print(f"WARNING: could not write cache {self.cache_path}: {e}", file=sys.stderr)
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+def _repo_relative(path: Path) -> str:
+    return os.path.relpath(path, REPO_ROOT)
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print(__doc__.split("Usage as a library:")[0].strip(), file=sys.stderr)
+        print("\nUsage: python3 dart_exports.py PATH [PATH ...]", file=sys.stderr)
+        sys.exit(2)
+    graph = ExportGraph()
+    for arg in sys.argv[1:]:
+        print(f"{arg}: {'public' if graph.is_public_file(Path(arg).resolve()) else 'internal'}")
+
+
+if __name__ == "__main__":
+    main()
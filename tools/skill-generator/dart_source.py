@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Dart source lexing shared by the SDK tooling.
+
+One pass over a Dart file strips its comments (keeping the newlines inside
+block comments, so line numbers survive) and derives a line index on demand.
+lex_file memoises the result per path, so every consumer in a process shares a
+single read and lex of each file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+
+def skip_string_literal(text: str, i: int) -> int:
+    """
+    Given that text[i] opens a string literal ('"' or "'"), return the index of
+    the character immediately after the closing quote (or after the run of
+    literal content for an unterminated single-line string). Handles triple- and
+    single-quoted strings and backslash escapes.
+    """
+    n = len(text)
+    quote = text[i]
+    # Triple-quoted string
+    if text[i:i + 3] in ('"""', "'''"):
+        triple = text[i:i + 3]
+        i += 3
+        while i < n:
+            if text[i:i + 3] == triple:
+                return i + 3
+            if text[i] == '\\':
+                i += 2
+            else:
+                i += 1
+        return n
+    # Single-quoted string (terminates at quote or newline)
+    i += 1
+    while i < n and text[i] != quote and text[i] != '\n':
+        if text[i] == '\\':
+            i += 2
+        else:
+            i += 1
+    if i < n and text[i] == quote:
+        return i + 1
+    return i
+
+
+# The characters at which the lexer has to look closer: a quote opens a string
+# literal and `//` or `/*` opens a comment. Everything between two matches is
+# copied through in one slice.
+_LEX_INTEREST_RE = re.compile(r"""["']|/[/*]""")
+
+
+@dataclass
+class LexedSource:
+    """One Dart file after a single lexer pass, shared by every consumer.
+
+    `clean` is the text with every comment removed and the newlines inside block
+    comments kept, exactly what `strip_all_comments` returns.
+    """
+    path: Path | None
+    text: str
+    clean: str
+
+    @cached_property
+    def line_starts(self) -> list[int]:
+        """Offset in `clean` at which each line begins; line numbers are 0-based."""
+        return [0] + [m.end() for m in re.finditer('\n', self.clean)]
+
+    def line_of(self, offset: int) -> int:
+        """The 0-based line of `clean` containing `offset`."""
+        return bisect_right(self.line_starts, offset) - 1
+
+    @cached_property
+    def deprecated_lines(self) -> list[bool]:
+        """For each line, whether a declaration on it sits under a `@Deprecated`.
+
+        The annotation block above a line is the run of non-blank lines before
+        it, ending at a blank line or at a line that closes a prior declaration
+        (`}`/`;`/`{`). The answer for a line follows from the line just above:
+        blank or boundary means no, an annotation means yes, and anything else
+        (an annotation continuation) inherits that line's own answer. One
+        forward pass therefore answers every line.
+        """
+        starts = self.line_starts
+        answers = [False] * len(starts)
+        for line in range(1, len(starts)):
+            s = self.clean[starts[line - 1]:starts[line]].strip()
+            if not s:
+                answers[line] = False
+            elif '@Deprecated' in s or '@deprecated' in s:
+                answers[line] = True
+            elif s.endswith('}') or s.endswith(';') or s.endswith('{'):
+                answers[line] = False
+            else:
+                answers[line] = answers[line - 1]
+        return answers
+
+
+def lex_dart(content: str, path: Path | None = None) -> LexedSource:
+    """Lex Dart source once: strip its comments, keeping string literals intact."""
+    out: list[str] = []
+    i = 0
+    n = len(content)
+    while i < n:
+        m = _LEX_INTEREST_RE.search(content, i)
+        if not m:
+            out.append(content[i:])
+            break
+        j = m.start()
+        if j > i:
+            out.append(content[i:j])
+        if m.group() in ('"', "'"):
+            # String literals — copy them intact
+            end = skip_string_literal(content, j)
+            out.append(content[j:end])
+            i = end
+        elif m.group() == '/*':
+            close = content.find('*/', j + 2)
+            end = n if close == -1 else close + 2
+            # Preserve newlines for line counting
+            newlines = content.count('\n', j + 2, n if close == -1 else close)
+            out.append('\n' * newlines)
+            i = end
+        else:
+            close = content.find('\n', j)
+            i = n if close == -1 else close
+    return LexedSource(path, content, ''.join(out))
+
+
+@lru_cache(maxsize=None)
+def lex_file(filepath: Path) -> LexedSource:
+    """Read and lex a file once per run; every later consumer gets the same result."""
+    return lex_dart(filepath.read_text(encoding='utf-8'), filepath)
+
+
+def strip_all_comments(content: str) -> str:
+    """Remove all comments from Dart source, preserving string literals."""
+    return lex_dart(content).clean
+
+
+@lru_cache(maxsize=None)
+def file_digest(filepath: Path) -> str:
+    """SHA-256 of a file's bytes, computed once per run."""
+    return hashlib.sha256(filepath.read_bytes()).hexdigest()
@@ -13,29 +13,81 @@ A declaration is treated as public when its declaring file is reachable from
 the public barrel (lib/stellar_flutter_sdk.dart) via the transitive export
 graph and the declared name is not underscore-prefixed.
 
-Usage: python3 generate_api_reference.py
+Files are parsed in worker processes and merged back in walk order, so the
+output does not depend on the number of workers.
+
+Next to the markdown it writes api_reference.index.json, a symbol index that
+maps every type and member signature to its group, source file and byte range
+in the markdown, so tools can look a symbol up without scanning the document.
+
+With --include-xdr the XDR types (skipped by default) are added as a compact
+final section: the encode/decode, base64, XDR-JSON and TxRep boilerplate
+every XDR type shares is described once per type kind, and each type gets a
+single line listing only its distinctive fields, enum values or union arms.
+
+With --sharded the reference is split into one markdown file per group
+(api_reference-<group>.md) and api_reference.md becomes a small index listing
+each type and the shard that holds it.
+
+Every run also saves a structured snapshot of the API (types, headers and
+members keyed by name with signature hashes) to
+.tmp/api_reference.snapshot.json, or to --snapshot PATH; it is a review aid and
+stays out of the skill bundle. --diff-against SNAPSHOT compares the freshly
+generated API with an earlier snapshot and reports added, removed and changed
+types and members.
+
+Per-file results are cached under .tmp/, keyed by the content hash of each
+source file and of the parser, so a rerun parses only the files that changed.
+The lexer lives in dart_source.py and the export allowlist, with its own
+persisted cache, in dart_exports.py; both are shared with other SDK tooling.
+
+Usage: python3 generate_api_reference.py [--sharded] [--include-xdr] [--jobs N]
+                                         [--diff-against SNAPSHOT] [--snapshot PATH]
+                                         [--cache-dir DIR | --no-cache]
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import importlib.util
+import json
 import os
 import re
 import sys
+import tempfile
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+
+from dart_exports import BARREL_PATH, ExportGraph
+from dart_source import LexedSource, file_digest, lex_file, skip_string_literal
+
+# The shared --profile support lives with the matrix generator's scripts. It is
+# loaded from its file instead of through sys.path, so nothing in that
+# directory can shadow a module of this tool or of the standard library.
+_spec = importlib.util.spec_from_file_location(
+    "matrix_generator_profiling", Path(__file__).resolve().parent.parent / "matrix-generator" / "profiling.py")
+_profiling = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_profiling)
+add_profile_argument, profiled = _profiling.add_profile_argument, _profiling.profiled
 
 # Configuration — paths derived from script location
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 SDK_PATH = REPO_ROOT / "lib" / "src"
-LIB_PATH = REPO_ROOT / "lib"
-BARREL_PATH = REPO_ROOT / "lib" / "stellar_flutter_sdk.dart"
 OUTPUT_PATH = REPO_ROOT / "skills" / "stellar-flutter-sdk" / "references" / "api_reference.md"
-
-# Package import prefix used by `package:...` export URIs.
-PACKAGE_PREFIX = "package:stellar_flutter_sdk/"
-
-# Directories to skip entirely
+INDEX_PATH = OUTPUT_PATH.with_suffix(".index.json")
+# Per-group shard files written by --sharded, next to OUTPUT_PATH.
+SHARD_NAME = OUTPUT_PATH.stem + "-{group}.md"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".tmp"
+# The API snapshot is for reviewers, not for the skill, so it is kept out of
+# the skill's references directory.
+SNAPSHOT_PATH = DEFAULT_CACHE_DIR / (OUTPUT_PATH.stem + ".snapshot.json")
+PROFILES_DIR = DEFAULT_CACHE_DIR / "profiles"
+
+# Directories to skip entirely (--include-xdr drops "xdr" from this set)
 SKIP_DIRS = {"xdr"}
 
 # Files to skip (stubs, internals)
@@ -87,6 +139,9 @@ GROUP_TITLES = {
     # barrel (lib/stellar_flutter_sdk.dart), so no class is ever grouped under
     # it. No "eventsource" group title is defined here for that reason.
     "constants": "Constants",
+    # Only populated with --include-xdr, and rendered compactly (see
+    # format_xdr_line).
+    "xdr": "XDR Types (compact)",
 }
 
 
@@ -106,6 +161,7 @@ class ClassInfo:
     setters: list[str] = field(default_factory=list)
     on_type: str = ""    # for extensions: the `on Type` target
     signature: str = ""  # for typedefs: the aliased signature shown as content
+    source: str = ""     # declaring file, relative to the repository root
 
     def member_lines(self) -> list[str]:
         """All emitted member signature lines in render order."""
@@ -134,70 +190,6 @@ def is_private(name: str) -> bool:
     return name.startswith('_')
 
 
-def skip_string_literal(text: str, i: int) -> int:
-    """
-    Given that text[i] opens a string literal ('"' or "'"), return the index of
-    the character immediately after the closing quote (or after the run of
-    literal content for an unterminated single-line string). Handles triple- and
-    single-quoted strings and backslash escapes.
-    """
-    n = len(text)
-    quote = text[i]
-    # Triple-quoted string
-    if text[i:i + 3] in ('"""', "'''"):
-        triple = text[i:i + 3]
-        i += 3
-        while i < n:
-            if text[i:i + 3] == triple:
-                return i + 3
-            if text[i] == '\\':
-                i += 2
-            else:
-                i += 1
-        return n
-    # Single-quoted string (terminates at quote or newline)
-    i += 1
-    while i < n and text[i] != quote and text[i] != '\n':
-        if text[i] == '\\':
-            i += 2
-        else:
-            i += 1
-    if i < n and text[i] == quote:
-        return i + 1
-    return i
-
-
-def strip_all_comments(content: str) -> str:
-    """Remove all comments from Dart source, preserving string literals."""
-    result = []
-    i = 0
-    n = len(content)
-    while i < n:
-        ch = content[i]
-        # String literals — copy them intact
-        if ch in ('"', "'"):
-            end = skip_string_literal(content, i)
-            result.append(content[i:end])
-            i = end
-        # Multi-line comments
-        elif content[i:i + 2] == '/*':
-            i += 2
-            while i < n and content[i:i + 2] != '*/':
-                # Preserve newlines for line counting
-                if content[i] == '\n':
-                    result.append('\n')
-                i += 1
-            i += 2  # skip */
-        # Single-line comments
-        elif content[i:i + 2] == '//':
-            while i < n and content[i] != '\n':
-                i += 1
-        else:
-            result.append(ch)
-            i += 1
-    return ''.join(result)
-
-
 def balance(text: str, start: int, open_ch: str, close_ch: str) -> int:
     """
     Find the index of the closing delimiter matching the opening delimiter at
@@ -277,6 +269,39 @@ _FIELD_RE = re.compile(
     r'(?:([\w<>,?.\s]+?)\s+)?'
     r'(\w+)\s*(?:=.*)?$'
 )
+# Annotations such as `@override` or `@JsonKey(...)`, stripped before
+# classification.
+_ANNOTATION_RE = re.compile(r'@\w+(?:\([^)]*\))?\s*')
+
+# Classifier dispatch. One scan of a line with this combined alternation finds
+# every keyword a branch needs before its pattern can match; each group is a
+# necessary condition of the named branch's regex on a normalized line:
+#   static    -> _STATIC_CONST_RE (the line starts with `static `)
+#   setter    -> _SETTER_RE (the line starts with `set `)
+#   getter    -> _GETTER_RE (`get` followed by whitespace, anywhere)
+#   operator  -> _OPERATOR_RE (`operator`, anywhere)
+# Branches whose keyword is absent are skipped without running their pattern;
+# the order in which the remaining branches are tried is unchanged.
+_MEMBER_KEYWORD_RE = re.compile(
+    r'(?P<static>^static\s)'
+    r'|(?P<setter>^set\s)'
+    r'|(?P<getter>get\s)'
+    r'|(?P<operator>operator)'
+)
+
+
+def _member_keywords(line: str) -> set[str]:
+    """The dispatch keywords present in `line` (see `_MEMBER_KEYWORD_RE`)."""
+    return {m.lastgroup for m in _MEMBER_KEYWORD_RE.finditer(line)}
+
+
+@lru_cache(maxsize=None)
+def _constructor_re(class_name: str) -> re.Pattern[str]:
+    """Constructor pattern (const / factory / const factory / plain, named or not) for a type."""
+    return re.compile(
+        r'(const\s+factory\s+|factory\s+|const\s+)?'
+        rf'({re.escape(class_name)}(?:\.\w+)?)\s*\('
+    )
 
 
 def _classify_operator(line: str, info: ClassInfo) -> bool:
@@ -533,12 +558,13 @@ def _classify_member(line: str, info: ClassInfo, class_name: str) -> None:
         return
 
     # Remove remaining annotations like @override.
-    line = re.sub(r'@\w+(?:\([^)]*\))?\s*', '', line).strip()
+    line = _ANNOTATION_RE.sub('', line).strip()
     if not line:
         return
+    keywords = _member_keywords(line)
 
     # --- Static const / static final ---
-    m = _STATIC_CONST_RE.match(line)
+    m = _STATIC_CONST_RE.match(line) if "static" in keywords else None
     if m:
         type_hint = (m.group(1) or "").strip()
         name = m.group(2)
@@ -551,7 +577,7 @@ def _classify_member(line: str, info: ClassInfo, class_name: str) -> None:
 
     # --- Getters ---
     # Pattern: [static] ReturnType get name
-    m = _GETTER_RE.match(line)
+    m = _GETTER_RE.match(line) if "getter" in keywords else None
     if m and m.group(3) and not is_private(m.group(3)):
         is_static = bool(m.group(1))
         return_type = (m.group(2) or "").strip()
@@ -568,7 +594,7 @@ def _classify_member(line: str, info: ClassInfo, class_name: str) -> None:
         return
 
     # --- Setters ---
-    m = _SETTER_RE.match(line)
+    m = _SETTER_RE.match(line) if "setter" in keywords else None
     if m:
         name = m.group(1)
         params = compact_whitespace(m.group(2))
@@ -577,15 +603,11 @@ def _classify_member(line: str, info: ClassInfo, class_name: str) -> None:
         return
 
     # --- Operators ---
-    if _classify_operator(line, info):
+    if "operator" in keywords and _classify_operator(line, info):
         return
 
     # --- Constructors (const / factory / const factory / plain, named or not) ---
-    ctor_pattern = (
-        r'(const\s+factory\s+|factory\s+|const\s+)?'
-        rf'({re.escape(class_name)}(?:\.\w+)?)\s*\('
-    )
-    m = re.match(ctor_pattern, line)
+    m = _constructor_re(class_name).match(line) if class_name in line else None
     if m:
         modifier = (m.group(1) or "").strip()
         ctor_name = m.group(2)
@@ -799,87 +821,6 @@ def scan_enum_value_count(body: str) -> int:
     return count
 
 
-def _extract_export_targets(export_clean: str) -> list[str]:
-    """
-    Extract the resolvable target URI(s) from a single `export '...';` clause
-    (comments already stripped from the input).
-
-    Plain export:        export 'a/b.dart';            -> ['a/b.dart']
-    Conditional export:  export 'stub.dart'
-                             if (dart.library.js_interop) 'impl.dart';
-
-    For conditional exports we deliberately select ONLY the `if (...)` target
-    (the platform implementation, e.g. the Flutter-web variant) and drop the
-    default token (the stub). This guarantees a single allowlisted variant so
-    the public class is emitted exactly once with its real signature.
-    """
-    uris = re.findall(r"'([^']+)'", export_clean)
-    if not uris:
-        return []
-    start = 1 if ('if (' in export_clean and len(uris) >= 2) else 0
-    return [u for u in uris[start:] if u.endswith('.dart')]
-
-
-def _resolve_export_uri(uri: str, current_file: Path) -> Path | None:
-    """
-    Resolve an export URI to an absolute path under lib/.
-
-    Handles relative-to-file URIs and `package:stellar_flutter_sdk/...` URIs.
-    Returns None for non-package external URIs (e.g. dart:io).
-    """
-    if uri.startswith('dart:'):
-        return None
-    if uri.startswith(PACKAGE_PREFIX):
-        rel = uri.removeprefix(PACKAGE_PREFIX)
-        return (LIB_PATH / rel).resolve()
-    if uri.startswith('package:'):
-        return None
-    # Relative to the directory of the exporting file
-    return (current_file.parent / uri).resolve()
-
-
-def _collect_exports(clean_text: str, source_file: Path) -> list[Path]:
-    """Resolve all export target paths declared in already-cleaned `clean_text`."""
-    resolved_paths: list[Path] = []
-    for stmt in re.finditer(r'export\b([^;]*);', clean_text):
-        for uri in _extract_export_targets(stmt.group(1)):
-            resolved = _resolve_export_uri(uri, source_file)
-            if resolved:
-                resolved_paths.append(resolved)
-    return resolved_paths
-
-
-def build_export_allowlist() -> set[Path]:
-    """
-    Build the transitive set of source files reachable from the public barrel
-    (lib/stellar_flutter_sdk.dart) via `export` statements.
-
-    Only classes declared in files within this set are emitted, mirroring the
-    public API surface authority of the barrel.
-    """
-    allow: set[Path] = set()
-    worklist: list[Path] = [BARREL_PATH]
-
-    while worklist:
-        current = worklist.pop()
-        if not current.exists():
-            print(f"WARNING: export target does not exist, skipping: {current}",
-                  file=sys.stderr)
-            continue
-        try:
-            clean = strip_all_comments(current.read_text(encoding='utf-8'))
-        except (OSError, UnicodeDecodeError) as e:
-            print(f"WARNING: could not read export target {current}: {e}",
-                  file=sys.stderr)
-            continue
-        for resolved in _collect_exports(clean, current):
-            if resolved not in allow:
-                allow.add(resolved)
-                worklist.append(resolved)
-
-    return allow
-
-
 def scan_public_declaration_names(filepath: Path) -> set[str]:
     """
     Broad secondary scan: return the set of every top-level public declaration
@@ -889,15 +830,15 @@ def scan_public_declaration_names(filepath: Path) -> set[str]:
     Diagnostic only (coverage sanity scan); never influences emitted output.
     """
     try:
-        clean = strip_all_comments(filepath.read_text(encoding='utf-8'))
+        source = lex_file(filepath.resolve())
     except (OSError, UnicodeDecodeError) as e:
         print(f"WARNING: could not read {filepath} for sanity scan: {e}",
               file=sys.stderr)
         return set()
     names: set[str] = set()
-    for m in _SANITY_DECL_RE.finditer(clean):
+    for m in _SANITY_DECL_RE.finditer(source.clean):
         name = m.group('cls') or m.group('ext') or m.group('td')
-        if name and not is_private(name) and not _preceded_by_deprecated(clean, m.start()):
+        if name and not is_private(name) and not _preceded_by_deprecated(source, m.start()):
             names.add(name)
     return names
 
@@ -920,33 +861,23 @@ _EXT_RE = re.compile(
 _TYPEDEF_RE = re.compile(r'^[ \t]*typedef\s+([^;{]+?)\s*;', re.MULTILINE)
 
 
-def _preceded_by_deprecated(text: str, start: int) -> bool:
+def _preceded_by_deprecated(source: LexedSource, start: int) -> bool:
     """
     True when the declaration starting at `start` is directly preceded by a
     `@Deprecated` annotation, including a multi-line `@Deprecated(\n  '...')`
     form. Runs on comment-stripped text, so the contiguous non-blank lines
-    above a declaration are annotation lines (and their continuations). Walks
-    that block backwards; a blank line, or a prior-declaration boundary
-    (`}`/`;`/`{`), ends the walk.
+    above a declaration are annotation lines (and their continuations). The
+    walk over that block is precomputed per line in
+    `LexedSource.deprecated_lines`, so each lookup is a bisect into the file's
+    line-start table.
     """
-    line_start = text.rfind('\n', 0, start) + 1
-    for ln in reversed(text[:line_start].splitlines()):
-        s = ln.strip()
-        if not s:
-            break
-        if '@Deprecated' in s or '@deprecated' in s:
-            return True
-        # A line ending in a declaration boundary means we have walked past
-        # this declaration's annotation block into prior code.
-        if s.endswith('}') or s.endswith(';') or s.endswith('{'):
-            break
-    return False
+    return source.deprecated_lines[source.line_of(start)]
 
 
 def parse_dart_file(filepath: Path) -> list[ClassInfo]:
     """Parse a Dart file and extract all public classes with their members."""
-    content = filepath.read_text(encoding='utf-8')
-    clean = strip_all_comments(content)
+    source = lex_file(filepath.resolve())
+    clean = source.clean
     results: list[ClassInfo] = []
 
     # --- Classes / mixins / mixin classes / enums ---
@@ -960,7 +891,7 @@ def parse_dart_file(filepath: Path) -> list[ClassInfo]:
 
         if is_private(class_name):
             continue
-        if _preceded_by_deprecated(clean, m.start()):
+        if _preceded_by_deprecated(source, m.start()):
             continue
 
         is_enum = (kind_word == "enum")
@@ -1021,7 +952,7 @@ def parse_dart_file(filepath: Path) -> list[ClassInfo]:
         on_type = compact_whitespace(m.group(2) or "")
         if ext_name and is_private(ext_name):
             continue
-        if _preceded_by_deprecated(clean, m.start()):
+        if _preceded_by_deprecated(source, m.start()):
             continue
         brace_pos = m.end() - 1
         body_end = balance_braces(clean, brace_pos)
@@ -1041,7 +972,7 @@ def parse_dart_file(filepath: Path) -> list[ClassInfo]:
     # Modern:  typedef Name<...> = <aliased>;
     # Legacy:  typedef ReturnType Name(args);
     for m in _TYPEDEF_RE.finditer(clean):
-        if _preceded_by_deprecated(clean, m.start()):
+        if _preceded_by_deprecated(source, m.start()):
             continue
         decl = compact_whitespace(m.group(1))
         eq = decl.find('=')
@@ -1105,24 +1036,152 @@ def format_class_section(info: ClassInfo) -> str:
     return "\n".join(lines)
 
 
+@dataclass
+class FileAnalysis:
+    """Everything `collect_classes` needs from one source file.
+
+    Built by `analyze_file`, possibly in a worker process, so it carries only
+    picklable values; the caller merges results in walk order.
+    """
+    classes: list[ClassInfo] = field(default_factory=list)
+    scanned: set[str] = field(default_factory=set)
+    member_gaps: list[tuple[str, str, int, int]] = field(default_factory=list)
+    error: str | None = None
+
+
+class GenerationCache:
+    """
+    Per-file analyses from earlier runs.
+
+    An analysis is reused when its file's content hash is unchanged. The whole
+    cache is dropped when this script or the lexer changes, so a parser fix
+    never serves stale results. (The export allowlist has its own cache; see
+    dart_exports.ExportGraph.)
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        here = Path(__file__).resolve().parent
+        self.generator = "".join(file_digest(here / name) for name in
+                                 ("generate_api_reference.py", "dart_source.py"))
+        self.hits = 0
+        self.misses = 0
+        self.files: dict[str, dict] = {}
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION and data.get("generator") == self.generator:
+            self.files = data.get("files", {})
+
+    def analysis(self, rel_path: str, digest: str) -> FileAnalysis | None:
+        entry = self.files.get(rel_path)
+        if entry is None or entry["digest"] != digest:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return FileAnalysis(
+            classes=[ClassInfo(**c) for c in entry["classes"]],
+            scanned=set(entry["scanned"]),
+            member_gaps=[tuple(g) for g in entry["member_gaps"]],
+        )
+
+    def store_analysis(self, rel_path: str, digest: str, analysis: FileAnalysis) -> None:
+        if analysis.error is not None:
+            self.files.pop(rel_path, None)
+            return
+        self.files[rel_path] = {
+            "digest": digest,
+            "classes": [asdict(c) for c in analysis.classes],
+            "scanned": sorted(analysis.scanned),
+            "member_gaps": [list(g) for g in analysis.member_gaps],
+        }
+
+    def save(self) -> None:
+        """Write the cache atomically; a failed write only costs the next run time."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": self.VERSION, "generator": self.generator,
+                "files": self.files}
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"WARNING: could not write cache {self.path}: {e}", file=sys.stderr)
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+def _repo_relative(path: Path) -> str:
+    return os.path.relpath(path, REPO_ROOT)
+
+
+def analyze_file(filepath: Path, rel_path: str) -> FileAnalysis:
+    """
+    Parse one allowlisted file, run the declaration-level coverage scan over it,
+    and compare the broad member scan over each type body against the member
+    count actually emitted. Errors are returned, not raised, so that one bad
+    file is reported in order alongside the others.
+    """
+    result = FileAnalysis()
+    try:
+        clean = lex_file(filepath.resolve()).clean
+        result.classes = parse_dart_file(filepath)
+        for cls in result.classes:
+            cls.source = _repo_relative(filepath)
+        result.scanned = scan_public_declaration_names(filepath)
+
+        for cls in result.classes:
+            if cls.kind in ("typedef",):
+                continue
+            body = _find_type_body(clean, cls)
+            if body is None:
+                continue
+            member_count = cls.member_count()
+            if cls.kind == "enum":
+                semi = body.find(';')
+                trailing = body if semi == -1 else body[semi + 1:]
+                scanned = scan_enum_value_count(body) + scan_public_member_count(trailing, cls.name)
+            else:
+                scanned = scan_public_member_count(body, cls.name)
+            if scanned > member_count:
+                result.member_gaps.append((cls.name, rel_path, scanned, member_count))
+
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        result.error = f"{e}\n{traceback.format_exc()}"
+    return result
+
+
 def collect_classes(
     allowlist: set[Path],
     stats: dict,
     scanned_by_file: dict[Path, set[str]],
     emitted_by_file: dict[Path, set[str]],
     member_gaps: list[tuple[str, str, int, int]],
+    jobs: int | None = None,
+    cache: GenerationCache | None = None,
+    skip_dirs: set[str] = SKIP_DIRS,
 ) -> dict[str, list[ClassInfo]]:
     """
     Walk the SDK source, parse each barrel-allowlisted file, and group the
     parsed classes. Populates `stats` and the coverage-scan tracking dicts.
+
+    Files are analysed by up to `jobs` worker processes (all CPUs when None,
+    in-process when 1); results are merged in walk order, so the groups and
+    every diagnostic come out exactly as a serial run produces them. Files
+    whose content hash matches an entry in `cache` are not parsed at all.
     """
     groups: dict[str, list[ClassInfo]] = {k: [] for k in GROUP_TITLES}
+    work: list[tuple[Path, str, str]] = []
 
     for root, dirs, files in os.walk(SDK_PATH):
         # Skip excluded directories in place (preserving the skip count).
         kept = []
         for d in dirs:
-            if d in SKIP_DIRS:
+            if d in skip_dirs:
                 stats["skipped_dirs"] += 1
             else:
                 kept.append(d)
@@ -1140,46 +1199,60 @@ def collect_classes(
             if filepath.resolve() not in allowlist:
                 stats["skipped_files_not_exported"] += 1
                 continue
+            work.append((filepath, rel_path, group))
 
+    analyses: list[FileAnalysis | None] = [None] * len(work)
+    digests: list[str | None] = [None] * len(work)
+    if cache is not None:
+        for i, (filepath, rel_path, _) in enumerate(work):
             try:
-                content = filepath.read_text(encoding='utf-8')
-                clean = strip_all_comments(content)
-                classes = parse_dart_file(filepath)
-                stats["files"] += 1
-
-                resolved_fp = filepath.resolve()
-                scanned_by_file[resolved_fp] = scan_public_declaration_names(filepath)
-                emitted_by_file.setdefault(resolved_fp, set())
-
-                # Member-level coverage: compare the broad member scan over each
-                # type body against the member count actually emitted.
-                for cls in classes:
-                    member_count = cls.member_count()
-                    stats["classes"] += 1
-                    stats["members"] += member_count
-                    groups[group].append(cls)
-                    emitted_by_file[resolved_fp].add(cls.name)
-                    print(f"  {rel_path}: {cls.name} ({member_count} members)",
-                          file=sys.stderr)
-
-                    if cls.kind in ("typedef",):
-                        continue
-                    body = _find_type_body(clean, cls)
-                    if body is None:
-                        continue
-                    if cls.kind == "enum":
-                        semi = body.find(';')
-                        trailing = body if semi == -1 else body[semi + 1:]
-                        scanned = scan_enum_value_count(body) + scan_public_member_count(trailing, cls.name)
-                    else:
-                        scanned = scan_public_member_count(body, cls.name)
-                    if scanned > member_count:
-                        member_gaps.append((cls.name, rel_path, scanned, member_count))
-
-            except (OSError, UnicodeDecodeError, ValueError) as e:
-                print(f"  ERROR parsing {rel_path}: {e}", file=sys.stderr)
-                traceback.print_exc(file=sys.stderr)
-                stats["errors"] += 1
+                digests[i] = file_digest(filepath)
+            except OSError:
+                continue  # analyze_file reports the read error in order
+            analyses[i] = cache.analysis(rel_path, digests[i])
+    pending = [i for i, a in enumerate(analyses) if a is None]
+    paths = [work[i][0] for i in pending]
+    rel_paths = [work[i][1] for i in pending]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(pending) < 2:
+        fresh = map(analyze_file, paths, rel_paths)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        chunk = max(1, len(pending) // (jobs * 4))
+        fresh = executor.map(analyze_file, paths, rel_paths, chunksize=chunk)
+
+    try:
+        for i, analysis in zip(pending, fresh):
+            analyses[i] = analysis
+            if cache is not None and digests[i] is not None:
+                cache.store_analysis(work[i][1], digests[i], analysis)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    for (filepath, rel_path, group), analysis in zip(work, analyses):
+        if analysis.error is not None:
+            print(f"  ERROR parsing {rel_path}: {analysis.error}",
+                  file=sys.stderr, end="")
+            stats["errors"] += 1
+            continue
+        stats["files"] += 1
+
+        resolved_fp = filepath.resolve()
+        scanned_by_file[resolved_fp] = analysis.scanned
+        emitted_by_file.setdefault(resolved_fp, set())
+
+        for cls in analysis.classes:
+            member_count = cls.member_count()
+            stats["classes"] += 1
+            stats["members"] += member_count
+            groups[group].append(cls)
+            emitted_by_file[resolved_fp].add(cls.name)
+            print(f"  {rel_path}: {cls.name} ({member_count} members)",
+                  file=sys.stderr)
+        member_gaps.extend(analysis.member_gaps)
 
     return groups
 
@@ -1251,29 +1324,421 @@ def report_coverage(
     return len(missing) + len(member_gaps)
 
 
-def render_markdown(groups: dict[str, list[ClassInfo]], stats: dict) -> str:
-    """Render the full markdown document from grouped classes."""
+# Boilerplate every generated XDR type carries, by pattern tag. A member
+# matches when the signature (trailing comma removed) fits the regex and `t`,
+# when present, names the type itself, its base class or its parent.
+XDR_STANDARD_TAGS = ("codec", "base64", "json")
+_XDR_BOILERPLATE = [(tag, re.compile(pattern)) for tag, pattern in (
+    ("codec", r'static void encode\(XdrDataOutputStream stream, (?P<t>\w+)\?? \w+\)'),
+    ("codec", r'static (?P<t>\w+) decode\(XdrDataInputStream stream\)'),
+    ("codec", r'static T decodeAs<T extends (?P<t>\w+)>\(.*\)'),
+    ("base64", r'String toBase64EncodedXdrString\(\)'),
+    ("base64", r'static (?P<t>\w+) fromBase64EncodedXdrString\(String base64Encoded\)'),
+    ("json", r'String toXdrJson\(\)'),
+    ("json", r'static (?P<t>\w+) fromXdrJson\(String json\)'),
+    ("json", r'Object\? toXdrJsonValue\(\)'),
+    ("json", r'static (?P<t>\w+) fromXdrJsonValue\(Object\? value\)'),
+    ("json", r'static T fromXdrJsonValueAs<T extends (?P<t>\w+)>\(.*\)'),
+    ("txrep", r'void toTxRep\(String prefix, List<String> lines\)'),
+    ("txrep", r'static (?P<t>\w+) fromTxRep\(Map<String, String> map, String prefix\)'),
+    ("txrep", r'static (?P<t>\w+) fromTxRepName\(String name\)'),
+    ("txrep", r'String enumName\(\)'),
+    ("==", r'bool operator ==\(Object other\)'),
+)]
+# Constructor parameters that only store fields: `this._x` or `super.x`.
+_XDR_FIELD_PARAM_RE = re.compile(r'this\._\w+|super\.\w+')
+_XDR_GETTER_RE = re.compile(r'(?:(?P<type>.+) )?get (?P<name>\w+)')
+_XDR_SETTER_RE = re.compile(r'set (?P<name>\w+)\(')
+
+XDR_PREAMBLE = (
+    "Each XDR type is one line. Every type shares one pattern, "
+    "described here once rather than repeated (`T` is the type):\n\n"
+    "- codec: `static void encode(XdrDataOutputStream stream, T value)`, "
+    "`static T decode(XdrDataInputStream stream)`\n"
+    "- base64: `String toBase64EncodedXdrString()`, "
+    "`static T fromBase64EncodedXdrString(String base64Encoded)`\n"
+    "- json: `String toXdrJson()`, `static T fromXdrJson(String json)`, "
+    "`Object? toXdrJsonValue()`, `static T fromXdrJsonValue(Object? value)`\n"
+    "- struct: a constructor taking the listed fields in order, "
+    "and a getter and setter per field\n"
+    "- enum: `static const` per listed value, `T(this._value)`, `get value`, "
+    "`bool operator ==(Object other)`\n"
+    "- union: `T(discriminant)`, a `discriminant` getter and setter, and a "
+    "nullable getter and setter per listed arm\n"
+    "- `+txrep`: also `void toTxRep(String prefix, List<String> lines)` and "
+    "`static T fromTxRep(Map<String, String> map, String prefix)` "
+    "(enums: `fromTxRepName`, `enumName`)\n"
+    "- `-codec`, `-base64`, `-json`: the type lacks that part of the pattern\n"
+    "- `also:` members outside the pattern\n\n"
+)
+
+
+def format_xdr_line(info: ClassInfo) -> str | None:
+    """
+    The compact one-line form of an XDR type, or None when the type does not
+    follow the generated pattern (helpers such as the stream classes), in
+    which case it is rendered as a full section.
+    """
+    tags: set[str] = set()
+    extras: list[str] = []
+    owners = {info.name, info.name + "Base", info.parent}
+    for member in info.methods:
+        signature = re.sub(r',\)$', ')', member)
+        for tag, pattern in _XDR_BOILERPLATE:
+            m = pattern.fullmatch(signature)
+            if m and (m.groupdict().get('t') is None or m.group('t') in owners):
+                tags.add(tag)
+                break
+        else:
+            extras.append(member)
+    if "codec" not in tags:
+        return None
+
+    for ctor in info.constructors:
+        params = [p.strip() for p in ctor[ctor.find('(') + 1:ctor.rfind(')')].split(',')]
+        if not all(_XDR_FIELD_PARAM_RE.fullmatch(p) for p in params if p):
+            extras.append(ctor)
+
+    setters = {m.group('name') for m in map(_XDR_SETTER_RE.match, info.setters) if m}
+    fields: list[str] = []
+    discriminant = ""
+    for getter in info.getters:
+        m = _XDR_GETTER_RE.fullmatch(getter)
+        if m is None:
+            extras.append(getter)
+        elif m.group('name') == "discriminant":
+            discriminant = m.group('type') or ""
+        elif m.group('name') in setters:
+            fields.append(f"{m.group('type')} {m.group('name')}" if m.group('type') else m.group('name'))
+        elif not (m.group('name') == "value" and info.constants):
+            extras.append(getter)
+
+    if info.constants:
+        kind = "enum"
+        listed = [c.removeprefix("static const ") for c in info.constants]
+    elif discriminant:
+        # The union's own name for its discriminant (`type`, `code`, `v`, ...)
+        # is the one field of exactly the discriminant type.
+        mirror = [f for f in fields if f.rsplit(' ', 1)[0] == discriminant]
+        kind = f"union on {mirror[0] if mirror else discriminant}"
+        listed = [f for f in fields if f not in mirror[:1]]
+    else:
+        kind = "struct"
+        listed = fields
+    marks = [f"-{tag}" for tag in XDR_STANDARD_TAGS if tag not in tags]
+    if "txrep" in tags:
+        marks.append("+txrep")
+
+    head = info.name + (f" extends {info.parent}" if info.parent else "")
+    line = f"- {head} ({', '.join([kind] + marks)})"
+    if listed:
+        line += ": " + ", ".join(listed)
+    if extras:
+        line += "; also: " + "; ".join(extras)
+    return line + "\n"
+
+
+def format_group(group_key: str, class_list: list[ClassInfo]) -> list[tuple[ClassInfo | None, str, bool]]:
+    """
+    A group's rendered pieces in order, as (type, text, compact); a piece with
+    no type is connecting text. Only the XDR group has a preamble and compact
+    lines, which come first, with full sections for the types outside the
+    pattern after a blank line.
+    """
+    if group_key != "xdr":
+        return [(cls, format_class_section(cls), False) for cls in class_list]
+    compact: list[tuple[ClassInfo | None, str, bool]] = [(None, XDR_PREAMBLE, False)]
+    full: list[tuple[ClassInfo | None, str, bool]] = []
+    for cls in class_list:
+        line = format_xdr_line(cls)
+        if line is None:
+            full.append((cls, format_class_section(cls), False))
+        else:
+            compact.append((cls, line, True))
+    if full:
+        compact.append((None, "\n", False))
+    return compact + full
+
+
+def render_markdown(groups: dict[str, list[ClassInfo]], stats: dict,
+                    index: list[dict] | None = None) -> str:
+    """
+    Render the full markdown document from grouped classes.
+
+    When `index` is given it receives one symbol-index entry per type, in
+    document order; see `index_entry` for the shape.
+    """
     parts: list[str] = []
     parts.append("# Flutter SDK API Reference (Signatures)\n\n")
     parts.append("Compact method signature reference for `stellar_flutter_sdk`.\n")
     parts.append("Generated by `generate_api_reference.py`. Do not edit manually.\n\n")
     parts.append(f"**Stats:** {stats['classes']} classes, {stats['members']} members\n\n")
+    offset = sum(len(part.encode('utf-8')) for part in parts)
 
     for group_key, title in GROUP_TITLES.items():
         class_list = groups[group_key]
         if not class_list:
             continue
-        parts.append("---\n")
-        parts.append(f"## {title}\n")
-        parts.append("---\n\n")
-        for cls in class_list:
-            parts.append(format_class_section(cls))
+        for part in ("---\n", f"## {title}\n", "---\n\n"):
+            parts.append(part)
+            offset += len(part.encode('utf-8'))
+        for cls, section, compact in format_group(group_key, class_list):
+            if index is not None and cls is not None:
+                index.append(index_entry(cls, group_key, OUTPUT_PATH.name, offset, section, compact))
+            parts.append(section)
+            offset += len(section.encode('utf-8'))
 
     return "".join(parts)
 
 
+def index_entry(info: ClassInfo, group: str, file: str, start: int,
+                section: str, compact: bool = False) -> dict:
+    """
+    The symbol-index entry for a type whose rendered `section` starts at byte
+    `start` of the markdown file `file`.
+
+    Byte ranges are [start, end) into the UTF-8 markdown and cover the line
+    without its newline; the type's own range spans its whole section. Each
+    member is a compact [bucket, signature, start, end] row, following the
+    line layout of `format_class_section`. A compact XDR line has no
+    per-member rows.
+    """
+    header = format_class_header(info)
+    members: list[list] = []
+    position = start + len(header.encode('utf-8')) + 1
+    if not compact and (info.kind != "typedef" or not info.signature):
+        for bucket in MEMBER_FIELDS:
+            for line in getattr(info, bucket):
+                size = len(line.encode('utf-8'))
+                members.append([bucket, line, position, position + size])
+                position += size + 1
+    end = start + len(section.encode('utf-8'))
+    return {
+        "name": info.name,
+        "kind": info.kind,
+        "group": group,
+        "source": info.source,
+        "file": file,
+        "range": [start, end],
+        "members": members,
+    }
+
+
+def render_sharded(groups: dict[str, list[ClassInfo]], stats: dict,
+                   index: list[dict] | None = None) -> dict[str, str]:
+    """
+    Render one markdown shard per non-empty group plus the index document that
+    lists each type with its shard. Returns file name -> content; the index is
+    under OUTPUT_PATH's name. Sections are formatted exactly as in the single
+    document, and `index` receives entries whose ranges point into the shards.
+    """
+    files: dict[str, str] = {}
+    listing: list[str] = []
+    listing.append("# Flutter SDK API Reference (Signatures)\n\n")
+    listing.append("Compact method signature reference for `stellar_flutter_sdk`.\n")
+    listing.append("Generated by `generate_api_reference.py`. Do not edit manually.\n\n")
+    listing.append(f"**Stats:** {stats['classes']} classes, {stats['members']} members\n\n")
+    listing.append("Signatures are split into one file per group. "
+                   "Each type below is listed under the file that holds its section.\n\n")
+
+    for group_key, title in GROUP_TITLES.items():
+        class_list = groups[group_key]
+        if not class_list:
+            continue
+        name = SHARD_NAME.format(group=group_key)
+        members = sum(cls.member_count() for cls in class_list)
+        parts: list[str] = []
+        parts.append(f"# Flutter SDK API Reference: {title}\n\n")
+        parts.append("Generated by `generate_api_reference.py`. Do not edit manually.\n\n")
+        parts.append(f"**Stats:** {len(class_list)} classes, {members} members\n\n")
+        offset = sum(len(part.encode('utf-8')) for part in parts)
+        for cls, section, compact in format_group(group_key, class_list):
+            if index is not None and cls is not None:
+                index.append(index_entry(cls, group_key, name, offset, section, compact))
+            parts.append(section)
+            offset += len(section.encode('utf-8'))
+        files[name] = "".join(parts)
+
+        listing.append(f"## {title}\n")
+        listing.append(f"Shard: `{name}`\n\n")
+        for cls in class_list:
+            kind = f"{cls.kind} " if cls.kind else ""
+            listing.append(f"- {kind}{cls.name}\n")
+        listing.append("\n")
+
+    files[OUTPUT_PATH.name] = "".join(listing)
+    return files
+
+
+def write_reference(files: dict[str, str]) -> None:
+    """
+    Write the rendered markdown files next to OUTPUT_PATH and remove shards
+    left over from an earlier run that this one did not write.
+    """
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    for stale in OUTPUT_PATH.parent.glob(SHARD_NAME.format(group="*")):
+        if stale.name not in files:
+            stale.unlink()
+    for name, text in files.items():
+        (OUTPUT_PATH.parent / name).write_text(text, encoding='utf-8')
+
+
+def write_symbol_index(entries: list[dict], path: Path = INDEX_PATH) -> None:
+    """
+    Write the symbol index as deterministic JSON, one type per line, so a grep
+    for a name returns just that type's entry and regenerations diff per type.
+    """
+    lines = ["{", '"version":1,', f'"reference":{json.dumps(OUTPUT_PATH.name)},', '"types":[']
+    for i, entry in enumerate(entries):
+        sep = "," if i < len(entries) - 1 else ""
+        lines.append(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + sep)
+    lines.append("]}")
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+
+# The name a member is known by, for matching it across snapshots: the
+# operator, the (possibly named) constructor or method, the accessor, or the
+# last identifier of a field/constant declaration. A `Function(` match is a
+# function-typed return type, not the member's name.
+_MEMBER_NAME_RES = (
+    re.compile(r'\boperator\s*(\S+?)\s*\('),
+    re.compile(r'\b(?:get|set)\s+(\w+)\s*(?:\(|$)'),
+    re.compile(r'([\w$.]+)\s*(?:<[^()]*>)?\s*\('),
+    re.compile(r'([\w$]+)\s*(?:=.*)?$'),
+)
+
+
+def member_key(bucket: str, signature: str) -> str:
+    """A member's matching key: its bucket and name, e.g. `methods:account`."""
+    for pattern in _MEMBER_NAME_RES:
+        for m in pattern.finditer(signature):
+            if m.group(1) != "Function":
+                return f"{bucket}:{m.group(1)}"
+    return f"{bucket}:{signature}"
+
+
+def _signature_hash(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def build_snapshot(groups: dict[str, list[ClassInfo]]) -> dict:
+    """
+    The structured API snapshot: every type keyed by name, with its group,
+    source, header and members keyed by `member_key`. Each type and member
+    carries a short signature hash, so a diff compares hashes and only looks
+    at the members of types whose hash changed.
+    """
+    types: dict[str, dict] = {}
+    for group_key in GROUP_TITLES:
+        for cls in groups[group_key]:
+            members: dict[str, list[str]] = {}
+            seen: dict[str, int] = {}
+            for bucket in MEMBER_FIELDS:
+                for line in getattr(cls, bucket):
+                    key = member_key(bucket, line)
+                    seen[key] = seen.get(key, 0) + 1
+                    if seen[key] > 1:  # same name twice: keep both, in order
+                        key = f"{key}#{seen[key]}"
+                    members[key] = [line, _signature_hash(line)]
+            header = format_class_header(cls)
+            if cls.signature:
+                header += "\n" + cls.signature
+            types[cls.name] = {
+                "group": group_key,
+                "source": cls.source,
+                "header": header,
+                "hash": _signature_hash(header + "\n" + "\n".join(
+                    h for _, h in members.values())),
+                "members": members,
+            }
+    return {"version": 1, "types": types}
+
+
+def write_snapshot(snapshot: dict, path: Path = SNAPSHOT_PATH) -> None:
+    """Write the snapshot as deterministic JSON, one type per line."""
+    lines = ["{", f'"version":{snapshot["version"]},', '"types":{']
+    items = sorted(snapshot["types"].items())
+    for i, (name, entry) in enumerate(items):
+        sep = "," if i < len(items) - 1 else ""
+        lines.append(json.dumps(name) + ":"
+                     + json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + sep)
+    lines.append("}}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+
+def diff_snapshots(old: dict, new: dict) -> list[str]:
+    """
+    Report lines for the differences between two snapshots: `+`/`-` for added
+    and removed types and members, `~` for a type or member whose signature
+    changed. Runs in time linear in the number of types and members.
+    """
+    lines: list[str] = []
+    old_types, new_types = old.get("types", {}), new.get("types", {})
+    for name in sorted(old_types.keys() - new_types.keys()):
+        lines.append(f"- {old_types[name]['header'].splitlines()[0].removeprefix('## ')}")
+    for name in sorted(new_types.keys() - old_types.keys()):
+        lines.append(f"+ {new_types[name]['header'].splitlines()[0].removeprefix('## ')}")
+    for name in sorted(old_types.keys() & new_types.keys()):
+        before, after = old_types[name], new_types[name]
+        if before["hash"] == after["hash"] and before["group"] == after["group"]:
+            continue
+        lines.append(f"~ {name}")
+        if before["group"] != after["group"]:
+            lines.append(f"    group: {before['group']} -> {after['group']}")
+        if before["header"] != after["header"]:
+            lines.append(f"    - {before['header']}")
+            lines.append(f"    + {after['header']}")
+        old_members, new_members = before["members"], after["members"]
+        for key in old_members:
+            if key not in new_members:
+                lines.append(f"    - {old_members[key][0]}")
+        for key, (line, digest) in new_members.items():
+            if key not in old_members:
+                lines.append(f"    + {line}")
+            elif old_members[key][1] != digest:
+                lines.append(f"    ~ {old_members[key][0]}  ->  {line}")
+    return lines
+
+
 def main() -> None:
     """Generate the API reference markdown and exit nonzero on any regression."""
+    parser = argparse.ArgumentParser(description="Generate the SDK API reference markdown.")
+    parser.add_argument("--sharded", action="store_true",
+                        help="write one markdown file per group plus an index in api_reference.md")
+    parser.add_argument("--include-xdr", action="store_true",
+                        help="add the XDR types as a compact final section")
+    parser.add_argument("--diff-against", type=Path, metavar="SNAPSHOT",
+                        help="report API changes relative to an earlier api_reference.snapshot.json")
+    parser.add_argument("--snapshot", type=Path, default=SNAPSHOT_PATH, metavar="PATH",
+                        help=f"where to save this run's API snapshot (default: {SNAPSHOT_PATH})")
+    parser.add_argument("--jobs", type=int, default=None, metavar="N",
+                        help="worker processes for parsing (default: all CPUs; 1 = in-process)")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, metavar="DIR",
+                        help=f"where per-file results are cached (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse every file and leave the cache untouched")
+    add_profile_argument(parser, PROFILES_DIR)
+    args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.profile and args.jobs is None:
+        # Worker processes are invisible to the profiler; parse in-process instead.
+        args.jobs = 1
+    previous = None
+    if args.diff_against is not None:
+        # Read before generating: the snapshot may be the one about to be overwritten.
+        try:
+            previous = json.loads(args.diff_against.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read snapshot {args.diff_against}: {e}")
+
+    with profiled(args.profile, "generate_api_reference", directory=PROFILES_DIR):
+        generate(args, previous)
+
+
+def generate(args: argparse.Namespace, previous: dict | None) -> None:
+    """Run one generation for the parsed command line; `previous` is the snapshot to diff against."""
     if not SDK_PATH.exists():
         print(f"ERROR: SDK source not found at {SDK_PATH}", file=sys.stderr)
         print(f"Clone it first: git clone https://github.com/Soneso/stellar_flutter_sdk.git {SDK_PATH.parent}", file=sys.stderr)
@@ -1285,8 +1750,12 @@ def main() -> None:
 
     print(f"Scanning Dart files in {SDK_PATH}...", file=sys.stderr)
 
-    # Build the public-API allowlist from the barrel's transitive export graph.
-    allowlist = build_export_allowlist()
+    cache = None if args.no_cache else GenerationCache(args.cache_dir / "api-reference-cache.json")
+
+    # Build the public-API allowlist from the barrel's transitive export graph,
+    # unless no file in that graph has changed since the cached walk.
+    exports = ExportGraph(None if args.no_cache else args.cache_dir / "export-graph.json")
+    allowlist = exports.allowlist()
     print(f"Barrel export allowlist: {len(allowlist)} reachable files", file=sys.stderr)
 
     stats = {"files": 0, "classes": 0, "members": 0, "skipped_dirs": 0,
@@ -1298,7 +1767,11 @@ def main() -> None:
     member_gaps: list[tuple[str, str, int, int]] = []
 
     groups = collect_classes(allowlist, stats, scanned_by_file,
-                             emitted_by_file, member_gaps)
+                             emitted_by_file, member_gaps, jobs=args.jobs, cache=cache,
+                             skip_dirs=SKIP_DIRS - {"xdr"} if args.include_xdr else SKIP_DIRS)
+    if cache is not None:
+        cache.save()
+        print(f"Cache: {cache.hits} files reused, {cache.misses} parsed", file=sys.stderr)
 
     unemitted = report_coverage(scanned_by_file, emitted_by_file, member_gaps)
 
@@ -1306,10 +1779,15 @@ def main() -> None:
     for group in groups.values():
         group.sort(key=lambda c: c.name)
 
-    md = render_markdown(groups, stats)
-
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(md, encoding='utf-8')
+    index: list[dict] = []
+    if args.sharded:
+        files = render_sharded(groups, stats, index)
+    else:
+        files = {OUTPUT_PATH.name: render_markdown(groups, stats, index)}
+    write_reference(files)
+    write_symbol_index(index)
+    snapshot = build_snapshot(groups)
+    write_snapshot(snapshot, args.snapshot)
 
     print("\n=== Generation Complete ===", file=sys.stderr)
     print(f"Files processed: {stats['files']}", file=sys.stderr)
@@ -1320,6 +1798,16 @@ def main() -> None:
     print(f"Errors: {stats['errors']}", file=sys.stderr)
     print(f"Output written to: {OUTPUT_PATH}", file=sys.stderr)
     print(f"File size: {OUTPUT_PATH.stat().st_size:,} bytes", file=sys.stderr)
+    if args.sharded:
+        print(f"Shards written: {len(files) - 1}", file=sys.stderr)
+    print(f"Symbol index written to: {INDEX_PATH}", file=sys.stderr)
+    print(f"API snapshot written to: {args.snapshot}", file=sys.stderr)
+
+    if previous is not None:
+        changes = diff_snapshots(previous, snapshot)
+        print(f"\n=== API changes against {args.diff_against} ===", file=sys.stderr)
+        for line in changes or ["(no changes)"]:
+            print(line)
 
     if stats["errors"] > 0 or unemitted > 0:
         print("FAILURE: errors or unemitted public symbols detected; "